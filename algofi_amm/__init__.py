@@ -2,6 +2,16 @@
 This module contains all the relevant classes and data for interacting with the Algofi AMM
 """
 
-__all__ = ["v0", "contract_strings", "utils"]
+__all__ = ["v0", "contract_strings", "utils", "telemetry", "transport", "scheduler", "failover", "confirmation", "profiling"]
 __version__ = "1.0.3"
-__author__ = "Algofi"
\ No newline at end of file
+__author__ = "Algofi"
+
+
+def __getattr__(name):
+    """Imports submodules on first attribute access, so that e.g. algofi_amm.v0 is usable after import algofi_amm
+    """
+
+    if name in __all__:
+        import importlib
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,247 @@
+import time
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# default number of concurrent pending_transaction_info requests of a polling pass
+DEFAULT_MAX_WORKERS = 8
+
+# seconds to wait before asking an unreachable node for the next round again
+ERROR_RETRY_DELAY = 1.0
+
+# default seconds without pending groups after which the background thread and its executor exit
+DEFAULT_IDLE_TIMEOUT = 60.0
+
+
+class TransactionGroupExpired(Exception):
+    """Raised by a :class:`GroupFuture` when the network passed the last valid round of its group without
+    confirming it
+    """
+
+
+class GroupFuture(Future):
+
+    def __init__(self, txids, last_valid_round):
+        """Constructor method for :class:`GroupFuture`, a :class:`Future` resolving to the confirmed transaction
+        information of a submitted group, as a dict of txid -> pending_transaction_info response in group order.
+        It fails with :class:`TransactionGroupExpired` once the network passes last_valid_round without confirming
+        the group, and with an :class:`Exception` if the node drops the group from its pool. Cancelling the future
+        stops tracking the group, it does not withdraw the submitted transactions.
+
+        :param txids: transaction ids of the group
+        :type txids: list
+        :param last_valid_round: last round in which the group can be confirmed, the minimum last valid round of
+            its transactions
+        :type last_valid_round: int
+        """
+
+        super().__init__()
+        self.txids = txids
+        self.last_valid_round = last_valid_round
+
+
+class ConfirmationPoller():
+
+    def __init__(self, algod_client, max_workers=DEFAULT_MAX_WORKERS, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        """Constructor method for :class:`ConfirmationPoller`, which tracks the confirmation of many submitted
+        groups in one background thread. The thread waits for each new round with status_after_block while groups
+        are pending and checks every pending group once per round. It exits with its executor after idle_timeout
+        seconds without pending groups, and the next tracked group starts a new one.
+
+        :param algod_client: a :class:`AlgodClient` object for interacting with the network
+        :type algod_client: :class:`AlgodClient`
+        :param max_workers: maximum number of concurrent pending_transaction_info requests of a round
+        :type max_workers: int, optional
+        :param idle_timeout: seconds without pending groups after which the background thread exits
+        :type idle_timeout: float, optional
+        """
+
+        self.algod = algod_client
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self.pending = []
+        self.condition = threading.Condition()
+        self.thread = None
+        self.stopped = False
+        self.last_round = None
+        self.executor = None
+
+    def submit(self, transaction_group):
+        """Sends a signed transaction group and returns a future of its confirmation
+
+        :param transaction_group: signed transaction group
+        :type transaction_group: :class:`TransactionGroup`
+        :return: future of the confirmed transaction information of the group
+        :rtype: :class:`GroupFuture`
+        """
+
+        self.algod.send_transactions(transaction_group.signed_transactions)
+        txids = [txn.get_txid() for txn in transaction_group.transactions]
+        last_valid_round = min(txn.last_valid_round for txn in transaction_group.transactions)
+        return self.track(txids, last_valid_round)
+
+    def track(self, txids, last_valid_round):
+        """Returns a future of the confirmation of an already submitted group
+
+        :param txids: transaction ids of the group
+        :type txids: list
+        :param last_valid_round: last round in which the group can be confirmed
+        :type last_valid_round: int
+        :return: future of the confirmed transaction information of the group
+        :rtype: :class:`GroupFuture`
+        """
+
+        future = GroupFuture(list(txids), last_valid_round)
+        with self.condition:
+            if self.stopped:
+                raise Exception("Confirmation poller is stopped")
+            self.pending.append(future)
+            if self.thread is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+        return future
+
+    def _run(self):
+        while True:
+            with self.condition:
+                deadline = time.monotonic() + self.idle_timeout
+                while not self.pending and not self.stopped:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        # idle, the next tracked group starts a new thread
+                        self.thread = None
+                        self.executor.shutdown(wait=False)
+                        self.executor = None
+                        return
+                    self.condition.wait(remaining)
+                if self.stopped:
+                    return
+            try:
+                if self.last_round is None:
+                    self.last_round = self.algod.status()["last-round"]
+                else:
+                    self.last_round = self.algod.status_after_block(self.last_round)["last-round"]
+            except Exception:
+                # the node is unreachable, pending groups are checked once it answers again
+                time.sleep(ERROR_RETRY_DELAY)
+                continue
+            try:
+                self.poll(self.last_round)
+            except RuntimeError:
+                # the executor was shut down by stop
+                return
+
+    def _check(self, future, round_num):
+        """Returns (result, error) of a pending group, both None while it is pending"""
+
+        try:
+            txinfo = self.algod.pending_transaction_info(future.txids[0])
+        except Exception:
+            if round_num > future.last_valid_round:
+                return None, TransactionGroupExpired("Transaction group %s expired at round %d" % (future.txids[0], future.last_valid_round))
+            return None, None
+        if txinfo.get("confirmed-round", 0):
+            # the transactions of a group are confirmed together
+            txinfos = {future.txids[0]: txinfo}
+            try:
+                for txid in future.txids[1:]:
+                    txinfos[txid] = self.algod.pending_transaction_info(txid)
+            except Exception:
+                return None, None
+            for txid, txinfo in txinfos.items():
+                txinfo["txid"] = txid
+            return txinfos, None
+        if txinfo.get("pool-error", ""):
+            return None, Exception("Transaction group %s rejected: %s" % (future.txids[0], txinfo["pool-error"]))
+        if round_num > future.last_valid_round:
+            return None, TransactionGroupExpired("Transaction group %s expired at round %d" % (future.txids[0], future.last_valid_round))
+        return None, None
+
+    def poll(self, round_num):
+        """Checks every pending group once and resolves the confirmed, rejected and expired ones. Called by the
+        background thread for each new round.
+
+        :param round_num: latest round
+        :type round_num: int
+        """
+
+        with self.condition:
+            self.pending = [future for future in self.pending if not future.cancelled()]
+            futures = list(self.pending)
+        if not futures:
+            return
+
+        if len(futures) > 1 and self.executor is not None:
+            outcomes = list(self.executor.map(lambda future: self._check(future, round_num), futures))
+        else:
+            outcomes = [self._check(future, round_num) for future in futures]
+
+        resolved = set()
+        for future, (result, error) in zip(futures, outcomes):
+            if result is None and error is None:
+                continue
+            resolved.add(future)
+            try:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            except Exception:
+                # cancelled while being checked
+                pass
+        with self.condition:
+            self.pending = [future for future in self.pending if future not in resolved]
+
+    def get_pending_count(self):
+        """Returns the number of groups awaiting confirmation
+
+        :return: number of pending groups
+        :rtype: int
+        """
+
+        with self.condition:
+            return sum(1 for future in self.pending if not future.cancelled())
+
+    def stop(self, cancel_pending=True):
+        """Stops the background thread after its current wait for a round
+
+        :param cancel_pending: whether to cancel the futures of pending groups
+        :type cancel_pending: bool, optional
+        """
+
+        with self.condition:
+            self.stopped = True
+            if cancel_pending:
+                for future in self.pending:
+                    future.cancel()
+                self.pending = []
+            self.condition.notify()
+            executor = self.executor
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# id of algod client -> poller of the pollers shared by :meth:`TransactionGroup.submit_async`. The pollers are
+# referenced weakly, a poller is kept alive by its background thread while groups are pending, and released with its
+# client once the thread exits idle
+_shared_pollers = weakref.WeakValueDictionary()
+_shared_pollers_lock = threading.Lock()
+
+
+def get_shared_poller(algod_client):
+    """Returns the :class:`ConfirmationPoller` shared by all groups submitted asynchronously with an algod client
+
+    :param algod_client: a :class:`AlgodClient` object for interacting with the network
+    :type algod_client: :class:`AlgodClient`
+    :return: shared confirmation poller of the client
+    :rtype: :class:`ConfirmationPoller`
+    """
+
+    with _shared_pollers_lock:
+        poller = _shared_pollers.get(id(algod_client), None)
+        if poller is None or poller.algod is not algod_client or poller.stopped:
+            poller = ConfirmationPoller(algod_client)
+            _shared_pollers[id(algod_client)] = poller
+        return poller
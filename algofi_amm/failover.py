@@ -0,0 +1,370 @@
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .scheduler import NON_IDEMPOTENT_METHODS, is_retryable_error, get_status_code
+
+# read methods which are sent to a second endpoint when the first has not answered within the hedge delay
+HEDGED_METHODS = frozenset(["application_info", "account_info", "asset_info", "status", "block_info", "suggested_params",
+                            "health"])
+
+# methods sending transactions, whose transactions are pinned to the endpoint which accepted them
+SEND_METHODS = frozenset(["send_transaction", "send_transactions", "send_raw_transaction"])
+
+# maximum number of transaction ids pinned to the endpoint which accepted them, oldest are unpinned first
+MAX_PINNED_TRANSACTIONS = 10000
+
+# default seconds to wait for an endpoint before hedging a read to the next one
+DEFAULT_HEDGE_DELAY = 0.05
+
+# default number of consecutive failures after which an endpoint is ejected
+DEFAULT_MAX_FAILURES = 3
+
+# default seconds an ejected endpoint is skipped before it is tried again
+DEFAULT_EJECTION_TIME = 30.0
+
+# weight of the latest latency in the moving average latency of an endpoint
+LATENCY_EWMA_WEIGHT = 0.2
+
+# default number of threads sending hedged reads
+DEFAULT_MAX_WORKERS = 32
+
+
+def get_sent_txids(method, args, kwargs, response):
+    """Returns the ids of the transactions sent by a successful send call
+
+    :param method: name of the client method
+    :type method: str
+    :param args: positional arguments of the call
+    :type args: tuple
+    :param kwargs: keyword arguments of the call
+    :type kwargs: dict
+    :param response: response of the call, the id of the (first) sent transaction
+    :type response: str or dict
+    :return: set of transaction ids
+    :rtype: set
+    """
+
+    txids = set()
+    if isinstance(response, str):
+        txids.add(response)
+    if method == "send_transactions":
+        txns = args[0] if args else kwargs.get("txns", [])
+    elif method == "send_transaction":
+        txns = [args[0] if args else kwargs.get("txn", None)]
+    else:
+        txns = []
+    for txn in txns:
+        get_txid = getattr(txn, "get_txid", None)
+        if get_txid is not None:
+            txids.add(get_txid())
+    return txids
+
+
+def is_endpoint_failure(e):
+    """Returns whether a failed call counts against the health of the endpoint: connection errors, throttling and
+    server errors do, other error responses, e.g. a 404, mean the endpoint answered
+
+    :param e: exception raised by the call
+    :type e: :class:`Exception`
+    :return: whether the endpoint failed
+    :rtype: bool
+    """
+
+    code = get_status_code(e)
+    if code is not None:
+        return code == 429 or code >= 500
+    return isinstance(e, (OSError, ConnectionError))
+
+
+class EndpointHealth():
+
+    def __init__(self, name, client):
+        """Constructor method for :class:`EndpointHealth`, the client of one endpoint and its recent health
+
+        :param name: name of the endpoint, e.g. its address
+        :type name: str
+        :param client: client of the endpoint
+        :type client: :class:`AlgodClient` or :class:`IndexerClient`
+        """
+
+        self.name = name
+        self.client = client
+        self.latency = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+
+    def __str__(self):
+        """Returns a string representation of the :class:`EndpointHealth` object
+        """
+
+        return "EndpointHealth({}, latency={:.1f}ms, requests={}, failures={}, ejections={})".format(
+            self.name, self.latency * 1000, self.requests, self.failures, self.ejections)
+
+    def is_ejected(self, now=None):
+        return self.ejected_until > (now if now is not None else time.monotonic())
+
+    def record_success(self, latency):
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latency = latency if self.requests == 1 else (1 - LATENCY_EWMA_WEIGHT) * self.latency + LATENCY_EWMA_WEIGHT * latency
+
+    def record_failure(self, max_failures, ejection_time):
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= max_failures:
+            self.ejected_until = time.monotonic() + ejection_time
+            self.consecutive_failures = 0
+            self.ejections += 1
+
+
+class EndpointPool():
+
+    def __init__(self, clients, names=None, hedge_delay=DEFAULT_HEDGE_DELAY, hedged_methods=HEDGED_METHODS,
+                 max_failures=DEFAULT_MAX_FAILURES, ejection_time=DEFAULT_EJECTION_TIME, retry_on=is_retryable_error,
+                 max_workers=DEFAULT_MAX_WORKERS):
+        """Constructor method for :class:`EndpointPool`, which spreads algod or indexer calls over several endpoints
+        serving the same network. Calls go to the healthy endpoint with the lowest moving average latency. Reads in
+        hedged_methods are also sent to the next endpoint if the first has not answered within hedge_delay, and the
+        first answer wins. Idempotent reads which fail with a retryable error fail over to the next endpoint.
+        Endpoints failing max_failures times in a row are skipped for ejection_time seconds. Calls which are not
+        idempotent, e.g. send_transactions, are sent to one endpoint only. The transactions it accepts are pinned to
+        it, and pending_transaction_info of a pinned transaction asks that endpoint first, as the others may not
+        have the transaction in their pool.
+
+        :param clients: clients of the endpoints, in order of preference
+        :type clients: list
+        :param names: names of the endpoints, defaults to the address of each client
+        :type names: list, optional
+        :param hedge_delay: seconds to wait before hedging a read, None to disable hedging
+        :type hedge_delay: float, optional
+        :param hedged_methods: names of the client methods which are hedged
+        :type hedged_methods: frozenset, optional
+        :param max_failures: number of consecutive failures after which an endpoint is ejected
+        :type max_failures: int, optional
+        :param ejection_time: seconds an ejected endpoint is skipped
+        :type ejection_time: float, optional
+        :param retry_on: function taking an exception and returning whether another endpoint should be tried
+        :type retry_on: function, optional
+        :param max_workers: maximum number of threads sending hedged reads, including the reads they race
+        :type max_workers: int, optional
+        """
+
+        if not clients:
+            raise Exception("At least one endpoint is required")
+        if names is None:
+            names = [getattr(client, "algod_address", None) or getattr(client, "indexer_address", None) or str(i)
+                     for i, client in enumerate(clients)]
+        self.endpoints = [EndpointHealth(name, client) for name, client in zip(names, clients)]
+        self.hedge_delay = hedge_delay
+        self.hedged_methods = hedged_methods
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.retry_on = retry_on
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.lock = threading.Lock()
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+        # transaction id -> endpoint which accepted the transaction
+        self.pinned_transactions = OrderedDict()
+
+    def get_endpoints(self):
+        """Returns the endpoints in the order they are tried: healthy endpoints by moving average latency, then
+        ejected endpoints as a last resort
+
+        :return: list of :class:`EndpointHealth`
+        :rtype: list
+        """
+
+        now = time.monotonic()
+        return sorted(self.endpoints, key=lambda endpoint: (endpoint.is_ejected(now), endpoint.latency))
+
+    def _pin_transactions(self, endpoint, txids):
+        with self.lock:
+            for txid in txids:
+                self.pinned_transactions[txid] = endpoint
+                self.pinned_transactions.move_to_end(txid)
+            while len(self.pinned_transactions) > MAX_PINNED_TRANSACTIONS:
+                self.pinned_transactions.popitem(last=False)
+
+    def _get_pinned_endpoint(self, method, args, kwargs):
+        if method != "pending_transaction_info":
+            return None
+        txid = args[0] if args else kwargs.get("transaction_id", None)
+        with self.lock:
+            return self.pinned_transactions.get(txid, None)
+
+    def _send(self, endpoint, method, args, kwargs):
+        start = time.monotonic()
+        try:
+            response = getattr(endpoint.client, method)(*args, **kwargs)
+        except Exception as e:
+            with self.lock:
+                if is_endpoint_failure(e) or self.retry_on(e):
+                    endpoint.record_failure(self.max_failures, self.ejection_time)
+                else:
+                    # the endpoint answered, e.g. with a 404
+                    endpoint.record_success(time.monotonic() - start)
+            raise
+        with self.lock:
+            endpoint.record_success(time.monotonic() - start)
+        return response
+
+    def call(self, method, args, kwargs):
+        """Executes a client call on the endpoints
+
+        :param method: name of the client method
+        :type method: str
+        :param args: positional arguments of the call
+        :type args: tuple
+        :param kwargs: keyword arguments of the call
+        :type kwargs: dict
+        :return: response of the first endpoint which answered
+        :rtype: dict
+        """
+
+        endpoints = self.get_endpoints()
+        if method in NON_IDEMPOTENT_METHODS:
+            response = self._send(endpoints[0], method, args, kwargs)
+            if method in SEND_METHODS:
+                self._pin_transactions(endpoints[0], get_sent_txids(method, args, kwargs, response))
+            return response
+
+        # the endpoint which accepted a transaction is asked first about it, the others only if it fails
+        pinned_endpoint = self._get_pinned_endpoint(method, args, kwargs)
+        if pinned_endpoint is not None:
+            endpoints = [pinned_endpoint] + [endpoint for endpoint in endpoints if endpoint is not pinned_endpoint]
+
+        hedge_delay = self.hedge_delay if method in self.hedged_methods else None
+        if hedge_delay is None or len(endpoints) == 1:
+            for i, endpoint in enumerate(endpoints):
+                try:
+                    return self._send(endpoint, method, args, kwargs)
+                except Exception as e:
+                    if i == len(endpoints) - 1 or not self.retry_on(e):
+                        raise
+                with self.lock:
+                    self.failovers += 1
+
+        # future -> whether the request is a hedge
+        pending = {}
+        next_index = 0
+        last_error = None
+
+        def submit(is_hedge):
+            nonlocal next_index
+            pending[self.executor.submit(self._send, endpoints[next_index], method, args, kwargs)] = is_hedge
+            next_index += 1
+
+        submit(False)
+        while pending:
+            can_hedge = next_index < len(endpoints)
+            done, _ = wait(pending, timeout=hedge_delay if can_hedge else None, return_when=FIRST_COMPLETED)
+            if not done:
+                with self.lock:
+                    self.hedges += 1
+                submit(True)
+                continue
+            for future in done:
+                is_hedge = pending.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    if not self.retry_on(e):
+                        raise
+                    last_error = e
+                    continue
+                if is_hedge:
+                    with self.lock:
+                        self.hedge_wins += 1
+                return response
+            # every finished request failed, fail over unless another request is still in flight
+            if not pending and next_index < len(endpoints):
+                with self.lock:
+                    self.failovers += 1
+                submit(False)
+        raise last_error
+
+    def get_stats(self):
+        """Returns the hedging and failover counters and the health of each endpoint
+
+        :return: dict with keys hedges, hedge_wins, failovers and endpoints
+        :rtype: dict
+        """
+
+        with self.lock:
+            return {
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "failovers": self.failovers,
+                "endpoints": [{"name": endpoint.name, "latency": endpoint.latency, "requests": endpoint.requests,
+                               "failures": endpoint.failures, "ejections": endpoint.ejections,
+                               "ejected": endpoint.is_ejected()} for endpoint in self.endpoints],
+            }
+
+    def close(self):
+        """Stops the worker threads once in flight requests have finished
+        """
+
+        self.executor.shutdown(wait=False)
+
+
+class FailoverClient():
+
+    def __init__(self, endpoint_pool):
+        """Constructor method for :class:`FailoverClient`, a proxy standing in for an :class:`AlgodClient` or
+        :class:`IndexerClient` which routes every method call through an :class:`EndpointPool`
+
+        :param endpoint_pool: endpoint pool
+        :type endpoint_pool: :class:`EndpointPool`
+        """
+
+        self.__dict__["_endpoint_pool"] = endpoint_pool
+
+    @property
+    def endpoint_pool(self):
+        """Returns the endpoint pool
+
+        :return: endpoint pool
+        :rtype: :class:`EndpointPool`
+        """
+
+        return self._endpoint_pool
+
+    def __getattr__(self, attr):
+        value = getattr(self._endpoint_pool.endpoints[0].client, attr)
+        if not callable(value) or attr.startswith("_") or attr.endswith("_request"):
+            return value
+
+        endpoint_pool = self._endpoint_pool
+
+        def failover(*args, **kwargs):
+            return endpoint_pool.call(attr, args, kwargs)
+
+        return failover
+
+    def __setattr__(self, attr, value):
+        for endpoint in self._endpoint_pool.endpoints:
+            setattr(endpoint.client, attr, value)
+
+
+def failover(clients, **kwargs):
+    """Returns a :class:`FailoverClient` over the given clients. A single client which is not in a list is returned
+    unchanged, as is None.
+
+    :param clients: clients of the endpoints, in order of preference
+    :type clients: list
+    :param kwargs: keyword arguments of :class:`EndpointPool`
+    :type kwargs: dict
+    :return: failover client
+    :rtype: :class:`FailoverClient`
+    """
+
+    if clients is None or not isinstance(clients, (list, tuple)):
+        return clients
+    return FailoverClient(EndpointPool(list(clients), **kwargs))
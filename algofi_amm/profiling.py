@@ -0,0 +1,482 @@
+import os
+import json
+import time
+import threading
+from bisect import bisect_left
+from collections import deque
+from functools import wraps
+from .telemetry import DEFAULT_LATENCY_BUCKETS
+
+# phases of the lifecycle of a transaction group, in order
+PHASES = ("params", "build", "sign", "submit", "confirm")
+
+# default maximum number of spans kept for export, older spans are dropped first
+DEFAULT_MAX_SPANS = 100000
+
+# maximum number of params spans of a thread awaiting the group they were fetched for
+MAX_PENDING_SPANS = 64
+
+# name of the service reported in exported traces
+DEFAULT_SERVICE_NAME = "algofi_amm"
+
+
+class Span():
+
+    def __init__(self, phase, start_ns, duration, thread_id, error=None, asynchronous=False):
+        """Constructor method for :class:`Span`, a single timed phase of a transaction group
+
+        :param phase: name of the phase
+        :type phase: str
+        :param start_ns: start of the phase in nanoseconds since the epoch
+        :type start_ns: int
+        :param duration: duration of the phase in seconds
+        :type duration: float
+        :param thread_id: identifier of the thread the phase started on
+        :type thread_id: int
+        :param error: exception raised by the phase, if any
+        :type error: :class:`Exception`, optional
+        :param asynchronous: whether the phase overlaps later phases of its thread, e.g. an asynchronous confirmation
+        :type asynchronous: bool, optional
+        """
+
+        self.phase = phase
+        self.start_ns = start_ns
+        self.duration = duration
+        self.thread_id = thread_id
+        self.error = error
+        self.asynchronous = asynchronous
+        self.span_id = os.urandom(8).hex()
+        self.trace_id = None
+
+    def __str__(self):
+        """Returns a string representation of the :class:`Span` object
+        """
+
+        return "Span({}, {:.3f}ms, trace={})".format(self.phase, self.duration * 1000, self.trace_id)
+
+
+class PhaseStats():
+
+    def __init__(self, buckets):
+        """Constructor method for :class:`PhaseStats`, the aggregated durations of a single phase
+
+        :param buckets: upper bounds of the duration histogram buckets in seconds
+        :type buckets: tuple
+        """
+
+        self.buckets = buckets
+        self.bucket_counts = [0 for _ in range(len(buckets) + 1)]
+        self.count = 0
+        self.errors = 0
+        self.duration_sum = 0.0
+
+    def observe(self, duration, is_error):
+        """Records a single phase
+
+        :param duration: duration of the phase in seconds
+        :type duration: float
+        :param is_error: whether the phase raised
+        :type is_error: bool
+        """
+
+        self.count += 1
+        self.duration_sum += duration
+        if is_error:
+            self.errors += 1
+        self.bucket_counts[bisect_left(self.buckets, duration)] += 1
+
+    def to_dict(self):
+        """Returns a dict representation of the statistics
+
+        :return: dict of count, error count, duration sum and histogram
+        :rtype: dict
+        """
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "duration_sum": self.duration_sum,
+            "duration_histogram": dict(zip(list(self.buckets) + [float("inf")], self.bucket_counts)),
+        }
+
+
+class _ThreadState(threading.local):
+
+    def __init__(self):
+        # depth of nested builder calls, only the outermost builder is timed
+        self.build_depth = 0
+        # total duration of params phases on this thread, used to exclude them from the build phase
+        self.params_time = 0.0
+        # (span, duration) of params phases awaiting the group they were fetched for
+        self.pending = deque(maxlen=MAX_PENDING_SPANS)
+
+
+_thread_state = _ThreadState()
+
+
+class Profiler():
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS, max_spans=DEFAULT_MAX_SPANS):
+        """Constructor method for :class:`Profiler`, a collector of the durations of the params, build, sign,
+        submit and confirm phases of transaction groups. Durations are aggregated into a histogram per phase, added
+        to the phase_timings of each :class:`TransactionGroup`, and kept as spans which can be exported as a chrome
+        trace or as OTLP spans. Activate a profiler with :func:`enable_profiling`.
+
+        :param buckets: upper bounds of the duration histogram buckets in seconds
+        :type buckets: tuple, optional
+        :param max_spans: maximum number of spans kept for export
+        :type max_spans: int, optional
+        """
+
+        self.buckets = tuple(sorted(buckets))
+        self.stats = {}
+        self.spans = deque(maxlen=max_spans)
+        self.lock = threading.Lock()
+
+    def record(self, phase, start_ns, duration, transaction_group=None, error=None, exclusive_duration=None,
+               asynchronous=False):
+        """Records a single phase
+
+        :param phase: name of the phase
+        :type phase: str
+        :param start_ns: start of the phase in nanoseconds since the epoch
+        :type start_ns: int
+        :param duration: duration of the phase in seconds
+        :type duration: float
+        :param transaction_group: group the phase belongs to, if known
+        :type transaction_group: :class:`TransactionGroup`, optional
+        :param error: exception raised by the phase, if any
+        :type error: :class:`Exception`, optional
+        :param exclusive_duration: duration excluding nested phases, recorded in the histogram and the phase
+            timings of the group, defaults to duration
+        :type exclusive_duration: float, optional
+        :param asynchronous: whether the phase overlaps later phases of its thread
+        :type asynchronous: bool, optional
+        :return: recorded span
+        :rtype: :class:`Span`
+        """
+
+        span = Span(phase, start_ns, duration, threading.get_ident(), error, asynchronous)
+        timed = duration if exclusive_duration is None else exclusive_duration
+        with self.lock:
+            stats = self.stats.get(phase, None)
+            if stats is None:
+                stats = PhaseStats(self.buckets)
+                self.stats[phase] = stats
+            stats.observe(timed, error is not None)
+            self.spans.append(span)
+        if transaction_group is not None:
+            self.attach(transaction_group, span, timed)
+        return span
+
+    def attach(self, transaction_group, span, duration):
+        """Adds a span to the trace and phase timings of a transaction group
+
+        :param transaction_group: transaction group
+        :type transaction_group: :class:`TransactionGroup`
+        :param span: span of a phase of the group
+        :type span: :class:`Span`
+        :param duration: duration added to the phase timings of the group in seconds
+        :type duration: float
+        """
+
+        if transaction_group.trace_id is None:
+            transaction_group.trace_id = os.urandom(16).hex()
+        span.trace_id = transaction_group.trace_id
+        timings = transaction_group.phase_timings
+        timings[span.phase] = timings.get(span.phase, 0.0) + duration
+
+    def reset(self):
+        """Clears all recorded statistics and spans
+        """
+
+        with self.lock:
+            self.stats = {}
+            self.spans.clear()
+
+    def get_stats(self):
+        """Returns a snapshot of recorded statistics keyed by phase
+
+        :return: dict of phase -> dict of statistics
+        :rtype: dict
+        """
+
+        with self.lock:
+            return {phase: stats.to_dict() for phase, stats in self.stats.items()}
+
+    def get_spans(self):
+        """Returns the recorded spans, oldest first
+
+        :return: list of :class:`Span`
+        :rtype: list
+        """
+
+        with self.lock:
+            return list(self.spans)
+
+    def get_chrome_trace(self):
+        """Returns the recorded spans in the chrome trace event format, which can be opened in chrome://tracing or
+        https://ui.perfetto.dev. Synchronous phases are complete events on the thread they ran on, asynchronous
+        confirmations are async events grouped by trace id.
+
+        :return: dict with a traceEvents list
+        :rtype: dict
+        """
+
+        pid = os.getpid()
+        events = []
+        for span in self.get_spans():
+            args = {"trace_id": span.trace_id}
+            if span.error is not None:
+                args["error"] = str(span.error)
+            ts = span.start_ns / 1000.0
+            if span.asynchronous:
+                event_id = span.trace_id or span.span_id
+                events.append({"name": span.phase, "cat": "algofi_amm", "ph": "b", "ts": ts, "pid": pid,
+                               "tid": span.thread_id, "id": event_id, "args": args})
+                events.append({"name": span.phase, "cat": "algofi_amm", "ph": "e", "ts": ts + span.duration * 1e6,
+                               "pid": pid, "tid": span.thread_id, "id": event_id})
+            else:
+                events.append({"name": span.phase, "cat": "algofi_amm", "ph": "X", "ts": ts,
+                               "dur": span.duration * 1e6, "pid": pid, "tid": span.thread_id, "args": args})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """Writes the recorded spans to a file in the chrome trace event format, see :meth:`get_chrome_trace`
+
+        :param path: path of the file
+        :type path: str
+        """
+
+        with open(path, "w") as f:
+            json.dump(self.get_chrome_trace(), f)
+
+    def get_otlp_spans(self, service_name=DEFAULT_SERVICE_NAME):
+        """Returns the recorded spans in the OTLP JSON encoding, e.g. to post to the /v1/traces endpoint of an
+        OpenTelemetry collector. Spans of the same transaction group share a trace id.
+
+        :param service_name: service name of the resource
+        :type service_name: str, optional
+        :return: dict with a resourceSpans list
+        :rtype: dict
+        """
+
+        spans = []
+        for span in self.get_spans():
+            end_ns = span.start_ns + int(span.duration * 1e9)
+            otlp_span = {
+                "traceId": span.trace_id or span.span_id * 2,
+                "spanId": span.span_id,
+                "name": span.phase,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(end_ns),
+                "attributes": [{"key": "thread.id", "value": {"intValue": str(span.thread_id)}}],
+                "status": {"code": 1},
+            }
+            if span.error is not None:
+                otlp_span["status"] = {"code": 2, "message": str(span.error)}
+            spans.append(otlp_span)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }]
+        }
+
+    def render_prometheus(self, prefix="algofi_amm"):
+        """Returns the phase histograms in the prometheus text exposition format
+
+        :param prefix: metric name prefix
+        :type prefix: str, optional
+        :return: prometheus text exposition
+        :rtype: str
+        """
+
+        lines = [
+            "# HELP %s_transaction_phase_errors_total Number of failed transaction group phases" % prefix,
+            "# TYPE %s_transaction_phase_errors_total counter" % prefix,
+        ]
+        stats = self.get_stats()
+        for phase, value in sorted(stats.items()):
+            lines.append('%s_transaction_phase_errors_total{phase="%s"} %d' % (prefix, phase, value["errors"]))
+        lines.append("# HELP %s_transaction_phase_seconds Duration of transaction group phases" % prefix)
+        lines.append("# TYPE %s_transaction_phase_seconds histogram" % prefix)
+        for phase, value in sorted(stats.items()):
+            cumulative = 0
+            for upper_bound, bucket_count in value["duration_histogram"].items():
+                cumulative += bucket_count
+                le = "+Inf" if upper_bound == float("inf") else repr(upper_bound)
+                lines.append('%s_transaction_phase_seconds_bucket{phase="%s",le="%s"} %d' % (prefix, phase, le, cumulative))
+            lines.append('%s_transaction_phase_seconds_sum{phase="%s"} %f' % (prefix, phase, value["duration_sum"]))
+            lines.append('%s_transaction_phase_seconds_count{phase="%s"} %d' % (prefix, phase, value["count"]))
+        return "\n".join(lines) + "\n"
+
+
+# active profiler, None while profiling is disabled
+_profiler = None
+
+
+def enable_profiling(profiler=None):
+    """Starts recording the phases of all transaction groups to a profiler
+
+    :param profiler: profiler to record to, defaults to a new :class:`Profiler`
+    :type profiler: :class:`Profiler`, optional
+    :return: active profiler
+    :rtype: :class:`Profiler`
+    """
+
+    global _profiler
+    if profiler is None:
+        profiler = Profiler()
+    _profiler = profiler
+    return profiler
+
+
+def disable_profiling():
+    """Stops recording the phases of transaction groups
+    """
+
+    global _profiler
+    _profiler = None
+
+
+def get_profiler():
+    """Returns the active profiler
+
+    :return: active profiler, or None if profiling is disabled
+    :rtype: :class:`Profiler`
+    """
+
+    return _profiler
+
+
+class _PhaseTimer():
+
+    def __init__(self, profiler, phase, transaction_group):
+        self.profiler = profiler
+        self.phase = phase
+        self.transaction_group = transaction_group
+
+    def __enter__(self):
+        self.start_ns = time.time_ns()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter() - self.start
+        span = self.profiler.record(self.phase, self.start_ns, duration, self.transaction_group, exc_value)
+        if self.transaction_group is None and self.phase == "params":
+            _thread_state.params_time += duration
+            _thread_state.pending.append((span, duration))
+        return False
+
+
+class _NullTimer():
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_null_timer = _NullTimer()
+
+
+def profile_phase(phase, transaction_group=None):
+    """Returns a context manager timing a phase with the active profiler, which does nothing while profiling is
+    disabled. Params phases without a group are attached to the next group built on the same thread.
+
+    :param phase: name of the phase
+    :type phase: str
+    :param transaction_group: group the phase belongs to
+    :type transaction_group: :class:`TransactionGroup`, optional
+    :return: context manager
+    :rtype: object
+    """
+
+    profiler = _profiler
+    if profiler is None:
+        return _null_timer
+    return _PhaseTimer(profiler, phase, transaction_group)
+
+
+def profile_confirmation(transaction_group, future):
+    """Times the confirm phase of a group submitted asynchronously, ending when its future is resolved
+
+    :param transaction_group: submitted transaction group
+    :type transaction_group: :class:`TransactionGroup`
+    :param future: future of the confirmation of the group
+    :type future: :class:`GroupFuture`
+    """
+
+    profiler = _profiler
+    if profiler is None:
+        return
+    start_ns = time.time_ns()
+    start = time.perf_counter()
+    thread_id = threading.get_ident()
+
+    def record(future):
+        error = None if future.cancelled() else future.exception()
+        span = profiler.record("confirm", start_ns, time.perf_counter() - start, transaction_group, error, asynchronous=True)
+        # shown on the thread which submitted the group
+        span.thread_id = thread_id
+
+    future.add_done_callback(record)
+
+
+def attach_pending_phases(transaction_group):
+    """Attaches the params phases of the current thread which are not yet attached to a group. Called when a group
+    is created outside of a profiled builder, the builder attaches them otherwise.
+
+    :param transaction_group: new transaction group
+    :type transaction_group: :class:`TransactionGroup`
+    """
+
+    profiler = _profiler
+    if profiler is None or _thread_state.build_depth:
+        return
+    pending = _thread_state.pending
+    while pending:
+        span, duration = pending.popleft()
+        profiler.attach(transaction_group, span, duration)
+
+
+def profile_build(builder):
+    """Decorator timing a method building a :class:`TransactionGroup` as the build phase of the group it returns.
+    Params fetched by the builder are attached to the group and excluded from its build duration. Builders called
+    by other builders are not timed separately.
+
+    :param builder: builder method
+    :type builder: function
+    :return: profiled builder method
+    :rtype: function
+    """
+
+    @wraps(builder)
+    def profiled(*args, **kwargs):
+        profiler = _profiler
+        if profiler is None or _thread_state.build_depth:
+            return builder(*args, **kwargs)
+        state = _thread_state
+        params_time = state.params_time
+        start_ns = time.time_ns()
+        start = time.perf_counter()
+        state.build_depth += 1
+        try:
+            transaction_group = builder(*args, **kwargs)
+        except Exception as e:
+            duration = time.perf_counter() - start
+            profiler.record("build", start_ns, duration, None, e, duration - (state.params_time - params_time))
+            state.pending.clear()
+            raise
+        finally:
+            state.build_depth -= 1
+        duration = time.perf_counter() - start
+        profiler.record("build", start_ns, duration, transaction_group, None, duration - (state.params_time - params_time))
+        attach_pending_phases(transaction_group)
+        return transaction_group
+
+    return profiled
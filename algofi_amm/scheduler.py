@@ -0,0 +1,314 @@
+import time
+import random
+import threading
+
+# client methods which are not safe to coalesce or retry
+NON_IDEMPOTENT_METHODS = frozenset(["send_transaction", "send_transactions", "send_raw_transaction", "dryrun", "compile", "status_after_block"])
+
+# http status codes which are retried
+RETRYABLE_STATUS_CODES = frozenset([408, 425, 429, 500, 502, 503, 504])
+
+
+def get_status_code(e):
+    """Returns the http status code of a failed algod / indexer call. The stock :class:`IndexerClient` raises an
+    :class:`IndexerHTTPError` without a code from within the handler of the urllib :class:`HTTPError`, so the code
+    is also looked up in the exceptions the error was raised from.
+
+    :param e: exception raised by the call
+    :type e: :class:`Exception`
+    :return: http status code, or None if the call did not receive a response
+    :rtype: int
+    """
+
+    seen = set()
+    while e is not None and id(e) not in seen:
+        seen.add(id(e))
+        code = getattr(e, "code", None)
+        if isinstance(code, int):
+            return code
+        e = e.__cause__ or e.__context__
+    return None
+
+
+def is_retryable_error(e):
+    """Returns whether a failed algod / indexer call should be retried. Throttling and server errors are
+    retried, as are connection errors which do not carry a status code.
+
+    :param e: exception raised by the call
+    :type e: :class:`Exception`
+    :return: whether the call should be retried
+    :rtype: bool
+    """
+
+    code = get_status_code(e)
+    if code is not None:
+        return code in RETRYABLE_STATUS_CODES
+    return isinstance(e, (OSError, ConnectionError))
+
+
+class TokenBucket():
+
+    def __init__(self, rate, burst=None):
+        """Constructor method for :class:`TokenBucket`
+
+        :param rate: number of tokens added per second
+        :type rate: float
+        :param burst: maximum number of tokens held, defaults to max(1, rate)
+        :type burst: float, optional
+        """
+
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self.tokens = self.burst
+        self.last_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token and returns the number of seconds to wait before it may be used
+
+        :return: seconds to wait
+        :rtype: float
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_time) * self.rate)
+            self.last_time = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Blocks until a token is available
+        """
+
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class InFlightRequest():
+
+    def __init__(self):
+        """Constructor method for :class:`InFlightRequest`, the shared result of coalesced requests
+        """
+
+        self.event = threading.Event()
+        self.response = None
+        self.error = None
+
+    def get(self):
+        """Waits for the request to complete and returns its response or raises its error
+
+        :return: response of the request
+        :rtype: dict
+        """
+
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+class RequestScheduler():
+
+    def __init__(self, rate_limits=None, default_rate_limit=None, max_retries=3, backoff_base=0.1, backoff_max=5.0,
+                 coalesce=True, retry_on=is_retryable_error):
+        """Constructor method for :class:`RequestScheduler`, which enforces token bucket rate limits on algod / indexer
+        calls, merges concurrent identical read calls into one in-flight request and retries throttled or failed
+        reads with jittered exponential backoff.
+
+        Rate limits are given as (rate per second, burst) tuples keyed by client name (e.g. "algod") and / or
+        "client.endpoint" (e.g. "indexer.accounts"). A call takes a token from every bucket that matches it.
+
+        :param rate_limits: dict of key -> (rate, burst)
+        :type rate_limits: dict, optional
+        :param default_rate_limit: (rate, burst) applied to clients with no client level limit
+        :type default_rate_limit: tuple, optional
+        :param max_retries: maximum number of retries of a read call
+        :type max_retries: int, optional
+        :param backoff_base: base backoff in seconds, doubled for every retry
+        :type backoff_base: float, optional
+        :param backoff_max: maximum backoff in seconds
+        :type backoff_max: float, optional
+        :param coalesce: whether concurrent identical read calls are merged
+        :type coalesce: bool, optional
+        :param retry_on: function taking an exception and returning whether to retry
+        :type retry_on: function, optional
+        """
+
+        self.rate_limits = dict(rate_limits) if rate_limits else {}
+        self.default_rate_limit = default_rate_limit
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.coalesce = coalesce
+        self.retry_on = retry_on
+        self.buckets = {}
+        self.endpoint_buckets = {}
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.requests_sent = 0
+        self.requests_coalesced = 0
+        self.retries = 0
+
+    def _get_buckets(self, client_name, endpoint):
+        key = (client_name, endpoint)
+        buckets = self.endpoint_buckets.get(key, None)
+        if buckets is not None:
+            return buckets
+        with self.lock:
+            buckets = []
+            for bucket_key in (client_name + "." + endpoint, client_name):
+                limit = self.rate_limits.get(bucket_key, None)
+                if limit is None and bucket_key == client_name:
+                    limit = self.default_rate_limit
+                if limit is not None:
+                    if bucket_key not in self.buckets:
+                        self.buckets[bucket_key] = TokenBucket(*limit)
+                    buckets.append(self.buckets[bucket_key])
+            self.endpoint_buckets[key] = buckets
+            return buckets
+
+    def get_backoff(self, attempt):
+        """Returns the backoff before the given retry attempt, with full jitter
+
+        :param attempt: retry attempt, starting at 0
+        :type attempt: int
+        :return: backoff in seconds
+        :rtype: float
+        """
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _send(self, client_name, endpoint, function, args, kwargs, idempotent):
+        buckets = self._get_buckets(client_name, endpoint)
+        attempt = 0
+        while True:
+            for bucket in buckets:
+                bucket.acquire()
+            with self.lock:
+                self.requests_sent += 1
+            try:
+                return function(*args, **kwargs)
+            except Exception as e:
+                if not idempotent or attempt >= self.max_retries or not self.retry_on(e):
+                    raise
+            time.sleep(self.get_backoff(attempt))
+            attempt += 1
+            with self.lock:
+                self.retries += 1
+
+    def call(self, client_name, endpoint, function, args, kwargs):
+        """Executes a client call subject to the rate limits, coalescing and retries
+
+        :param client_name: name of the client (e.g. "algod")
+        :type client_name: str
+        :param endpoint: name of the client method
+        :type endpoint: str
+        :param function: bound client method
+        :type function: function
+        :param args: positional arguments of the call
+        :type args: tuple
+        :param kwargs: keyword arguments of the call
+        :type kwargs: dict
+        :return: response of the call. Coalesced callers receive the same response object and must not mutate it.
+        :rtype: dict
+        """
+
+        idempotent = endpoint not in NON_IDEMPOTENT_METHODS
+        if not (idempotent and self.coalesce):
+            return self._send(client_name, endpoint, function, args, kwargs, idempotent)
+
+        try:
+            key = (client_name, endpoint, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return self._send(client_name, endpoint, function, args, kwargs, idempotent)
+
+        with self.lock:
+            request = self.in_flight.get(key, None)
+            if request is not None:
+                self.requests_coalesced += 1
+                is_leader = False
+            else:
+                request = InFlightRequest()
+                self.in_flight[key] = request
+                is_leader = True
+
+        if not is_leader:
+            return request.get()
+
+        try:
+            request.response = self._send(client_name, endpoint, function, args, kwargs, idempotent)
+        except Exception as e:
+            request.error = e
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+            request.event.set()
+        return request.get()
+
+
+class ScheduledClient():
+
+    def __init__(self, client, scheduler, name):
+        """Constructor method for :class:`ScheduledClient`, a proxy around an :class:`AlgodClient` or
+        :class:`IndexerClient` which routes every method call through a :class:`RequestScheduler`
+
+        :param client: client to wrap
+        :type client: :class:`AlgodClient` or :class:`IndexerClient`
+        :param scheduler: request scheduler
+        :type scheduler: :class:`RequestScheduler`
+        :param name: name of the client used to look up rate limits (e.g. "algod")
+        :type name: str
+        """
+
+        self.__dict__["_client"] = client
+        self.__dict__["_scheduler"] = scheduler
+        self.__dict__["_name"] = name
+
+    @property
+    def wrapped_client(self):
+        """Returns the wrapped client
+
+        :return: wrapped client
+        :rtype: :class:`AlgodClient` or :class:`IndexerClient`
+        """
+
+        return self._client
+
+    def __getattr__(self, attr):
+        value = getattr(self._client, attr)
+        if not callable(value) or attr.startswith("_") or attr.endswith("_request"):
+            return value
+
+        scheduler = self._scheduler
+        name = self._name
+
+        def scheduled(*args, **kwargs):
+            return scheduler.call(name, attr, value, args, kwargs)
+
+        return scheduled
+
+    def __setattr__(self, attr, value):
+        setattr(self._client, attr, value)
+
+
+def schedule(client, scheduler, name):
+    """Returns client wrapped in a :class:`ScheduledClient`. Returns client unchanged if it is None.
+
+    :param client: client to wrap
+    :type client: :class:`AlgodClient` or :class:`IndexerClient`
+    :param scheduler: request scheduler
+    :type scheduler: :class:`RequestScheduler`
+    :param name: name of the client used to look up rate limits (e.g. "algod")
+    :type name: str
+    :return: scheduled client
+    :rtype: :class:`ScheduledClient`
+    """
+
+    if client is None:
+        return None
+    return ScheduledClient(client, scheduler, name)
@@ -0,0 +1,385 @@
+import sys
+import time
+import json
+import threading
+from bisect import bisect_left
+
+# default latency histogram buckets (seconds)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# caller recorded for calls which do not originate from within the sdk
+EXTERNAL_CALLER = "external"
+
+SDK_MODULE_PREFIX = "algofi_amm."
+
+
+def get_payload_size(response):
+    """Returns the approximate size in bytes of an algod / indexer response
+
+    :param response: response returned by the client
+    :type response: dict or bytes or str
+    :return: size of the response in bytes
+    :rtype: int
+    """
+
+    if response is None:
+        return 0
+    if isinstance(response, (bytes, bytearray)):
+        return len(response)
+    if isinstance(response, str):
+        return len(response.encode("utf-8"))
+    try:
+        return len(json.dumps(response, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def get_sdk_caller(frame):
+    """Returns the name of the outermost sdk method on the stack above frame, i.e. the sdk entry point
+    that the user called. Returns "external" if the call did not originate from within the sdk.
+
+    :param frame: frame to start searching from
+    :type frame: :class:`frame`
+    :return: qualified name of calling sdk method
+    :rtype: str
+    """
+
+    caller = EXTERNAL_CALLER
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(SDK_MODULE_PREFIX) and module != __name__:
+            code = frame.f_code
+            owner = frame.f_locals.get("self", None)
+            if owner is not None:
+                caller = module + "." + type(owner).__name__ + "." + code.co_name
+            else:
+                caller = module + "." + code.co_name
+        frame = frame.f_back
+    return caller
+
+
+class EndpointStats():
+
+    def __init__(self, buckets):
+        """Constructor method for :class:`EndpointStats`, the aggregated statistics for a single
+        (client, endpoint, caller) key
+
+        :param buckets: upper bounds of the latency histogram buckets in seconds
+        :type buckets: tuple
+        """
+
+        self.buckets = buckets
+        self.bucket_counts = [0 for _ in range(len(buckets) + 1)]
+        self.count = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.payload_bytes = 0
+
+    def observe(self, latency, payload_size, is_error):
+        """Records a single call
+
+        :param latency: latency of the call in seconds
+        :type latency: float
+        :param payload_size: size of the response in bytes
+        :type payload_size: int
+        :param is_error: whether the call raised
+        :type is_error: bool
+        """
+
+        self.count += 1
+        self.latency_sum += latency
+        self.payload_bytes += payload_size
+        if is_error:
+            self.errors += 1
+        self.bucket_counts[bisect_left(self.buckets, latency)] += 1
+
+    def to_dict(self):
+        """Returns a dict representation of the statistics
+
+        :return: dict of call count, error count, latency sum, payload bytes and histogram
+        :rtype: dict
+        """
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "latency_sum": self.latency_sum,
+            "payload_bytes": self.payload_bytes,
+            "latency_histogram": dict(zip(list(self.buckets) + [float("inf")], self.bucket_counts)),
+        }
+
+
+class Telemetry():
+
+    def __init__(self, enabled=True, buckets=DEFAULT_LATENCY_BUCKETS, record_callers=True):
+        """Constructor method for :class:`Telemetry`, a collector of call counts, latency histograms
+        and payload sizes of algod / indexer calls made through :class:`InstrumentedClient` objects
+
+        :param enabled: whether calls are recorded, defaults to True
+        :type enabled: bool, optional
+        :param buckets: upper bounds of the latency histogram buckets in seconds
+        :type buckets: tuple, optional
+        :param record_callers: whether the calling sdk method is recorded for each call, defaults to True
+        :type record_callers: bool, optional
+        """
+
+        self.enabled = enabled
+        self.buckets = tuple(sorted(buckets))
+        self.record_callers = record_callers
+        self.callbacks = []
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def enable(self):
+        """Starts recording calls
+        """
+
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording calls. Instrumented clients then forward calls directly to the wrapped client.
+        """
+
+        self.enabled = False
+
+    def reset(self):
+        """Clears all recorded statistics
+        """
+
+        with self.lock:
+            self.stats = {}
+
+    def add_callback(self, callback):
+        """Registers a callback that is called after every recorded call with a dict containing
+        the keys client, endpoint, caller, latency, payload_size and error
+
+        :param callback: function taking a single dict argument
+        :type callback: function
+        """
+
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """Removes a previously registered callback
+
+        :param callback: callback to remove
+        :type callback: function
+        """
+
+        self.callbacks.remove(callback)
+
+    def record(self, client_name, endpoint, caller, latency, payload_size, error=None):
+        """Records a single call to an algod / indexer endpoint
+
+        :param client_name: name of the client (e.g. "algod", "indexer")
+        :type client_name: str
+        :param endpoint: name of the client method called
+        :type endpoint: str
+        :param caller: name of the calling sdk method
+        :type caller: str
+        :param latency: latency of the call in seconds
+        :type latency: float
+        :param payload_size: size of the response in bytes
+        :type payload_size: int
+        :param error: exception raised by the call, if any
+        :type error: :class:`Exception`, optional
+        """
+
+        key = (client_name, endpoint, caller)
+        with self.lock:
+            stats = self.stats.get(key, None)
+            if stats is None:
+                stats = EndpointStats(self.buckets)
+                self.stats[key] = stats
+            stats.observe(latency, payload_size, error is not None)
+
+        if self.callbacks:
+            event = {
+                "client": client_name,
+                "endpoint": endpoint,
+                "caller": caller,
+                "latency": latency,
+                "payload_size": payload_size,
+                "error": error,
+            }
+            for callback in self.callbacks:
+                callback(event)
+
+    def get_stats(self):
+        """Returns a snapshot of recorded statistics keyed by (client, endpoint, caller)
+
+        :return: dict of (client, endpoint, caller) -> dict of statistics
+        :rtype: dict
+        """
+
+        with self.lock:
+            return {key: stats.to_dict() for key, stats in self.stats.items()}
+
+    def get_call_counts(self, by_caller=False):
+        """Returns call counts aggregated by (client, endpoint) or by (client, endpoint, caller)
+
+        :param by_caller: whether to break down counts by calling sdk method
+        :type by_caller: bool, optional
+        :return: dict of key -> call count
+        :rtype: dict
+        """
+
+        counts = {}
+        with self.lock:
+            for (client_name, endpoint, caller), stats in self.stats.items():
+                key = (client_name, endpoint, caller) if by_caller else (client_name, endpoint)
+                counts[key] = counts.get(key, 0) + stats.count
+        return counts
+
+    def render_prometheus(self, prefix="algofi_amm"):
+        """Returns the recorded statistics in the prometheus text exposition format
+
+        :param prefix: metric name prefix
+        :type prefix: str, optional
+        :return: prometheus text exposition
+        :rtype: str
+        """
+
+        def labels(client_name, endpoint, caller, extra=""):
+            return '{client="%s",endpoint="%s",caller="%s"%s}' % (client_name, endpoint, caller, extra)
+
+        lines = [
+            "# HELP %s_requests_total Number of algod / indexer calls" % prefix,
+            "# TYPE %s_requests_total counter" % prefix,
+        ]
+        stats = self.get_stats()
+        for key, value in sorted(stats.items()):
+            lines.append("%s_requests_total%s %d" % (prefix, labels(*key), value["count"]))
+        lines.append("# HELP %s_request_errors_total Number of failed algod / indexer calls" % prefix)
+        lines.append("# TYPE %s_request_errors_total counter" % prefix)
+        for key, value in sorted(stats.items()):
+            lines.append("%s_request_errors_total%s %d" % (prefix, labels(*key), value["errors"]))
+        lines.append("# HELP %s_response_bytes_total Bytes received from algod / indexer calls" % prefix)
+        lines.append("# TYPE %s_response_bytes_total counter" % prefix)
+        for key, value in sorted(stats.items()):
+            lines.append("%s_response_bytes_total%s %d" % (prefix, labels(*key), value["payload_bytes"]))
+        lines.append("# HELP %s_request_latency_seconds Latency of algod / indexer calls" % prefix)
+        lines.append("# TYPE %s_request_latency_seconds histogram" % prefix)
+        for key, value in sorted(stats.items()):
+            cumulative = 0
+            for upper_bound, bucket_count in value["latency_histogram"].items():
+                cumulative += bucket_count
+                le = "+Inf" if upper_bound == float("inf") else repr(upper_bound)
+                lines.append("%s_request_latency_seconds_bucket%s %d" % (prefix, labels(*key, extra=',le="%s"' % le), cumulative))
+            lines.append("%s_request_latency_seconds_sum%s %f" % (prefix, labels(*key), value["latency_sum"]))
+            lines.append("%s_request_latency_seconds_count%s %d" % (prefix, labels(*key), value["count"]))
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedClient():
+
+    def __init__(self, client, telemetry, name):
+        """Constructor method for :class:`InstrumentedClient`, a proxy around an :class:`AlgodClient` or
+        :class:`IndexerClient` which records every method call to a :class:`Telemetry` collector.
+        When the collector is disabled, attribute lookups are forwarded directly to the wrapped client.
+
+        :param client: client to wrap
+        :type client: :class:`AlgodClient` or :class:`IndexerClient`
+        :param telemetry: telemetry collector
+        :type telemetry: :class:`Telemetry`
+        :param name: name of the client reported in the telemetry (e.g. "algod")
+        :type name: str
+        """
+
+        self.__dict__["_client"] = client
+        self.__dict__["_telemetry"] = telemetry
+        self.__dict__["_name"] = name
+
+    @property
+    def wrapped_client(self):
+        """Returns the wrapped client
+
+        :return: wrapped client
+        :rtype: :class:`AlgodClient` or :class:`IndexerClient`
+        """
+
+        return self._client
+
+    def __getattr__(self, attr):
+        value = getattr(self._client, attr)
+        telemetry = self._telemetry
+        if not telemetry.enabled or not callable(value) or attr.startswith("_"):
+            return value
+
+        name = self._name
+
+        def instrumented(*args, **kwargs):
+            caller = get_sdk_caller(sys._getframe(1)) if telemetry.record_callers else EXTERNAL_CALLER
+            start = time.perf_counter()
+            try:
+                response = value(*args, **kwargs)
+            except Exception as e:
+                telemetry.record(name, attr, caller, time.perf_counter() - start, 0, e)
+                raise
+            telemetry.record(name, attr, caller, time.perf_counter() - start, get_payload_size(response))
+            return response
+
+        return instrumented
+
+    def __setattr__(self, attr, value):
+        setattr(self._client, attr, value)
+
+
+def instrument(client, telemetry, name):
+    """Returns client wrapped in an :class:`InstrumentedClient`. Returns client unchanged if it is None
+    or already instrumented with the given telemetry collector.
+
+    :param client: client to wrap
+    :type client: :class:`AlgodClient` or :class:`IndexerClient`
+    :param telemetry: telemetry collector
+    :type telemetry: :class:`Telemetry`
+    :param name: name of the client reported in the telemetry (e.g. "algod")
+    :type name: str
+    :return: instrumented client
+    :rtype: :class:`InstrumentedClient`
+    """
+
+    if client is None:
+        return None
+    if isinstance(client, InstrumentedClient):
+        if client._telemetry is telemetry:
+            return client
+        client = client.wrapped_client
+    return InstrumentedClient(client, telemetry, name)
+
+
+def start_metrics_server(telemetry, host="127.0.0.1", port=9464):
+    """Starts a background http server exposing the telemetry in the prometheus text format at /metrics
+
+    :param telemetry: telemetry collector
+    :type telemetry: :class:`Telemetry`
+    :param host: host to bind to
+    :type host: str, optional
+    :param port: port to bind to
+    :type port: int, optional
+    :return: running http server, stop it with shutdown()
+    :rtype: :class:`ThreadingHTTPServer`
+    """
+
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = telemetry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
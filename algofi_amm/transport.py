@@ -0,0 +1,282 @@
+import json
+import socket
+import threading
+from collections import deque
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from urllib import parse
+from algosdk import constants, error
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+api_version_path_prefix = "/v2"
+
+# default maximum number of open connections per (scheme, host, port)
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+
+# default socket timeout in seconds
+DEFAULT_TIMEOUT = 30
+
+# errors raised when a kept-alive connection has been closed by the server
+STALE_CONNECTION_ERRORS = (HTTPException, ConnectionResetError, BrokenPipeError, ConnectionAbortedError)
+
+
+class ConnectionPool():
+
+    def __init__(self, max_connections_per_host=DEFAULT_MAX_CONNECTIONS_PER_HOST, timeout=DEFAULT_TIMEOUT):
+        """Constructor method for :class:`ConnectionPool`, a thread safe pool of keep-alive HTTP/1.1
+        connections shared between clients
+
+        :param max_connections_per_host: maximum number of open connections per host
+        :type max_connections_per_host: int, optional
+        :param timeout: socket timeout in seconds
+        :type timeout: float, optional
+        """
+
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.idle_connections = {}
+        self.host_semaphores = {}
+        self.lock = threading.Lock()
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    def _get_host_state(self, key):
+        with self.lock:
+            if key not in self.host_semaphores:
+                self.host_semaphores[key] = threading.BoundedSemaphore(self.max_connections_per_host)
+                self.idle_connections[key] = deque()
+            return self.host_semaphores[key], self.idle_connections[key]
+
+    def _new_connection(self, scheme, host, port):
+        with self.lock:
+            self.connections_opened += 1
+        if scheme == "https":
+            connection = HTTPSConnection(host, port, timeout=self.timeout)
+        else:
+            connection = HTTPConnection(host, port, timeout=self.timeout)
+        connection.connect()
+        # small requests are latency bound, do not wait to coalesce segments
+        connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection
+
+    def request(self, method, url, body=None, headers=None):
+        """Sends a request over a pooled connection and returns the response status and body.
+        Blocks while max_connections_per_host requests to the same host are in flight.
+
+        :param method: request method
+        :type method: str
+        :param url: absolute url of the request
+        :type url: str
+        :param body: request body
+        :type body: bytes, optional
+        :param headers: request headers
+        :type headers: dict, optional
+        :return: tuple of (status code, response body)
+        :rtype: tuple
+        """
+
+        split_url = parse.urlsplit(url)
+        scheme = split_url.scheme or "http"
+        host = split_url.hostname
+        port = split_url.port or (443 if scheme == "https" else 80)
+        path = split_url.path or "/"
+        if split_url.query:
+            path += "?" + split_url.query
+        key = (scheme, host, port)
+
+        semaphore, idle = self._get_host_state(key)
+        with semaphore:
+            try:
+                connection = idle.pop()
+                is_reused = True
+            except IndexError:
+                connection = self._new_connection(scheme, host, port)
+                is_reused = False
+
+            try:
+                response = self._send(connection, method, path, body, headers)
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                if not is_reused:
+                    raise
+                # kept-alive connection was closed by the server, retry once on a fresh connection
+                connection = self._new_connection(scheme, host, port)
+                is_reused = False
+                try:
+                    response = self._send(connection, method, path, body, headers)
+                except Exception:
+                    connection.close()
+                    raise
+            except Exception:
+                connection.close()
+                raise
+
+            status, will_close, data = response
+            if will_close:
+                connection.close()
+            else:
+                idle.append(connection)
+            if is_reused:
+                with self.lock:
+                    self.connections_reused += 1
+            return status, data
+
+    def _send(self, connection, method, path, body, headers):
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        data = response.read()
+        return response.status, response.will_close, data
+
+    def close(self):
+        """Closes all idle connections
+        """
+
+        with self.lock:
+            for idle in self.idle_connections.values():
+                while idle:
+                    idle.pop().close()
+
+
+def get_http_error_message(data):
+    """Returns the error message of an algod / indexer error response
+
+    :param data: body of the error response
+    :type data: bytes
+    :return: error message
+    :rtype: str
+    """
+
+    message = data.decode("utf-8")
+    try:
+        message = json.loads(message)["message"]
+    except (ValueError, KeyError, TypeError):
+        pass
+    return message
+
+
+class PooledAlgodClient(AlgodClient):
+
+    def __init__(self, algod_token, algod_address, headers=None, connection_pool=None):
+        """Constructor method for :class:`PooledAlgodClient`, an :class:`AlgodClient` which sends requests
+        over keep-alive connections from a :class:`ConnectionPool`
+
+        :param algod_token: algod API token
+        :type algod_token: str
+        :param algod_address: algod address
+        :type algod_address: str
+        :param headers: extra header name/value for all requests
+        :type headers: dict, optional
+        :param connection_pool: connection pool to use, a new pool is created if not specified
+        :type connection_pool: :class:`ConnectionPool`, optional
+        """
+
+        super().__init__(algod_token, algod_address, headers=headers)
+        self.connection_pool = connection_pool if connection_pool is not None else ConnectionPool()
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json"):
+        """Execute a given request over a pooled connection.
+
+        :param method: request method
+        :type method: str
+        :param requrl: url for the request
+        :type requrl: str
+        :param params: parameters for the request
+        :type params: dict, optional
+        :param data: data in the body of the request
+        :type data: bytes, optional
+        :param headers: additional header for request
+        :type headers: dict, optional
+        :param response_format: "json" or "msgpack"
+        :type response_format: str, optional
+        :return: loaded from json response body, or raw response body
+        :rtype: dict or bytes
+        """
+
+        header = {}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header.update({constants.algod_auth_header: self.algod_token})
+
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        status, body = self.connection_pool.request(method, self.algod_address + requrl, body=data, headers=header)
+        if status >= 400:
+            raise error.AlgodHTTPError(get_http_error_message(body), status)
+        if response_format == "json":
+            try:
+                return json.loads(body)
+            except Exception as e:
+                raise error.AlgodResponseError("Failed to parse JSON response from algod") from e
+        return body
+
+
+class PooledIndexerClient(IndexerClient):
+
+    def __init__(self, indexer_token, indexer_address, headers=None, connection_pool=None):
+        """Constructor method for :class:`PooledIndexerClient`, an :class:`IndexerClient` which sends requests
+        over keep-alive connections from a :class:`ConnectionPool`
+
+        :param indexer_token: indexer API token
+        :type indexer_token: str
+        :param indexer_address: indexer address
+        :type indexer_address: str
+        :param headers: extra header name/value for all requests
+        :type headers: dict, optional
+        :param connection_pool: connection pool to use, a new pool is created if not specified
+        :type connection_pool: :class:`ConnectionPool`, optional
+        """
+
+        super().__init__(indexer_token, indexer_address, headers=headers)
+        self.connection_pool = connection_pool if connection_pool is not None else ConnectionPool()
+
+    def indexer_request(self, method, requrl, params=None, data=None, headers=None):
+        """Execute a given request over a pooled connection.
+
+        :param method: request method
+        :type method: str
+        :param requrl: url for the request
+        :type requrl: str
+        :param params: parameters for the request
+        :type params: dict, optional
+        :param data: data in the body of the request
+        :type data: bytes, optional
+        :param headers: additional header for request
+        :type headers: dict, optional
+        :return: loaded from json response body
+        :rtype: dict
+        """
+
+        header = {}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if (requrl not in constants.no_auth) and self.indexer_token:
+            header.update({constants.indexer_auth_header: self.indexer_token})
+
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        status, body = self.connection_pool.request(method, self.indexer_address + requrl, body=data, headers=header)
+        if status >= 400:
+            http_error = error.IndexerHTTPError(get_http_error_message(body))
+            # IndexerHTTPError has no code argument, the status is attached for retry classification
+            http_error.code = status
+            raise http_error
+        response_dict = json.loads(body.decode("utf-8"))
+
+        def recursively_sort_dict(dictionary):
+            return {
+                k: recursively_sort_dict(v) if isinstance(v, dict) else v
+                for k, v in sorted(dictionary.items())
+            }
+
+        return recursively_sort_dict(response_dict)
@@ -2,9 +2,13 @@ import time
 from algosdk.future.transaction import PaymentTxn, AssetTransferTxn, assign_group_id, LogicSigTransaction
 from algosdk.error import AlgodHTTPError
 from base64 import b64decode
+from .confirmation import get_shared_poller
+from .profiling import profile_phase, profile_confirmation, attach_pending_phases
 
 # constants
 PARAMETER_SCALE_FACTOR = 1000000
+# maximum number of transactions in an atomic group
+MAX_GROUP_SIZE = 16
 
 def int_to_bytes(i):
     """Convert int to bytes
@@ -76,7 +80,19 @@ def get_application_global_state(algod_client, application_id):
     """
 
     application_info = algod_client.application_info(application_id)
-    application_global_state = application_info["params"]["global-state"]
+    return format_global_state(application_info["params"]["global-state"])
+
+
+def format_global_state(application_global_state):
+    """Returns dictionary of global state from the "global-state" field of an application, as returned by
+    application_info or in the "created-apps" of account_info
+
+    :param application_global_state: list of encoded key value pairs
+    :type application_global_state: list
+    :return: dictionary of global state
+    :rtype: dict
+    """
+
     formatted_global_state = {}
     for keyvalue in application_global_state:
         key, value = keyvalue["key"], keyvalue["value"]
@@ -160,7 +176,8 @@ def get_params(algod_client, fee=1000, flat_fee=True):
     :rtype: :class:`SuggestedParams`
     """
 
-    params = algod_client.suggested_params()
+    with profile_phase("params"):
+        params = algod_client.suggested_params()
     params.fee = fee
     params.flat_fee = flat_fee
 
@@ -213,6 +230,10 @@ class TransactionGroup:
         transactions = assign_group_id(transactions)
         self.transactions = transactions
         self.signed_transactions = [None for _ in self.transactions]
+        # phase -> seconds spent in the phase, recorded while profiling is enabled
+        self.phase_timings = {}
+        self.trace_id = None
+        attach_pending_phases(self)
 
     def sign_with_private_key(self, address, private_key):
         """Signs the transactions with specified private key and saves to class state
@@ -222,8 +243,9 @@ class TransactionGroup:
         :param private_key: private key of user
         :type private_key: string
         """
-        for i, txn in enumerate(self.transactions):
-            self.signed_transactions[i] = txn.sign(private_key)
+        with profile_phase("sign", self):
+            for i, txn in enumerate(self.transactions):
+                self.signed_transactions[i] = txn.sign(private_key)
     
     def sign_with_private_keys(self, private_keys, is_logic_sig):
         """Signs the transactions with specified private key and saves to class state
@@ -235,11 +257,12 @@ class TransactionGroup:
         """
         assert(len(private_keys) == len(self.transactions))
         assert(len(private_keys) == len(is_logic_sig))
-        for i, txn in enumerate(self.transactions):
-            if is_logic_sig[i]:
-                self.signed_transactions[i] = LogicSigTransaction(txn, private_keys[i])
-            else:
-                self.signed_transactions[i] = txn.sign(private_keys[i])
+        with profile_phase("sign", self):
+            for i, txn in enumerate(self.transactions):
+                if is_logic_sig[i]:
+                    self.signed_transactions[i] = LogicSigTransaction(txn, private_keys[i])
+                else:
+                    self.signed_transactions[i] = txn.sign(private_keys[i])
         
     def submit(self, algod, wait=False):
         """Submits the signed transactions to network using the algod client
@@ -251,14 +274,38 @@ class TransactionGroup:
         :return: dict of transaction id
         :rtype: dict
         """
-        try:
-            txid = algod.send_transactions(self.signed_transactions)
-        except AlgodHTTPError as e:
-            raise Exception(str(e))
+        with profile_phase("submit", self):
+            try:
+                txid = algod.send_transactions(self.signed_transactions)
+            except AlgodHTTPError as e:
+                raise Exception(str(e))
         if wait:
-            return wait_for_confirmation(algod, txid)
+            with profile_phase("confirm", self):
+                return wait_for_confirmation(algod, txid)
         return {"txid": txid}
 
+    def submit_async(self, algod, poller=None):
+        """Submits the signed transactions to network using the algod client without waiting for confirmation.
+        The confirmation is tracked by a :class:`ConfirmationPoller` shared by all groups submitted with the same
+        poller, by default one per algod client.
+
+        :param algod: algod client
+        :type algod: :class:`AlgodClient`
+        :param poller: confirmation poller, defaults to the shared poller of algod
+        :type poller: :class:`ConfirmationPoller`, optional
+        :return: future resolving to a dict of txid -> confirmed transaction information
+        :rtype: :class:`GroupFuture`
+        """
+        if poller is None:
+            poller = get_shared_poller(algod)
+        with profile_phase("submit", self):
+            try:
+                future = poller.submit(self)
+            except AlgodHTTPError as e:
+                raise Exception(str(e))
+        profile_confirmation(self, future)
+        return future
+
     def __add__(self, transaction_group):
         """Combines two transaction groups together in order
 
@@ -273,4 +320,7 @@ class TransactionGroup:
         for i in range(len(aggregate_transactions)):
             aggregate_transactions[i].group = None
         new_transaction_group = TransactionGroup(aggregate_transactions)
+        for transaction_group in (self, transaction_group):
+            for phase, duration in transaction_group.phase_timings.items():
+                new_transaction_group.phase_timings[phase] = new_transaction_group.phase_timings.get(phase, 0.0) + duration
         return new_transaction_group
\ No newline at end of file
@@ -0,0 +1,205 @@
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .pool import Pool
+
+# default number of concurrent account_info requests of a bulk fetch
+DEFAULT_MAX_WORKERS = 16
+
+# default maximum age in seconds of a cached account, about one round
+DEFAULT_ACCOUNT_CACHE_MAX_AGE = 4.0
+
+# the memoized burn quote is bypassed so that valuing many accounts does not evict the pools' cached quotes
+get_burn_quote = getattr(Pool.get_burn_quote, "__wrapped__", Pool.get_burn_quote)
+
+
+class AccountCache():
+
+    def __init__(self, max_age=DEFAULT_ACCOUNT_CACHE_MAX_AGE):
+        """Constructor method for :class:`AccountCache`, a per-round cache of account_info responses. All entries
+        are dropped once a response of a newer round is stored, and entries expire after max_age seconds so that
+        a cache which sees no newer responses does not serve past rounds.
+
+        :param max_age: maximum age in seconds of a cached account
+        :type max_age: float, optional
+        """
+
+        self.max_age = max_age
+        self.round = 0
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, address):
+        """Returns the cached account_info response of address, or None if not cached or expired
+
+        :param address: account address
+        :type address: str
+        :return: account_info response
+        :rtype: dict
+        """
+
+        with self.lock:
+            entry = self.entries.get(address, None)
+            if entry is None or time.monotonic() - entry[1] > self.max_age:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def put(self, address, account_info):
+        """Caches an account_info response. Responses of rounds older than the cache round are not cached.
+
+        :param address: account address
+        :type address: str
+        :param account_info: account_info response
+        :type account_info: dict
+        """
+
+        round_num = account_info.get("round", 0)
+        with self.lock:
+            if round_num > self.round:
+                self.entries.clear()
+                self.round = round_num
+            elif round_num < self.round:
+                return
+            self.entries[address] = (account_info, time.monotonic())
+
+    def clear(self):
+        """Removes all cached accounts. Hit and miss counters are kept.
+        """
+
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self):
+        """Returns the hit / miss counters, round and size of the cache
+
+        :return: dict with keys hits, misses, round and size
+        :rtype: dict
+        """
+
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "round": self.round, "size": len(self.entries)}
+
+
+class AccountSummary():
+
+    def __init__(self, account_info, pools=None):
+        """Constructor method for :class:`AccountSummary`, the balances, opt ins and lp positions of one account
+
+        :param account_info: account_info response
+        :type account_info: dict
+        :param pools: pools whose lp tokens are valued against the cached pool states
+        :type pools: list, optional
+        """
+
+        self.address = account_info["address"]
+        self.round = account_info.get("round", None)
+        self.balances = {asset["asset-id"]: asset["amount"] for asset in account_info.get("assets", [])}
+        self.opted_in_assets = set(self.balances)
+        self.balances[1] = account_info["amount"]
+        self.opted_in_apps = set(app["id"] for app in account_info.get("apps-local-state", []))
+
+        # lp positions by pool application id, valued with burn quotes
+        self.lp_positions = {}
+        self.lp_pools = {}
+        for pool in (pools or []):
+            lp_amount = self.balances.get(pool.lp_asset_id, 0)
+            if lp_amount and pool.lp_circulation:
+                self.lp_positions[pool.application_id] = get_burn_quote(pool, min(lp_amount, pool.lp_circulation))
+                self.lp_pools[pool.application_id] = pool
+
+    def get_balance(self, asset_id):
+        """Returns the balance of the account in the asset with given asset id
+
+        :param asset_id: asset id
+        :type asset_id: int
+        :return: amount of asset
+        :rtype: int
+        """
+
+        return self.balances.get(asset_id, 0)
+
+    def is_opted_into_asset(self, asset_id):
+        """Returns whether the account is opted into the asset with given asset id
+
+        :param asset_id: asset id
+        :type asset_id: int
+        :return: whether the account is opted into the asset
+        :rtype: bool
+        """
+
+        return asset_id == 1 or asset_id in self.opted_in_assets
+
+    def is_opted_into_app(self, app_id):
+        """Returns whether the account is opted into the application with given app id
+
+        :param app_id: application id
+        :type app_id: int
+        :return: whether the account is opted into the application
+        :rtype: bool
+        """
+
+        return app_id in self.opted_in_apps
+
+    def get_lp_underlying_balances(self):
+        """Returns the amounts of the underlying assets claimed by the lp positions of the account
+
+        :return: dict of asset id -> amount
+        :rtype: dict
+        """
+
+        underlying = {}
+        for app_id, quote in self.lp_positions.items():
+            pool = self.lp_pools[app_id]
+            underlying[pool.asset1.asset_id] = underlying.get(pool.asset1.asset_id, 0) + quote.asset1_delta
+            underlying[pool.asset2.asset_id] = underlying.get(pool.asset2.asset_id, 0) + quote.asset2_delta
+        return underlying
+
+
+def get_account_infos(algod_client, addresses, max_workers=DEFAULT_MAX_WORKERS, account_cache=None):
+    """Fetches the account_info responses of many addresses concurrently. Duplicate addresses are fetched once
+    and cached accounts are not fetched.
+
+    :param algod_client: a :class:`AlgodClient` object for interacting with the network
+    :type algod_client: :class:`AlgodClient`
+    :param addresses: account addresses
+    :type addresses: list
+    :param max_workers: maximum number of concurrent requests
+    :type max_workers: int, optional
+    :param account_cache: cache read before and filled after fetching
+    :type account_cache: :class:`AccountCache`, optional
+    :return: dict of address -> account_info response
+    :rtype: dict
+    """
+
+    account_infos = {}
+    missing = []
+    seen = set()
+    for address in addresses:
+        if address in seen:
+            continue
+        seen.add(address)
+        account_info = account_cache.get(address) if account_cache is not None else None
+        if account_info is not None:
+            account_infos[address] = account_info
+        else:
+            missing.append(address)
+
+    if len(missing) == 1 or max_workers <= 1:
+        fetched = [algod_client.account_info(address) for address in missing]
+    elif missing:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+            fetched = list(executor.map(algod_client.account_info, missing))
+    else:
+        fetched = []
+
+    for address, account_info in zip(missing, fetched):
+        account_infos[address] = account_info
+        if account_cache is not None:
+            account_cache.put(address, account_info)
+
+    return account_infos
@@ -1,9 +1,227 @@
-TESTNET_APPROVAL_PROGRAM_30BP_CONSTANT_PRODUCT = [5, 32, 10, 1, 0, 2, 192, 132, 61, 6, 159, 237, 188, 31, 128, 148, 235, 220, 3, 4, 255, 255, 255, 255, 255, 255, 255, 255, 255, 1, 184, 23, 38, 33, 2, 98, 49, 2, 98, 50, 2, 97, 49, 2, 97, 50, 2, 108, 99, 2, 114, 102, 3, 97, 49, 114, 3, 97, 50, 114, 4, 109, 102, 108, 114, 1, 97, 3, 102, 108, 102, 3, 99, 117, 116, 3, 99, 117, 100, 3, 99, 102, 49, 3, 99, 102, 50, 1, 105, 1, 108, 2, 108, 116, 3, 115, 102, 101, 4, 99, 116, 49, 50, 4, 99, 116, 50, 49, 3, 99, 118, 49, 3, 99, 118, 50, 4, 99, 118, 49, 50, 4, 99, 118, 50, 49, 1, 112, 8, 65, 70, 45, 80, 79, 79, 76, 45, 1, 45, 5, 114, 112, 97, 49, 114, 5, 114, 112, 97, 50, 114, 4, 98, 97, 49, 111, 4, 98, 97, 50, 111, 3, 114, 115, 114, 49, 24, 35, 18, 64, 12, 164, 49, 25, 129, 5, 18, 64, 12, 152, 49, 25, 34, 18, 64, 12, 141, 49, 25, 36, 18, 64, 12, 130, 39, 15, 100, 34, 18, 64, 1, 78, 54, 26, 0, 128, 2, 105, 112, 18, 64, 0, 1, 0, 39, 15, 100, 20, 68, 42, 100, 34, 13, 64, 1, 46, 43, 100, 34, 13, 64, 1, 31, 42, 100, 34, 18, 64, 0, 249, 42, 100, 113, 3, 53, 45, 53, 46, 43, 100, 113, 3, 53, 47, 53, 48, 52, 45, 68, 52, 47, 68, 39, 26, 52, 46, 39, 27, 52, 48, 80, 80, 80, 53, 27, 177, 129, 3, 178, 16, 52, 27, 178, 38, 128, 7, 65, 70, 45, 80, 79, 79, 76, 178, 37, 33, 8, 178, 34, 33, 4, 178, 35, 128, 18, 104, 116, 116, 112, 115, 58, 47, 47, 97, 108, 103, 111, 102, 105, 46, 111, 114, 103, 178, 39, 50, 10, 178, 41, 50, 10, 178, 42, 179, 39, 16, 180, 60, 103, 33, 5, 39, 5, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 37, 14, 68, 39, 5, 52, 38, 103, 33, 5, 39, 10, 101, 53, 41, 53, 42, 52, 41, 68, 52, 42, 37, 14, 68, 39, 10, 52, 42, 103, 33, 5, 39, 8, 101, 53, 43, 53, 44, 52, 43, 68, 52, 44, 37, 14, 68, 39, 8, 52, 44, 103, 39, 11, 35, 103, 33, 5, 39, 12, 101, 53, 39, 53, 40, 52, 39, 68, 39, 12, 52, 40, 103, 39, 17, 50, 7, 103, 40, 35, 103, 41, 35, 103, 39, 4, 35, 103, 39, 6, 35, 103, 39, 7, 35, 103, 39, 19, 35, 103, 39, 20, 35, 103, 39, 21, 35, 103, 39, 22, 35, 103, 39, 23, 35, 103, 39, 24, 35, 103, 39, 13, 35, 103, 39, 14, 35, 103, 39, 15, 34, 103, 34, 66, 11, 161, 43, 100, 113, 3, 53, 47, 53, 48, 52, 47, 68, 39, 26, 128, 4, 65, 76, 71, 79, 39, 27, 52, 48, 80, 80, 80, 53, 27, 66, 255, 11, 43, 100, 136, 11, 156, 66, 254, 217, 42, 100, 136, 11, 148, 66, 254, 202, 49, 0, 39, 9, 100, 18, 64, 10, 128, 49, 25, 35, 18, 64, 0, 1, 0, 54, 26, 0, 128, 5, 100, 117, 109, 109, 121, 18, 64, 10, 102, 54, 26, 0, 39, 25, 18, 64, 7, 251, 54, 26, 0, 39, 28, 18, 64, 7, 125, 54, 26, 0, 39, 29, 18, 64, 6, 255, 54, 26, 0, 39, 30, 18, 64, 6, 70, 54, 26, 0, 39, 31, 18, 64, 5, 143, 54, 26, 0, 39, 18, 18, 54, 26, 0, 128, 3, 115, 101, 102, 18, 17, 64, 2, 78, 54, 26, 0, 39, 32, 18, 64, 1, 203, 54, 26, 0, 128, 2, 102, 108, 18, 64, 0, 1, 0, 33, 5, 39, 5, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 37, 14, 68, 39, 5, 52, 38, 103, 33, 5, 39, 10, 101, 53, 41, 53, 42, 52, 41, 68, 52, 42, 37, 14, 68, 39, 10, 52, 42, 103, 33, 5, 39, 8, 101, 53, 43, 53, 44, 52, 43, 68, 52, 44, 37, 14, 68, 39, 8, 52, 44, 103, 54, 26, 2, 23, 39, 10, 100, 29, 35, 37, 31, 72, 72, 76, 20, 68, 34, 8, 53, 22, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 49, 22, 35, 18, 68, 54, 26, 1, 23, 42, 100, 18, 54, 26, 1, 23, 43, 100, 18, 17, 68, 54, 26, 2, 23, 35, 13, 68, 54, 26, 1, 23, 42, 100, 18, 64, 1, 33, 54, 26, 2, 23, 41, 100, 39, 8, 100, 29, 35, 37, 31, 72, 72, 76, 20, 68, 14, 68, 54, 26, 1, 23, 34, 18, 64, 0, 214, 50, 4, 34, 9, 56, 16, 33, 7, 18, 68, 50, 4, 34, 9, 56, 17, 54, 26, 1, 23, 18, 68, 50, 4, 34, 9, 56, 20, 50, 10, 18, 68, 50, 4, 34, 9, 56, 18, 35, 13, 68, 50, 4, 34, 9, 56, 18, 54, 26, 2, 23, 52, 22, 8, 18, 68, 54, 26, 1, 23, 42, 100, 18, 64, 0, 119, 43, 100, 54, 26, 2, 23, 136, 10, 69, 54, 26, 1, 23, 42, 100, 18, 64, 0, 90, 41, 41, 100, 52, 22, 8, 103, 52, 22, 39, 5, 100, 29, 35, 37, 31, 72, 72, 76, 20, 68, 53, 23, 54, 26, 1, 23, 42, 100, 18, 64, 0, 38, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 40, 100, 41, 100, 10, 33, 6, 12, 68, 41, 100, 40, 100, 10, 33, 6, 12, 68, 34, 66, 9, 190, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 66, 255, 215, 40, 40, 100, 52, 22, 8, 103, 66, 255, 163, 42, 100, 34, 18, 64, 0, 12, 42, 100, 54, 26, 2, 23, 136, 9, 199, 66, 255, 127, 54, 26, 2, 23, 136, 9, 215, 66, 255, 117, 50, 4, 34, 9, 56, 16, 34, 18, 68, 50, 4, 34, 9, 56, 7, 50, 10, 18, 68, 50, 4, 34, 9, 56, 8, 35, 13, 68, 50, 4, 34, 9, 56, 8, 54, 26, 2, 23, 52, 22, 8, 18, 68, 66, 255, 52, 54, 26, 2, 23, 40, 100, 39, 8, 100, 29, 35, 37, 31, 72, 72, 76, 20, 68, 14, 68, 66, 254, 220, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 33, 4, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 18, 18, 68, 49, 22, 34, 9, 59, 14, 35, 13, 64, 0, 4, 34, 66, 8, 253, 49, 22, 34, 9, 59, 8, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 14, 136, 9, 31, 66, 255, 229, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 14, 136, 9, 10, 66, 255, 208, 49, 22, 34, 9, 59, 14, 136, 9, 24, 66, 255, 196, 50, 7, 39, 17, 100, 9, 53, 24, 39, 17, 50, 7, 103, 41, 100, 33, 6, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 25, 40, 100, 33, 6, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 26, 33, 8, 52, 25, 10, 52, 24, 13, 64, 2, 229, 33, 8, 52, 26, 10, 52, 24, 13, 64, 2, 201, 33, 5, 39, 5, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 37, 14, 68, 39, 5, 52, 38, 103, 49, 22, 34, 9, 56, 16, 34, 18, 64, 2, 121, 49, 22, 34, 9, 56, 17, 42, 100, 18, 49, 22, 34, 9, 56, 17, 43, 100, 18, 17, 68, 49, 22, 34, 9, 56, 16, 33, 7, 18, 68, 49, 22, 34, 9, 56, 17, 49, 22, 34, 9, 56, 17, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 9, 49, 22, 34, 9, 56, 17, 42, 100, 18, 64, 2, 34, 35, 53, 8, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 54, 26, 0, 39, 18, 18, 64, 1, 224, 54, 26, 0, 39, 18, 18, 64, 1, 3, 52, 9, 33, 9, 29, 35, 37, 31, 72, 72, 76, 20, 68, 34, 8, 53, 3, 52, 9, 52, 3, 9, 53, 10, 52, 10, 35, 13, 68, 52, 8, 64, 0, 164, 40, 100, 52, 10, 29, 35, 41, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 2, 9, 103, 41, 41, 100, 52, 9, 8, 103, 42, 100, 34, 18, 64, 0, 116, 42, 100, 52, 2, 136, 7, 211, 52, 2, 52, 10, 136, 8, 3, 39, 14, 39, 14, 100, 52, 3, 136, 7, 141, 103, 52, 2, 35, 13, 68, 52, 2, 54, 26, 1, 23, 15, 68, 52, 3, 39, 5, 100, 29, 35, 37, 31, 72, 72, 76, 20, 68, 53, 23, 52, 8, 64, 0, 38, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 40, 100, 41, 100, 10, 33, 6, 12, 68, 41, 100, 40, 100, 10, 33, 6, 12, 68, 34, 66, 7, 67, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 66, 255, 215, 52, 2, 136, 7, 123, 66, 255, 139, 41, 100, 52, 10, 29, 35, 40, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 9, 8, 103, 41, 41, 100, 52, 2, 9, 103, 43, 100, 52, 2, 136, 7, 54, 52, 10, 52, 2, 136, 7, 102, 39, 13, 39, 13, 100, 52, 3, 136, 6, 240, 103, 66, 255, 96, 54, 26, 1, 23, 53, 11, 52, 11, 35, 13, 68, 52, 8, 64, 0, 172, 41, 100, 52, 11, 29, 35, 40, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 52, 12, 35, 13, 68, 52, 12, 37, 29, 35, 37, 33, 9, 9, 31, 72, 72, 76, 20, 68, 34, 8, 52, 12, 9, 53, 3, 52, 12, 52, 3, 8, 53, 13, 52, 9, 52, 13, 15, 68, 52, 8, 64, 0, 64, 40, 40, 100, 52, 11, 9, 103, 41, 41, 100, 52, 13, 8, 103, 42, 100, 34, 18, 64, 0, 35, 42, 100, 52, 11, 136, 6, 179, 52, 11, 52, 12, 136, 6, 227, 39, 14, 39, 14, 100, 52, 3, 136, 6, 109, 103, 52, 9, 52, 13, 9, 53, 14, 66, 254, 227, 52, 11, 136, 6, 172, 66, 255, 220, 40, 40, 100, 52, 13, 8, 103, 41, 41, 100, 52, 11, 9, 103, 43, 100, 52, 11, 136, 6, 122, 52, 12, 52, 11, 136, 6, 170, 39, 13, 39, 13, 100, 52, 3, 136, 6, 52, 103, 66, 255, 196, 40, 100, 52, 11, 29, 35, 41, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 66, 255, 81, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 33, 4, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 32, 18, 68, 66, 253, 245, 34, 66, 253, 219, 42, 100, 34, 18, 68, 49, 22, 34, 9, 56, 16, 34, 18, 68, 49, 22, 34, 9, 56, 7, 50, 10, 18, 68, 49, 22, 34, 9, 56, 8, 35, 13, 68, 49, 22, 34, 9, 56, 8, 53, 9, 34, 53, 8, 66, 253, 174, 39, 20, 39, 20, 100, 52, 26, 52, 24, 11, 136, 5, 173, 103, 66, 253, 38, 39, 19, 39, 19, 100, 52, 25, 52, 24, 11, 136, 5, 156, 103, 66, 253, 10, 49, 22, 36, 9, 56, 16, 33, 7, 18, 68, 49, 22, 36, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 33, 4, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 30, 18, 68, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 49, 22, 36, 9, 56, 18, 39, 4, 100, 18, 64, 0, 63, 49, 22, 36, 9, 56, 18, 41, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 7, 52, 7, 35, 13, 68, 52, 7, 41, 100, 14, 68, 41, 41, 100, 52, 7, 9, 103, 39, 4, 39, 4, 100, 49, 22, 36, 9, 56, 18, 9, 103, 43, 100, 52, 7, 136, 5, 42, 34, 66, 4, 240, 41, 100, 53, 7, 66, 255, 207, 49, 22, 34, 9, 56, 16, 33, 7, 18, 68, 49, 22, 34, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 33, 4, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 31, 18, 68, 49, 22, 34, 9, 56, 18, 39, 4, 100, 18, 64, 0, 65, 49, 22, 34, 9, 56, 18, 40, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 6, 52, 6, 35, 13, 68, 52, 6, 40, 100, 14, 68, 40, 40, 100, 52, 6, 9, 103, 42, 100, 34, 18, 64, 0, 11, 42, 100, 52, 6, 136, 4, 130, 34, 66, 4, 72, 52, 6, 136, 4, 147, 66, 255, 244, 40, 100, 53, 6, 66, 255, 205, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 49, 22, 36, 9, 56, 25, 35, 18, 68, 49, 22, 36, 9, 56, 16, 33, 4, 18, 68, 49, 22, 36, 9, 56, 24, 50, 8, 18, 68, 49, 22, 36, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 36, 9, 59, 20, 35, 13, 64, 0, 4, 34, 66, 3, 247, 35, 64, 0, 14, 43, 100, 49, 22, 36, 9, 59, 20, 136, 4, 30, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 36, 9, 59, 20, 136, 4, 9, 66, 255, 213, 49, 22, 36, 9, 59, 20, 136, 4, 23, 66, 255, 201, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 33, 4, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 34, 9, 59, 19, 35, 13, 64, 0, 4, 34, 66, 3, 130, 34, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 19, 136, 3, 169, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 19, 136, 3, 148, 66, 255, 213, 49, 22, 34, 9, 59, 19, 136, 3, 162, 66, 255, 201, 42, 100, 34, 18, 64, 2, 52, 49, 22, 36, 9, 56, 16, 33, 7, 18, 68, 49, 22, 36, 9, 56, 17, 42, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 36, 9, 56, 18, 53, 4, 49, 22, 34, 9, 56, 16, 33, 7, 18, 68, 49, 22, 34, 9, 56, 17, 43, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 5, 49, 25, 35, 18, 68, 49, 16, 33, 4, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 33, 4, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 28, 18, 68, 49, 22, 36, 8, 56, 25, 35, 18, 68, 49, 22, 36, 8, 56, 16, 33, 4, 18, 68, 49, 22, 36, 8, 56, 24, 50, 8, 18, 68, 49, 22, 36, 8, 57, 26, 0, 39, 29, 18, 68, 40, 100, 41, 100, 8, 35, 18, 64, 1, 102, 40, 100, 33, 6, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 15, 52, 4, 33, 6, 29, 35, 52, 5, 31, 72, 72, 76, 20, 68, 53, 16, 52, 15, 37, 29, 35, 52, 16, 31, 72, 72, 76, 20, 68, 53, 21, 54, 26, 1, 23, 129, 144, 78, 14, 68, 52, 21, 37, 54, 26, 1, 23, 9, 13, 52, 21, 37, 54, 26, 1, 23, 8, 12, 16, 68, 52, 16, 52, 15, 13, 64, 0, 239, 52, 16, 52, 15, 12, 64, 0, 196, 52, 16, 52, 15, 18, 64, 0, 1, 0, 52, 4, 53, 17, 52, 5, 53, 18, 35, 53, 19, 35, 53, 20, 40, 100, 41, 100, 8, 35, 18, 64, 0, 129, 52, 17, 39, 4, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 28, 52, 18, 39, 4, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 29, 52, 28, 52, 29, 13, 64, 0, 80, 52, 28, 53, 0, 52, 0, 35, 13, 68, 40, 100, 41, 100, 8, 35, 18, 64, 0, 53, 40, 40, 100, 52, 17, 8, 103, 41, 41, 100, 52, 18, 8, 103, 39, 4, 39, 4, 100, 52, 0, 8, 103, 39, 16, 100, 52, 0, 136, 1, 226, 40, 100, 41, 100, 10, 33, 6, 12, 68, 41, 100, 40, 100, 10, 33, 6, 12, 68, 34, 66, 1, 150, 39, 17, 50, 7, 103, 66, 255, 195, 52, 29, 53, 0, 66, 255, 173, 33, 8, 52, 17, 10, 52, 18, 13, 64, 0, 12, 52, 17, 146, 52, 18, 146, 11, 53, 0, 66, 255, 150, 52, 17, 52, 18, 11, 146, 53, 0, 66, 255, 139, 52, 4, 53, 17, 52, 4, 41, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 18, 35, 53, 19, 52, 5, 52, 18, 9, 53, 20, 66, 255, 48, 52, 5, 40, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 17, 52, 5, 53, 18, 52, 4, 52, 17, 9, 53, 19, 35, 53, 20, 66, 255, 13, 52, 4, 53, 17, 52, 5, 53, 18, 66, 255, 2, 49, 22, 36, 9, 56, 16, 34, 18, 68, 49, 22, 36, 9, 56, 7, 50, 10, 18, 68, 49, 22, 36, 9, 56, 8, 35, 13, 68, 49, 22, 36, 9, 56, 8, 53, 4, 66, 253, 212, 34, 66, 0, 233, 49, 25, 33, 7, 18, 64, 0, 127, 54, 26, 0, 128, 3, 115, 99, 117, 18, 64, 0, 63, 54, 26, 0, 128, 2, 114, 114, 18, 64, 0, 1, 0, 49, 0, 39, 9, 100, 18, 68, 42, 100, 34, 18, 64, 0, 28, 42, 100, 39, 6, 100, 136, 0, 233, 43, 100, 39, 7, 100, 136, 0, 225, 39, 6, 35, 103, 39, 7, 35, 103, 34, 66, 0, 159, 39, 6, 100, 136, 0, 233, 66, 255, 227, 49, 0, 39, 9, 100, 18, 68, 33, 5, 39, 12, 101, 53, 39, 53, 40, 52, 39, 64, 0, 23, 54, 26, 1, 23, 50, 7, 39, 12, 100, 8, 15, 68, 39, 11, 54, 26, 1, 23, 103, 34, 66, 0, 106, 39, 12, 52, 40, 103, 66, 255, 225, 49, 0, 39, 9, 100, 18, 68, 39, 11, 100, 35, 19, 68, 39, 11, 100, 50, 7, 14, 68, 39, 11, 35, 103, 34, 66, 0, 70, 35, 66, 0, 66, 35, 66, 0, 62, 35, 66, 0, 58, 33, 5, 39, 9, 101, 53, 35, 53, 36, 52, 35, 68, 39, 9, 52, 36, 103, 54, 26, 0, 23, 35, 19, 54, 26, 1, 23, 35, 19, 16, 68, 54, 26, 0, 23, 54, 26, 1, 23, 12, 68, 42, 54, 26, 0, 23, 103, 43, 54, 26, 1, 23, 103, 39, 15, 35, 103, 34, 67, 53, 30, 53, 1, 52, 30, 33, 8, 52, 1, 9, 13, 64, 0, 6, 52, 1, 52, 30, 8, 137, 52, 30, 33, 8, 52, 1, 9, 9, 137, 53, 31, 177, 33, 7, 178, 16, 52, 31, 178, 17, 35, 178, 18, 50, 10, 178, 20, 35, 178, 1, 179, 137, 53, 33, 53, 32, 177, 33, 7, 178, 16, 52, 32, 178, 17, 52, 33, 178, 18, 49, 0, 178, 20, 35, 178, 1, 179, 137, 53, 34, 50, 10, 96, 52, 34, 50, 1, 8, 15, 68, 177, 34, 178, 16, 52, 34, 178, 8, 49, 0, 178, 7, 35, 178, 1, 179, 137, 53, 50, 53, 49, 39, 21, 39, 21, 100, 52, 49, 136, 255, 134, 103, 39, 22, 39, 22, 100, 52, 50, 136, 255, 123, 103, 33, 8, 52, 50, 10, 52, 25, 13, 64, 0, 28, 33, 8, 52, 49, 10, 52, 26, 13, 65, 0, 34, 39, 24, 39, 24, 100, 52, 49, 52, 26, 11, 136, 255, 87, 103, 66, 0, 17, 39, 23, 39, 23, 100, 52, 50, 52, 25, 11, 136, 255, 70, 103, 66, 255, 211, 137]
+"""
+Bytecode of the pool approval programs and the clear state program. The programs are stored base64 encoded
+and decoded to bytes on first access of the corresponding module attribute (e.g. CLEAR_STATE_PROGRAM).
+"""
 
-TESTNET_APPROVAL_PROGRAM_100BP_CONSTANT_PRODUCT = [5, 32, 10, 1, 0, 2, 6, 192, 132, 61, 159, 237, 188, 31, 128, 148, 235, 220, 3, 4, 255, 255, 255, 255, 255, 255, 255, 255, 255, 1, 144, 78, 38, 33, 2, 98, 49, 2, 98, 50, 2, 97, 49, 2, 97, 50, 2, 108, 99, 2, 114, 102, 3, 97, 49, 114, 3, 97, 50, 114, 4, 109, 102, 108, 114, 1, 97, 3, 102, 108, 102, 3, 99, 117, 116, 3, 99, 117, 100, 3, 99, 102, 49, 3, 99, 102, 50, 1, 105, 1, 108, 2, 108, 116, 3, 115, 102, 101, 4, 99, 116, 49, 50, 4, 99, 116, 50, 49, 3, 99, 118, 49, 3, 99, 118, 50, 4, 99, 118, 49, 50, 4, 99, 118, 50, 49, 1, 112, 8, 65, 70, 45, 80, 79, 79, 76, 45, 1, 45, 5, 114, 112, 97, 49, 114, 5, 114, 112, 97, 50, 114, 4, 98, 97, 49, 111, 4, 98, 97, 50, 111, 3, 114, 115, 114, 49, 24, 35, 18, 64, 12, 191, 49, 25, 129, 5, 18, 64, 12, 179, 49, 25, 34, 18, 64, 12, 168, 49, 25, 36, 18, 64, 12, 157, 39, 15, 100, 34, 18, 64, 1, 90, 54, 26, 0, 128, 2, 105, 112, 18, 64, 0, 1, 0, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 39, 15, 100, 20, 68, 42, 100, 34, 13, 64, 1, 48, 43, 100, 34, 13, 64, 1, 33, 42, 100, 34, 18, 64, 0, 251, 42, 100, 113, 3, 53, 45, 53, 46, 43, 100, 113, 3, 53, 47, 53, 48, 52, 45, 68, 52, 47, 68, 39, 26, 52, 46, 39, 27, 52, 48, 80, 80, 80, 53, 27, 177, 129, 3, 178, 16, 52, 27, 178, 38, 128, 7, 65, 70, 45, 80, 79, 79, 76, 178, 37, 33, 8, 178, 34, 37, 178, 35, 128, 18, 104, 116, 116, 112, 115, 58, 47, 47, 97, 108, 103, 111, 102, 105, 46, 111, 114, 103, 178, 39, 50, 10, 178, 41, 50, 10, 178, 42, 179, 39, 16, 180, 60, 103, 33, 5, 39, 5, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 33, 4, 14, 68, 39, 5, 52, 38, 103, 33, 5, 39, 10, 101, 53, 41, 53, 42, 52, 41, 68, 52, 42, 33, 4, 14, 68, 39, 10, 52, 42, 103, 33, 5, 39, 8, 101, 53, 43, 53, 44, 52, 43, 68, 52, 44, 33, 4, 14, 68, 39, 8, 52, 44, 103, 39, 11, 35, 103, 33, 5, 39, 12, 101, 53, 39, 53, 40, 52, 39, 68, 39, 12, 52, 40, 103, 39, 17, 50, 7, 103, 40, 35, 103, 41, 35, 103, 39, 4, 35, 103, 39, 6, 35, 103, 39, 7, 35, 103, 39, 19, 35, 103, 39, 20, 35, 103, 39, 21, 35, 103, 39, 22, 35, 103, 39, 23, 35, 103, 39, 24, 35, 103, 39, 13, 35, 103, 39, 14, 35, 103, 39, 15, 34, 103, 34, 66, 11, 176, 43, 100, 113, 3, 53, 47, 53, 48, 52, 47, 68, 39, 26, 128, 4, 65, 76, 71, 79, 39, 27, 52, 48, 80, 80, 80, 53, 27, 66, 255, 9, 43, 100, 136, 11, 173, 66, 254, 215, 42, 100, 136, 11, 165, 66, 254, 200, 49, 0, 39, 9, 100, 18, 64, 10, 143, 49, 25, 35, 18, 49, 16, 37, 18, 16, 64, 0, 1, 0, 54, 26, 0, 128, 5, 100, 117, 109, 109, 121, 18, 64, 10, 112, 54, 26, 0, 39, 25, 18, 64, 8, 6, 54, 26, 0, 39, 28, 18, 64, 7, 138, 54, 26, 0, 39, 29, 18, 64, 7, 14, 54, 26, 0, 39, 30, 18, 64, 6, 87, 54, 26, 0, 39, 31, 18, 64, 5, 162, 54, 26, 0, 39, 18, 18, 54, 26, 0, 128, 3, 115, 101, 102, 18, 17, 64, 2, 110, 54, 26, 0, 39, 32, 18, 64, 1, 237, 54, 26, 0, 128, 2, 102, 108, 18, 64, 0, 1, 0, 33, 5, 39, 5, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 33, 4, 14, 68, 39, 5, 52, 38, 103, 33, 5, 39, 10, 101, 53, 41, 53, 42, 52, 41, 68, 52, 42, 33, 4, 14, 68, 39, 10, 52, 42, 103, 33, 5, 39, 8, 101, 53, 43, 53, 44, 52, 43, 68, 52, 44, 33, 4, 14, 68, 39, 8, 52, 44, 103, 54, 26, 2, 23, 39, 10, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 34, 8, 53, 22, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 35, 18, 68, 54, 26, 1, 23, 42, 100, 18, 54, 26, 1, 23, 43, 100, 18, 17, 68, 54, 26, 2, 23, 35, 13, 68, 54, 26, 1, 23, 42, 100, 18, 64, 1, 63, 54, 26, 2, 23, 41, 100, 39, 8, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 14, 68, 54, 26, 1, 23, 34, 18, 64, 0, 243, 50, 4, 34, 9, 56, 16, 33, 7, 18, 68, 50, 4, 34, 9, 56, 17, 54, 26, 1, 23, 18, 68, 50, 4, 34, 9, 56, 20, 50, 10, 18, 68, 50, 4, 34, 9, 56, 18, 35, 13, 68, 50, 4, 34, 9, 56, 18, 54, 26, 2, 23, 52, 22, 8, 18, 68, 54, 26, 1, 23, 42, 100, 18, 64, 0, 148, 43, 100, 54, 26, 2, 23, 136, 10, 77, 54, 26, 1, 23, 42, 100, 18, 64, 0, 119, 41, 41, 100, 52, 22, 8, 103, 52, 22, 39, 5, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 53, 23, 54, 26, 1, 23, 42, 100, 18, 64, 0, 52, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 39, 14, 39, 14, 100, 52, 22, 52, 23, 9, 136, 9, 205, 103, 40, 100, 41, 100, 10, 33, 6, 12, 68, 41, 100, 40, 100, 10, 33, 6, 12, 68, 34, 66, 9, 181, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 39, 13, 39, 13, 100, 52, 22, 52, 23, 9, 136, 9, 153, 103, 66, 255, 201, 40, 40, 100, 52, 22, 8, 103, 66, 255, 134, 42, 100, 34, 18, 64, 0, 12, 42, 100, 54, 26, 2, 23, 136, 9, 178, 66, 255, 98, 54, 26, 2, 23, 136, 9, 194, 66, 255, 88, 50, 4, 34, 9, 56, 16, 34, 18, 68, 50, 4, 34, 9, 56, 7, 50, 10, 18, 68, 50, 4, 34, 9, 56, 8, 35, 13, 68, 50, 4, 34, 9, 56, 8, 54, 26, 2, 23, 52, 22, 8, 18, 68, 66, 255, 23, 54, 26, 2, 23, 40, 100, 39, 8, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 14, 68, 66, 254, 190, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 18, 18, 68, 49, 22, 34, 9, 59, 14, 35, 13, 64, 0, 4, 34, 66, 8, 231, 49, 22, 34, 9, 59, 8, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 14, 136, 9, 11, 66, 255, 229, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 14, 136, 8, 246, 66, 255, 208, 49, 22, 34, 9, 59, 14, 136, 9, 4, 66, 255, 196, 50, 7, 39, 17, 100, 9, 53, 24, 39, 17, 50, 7, 103, 41, 100, 33, 6, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 25, 40, 100, 33, 6, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 26, 33, 8, 52, 25, 10, 52, 24, 13, 64, 2, 216, 33, 8, 52, 26, 10, 52, 24, 13, 64, 2, 188, 33, 5, 39, 5, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 33, 4, 14, 68, 39, 5, 52, 38, 103, 49, 22, 34, 9, 56, 16, 34, 18, 64, 2, 107, 49, 22, 34, 9, 56, 17, 42, 100, 18, 49, 22, 34, 9, 56, 17, 43, 100, 18, 17, 68, 49, 22, 34, 9, 56, 16, 33, 7, 18, 68, 49, 22, 34, 9, 56, 17, 49, 22, 34, 9, 56, 17, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 9, 49, 22, 34, 9, 56, 17, 42, 100, 18, 64, 2, 20, 35, 53, 8, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 54, 26, 0, 39, 18, 18, 64, 1, 212, 54, 26, 0, 39, 18, 18, 64, 1, 11, 52, 9, 33, 9, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 34, 8, 53, 3, 52, 9, 52, 3, 9, 53, 10, 52, 10, 35, 13, 68, 52, 8, 64, 0, 182, 40, 100, 52, 10, 29, 35, 41, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 2, 9, 103, 41, 41, 100, 52, 9, 8, 103, 42, 100, 34, 18, 64, 0, 134, 42, 100, 52, 2, 136, 7, 190, 52, 2, 52, 10, 136, 7, 238, 52, 2, 35, 13, 68, 52, 2, 54, 26, 1, 23, 15, 68, 52, 3, 39, 5, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 53, 23, 52, 8, 64, 0, 52, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 39, 14, 39, 14, 100, 52, 3, 52, 23, 9, 136, 7, 64, 103, 40, 100, 41, 100, 10, 33, 6, 12, 68, 41, 100, 40, 100, 10, 33, 6, 12, 68, 34, 66, 7, 40, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 39, 13, 39, 13, 100, 52, 3, 52, 23, 9, 136, 7, 12, 103, 66, 255, 201, 52, 2, 136, 7, 84, 66, 255, 121, 41, 100, 52, 10, 29, 35, 40, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 9, 8, 103, 41, 41, 100, 52, 2, 9, 103, 43, 100, 52, 2, 136, 7, 15, 52, 10, 52, 2, 136, 7, 63, 66, 255, 78, 54, 26, 1, 23, 53, 11, 52, 11, 35, 13, 68, 52, 8, 64, 0, 152, 41, 100, 52, 11, 29, 35, 40, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 52, 12, 35, 13, 68, 52, 12, 33, 4, 29, 35, 33, 4, 33, 9, 9, 31, 72, 72, 76, 20, 68, 34, 8, 52, 12, 9, 53, 3, 52, 12, 52, 3, 8, 53, 13, 52, 9, 52, 13, 15, 68, 52, 8, 64, 0, 53, 40, 40, 100, 52, 11, 9, 103, 41, 41, 100, 52, 13, 8, 103, 42, 100, 34, 18, 64, 0, 24, 42, 100, 52, 11, 136, 6, 149, 52, 11, 52, 12, 136, 6, 197, 52, 9, 52, 13, 9, 53, 14, 66, 254, 218, 52, 11, 136, 6, 153, 66, 255, 231, 40, 40, 100, 52, 13, 8, 103, 41, 41, 100, 52, 11, 9, 103, 43, 100, 52, 11, 136, 6, 103, 52, 12, 52, 11, 136, 6, 151, 66, 255, 207, 40, 100, 52, 11, 29, 35, 41, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 66, 255, 101, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 32, 18, 68, 66, 254, 2, 34, 66, 253, 233, 42, 100, 34, 18, 68, 49, 22, 34, 9, 56, 16, 34, 18, 68, 49, 22, 34, 9, 56, 7, 50, 10, 18, 68, 49, 22, 34, 9, 56, 8, 35, 13, 68, 49, 22, 34, 9, 56, 8, 53, 9, 34, 53, 8, 66, 253, 188, 39, 20, 39, 20, 100, 52, 26, 52, 24, 11, 136, 5, 164, 103, 66, 253, 51, 39, 19, 39, 19, 100, 52, 25, 52, 24, 11, 136, 5, 147, 103, 66, 253, 23, 49, 22, 36, 9, 56, 16, 33, 7, 18, 68, 49, 22, 36, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 30, 18, 68, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 36, 9, 56, 18, 39, 4, 100, 18, 64, 0, 63, 49, 22, 36, 9, 56, 18, 41, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 7, 52, 7, 35, 13, 68, 52, 7, 41, 100, 14, 68, 41, 41, 100, 52, 7, 9, 103, 39, 4, 39, 4, 100, 49, 22, 36, 9, 56, 18, 9, 103, 43, 100, 52, 7, 136, 5, 37, 34, 66, 4, 233, 41, 100, 53, 7, 66, 255, 207, 49, 22, 34, 9, 56, 16, 33, 7, 18, 68, 49, 22, 34, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 31, 18, 68, 49, 22, 34, 9, 56, 18, 39, 4, 100, 18, 64, 0, 65, 49, 22, 34, 9, 56, 18, 40, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 6, 52, 6, 35, 13, 68, 52, 6, 40, 100, 14, 68, 40, 40, 100, 52, 6, 9, 103, 42, 100, 34, 18, 64, 0, 11, 42, 100, 52, 6, 136, 4, 127, 34, 66, 4, 67, 52, 6, 136, 4, 144, 66, 255, 244, 40, 100, 53, 6, 66, 255, 205, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 36, 9, 56, 25, 35, 18, 68, 49, 22, 36, 9, 56, 16, 37, 18, 68, 49, 22, 36, 9, 56, 24, 50, 8, 18, 68, 49, 22, 36, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 36, 9, 59, 20, 35, 13, 64, 0, 4, 34, 66, 3, 244, 35, 64, 0, 14, 43, 100, 49, 22, 36, 9, 59, 20, 136, 4, 29, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 36, 9, 59, 20, 136, 4, 8, 66, 255, 213, 49, 22, 36, 9, 59, 20, 136, 4, 22, 66, 255, 201, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 34, 9, 59, 19, 35, 13, 64, 0, 4, 34, 66, 3, 129, 34, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 19, 136, 3, 170, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 19, 136, 3, 149, 66, 255, 213, 49, 22, 34, 9, 59, 19, 136, 3, 163, 66, 255, 201, 42, 100, 34, 18, 64, 2, 51, 49, 22, 36, 9, 56, 16, 33, 7, 18, 68, 49, 22, 36, 9, 56, 17, 42, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 36, 9, 56, 18, 53, 4, 49, 22, 34, 9, 56, 16, 33, 7, 18, 68, 49, 22, 34, 9, 56, 17, 43, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 5, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 28, 18, 68, 49, 22, 36, 8, 56, 25, 35, 18, 68, 49, 22, 36, 8, 56, 16, 37, 18, 68, 49, 22, 36, 8, 56, 24, 50, 8, 18, 68, 49, 22, 36, 8, 57, 26, 0, 39, 29, 18, 68, 40, 100, 41, 100, 8, 35, 18, 64, 1, 104, 40, 100, 33, 6, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 15, 52, 4, 33, 6, 29, 35, 52, 5, 31, 72, 72, 76, 20, 68, 53, 16, 52, 15, 33, 4, 29, 35, 52, 16, 31, 72, 72, 76, 20, 68, 53, 21, 54, 26, 1, 23, 33, 9, 14, 68, 52, 21, 33, 4, 54, 26, 1, 23, 9, 13, 52, 21, 33, 4, 54, 26, 1, 23, 8, 12, 16, 68, 52, 16, 52, 15, 13, 64, 0, 239, 52, 16, 52, 15, 12, 64, 0, 196, 52, 16, 52, 15, 18, 64, 0, 1, 0, 52, 4, 53, 17, 52, 5, 53, 18, 35, 53, 19, 35, 53, 20, 40, 100, 41, 100, 8, 35, 18, 64, 0, 129, 52, 17, 39, 4, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 28, 52, 18, 39, 4, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 29, 52, 28, 52, 29, 13, 64, 0, 80, 52, 28, 53, 0, 52, 0, 35, 13, 68, 40, 100, 41, 100, 8, 35, 18, 64, 0, 53, 40, 40, 100, 52, 17, 8, 103, 41, 41, 100, 52, 18, 8, 103, 39, 4, 39, 4, 100, 52, 0, 8, 103, 39, 16, 100, 52, 0, 136, 1, 228, 40, 100, 41, 100, 10, 33, 6, 12, 68, 41, 100, 40, 100, 10, 33, 6, 12, 68, 34, 66, 1, 150, 39, 17, 50, 7, 103, 66, 255, 195, 52, 29, 53, 0, 66, 255, 173, 33, 8, 52, 17, 10, 52, 18, 13, 64, 0, 12, 52, 17, 146, 52, 18, 146, 11, 53, 0, 66, 255, 150, 52, 17, 52, 18, 11, 146, 53, 0, 66, 255, 139, 52, 4, 53, 17, 52, 4, 41, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 18, 35, 53, 19, 52, 5, 52, 18, 9, 53, 20, 66, 255, 48, 52, 5, 40, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 17, 52, 5, 53, 18, 52, 4, 52, 17, 9, 53, 19, 35, 53, 20, 66, 255, 13, 52, 4, 53, 17, 52, 5, 53, 18, 66, 255, 2, 49, 22, 36, 9, 56, 16, 34, 18, 68, 49, 22, 36, 9, 56, 7, 50, 10, 18, 68, 49, 22, 36, 9, 56, 8, 35, 13, 68, 49, 22, 36, 9, 56, 8, 53, 4, 66, 253, 213, 34, 66, 0, 233, 49, 25, 33, 7, 18, 64, 0, 127, 54, 26, 0, 128, 3, 115, 99, 117, 18, 64, 0, 63, 54, 26, 0, 128, 2, 114, 114, 18, 64, 0, 1, 0, 49, 0, 39, 9, 100, 18, 68, 42, 100, 34, 18, 64, 0, 28, 42, 100, 39, 6, 100, 136, 0, 235, 43, 100, 39, 7, 100, 136, 0, 227, 39, 6, 35, 103, 39, 7, 35, 103, 34, 66, 0, 159, 39, 6, 100, 136, 0, 235, 66, 255, 227, 49, 0, 39, 9, 100, 18, 68, 33, 5, 39, 12, 101, 53, 39, 53, 40, 52, 39, 64, 0, 23, 54, 26, 1, 23, 50, 7, 39, 12, 100, 8, 15, 68, 39, 11, 54, 26, 1, 23, 103, 34, 66, 0, 106, 39, 12, 52, 40, 103, 66, 255, 225, 49, 0, 39, 9, 100, 18, 68, 39, 11, 100, 35, 19, 68, 39, 11, 100, 50, 7, 14, 68, 39, 11, 35, 103, 34, 66, 0, 70, 35, 66, 0, 66, 35, 66, 0, 62, 35, 66, 0, 58, 33, 5, 39, 9, 101, 53, 35, 53, 36, 52, 35, 68, 39, 9, 52, 36, 103, 54, 26, 0, 23, 35, 19, 54, 26, 1, 23, 35, 19, 16, 68, 54, 26, 0, 23, 54, 26, 1, 23, 12, 68, 42, 54, 26, 0, 23, 103, 43, 54, 26, 1, 23, 103, 39, 15, 35, 103, 34, 67, 53, 30, 53, 1, 52, 30, 33, 8, 52, 1, 9, 13, 64, 0, 6, 52, 1, 52, 30, 8, 137, 52, 30, 33, 8, 52, 1, 9, 9, 34, 9, 137, 53, 31, 177, 33, 7, 178, 16, 52, 31, 178, 17, 35, 178, 18, 50, 10, 178, 20, 35, 178, 1, 179, 137, 53, 33, 53, 32, 177, 33, 7, 178, 16, 52, 32, 178, 17, 52, 33, 178, 18, 49, 0, 178, 20, 35, 178, 1, 179, 137, 53, 34, 50, 10, 96, 52, 34, 50, 1, 8, 15, 68, 177, 34, 178, 16, 52, 34, 178, 8, 49, 0, 178, 7, 35, 178, 1, 179, 137, 53, 50, 53, 49, 39, 21, 39, 21, 100, 52, 49, 136, 255, 132, 103, 39, 22, 39, 22, 100, 52, 50, 136, 255, 121, 103, 33, 8, 52, 50, 10, 52, 25, 13, 64, 0, 28, 33, 8, 52, 49, 10, 52, 26, 13, 65, 0, 34, 39, 24, 39, 24, 100, 52, 49, 52, 26, 11, 136, 255, 85, 103, 66, 0, 17, 39, 23, 39, 23, 100, 52, 50, 52, 25, 11, 136, 255, 68, 103, 66, 255, 211, 137]
+from base64 import b64decode
 
-MAINNET_APPROVAL_PROGRAM_25BP_CONSTANT_PRODUCT = [5, 32, 11, 1, 0, 2, 6, 192, 132, 61, 188, 160, 236, 160, 2, 4, 128, 148, 235, 220, 3, 255, 255, 255, 255, 255, 255, 255, 255, 255, 1, 232, 7, 196, 19, 38, 34, 2, 98, 49, 2, 98, 50, 2, 97, 49, 2, 97, 50, 2, 108, 99, 2, 114, 102, 3, 97, 49, 114, 3, 97, 50, 114, 4, 109, 102, 108, 114, 1, 97, 3, 102, 108, 102, 3, 99, 117, 116, 3, 99, 117, 100, 3, 99, 102, 49, 3, 99, 102, 50, 1, 105, 1, 108, 2, 108, 116, 3, 115, 102, 101, 4, 99, 116, 49, 50, 4, 99, 116, 50, 49, 3, 99, 118, 49, 3, 99, 118, 50, 4, 99, 118, 49, 50, 4, 99, 118, 50, 49, 1, 112, 8, 65, 70, 45, 80, 79, 79, 76, 45, 1, 45, 7, 45, 50, 53, 46, 48, 66, 80, 5, 114, 112, 97, 49, 114, 5, 114, 112, 97, 50, 114, 4, 98, 97, 49, 111, 4, 98, 97, 50, 111, 3, 114, 115, 114, 49, 24, 35, 18, 64, 12, 240, 49, 25, 129, 5, 18, 64, 12, 228, 49, 25, 34, 18, 64, 12, 217, 49, 25, 36, 18, 64, 12, 206, 39, 15, 100, 34, 18, 64, 1, 111, 54, 26, 0, 128, 2, 105, 112, 18, 64, 0, 1, 0, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 39, 15, 100, 20, 68, 42, 100, 34, 13, 64, 1, 69, 43, 100, 34, 13, 64, 1, 54, 42, 100, 34, 18, 64, 1, 13, 42, 100, 113, 3, 53, 39, 53, 40, 43, 100, 113, 3, 53, 41, 53, 42, 52, 39, 68, 52, 41, 68, 39, 26, 52, 40, 80, 39, 27, 80, 52, 42, 80, 39, 28, 80, 53, 27, 177, 129, 3, 178, 16, 52, 27, 178, 38, 128, 7, 65, 70, 45, 80, 79, 79, 76, 178, 37, 33, 8, 178, 34, 37, 178, 35, 128, 18, 104, 116, 116, 112, 115, 58, 47, 47, 97, 108, 103, 111, 102, 105, 46, 111, 114, 103, 178, 39, 50, 10, 178, 41, 50, 10, 178, 42, 179, 39, 16, 180, 60, 103, 33, 5, 39, 5, 101, 53, 31, 53, 32, 52, 31, 68, 52, 32, 33, 4, 14, 68, 39, 5, 52, 32, 103, 33, 5, 39, 10, 101, 53, 35, 53, 36, 52, 35, 68, 52, 36, 33, 4, 14, 68, 39, 10, 52, 36, 103, 33, 5, 39, 8, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 33, 4, 14, 68, 39, 8, 52, 38, 103, 39, 11, 35, 103, 33, 5, 39, 12, 101, 53, 33, 53, 34, 52, 33, 68, 39, 12, 52, 34, 103, 39, 17, 50, 7, 103, 40, 35, 103, 41, 35, 103, 39, 4, 35, 103, 39, 6, 35, 103, 39, 7, 35, 103, 39, 19, 35, 103, 39, 20, 35, 103, 39, 21, 35, 103, 39, 22, 35, 103, 39, 23, 35, 103, 39, 24, 35, 103, 39, 13, 35, 103, 39, 14, 35, 103, 128, 2, 109, 97, 33, 5, 103, 128, 3, 115, 102, 112, 33, 10, 103, 39, 15, 34, 103, 34, 66, 11, 228, 43, 100, 113, 3, 53, 41, 53, 42, 52, 41, 68, 39, 26, 128, 4, 65, 76, 71, 79, 80, 39, 27, 80, 52, 42, 80, 39, 28, 80, 53, 27, 66, 254, 247, 43, 100, 136, 11, 222, 66, 254, 194, 42, 100, 136, 11, 214, 66, 254, 179, 49, 0, 39, 9, 100, 18, 64, 10, 171, 49, 25, 35, 18, 49, 16, 37, 18, 16, 64, 0, 1, 0, 54, 26, 0, 128, 5, 100, 117, 109, 109, 121, 18, 64, 10, 140, 54, 26, 0, 39, 25, 18, 64, 8, 30, 54, 26, 0, 39, 29, 18, 64, 7, 162, 54, 26, 0, 39, 30, 18, 64, 7, 38, 54, 26, 0, 39, 31, 18, 64, 6, 111, 54, 26, 0, 39, 32, 18, 64, 5, 186, 54, 26, 0, 39, 18, 18, 54, 26, 0, 128, 3, 115, 101, 102, 18, 17, 64, 2, 122, 54, 26, 0, 39, 33, 18, 64, 1, 249, 54, 26, 0, 128, 2, 102, 108, 18, 64, 0, 1, 0, 33, 5, 39, 5, 101, 53, 31, 53, 32, 52, 31, 68, 52, 32, 33, 4, 14, 68, 39, 5, 52, 32, 103, 33, 5, 39, 10, 101, 53, 35, 53, 36, 52, 35, 68, 52, 36, 33, 4, 14, 68, 39, 10, 52, 36, 103, 33, 5, 39, 8, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 33, 4, 14, 68, 39, 8, 52, 38, 103, 54, 26, 2, 23, 39, 10, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 34, 8, 53, 22, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 35, 18, 68, 54, 26, 1, 23, 42, 100, 18, 54, 26, 1, 23, 43, 100, 18, 17, 68, 54, 26, 2, 23, 35, 13, 68, 54, 26, 1, 23, 42, 100, 18, 64, 1, 75, 54, 26, 2, 23, 41, 100, 39, 8, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 14, 68, 54, 26, 1, 23, 34, 18, 64, 0, 255, 50, 4, 34, 9, 56, 16, 33, 6, 18, 68, 50, 4, 34, 9, 56, 17, 54, 26, 1, 23, 18, 68, 50, 4, 34, 9, 56, 20, 50, 10, 18, 68, 50, 4, 34, 9, 56, 18, 35, 13, 68, 50, 4, 34, 9, 56, 18, 54, 26, 2, 23, 52, 22, 8, 18, 68, 54, 26, 1, 23, 42, 100, 18, 64, 0, 160, 43, 100, 54, 26, 2, 23, 136, 10, 126, 54, 26, 1, 23, 42, 100, 18, 64, 0, 131, 41, 41, 100, 52, 22, 8, 103, 52, 22, 39, 5, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 53, 23, 54, 26, 1, 23, 42, 100, 18, 64, 0, 64, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 39, 14, 39, 14, 100, 52, 22, 52, 23, 9, 136, 9, 254, 103, 40, 100, 33, 9, 15, 68, 41, 100, 33, 9, 15, 68, 40, 100, 41, 100, 10, 33, 7, 12, 68, 41, 100, 40, 100, 10, 33, 7, 12, 68, 34, 66, 9, 218, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 39, 13, 39, 13, 100, 52, 22, 52, 23, 9, 136, 9, 190, 103, 66, 255, 189, 40, 40, 100, 52, 22, 8, 103, 66, 255, 122, 42, 100, 34, 18, 64, 0, 12, 42, 100, 54, 26, 2, 23, 136, 9, 215, 66, 255, 86, 54, 26, 2, 23, 136, 9, 231, 66, 255, 76, 50, 4, 34, 9, 56, 16, 34, 18, 68, 50, 4, 34, 9, 56, 7, 50, 10, 18, 68, 50, 4, 34, 9, 56, 8, 35, 13, 68, 50, 4, 34, 9, 56, 8, 54, 26, 2, 23, 52, 22, 8, 18, 68, 66, 255, 11, 54, 26, 2, 23, 40, 100, 39, 8, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 14, 68, 66, 254, 178, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 18, 18, 68, 49, 22, 34, 9, 59, 14, 35, 13, 64, 0, 4, 34, 66, 9, 12, 49, 22, 34, 9, 59, 8, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 14, 136, 9, 48, 66, 255, 229, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 14, 136, 9, 27, 66, 255, 208, 49, 22, 34, 9, 59, 14, 136, 9, 41, 66, 255, 196, 50, 7, 39, 17, 100, 9, 53, 24, 39, 17, 50, 7, 103, 41, 100, 33, 7, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 25, 40, 100, 33, 7, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 26, 33, 8, 52, 25, 10, 52, 24, 13, 64, 2, 228, 33, 8, 52, 26, 10, 52, 24, 13, 64, 2, 200, 33, 5, 39, 5, 101, 53, 31, 53, 32, 52, 31, 68, 52, 32, 33, 4, 14, 68, 39, 5, 52, 32, 103, 49, 22, 34, 9, 56, 16, 34, 18, 64, 2, 119, 49, 22, 34, 9, 56, 17, 42, 100, 18, 49, 22, 34, 9, 56, 17, 43, 100, 18, 17, 68, 49, 22, 34, 9, 56, 16, 33, 6, 18, 68, 49, 22, 34, 9, 56, 17, 49, 22, 34, 9, 56, 17, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 9, 49, 22, 34, 9, 56, 17, 42, 100, 18, 64, 2, 32, 35, 53, 8, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 54, 26, 0, 39, 18, 18, 64, 1, 224, 54, 26, 0, 39, 18, 18, 64, 1, 23, 52, 9, 33, 10, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 34, 8, 53, 3, 52, 9, 52, 3, 9, 53, 10, 52, 10, 35, 13, 68, 52, 8, 64, 0, 194, 40, 100, 52, 10, 29, 35, 41, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 2, 9, 103, 41, 41, 100, 52, 9, 8, 103, 42, 100, 34, 18, 64, 0, 146, 42, 100, 52, 2, 136, 7, 227, 52, 2, 52, 10, 136, 8, 19, 52, 2, 35, 13, 68, 52, 2, 54, 26, 1, 23, 15, 68, 52, 3, 39, 5, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 53, 23, 52, 8, 64, 0, 64, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 39, 14, 39, 14, 100, 52, 3, 52, 23, 9, 136, 7, 101, 103, 40, 100, 33, 9, 15, 68, 41, 100, 33, 9, 15, 68, 40, 100, 41, 100, 10, 33, 7, 12, 68, 41, 100, 40, 100, 10, 33, 7, 12, 68, 34, 66, 7, 65, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 39, 13, 39, 13, 100, 52, 3, 52, 23, 9, 136, 7, 37, 103, 66, 255, 189, 52, 2, 136, 7, 109, 66, 255, 109, 41, 100, 52, 10, 29, 35, 40, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 9, 8, 103, 41, 41, 100, 52, 2, 9, 103, 43, 100, 52, 2, 136, 7, 40, 52, 10, 52, 2, 136, 7, 88, 66, 255, 66, 54, 26, 1, 23, 53, 11, 52, 11, 35, 13, 68, 52, 8, 64, 0, 152, 41, 100, 52, 11, 29, 35, 40, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 52, 12, 35, 13, 68, 52, 12, 33, 4, 29, 35, 33, 4, 33, 10, 9, 31, 72, 72, 76, 20, 68, 34, 8, 52, 12, 9, 53, 3, 52, 12, 52, 3, 8, 53, 13, 52, 9, 52, 13, 15, 68, 52, 8, 64, 0, 53, 40, 40, 100, 52, 11, 9, 103, 41, 41, 100, 52, 13, 8, 103, 42, 100, 34, 18, 64, 0, 24, 42, 100, 52, 11, 136, 6, 174, 52, 11, 52, 12, 136, 6, 222, 52, 9, 52, 13, 9, 53, 14, 66, 254, 206, 52, 11, 136, 6, 178, 66, 255, 231, 40, 40, 100, 52, 13, 8, 103, 41, 41, 100, 52, 11, 9, 103, 43, 100, 52, 11, 136, 6, 128, 52, 12, 52, 11, 136, 6, 176, 66, 255, 207, 40, 100, 52, 11, 29, 35, 41, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 66, 255, 101, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 33, 18, 68, 66, 253, 246, 34, 66, 253, 221, 42, 100, 34, 18, 68, 49, 22, 34, 9, 56, 16, 34, 18, 68, 49, 22, 34, 9, 56, 7, 50, 10, 18, 68, 49, 22, 34, 9, 56, 8, 35, 13, 68, 49, 22, 34, 9, 56, 8, 53, 9, 34, 53, 8, 66, 253, 176, 39, 20, 39, 20, 100, 52, 26, 52, 24, 11, 136, 5, 189, 103, 66, 253, 39, 39, 19, 39, 19, 100, 52, 25, 52, 24, 11, 136, 5, 172, 103, 66, 253, 11, 49, 22, 36, 9, 56, 16, 33, 6, 18, 68, 49, 22, 36, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 31, 18, 68, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 36, 9, 56, 18, 39, 4, 100, 18, 64, 0, 63, 49, 22, 36, 9, 56, 18, 41, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 7, 52, 7, 35, 13, 68, 52, 7, 41, 100, 14, 68, 41, 41, 100, 52, 7, 9, 103, 39, 4, 39, 4, 100, 49, 22, 36, 9, 56, 18, 9, 103, 43, 100, 52, 7, 136, 5, 62, 34, 66, 5, 2, 41, 100, 53, 7, 66, 255, 207, 49, 22, 34, 9, 56, 16, 33, 6, 18, 68, 49, 22, 34, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 32, 18, 68, 49, 22, 34, 9, 56, 18, 39, 4, 100, 18, 64, 0, 65, 49, 22, 34, 9, 56, 18, 40, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 6, 52, 6, 35, 13, 68, 52, 6, 40, 100, 14, 68, 40, 40, 100, 52, 6, 9, 103, 42, 100, 34, 18, 64, 0, 11, 42, 100, 52, 6, 136, 4, 152, 34, 66, 4, 92, 52, 6, 136, 4, 169, 66, 255, 244, 40, 100, 53, 6, 66, 255, 205, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 36, 9, 56, 25, 35, 18, 68, 49, 22, 36, 9, 56, 16, 37, 18, 68, 49, 22, 36, 9, 56, 24, 50, 8, 18, 68, 49, 22, 36, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 36, 9, 59, 20, 35, 13, 64, 0, 4, 34, 66, 4, 13, 35, 64, 0, 14, 43, 100, 49, 22, 36, 9, 59, 20, 136, 4, 54, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 36, 9, 59, 20, 136, 4, 33, 66, 255, 213, 49, 22, 36, 9, 59, 20, 136, 4, 47, 66, 255, 201, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 34, 9, 59, 19, 35, 13, 64, 0, 4, 34, 66, 3, 154, 34, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 19, 136, 3, 195, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 19, 136, 3, 174, 66, 255, 213, 49, 22, 34, 9, 59, 19, 136, 3, 188, 66, 255, 201, 42, 100, 34, 18, 64, 2, 55, 49, 22, 36, 9, 56, 16, 33, 6, 18, 68, 49, 22, 36, 9, 56, 17, 42, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 36, 9, 56, 18, 53, 4, 49, 22, 34, 9, 56, 16, 33, 6, 18, 68, 49, 22, 34, 9, 56, 17, 43, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 5, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 29, 18, 68, 49, 22, 36, 8, 56, 25, 35, 18, 68, 49, 22, 36, 8, 56, 16, 37, 18, 68, 49, 22, 36, 8, 56, 24, 50, 8, 18, 68, 49, 22, 36, 8, 57, 26, 0, 39, 30, 18, 68, 40, 100, 41, 100, 8, 35, 18, 64, 1, 108, 40, 100, 33, 7, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 15, 52, 4, 33, 7, 29, 35, 52, 5, 31, 72, 72, 76, 20, 68, 53, 16, 52, 15, 33, 4, 29, 35, 52, 16, 31, 72, 72, 76, 20, 68, 53, 21, 52, 21, 33, 4, 54, 26, 1, 23, 9, 13, 52, 21, 33, 4, 54, 26, 1, 23, 8, 12, 16, 68, 52, 16, 52, 15, 13, 64, 0, 251, 52, 16, 52, 15, 12, 64, 0, 208, 52, 16, 52, 15, 18, 64, 0, 1, 0, 52, 4, 53, 17, 52, 5, 53, 18, 35, 53, 19, 35, 53, 20, 40, 100, 41, 100, 8, 35, 18, 64, 0, 141, 52, 17, 39, 4, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 28, 52, 18, 39, 4, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 29, 52, 28, 52, 29, 13, 64, 0, 92, 52, 28, 53, 0, 52, 0, 35, 13, 68, 40, 100, 41, 100, 8, 35, 18, 64, 0, 65, 40, 40, 100, 52, 17, 8, 103, 41, 41, 100, 52, 18, 8, 103, 39, 4, 39, 4, 100, 52, 0, 8, 103, 39, 16, 100, 52, 0, 136, 2, 5, 40, 100, 33, 9, 15, 68, 41, 100, 33, 9, 15, 68, 40, 100, 41, 100, 10, 33, 7, 12, 68, 41, 100, 40, 100, 10, 33, 7, 12, 68, 34, 66, 1, 171, 39, 17, 50, 7, 103, 66, 255, 183, 52, 29, 53, 0, 66, 255, 161, 33, 8, 52, 17, 10, 52, 18, 13, 64, 0, 12, 52, 17, 146, 52, 18, 146, 11, 53, 0, 66, 255, 138, 52, 17, 52, 18, 11, 146, 53, 0, 66, 255, 127, 52, 4, 53, 17, 52, 4, 41, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 18, 35, 53, 19, 52, 5, 52, 18, 9, 53, 20, 66, 255, 36, 52, 5, 40, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 17, 52, 5, 53, 18, 52, 4, 52, 17, 9, 53, 19, 35, 53, 20, 66, 255, 1, 52, 4, 53, 17, 52, 5, 53, 18, 66, 254, 246, 49, 22, 36, 9, 56, 16, 34, 18, 68, 49, 22, 36, 9, 56, 7, 50, 10, 18, 68, 49, 22, 36, 9, 56, 8, 35, 13, 68, 49, 22, 36, 9, 56, 8, 53, 4, 66, 253, 209, 34, 66, 0, 254, 49, 25, 33, 6, 18, 64, 0, 127, 54, 26, 0, 128, 3, 115, 99, 117, 18, 64, 0, 63, 54, 26, 0, 128, 2, 114, 114, 18, 64, 0, 1, 0, 49, 0, 39, 9, 100, 18, 68, 42, 100, 34, 18, 64, 0, 28, 42, 100, 39, 6, 100, 136, 1, 0, 43, 100, 39, 7, 100, 136, 0, 248, 39, 6, 35, 103, 39, 7, 35, 103, 34, 66, 0, 180, 39, 6, 100, 136, 1, 0, 66, 255, 227, 49, 0, 39, 9, 100, 18, 68, 33, 5, 39, 12, 101, 53, 33, 53, 34, 52, 33, 64, 0, 23, 54, 26, 1, 23, 50, 7, 39, 12, 100, 8, 15, 68, 39, 11, 54, 26, 1, 23, 103, 34, 66, 0, 127, 39, 12, 52, 34, 103, 66, 255, 225, 49, 0, 39, 9, 100, 18, 68, 39, 11, 100, 35, 19, 68, 39, 11, 100, 50, 7, 14, 68, 39, 11, 35, 103, 34, 66, 0, 91, 35, 66, 0, 87, 35, 66, 0, 83, 35, 66, 0, 79, 49, 53, 33, 6, 15, 68, 49, 52, 129, 32, 15, 68, 33, 5, 39, 9, 101, 53, 1, 53, 30, 52, 1, 68, 39, 9, 52, 30, 103, 54, 26, 0, 23, 35, 19, 54, 26, 1, 23, 35, 19, 16, 68, 54, 26, 0, 23, 54, 26, 1, 23, 12, 68, 42, 54, 26, 0, 23, 103, 43, 54, 26, 1, 23, 103, 128, 2, 118, 105, 54, 26, 2, 23, 103, 39, 15, 35, 103, 34, 67, 53, 44, 53, 43, 52, 44, 33, 8, 52, 43, 9, 13, 64, 0, 6, 52, 43, 52, 44, 8, 137, 52, 44, 33, 8, 52, 43, 9, 9, 34, 9, 137, 53, 45, 177, 33, 6, 178, 16, 52, 45, 178, 17, 35, 178, 18, 50, 10, 178, 20, 35, 178, 1, 179, 137, 53, 47, 53, 46, 177, 33, 6, 178, 16, 52, 46, 178, 17, 52, 47, 178, 18, 49, 0, 178, 20, 35, 178, 1, 179, 137, 53, 48, 50, 10, 96, 52, 48, 50, 1, 8, 15, 68, 177, 34, 178, 16, 52, 48, 178, 8, 49, 0, 178, 7, 35, 178, 1, 179, 137, 53, 50, 53, 49, 39, 21, 39, 21, 100, 52, 49, 136, 255, 132, 103, 39, 22, 39, 22, 100, 52, 50, 136, 255, 121, 103, 33, 8, 52, 50, 10, 52, 25, 13, 64, 0, 28, 33, 8, 52, 49, 10, 52, 26, 13, 65, 0, 34, 39, 24, 39, 24, 100, 52, 49, 52, 26, 11, 136, 255, 85, 103, 66, 0, 17, 39, 23, 39, 23, 100, 52, 50, 52, 25, 11, 136, 255, 68, 103, 66, 255, 211, 137]
+TESTNET_APPROVAL_PROGRAM_30BP_CONSTANT_PRODUCT_B64 = (
+    "BSAKAQACwIQ9Bp/tvB+AlOvcAwT///////////8BuBcmIQJiMQJiMgJhMQJhMgJsYwJyZgNhMXIDYTJyBG1mbHIBYQNmbGYDY3V0A2N1ZANjZjEDY2Yy"
+    "AWkBbAJsdANzZmUEY3QxMgRjdDIxA2N2MQNjdjIEY3YxMgRjdjIxAXAIQUYtUE9PTC0BLQVycGExcgVycGEycgRiYTFvBGJhMm8DcnNyMRgjEkAMpDEZ"
+    "gQUSQAyYMRkiEkAMjTEZJBJADIInD2QiEkABTjYaAIACaXASQAABACcPZBREKmQiDUABLitkIg1AAR8qZCISQAD5KmRxAzUtNS4rZHEDNS81MDQtRDQv"
+    "RCcaNC4nGzQwUFBQNRuxgQOyEDQbsiaAB0FGLVBPT0yyJSEIsiIhBLIjgBJodHRwczovL2FsZ29maS5vcmeyJzIKsikyCrIqsycQtDxnIQUnBWU1JTUm"
+    "NCVENCYlDkQnBTQmZyEFJwplNSk1KjQpRDQqJQ5EJwo0KmchBScIZTUrNSw0K0Q0LCUORCcINCxnJwsjZyEFJwxlNSc1KDQnRCcMNChnJxEyB2coI2cp"
+    "I2cnBCNnJwYjZycHI2cnEyNnJxQjZycVI2cnFiNnJxcjZycYI2cnDSNnJw4jZycPImciQguhK2RxAzUvNTA0L0QnGoAEQUxHTycbNDBQUFA1G0L/Cytk"
+    "iAucQv7ZKmSIC5RC/soxACcJZBJACoAxGSMSQAABADYaAIAFZHVtbXkSQApmNhoAJxkSQAf7NhoAJxwSQAd9NhoAJx0SQAb/NhoAJx4SQAZGNhoAJx8S"
+    "QAWPNhoAJxISNhoAgANzZWYSEUACTjYaACcgEkAByzYaAIACZmwSQAABACEFJwVlNSU1JjQlRDQmJQ5EJwU0JmchBScKZTUpNSo0KUQ0KiUORCcKNCpn"
+    "IQUnCGU1KzUsNCtENCwlDkQnCDQsZzYaAhcnCmQdIyUfSEhMFEQiCDUWMRkjEkQxECEEEkQxFiMSRDYaARcqZBI2GgEXK2QSEUQ2GgIXIw1ENhoBFypk"
+    "EkABITYaAhcpZCcIZB0jJR9ISEwURA5ENhoBFyISQADWMgQiCTgQIQcSRDIEIgk4ETYaARcSRDIEIgk4FDIKEkQyBCIJOBIjDUQyBCIJOBI2GgIXNBYI"
+    "EkQ2GgEXKmQSQAB3K2Q2GgIXiApFNhoBFypkEkAAWikpZDQWCGc0FicFZB0jJR9ISEwURDUXNhoBFypkEkAAJikpZDQXCWcnBycHZDQXCGcoZClkCiEG"
+    "DEQpZChkCiEGDEQiQgm+KChkNBcJZycGJwZkNBcIZ0L/1ygoZDQWCGdC/6MqZCISQAAMKmQ2GgIXiAnHQv9/NhoCF4gJ10L/dTIEIgk4ECISRDIEIgk4"
+    "BzIKEkQyBCIJOAgjDUQyBCIJOAg2GgIXNBYIEkRC/zQ2GgIXKGQnCGQdIyUfSEhMFEQOREL+3DEZIxJEMRAhBBJEMRYiCTgZIxJEMRYiCTgQIQQSRDEW"
+    "Igk4GDIIEkQxFiIJORoAJxISRDEWIgk7DiMNQAAEIkII/TEWIgk7CEAADitkMRYiCTsOiAkfQv/lKmQiEkAADipkMRYiCTsOiAkKQv/QMRYiCTsOiAkY"
+    "Qv/EMgcnEWQJNRgnETIHZylkIQYdIyhkH0hITBRENRkoZCEGHSMpZB9ISEwURDUaIQg0GQo0GA1AAuUhCDQaCjQYDUACySEFJwVlNSU1JjQlRDQmJQ5E"
+    "JwU0JmcxFiIJOBAiEkACeTEWIgk4ESpkEjEWIgk4EStkEhFEMRYiCTgQIQcSRDEWIgk4ETEWIgk4ERJEMRYiCTgUMgoSRDEWIgk4EiMNRDEWIgk4EjUJ"
+    "MRYiCTgRKmQSQAIiIzUIMRkjEkQxECEEEkQ2GgAnEhJAAeA2GgAnEhJAAQM0CSEJHSMlH0hITBREIgg1AzQJNAMJNQo0CiMNRDQIQACkKGQ0Ch0jKWQ0"
+    "CggfSEhMFEQ1AigoZDQCCWcpKWQ0CQhnKmQiEkAAdCpkNAKIB9M0AjQKiAgDJw4nDmQ0A4gHjWc0AiMNRDQCNhoBFw9ENAMnBWQdIyUfSEhMFEQ1FzQI"
+    "QAAmKSlkNBcJZycHJwdkNBcIZyhkKWQKIQYMRClkKGQKIQYMRCJCB0MoKGQ0FwlnJwYnBmQ0FwhnQv/XNAKIB3tC/4spZDQKHSMoZDQKCB9ISEwURDUC"
+    "KChkNAkIZykpZDQCCWcrZDQCiAc2NAo0AogHZicNJw1kNAOIBvBnQv9gNhoBFzULNAsjDUQ0CEAArClkNAsdIyhkNAsJH0hITBREIgg1DDQMIw1ENAwl"
+    "HSMlIQkJH0hITBREIgg0DAk1AzQMNAMINQ00CTQND0Q0CEAAQCgoZDQLCWcpKWQ0DQhnKmQiEkAAIypkNAuIBrM0CzQMiAbjJw4nDmQ0A4gGbWc0CTQN"
+    "CTUOQv7jNAuIBqxC/9woKGQ0DQhnKSlkNAsJZytkNAuIBno0DDQLiAaqJw0nDWQ0A4gGNGdC/8QoZDQLHSMpZDQLCR9ISEwURCIINQxC/1ExFiIIOBkj"
+    "EkQxFiIIOBAhBBJEMRYiCDgYMggSRDEWIgg5GgAnIBJEQv31IkL92ypkIhJEMRYiCTgQIhJEMRYiCTgHMgoSRDEWIgk4CCMNRDEWIgk4CDUJIjUIQv2u"
+    "JxQnFGQ0GjQYC4gFrWdC/SYnEycTZDQZNBgLiAWcZ0L9CjEWJAk4ECEHEkQxFiQJOBEnEGQSRDEWJAk4FDIKEkQxFiQJOBIjDUQxFiIJOBkjEkQxFiIJ"
+    "OBAhBBJEMRYiCTgYMggSRDEWIgk5GgAnHhJEMRkjEkQxECEEEkQxFiQJOBInBGQSQAA/MRYkCTgSKWQdIycEZB9ISEwURDUHNAcjDUQ0BylkDkQpKWQ0"
+    "BwlnJwQnBGQxFiQJOBIJZytkNAeIBSoiQgTwKWQ1B0L/zzEWIgk4ECEHEkQxFiIJOBEnEGQSRDEWIgk4FDIKEkQxFiIJOBIjDUQxGSMSRDEQIQQSRDEW"
+    "Igg4GSMSRDEWIgg4ECEEEkQxFiIIOBgyCBJEMRYiCDkaACcfEkQxFiIJOBInBGQSQABBMRYiCTgSKGQdIycEZB9ISEwURDUGNAYjDUQ0BihkDkQoKGQ0"
+    "BglnKmQiEkAACypkNAaIBIIiQgRINAaIBJNC//QoZDUGQv/NMRkjEkQxECEEEkQxFiQJOBkjEkQxFiQJOBAhBBJEMRYkCTgYMggSRDEWJAk5GgAnGRJE"
+    "MRYkCTsUIw1AAAQiQgP3I0AADitkMRYkCTsUiAQeQv/qKmQiEkAADipkMRYkCTsUiAQJQv/VMRYkCTsUiAQXQv/JMRkjEkQxECEEEkQxFiIJOBkjEkQx"
+    "FiIJOBAhBBJEMRYiCTgYMggSRDEWIgk5GgAnGRJEMRYiCTsTIw1AAAQiQgOCIkAADitkMRYiCTsTiAOpQv/qKmQiEkAADipkMRYiCTsTiAOUQv/VMRYi"
+    "CTsTiAOiQv/JKmQiEkACNDEWJAk4ECEHEkQxFiQJOBEqZBJEMRYkCTgUMgoSRDEWJAk4EiMNRDEWJAk4EjUEMRYiCTgQIQcSRDEWIgk4EStkEkQxFiIJ"
+    "OBQyChJEMRYiCTgSIw1EMRYiCTgSNQUxGSMSRDEQIQQSRDEWIgg4GSMSRDEWIgg4ECEEEkQxFiIIOBgyCBJEMRYiCDkaACccEkQxFiQIOBkjEkQxFiQI"
+    "OBAhBBJEMRYkCDgYMggSRDEWJAg5GgAnHRJEKGQpZAgjEkABZihkIQYdIylkH0hITBRENQ80BCEGHSM0BR9ISEwURDUQNA8lHSM0EB9ISEwURDUVNhoB"
+    "F4GQTg5ENBUlNhoBFwkNNBUlNhoBFwgMEEQ0EDQPDUAA7zQQNA8MQADENBA0DxJAAAEANAQ1ETQFNRIjNRMjNRQoZClkCCMSQACBNBEnBGQdIyhkH0hI"
+    "TBRENRw0EicEZB0jKWQfSEhMFEQ1HTQcNB0NQABQNBw1ADQAIw1EKGQpZAgjEkAANSgoZDQRCGcpKWQ0EghnJwQnBGQ0AAhnJxBkNACIAeIoZClkCiEG"
+    "DEQpZChkCiEGDEQiQgGWJxEyB2dC/8M0HTUAQv+tIQg0EQo0Eg1AAAw0EZI0EpILNQBC/5Y0ETQSC5I1AEL/izQENRE0BClkHSMoZB9ISEwURCIINRIj"
+    "NRM0BTQSCTUUQv8wNAUoZB0jKWQfSEhMFEQiCDURNAU1EjQENBEJNRMjNRRC/w00BDURNAU1EkL/AjEWJAk4ECISRDEWJAk4BzIKEkQxFiQJOAgjDUQx"
+    "FiQJOAg1BEL91CJCAOkxGSEHEkAAfzYaAIADc2N1EkAAPzYaAIACcnISQAABADEAJwlkEkQqZCISQAAcKmQnBmSIAOkrZCcHZIgA4ScGI2cnByNnIkIA"
+    "nycGZIgA6UL/4zEAJwlkEkQhBScMZTUnNSg0J0AAFzYaARcyBycMZAgPRCcLNhoBF2ciQgBqJww0KGdC/+ExACcJZBJEJwtkIxNEJwtkMgcORCcLI2ci"
+    "QgBGI0IAQiNCAD4jQgA6IQUnCWU1IzUkNCNEJwk0JGc2GgAXIxM2GgEXIxMQRDYaABc2GgEXDEQqNhoAF2crNhoBF2cnDyNnIkM1HjUBNB4hCDQBCQ1A"
+    "AAY0ATQeCIk0HiEINAEJCYk1H7EhB7IQNB+yESOyEjIKshQjsgGziTUhNSCxIQeyEDQgshE0IbISMQCyFCOyAbOJNSIyCmA0IjIBCA9EsSKyEDQisggx"
+    "ALIHI7IBs4k1MjUxJxUnFWQ0MYj/hmcnFicWZDQyiP97ZyEINDIKNBkNQAAcIQg0MQo0Gg1BACInGCcYZDQxNBoLiP9XZ0IAEScXJxdkNDI0GQuI/0Zn"
+    "Qv/TiQ=="
+)
 
-MAINNET_APPROVAL_PROGRAM_75BP_CONSTANT_PRODUCT = [5, 32, 11, 1, 0, 2, 6, 192, 132, 61, 188, 160, 236, 160, 2, 4, 128, 148, 235, 220, 3, 255, 255, 255, 255, 255, 255, 255, 255, 255, 1, 232, 7, 204, 58, 38, 34, 2, 98, 49, 2, 98, 50, 2, 97, 49, 2, 97, 50, 2, 108, 99, 2, 114, 102, 3, 97, 49, 114, 3, 97, 50, 114, 4, 109, 102, 108, 114, 1, 97, 3, 102, 108, 102, 3, 99, 117, 116, 3, 99, 117, 100, 3, 99, 102, 49, 3, 99, 102, 50, 1, 105, 1, 108, 2, 108, 116, 3, 115, 102, 101, 4, 99, 116, 49, 50, 4, 99, 116, 50, 49, 3, 99, 118, 49, 3, 99, 118, 50, 4, 99, 118, 49, 50, 4, 99, 118, 50, 49, 1, 112, 8, 65, 70, 45, 80, 79, 79, 76, 45, 1, 45, 7, 45, 55, 53, 46, 48, 66, 80, 5, 114, 112, 97, 49, 114, 5, 114, 112, 97, 50, 114, 4, 98, 97, 49, 111, 4, 98, 97, 50, 111, 3, 114, 115, 114, 49, 24, 35, 18, 64, 12, 240, 49, 25, 129, 5, 18, 64, 12, 228, 49, 25, 34, 18, 64, 12, 217, 49, 25, 36, 18, 64, 12, 206, 39, 15, 100, 34, 18, 64, 1, 111, 54, 26, 0, 128, 2, 105, 112, 18, 64, 0, 1, 0, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 39, 15, 100, 20, 68, 42, 100, 34, 13, 64, 1, 69, 43, 100, 34, 13, 64, 1, 54, 42, 100, 34, 18, 64, 1, 13, 42, 100, 113, 3, 53, 39, 53, 40, 43, 100, 113, 3, 53, 41, 53, 42, 52, 39, 68, 52, 41, 68, 39, 26, 52, 40, 80, 39, 27, 80, 52, 42, 80, 39, 28, 80, 53, 27, 177, 129, 3, 178, 16, 52, 27, 178, 38, 128, 7, 65, 70, 45, 80, 79, 79, 76, 178, 37, 33, 8, 178, 34, 37, 178, 35, 128, 18, 104, 116, 116, 112, 115, 58, 47, 47, 97, 108, 103, 111, 102, 105, 46, 111, 114, 103, 178, 39, 50, 10, 178, 41, 50, 10, 178, 42, 179, 39, 16, 180, 60, 103, 33, 5, 39, 5, 101, 53, 31, 53, 32, 52, 31, 68, 52, 32, 33, 4, 14, 68, 39, 5, 52, 32, 103, 33, 5, 39, 10, 101, 53, 35, 53, 36, 52, 35, 68, 52, 36, 33, 4, 14, 68, 39, 10, 52, 36, 103, 33, 5, 39, 8, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 33, 4, 14, 68, 39, 8, 52, 38, 103, 39, 11, 35, 103, 33, 5, 39, 12, 101, 53, 33, 53, 34, 52, 33, 68, 39, 12, 52, 34, 103, 39, 17, 50, 7, 103, 40, 35, 103, 41, 35, 103, 39, 4, 35, 103, 39, 6, 35, 103, 39, 7, 35, 103, 39, 19, 35, 103, 39, 20, 35, 103, 39, 21, 35, 103, 39, 22, 35, 103, 39, 23, 35, 103, 39, 24, 35, 103, 39, 13, 35, 103, 39, 14, 35, 103, 128, 2, 109, 97, 33, 5, 103, 128, 3, 115, 102, 112, 33, 10, 103, 39, 15, 34, 103, 34, 66, 11, 228, 43, 100, 113, 3, 53, 41, 53, 42, 52, 41, 68, 39, 26, 128, 4, 65, 76, 71, 79, 80, 39, 27, 80, 52, 42, 80, 39, 28, 80, 53, 27, 66, 254, 247, 43, 100, 136, 11, 222, 66, 254, 194, 42, 100, 136, 11, 214, 66, 254, 179, 49, 0, 39, 9, 100, 18, 64, 10, 171, 49, 25, 35, 18, 49, 16, 37, 18, 16, 64, 0, 1, 0, 54, 26, 0, 128, 5, 100, 117, 109, 109, 121, 18, 64, 10, 140, 54, 26, 0, 39, 25, 18, 64, 8, 30, 54, 26, 0, 39, 29, 18, 64, 7, 162, 54, 26, 0, 39, 30, 18, 64, 7, 38, 54, 26, 0, 39, 31, 18, 64, 6, 111, 54, 26, 0, 39, 32, 18, 64, 5, 186, 54, 26, 0, 39, 18, 18, 54, 26, 0, 128, 3, 115, 101, 102, 18, 17, 64, 2, 122, 54, 26, 0, 39, 33, 18, 64, 1, 249, 54, 26, 0, 128, 2, 102, 108, 18, 64, 0, 1, 0, 33, 5, 39, 5, 101, 53, 31, 53, 32, 52, 31, 68, 52, 32, 33, 4, 14, 68, 39, 5, 52, 32, 103, 33, 5, 39, 10, 101, 53, 35, 53, 36, 52, 35, 68, 52, 36, 33, 4, 14, 68, 39, 10, 52, 36, 103, 33, 5, 39, 8, 101, 53, 37, 53, 38, 52, 37, 68, 52, 38, 33, 4, 14, 68, 39, 8, 52, 38, 103, 54, 26, 2, 23, 39, 10, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 34, 8, 53, 22, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 35, 18, 68, 54, 26, 1, 23, 42, 100, 18, 54, 26, 1, 23, 43, 100, 18, 17, 68, 54, 26, 2, 23, 35, 13, 68, 54, 26, 1, 23, 42, 100, 18, 64, 1, 75, 54, 26, 2, 23, 41, 100, 39, 8, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 14, 68, 54, 26, 1, 23, 34, 18, 64, 0, 255, 50, 4, 34, 9, 56, 16, 33, 6, 18, 68, 50, 4, 34, 9, 56, 17, 54, 26, 1, 23, 18, 68, 50, 4, 34, 9, 56, 20, 50, 10, 18, 68, 50, 4, 34, 9, 56, 18, 35, 13, 68, 50, 4, 34, 9, 56, 18, 54, 26, 2, 23, 52, 22, 8, 18, 68, 54, 26, 1, 23, 42, 100, 18, 64, 0, 160, 43, 100, 54, 26, 2, 23, 136, 10, 126, 54, 26, 1, 23, 42, 100, 18, 64, 0, 131, 41, 41, 100, 52, 22, 8, 103, 52, 22, 39, 5, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 53, 23, 54, 26, 1, 23, 42, 100, 18, 64, 0, 64, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 39, 14, 39, 14, 100, 52, 22, 52, 23, 9, 136, 9, 254, 103, 40, 100, 33, 9, 15, 68, 41, 100, 33, 9, 15, 68, 40, 100, 41, 100, 10, 33, 7, 12, 68, 41, 100, 40, 100, 10, 33, 7, 12, 68, 34, 66, 9, 218, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 39, 13, 39, 13, 100, 52, 22, 52, 23, 9, 136, 9, 190, 103, 66, 255, 189, 40, 40, 100, 52, 22, 8, 103, 66, 255, 122, 42, 100, 34, 18, 64, 0, 12, 42, 100, 54, 26, 2, 23, 136, 9, 215, 66, 255, 86, 54, 26, 2, 23, 136, 9, 231, 66, 255, 76, 50, 4, 34, 9, 56, 16, 34, 18, 68, 50, 4, 34, 9, 56, 7, 50, 10, 18, 68, 50, 4, 34, 9, 56, 8, 35, 13, 68, 50, 4, 34, 9, 56, 8, 54, 26, 2, 23, 52, 22, 8, 18, 68, 66, 255, 11, 54, 26, 2, 23, 40, 100, 39, 8, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 14, 68, 66, 254, 178, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 18, 18, 68, 49, 22, 34, 9, 59, 14, 35, 13, 64, 0, 4, 34, 66, 9, 12, 49, 22, 34, 9, 59, 8, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 14, 136, 9, 48, 66, 255, 229, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 14, 136, 9, 27, 66, 255, 208, 49, 22, 34, 9, 59, 14, 136, 9, 41, 66, 255, 196, 50, 7, 39, 17, 100, 9, 53, 24, 39, 17, 50, 7, 103, 41, 100, 33, 7, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 25, 40, 100, 33, 7, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 26, 33, 8, 52, 25, 10, 52, 24, 13, 64, 2, 228, 33, 8, 52, 26, 10, 52, 24, 13, 64, 2, 200, 33, 5, 39, 5, 101, 53, 31, 53, 32, 52, 31, 68, 52, 32, 33, 4, 14, 68, 39, 5, 52, 32, 103, 49, 22, 34, 9, 56, 16, 34, 18, 64, 2, 119, 49, 22, 34, 9, 56, 17, 42, 100, 18, 49, 22, 34, 9, 56, 17, 43, 100, 18, 17, 68, 49, 22, 34, 9, 56, 16, 33, 6, 18, 68, 49, 22, 34, 9, 56, 17, 49, 22, 34, 9, 56, 17, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 9, 49, 22, 34, 9, 56, 17, 42, 100, 18, 64, 2, 32, 35, 53, 8, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 54, 26, 0, 39, 18, 18, 64, 1, 224, 54, 26, 0, 39, 18, 18, 64, 1, 23, 52, 9, 33, 10, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 34, 8, 53, 3, 52, 9, 52, 3, 9, 53, 10, 52, 10, 35, 13, 68, 52, 8, 64, 0, 194, 40, 100, 52, 10, 29, 35, 41, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 2, 9, 103, 41, 41, 100, 52, 9, 8, 103, 42, 100, 34, 18, 64, 0, 146, 42, 100, 52, 2, 136, 7, 227, 52, 2, 52, 10, 136, 8, 19, 52, 2, 35, 13, 68, 52, 2, 54, 26, 1, 23, 15, 68, 52, 3, 39, 5, 100, 29, 35, 33, 4, 31, 72, 72, 76, 20, 68, 53, 23, 52, 8, 64, 0, 64, 41, 41, 100, 52, 23, 9, 103, 39, 7, 39, 7, 100, 52, 23, 8, 103, 39, 14, 39, 14, 100, 52, 3, 52, 23, 9, 136, 7, 101, 103, 40, 100, 33, 9, 15, 68, 41, 100, 33, 9, 15, 68, 40, 100, 41, 100, 10, 33, 7, 12, 68, 41, 100, 40, 100, 10, 33, 7, 12, 68, 34, 66, 7, 65, 40, 40, 100, 52, 23, 9, 103, 39, 6, 39, 6, 100, 52, 23, 8, 103, 39, 13, 39, 13, 100, 52, 3, 52, 23, 9, 136, 7, 37, 103, 66, 255, 189, 52, 2, 136, 7, 109, 66, 255, 109, 41, 100, 52, 10, 29, 35, 40, 100, 52, 10, 8, 31, 72, 72, 76, 20, 68, 53, 2, 40, 40, 100, 52, 9, 8, 103, 41, 41, 100, 52, 2, 9, 103, 43, 100, 52, 2, 136, 7, 40, 52, 10, 52, 2, 136, 7, 88, 66, 255, 66, 54, 26, 1, 23, 53, 11, 52, 11, 35, 13, 68, 52, 8, 64, 0, 152, 41, 100, 52, 11, 29, 35, 40, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 52, 12, 35, 13, 68, 52, 12, 33, 4, 29, 35, 33, 4, 33, 10, 9, 31, 72, 72, 76, 20, 68, 34, 8, 52, 12, 9, 53, 3, 52, 12, 52, 3, 8, 53, 13, 52, 9, 52, 13, 15, 68, 52, 8, 64, 0, 53, 40, 40, 100, 52, 11, 9, 103, 41, 41, 100, 52, 13, 8, 103, 42, 100, 34, 18, 64, 0, 24, 42, 100, 52, 11, 136, 6, 174, 52, 11, 52, 12, 136, 6, 222, 52, 9, 52, 13, 9, 53, 14, 66, 254, 206, 52, 11, 136, 6, 178, 66, 255, 231, 40, 40, 100, 52, 13, 8, 103, 41, 41, 100, 52, 11, 9, 103, 43, 100, 52, 11, 136, 6, 128, 52, 12, 52, 11, 136, 6, 176, 66, 255, 207, 40, 100, 52, 11, 29, 35, 41, 100, 52, 11, 9, 31, 72, 72, 76, 20, 68, 34, 8, 53, 12, 66, 255, 101, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 33, 18, 68, 66, 253, 246, 34, 66, 253, 221, 42, 100, 34, 18, 68, 49, 22, 34, 9, 56, 16, 34, 18, 68, 49, 22, 34, 9, 56, 7, 50, 10, 18, 68, 49, 22, 34, 9, 56, 8, 35, 13, 68, 49, 22, 34, 9, 56, 8, 53, 9, 34, 53, 8, 66, 253, 176, 39, 20, 39, 20, 100, 52, 26, 52, 24, 11, 136, 5, 189, 103, 66, 253, 39, 39, 19, 39, 19, 100, 52, 25, 52, 24, 11, 136, 5, 172, 103, 66, 253, 11, 49, 22, 36, 9, 56, 16, 33, 6, 18, 68, 49, 22, 36, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 31, 18, 68, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 36, 9, 56, 18, 39, 4, 100, 18, 64, 0, 63, 49, 22, 36, 9, 56, 18, 41, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 7, 52, 7, 35, 13, 68, 52, 7, 41, 100, 14, 68, 41, 41, 100, 52, 7, 9, 103, 39, 4, 39, 4, 100, 49, 22, 36, 9, 56, 18, 9, 103, 43, 100, 52, 7, 136, 5, 62, 34, 66, 5, 2, 41, 100, 53, 7, 66, 255, 207, 49, 22, 34, 9, 56, 16, 33, 6, 18, 68, 49, 22, 34, 9, 56, 17, 39, 16, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 32, 18, 68, 49, 22, 34, 9, 56, 18, 39, 4, 100, 18, 64, 0, 65, 49, 22, 34, 9, 56, 18, 40, 100, 29, 35, 39, 4, 100, 31, 72, 72, 76, 20, 68, 53, 6, 52, 6, 35, 13, 68, 52, 6, 40, 100, 14, 68, 40, 40, 100, 52, 6, 9, 103, 42, 100, 34, 18, 64, 0, 11, 42, 100, 52, 6, 136, 4, 152, 34, 66, 4, 92, 52, 6, 136, 4, 169, 66, 255, 244, 40, 100, 53, 6, 66, 255, 205, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 36, 9, 56, 25, 35, 18, 68, 49, 22, 36, 9, 56, 16, 37, 18, 68, 49, 22, 36, 9, 56, 24, 50, 8, 18, 68, 49, 22, 36, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 36, 9, 59, 20, 35, 13, 64, 0, 4, 34, 66, 4, 13, 35, 64, 0, 14, 43, 100, 49, 22, 36, 9, 59, 20, 136, 4, 54, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 36, 9, 59, 20, 136, 4, 33, 66, 255, 213, 49, 22, 36, 9, 59, 20, 136, 4, 47, 66, 255, 201, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 9, 56, 25, 35, 18, 68, 49, 22, 34, 9, 56, 16, 37, 18, 68, 49, 22, 34, 9, 56, 24, 50, 8, 18, 68, 49, 22, 34, 9, 57, 26, 0, 39, 25, 18, 68, 49, 22, 34, 9, 59, 19, 35, 13, 64, 0, 4, 34, 66, 3, 154, 34, 64, 0, 14, 43, 100, 49, 22, 34, 9, 59, 19, 136, 3, 195, 66, 255, 234, 42, 100, 34, 18, 64, 0, 14, 42, 100, 49, 22, 34, 9, 59, 19, 136, 3, 174, 66, 255, 213, 49, 22, 34, 9, 59, 19, 136, 3, 188, 66, 255, 201, 42, 100, 34, 18, 64, 2, 55, 49, 22, 36, 9, 56, 16, 33, 6, 18, 68, 49, 22, 36, 9, 56, 17, 42, 100, 18, 68, 49, 22, 36, 9, 56, 20, 50, 10, 18, 68, 49, 22, 36, 9, 56, 18, 35, 13, 68, 49, 22, 36, 9, 56, 18, 53, 4, 49, 22, 34, 9, 56, 16, 33, 6, 18, 68, 49, 22, 34, 9, 56, 17, 43, 100, 18, 68, 49, 22, 34, 9, 56, 20, 50, 10, 18, 68, 49, 22, 34, 9, 56, 18, 35, 13, 68, 49, 22, 34, 9, 56, 18, 53, 5, 49, 25, 35, 18, 68, 49, 16, 37, 18, 68, 49, 22, 34, 8, 56, 25, 35, 18, 68, 49, 22, 34, 8, 56, 16, 37, 18, 68, 49, 22, 34, 8, 56, 24, 50, 8, 18, 68, 49, 22, 34, 8, 57, 26, 0, 39, 29, 18, 68, 49, 22, 36, 8, 56, 25, 35, 18, 68, 49, 22, 36, 8, 56, 16, 37, 18, 68, 49, 22, 36, 8, 56, 24, 50, 8, 18, 68, 49, 22, 36, 8, 57, 26, 0, 39, 30, 18, 68, 40, 100, 41, 100, 8, 35, 18, 64, 1, 108, 40, 100, 33, 7, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 15, 52, 4, 33, 7, 29, 35, 52, 5, 31, 72, 72, 76, 20, 68, 53, 16, 52, 15, 33, 4, 29, 35, 52, 16, 31, 72, 72, 76, 20, 68, 53, 21, 52, 21, 33, 4, 54, 26, 1, 23, 9, 13, 52, 21, 33, 4, 54, 26, 1, 23, 8, 12, 16, 68, 52, 16, 52, 15, 13, 64, 0, 251, 52, 16, 52, 15, 12, 64, 0, 208, 52, 16, 52, 15, 18, 64, 0, 1, 0, 52, 4, 53, 17, 52, 5, 53, 18, 35, 53, 19, 35, 53, 20, 40, 100, 41, 100, 8, 35, 18, 64, 0, 141, 52, 17, 39, 4, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 53, 28, 52, 18, 39, 4, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 53, 29, 52, 28, 52, 29, 13, 64, 0, 92, 52, 28, 53, 0, 52, 0, 35, 13, 68, 40, 100, 41, 100, 8, 35, 18, 64, 0, 65, 40, 40, 100, 52, 17, 8, 103, 41, 41, 100, 52, 18, 8, 103, 39, 4, 39, 4, 100, 52, 0, 8, 103, 39, 16, 100, 52, 0, 136, 2, 5, 40, 100, 33, 9, 15, 68, 41, 100, 33, 9, 15, 68, 40, 100, 41, 100, 10, 33, 7, 12, 68, 41, 100, 40, 100, 10, 33, 7, 12, 68, 34, 66, 1, 171, 39, 17, 50, 7, 103, 66, 255, 183, 52, 29, 53, 0, 66, 255, 161, 33, 8, 52, 17, 10, 52, 18, 13, 64, 0, 12, 52, 17, 146, 52, 18, 146, 11, 53, 0, 66, 255, 138, 52, 17, 52, 18, 11, 146, 53, 0, 66, 255, 127, 52, 4, 53, 17, 52, 4, 41, 100, 29, 35, 40, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 18, 35, 53, 19, 52, 5, 52, 18, 9, 53, 20, 66, 255, 36, 52, 5, 40, 100, 29, 35, 41, 100, 31, 72, 72, 76, 20, 68, 34, 8, 53, 17, 52, 5, 53, 18, 52, 4, 52, 17, 9, 53, 19, 35, 53, 20, 66, 255, 1, 52, 4, 53, 17, 52, 5, 53, 18, 66, 254, 246, 49, 22, 36, 9, 56, 16, 34, 18, 68, 49, 22, 36, 9, 56, 7, 50, 10, 18, 68, 49, 22, 36, 9, 56, 8, 35, 13, 68, 49, 22, 36, 9, 56, 8, 53, 4, 66, 253, 209, 34, 66, 0, 254, 49, 25, 33, 6, 18, 64, 0, 127, 54, 26, 0, 128, 3, 115, 99, 117, 18, 64, 0, 63, 54, 26, 0, 128, 2, 114, 114, 18, 64, 0, 1, 0, 49, 0, 39, 9, 100, 18, 68, 42, 100, 34, 18, 64, 0, 28, 42, 100, 39, 6, 100, 136, 1, 0, 43, 100, 39, 7, 100, 136, 0, 248, 39, 6, 35, 103, 39, 7, 35, 103, 34, 66, 0, 180, 39, 6, 100, 136, 1, 0, 66, 255, 227, 49, 0, 39, 9, 100, 18, 68, 33, 5, 39, 12, 101, 53, 33, 53, 34, 52, 33, 64, 0, 23, 54, 26, 1, 23, 50, 7, 39, 12, 100, 8, 15, 68, 39, 11, 54, 26, 1, 23, 103, 34, 66, 0, 127, 39, 12, 52, 34, 103, 66, 255, 225, 49, 0, 39, 9, 100, 18, 68, 39, 11, 100, 35, 19, 68, 39, 11, 100, 50, 7, 14, 68, 39, 11, 35, 103, 34, 66, 0, 91, 35, 66, 0, 87, 35, 66, 0, 83, 35, 66, 0, 79, 49, 53, 33, 6, 15, 68, 49, 52, 129, 32, 15, 68, 33, 5, 39, 9, 101, 53, 1, 53, 30, 52, 1, 68, 39, 9, 52, 30, 103, 54, 26, 0, 23, 35, 19, 54, 26, 1, 23, 35, 19, 16, 68, 54, 26, 0, 23, 54, 26, 1, 23, 12, 68, 42, 54, 26, 0, 23, 103, 43, 54, 26, 1, 23, 103, 128, 2, 118, 105, 54, 26, 2, 23, 103, 39, 15, 35, 103, 34, 67, 53, 44, 53, 43, 52, 44, 33, 8, 52, 43, 9, 13, 64, 0, 6, 52, 43, 52, 44, 8, 137, 52, 44, 33, 8, 52, 43, 9, 9, 34, 9, 137, 53, 45, 177, 33, 6, 178, 16, 52, 45, 178, 17, 35, 178, 18, 50, 10, 178, 20, 35, 178, 1, 179, 137, 53, 47, 53, 46, 177, 33, 6, 178, 16, 52, 46, 178, 17, 52, 47, 178, 18, 49, 0, 178, 20, 35, 178, 1, 179, 137, 53, 48, 50, 10, 96, 52, 48, 50, 1, 8, 15, 68, 177, 34, 178, 16, 52, 48, 178, 8, 49, 0, 178, 7, 35, 178, 1, 179, 137, 53, 50, 53, 49, 39, 21, 39, 21, 100, 52, 49, 136, 255, 132, 103, 39, 22, 39, 22, 100, 52, 50, 136, 255, 121, 103, 33, 8, 52, 50, 10, 52, 25, 13, 64, 0, 28, 33, 8, 52, 49, 10, 52, 26, 13, 65, 0, 34, 39, 24, 39, 24, 100, 52, 49, 52, 26, 11, 136, 255, 85, 103, 66, 0, 17, 39, 23, 39, 23, 100, 52, 50, 52, 25, 11, 136, 255, 68, 103, 66, 255, 211, 137]
+TESTNET_APPROVAL_PROGRAM_100BP_CONSTANT_PRODUCT_B64 = (
+    "BSAKAQACBsCEPZ/tvB+AlOvcAwT///////////8BkE4mIQJiMQJiMgJhMQJhMgJsYwJyZgNhMXIDYTJyBG1mbHIBYQNmbGYDY3V0A2N1ZANjZjEDY2Yy"
+    "AWkBbAJsdANzZmUEY3QxMgRjdDIxA2N2MQNjdjIEY3YxMgRjdjIxAXAIQUYtUE9PTC0BLQVycGExcgVycGEycgRiYTFvBGJhMm8DcnNyMRgjEkAMvzEZ"
+    "gQUSQAyzMRkiEkAMqDEZJBJADJ0nD2QiEkABWjYaAIACaXASQAABADEZIxJEMRAlEkQnD2QURCpkIg1AATArZCINQAEhKmQiEkAA+ypkcQM1LTUuK2Rx"
+    "AzUvNTA0LUQ0L0QnGjQuJxs0MFBQUDUbsYEDshA0G7ImgAdBRi1QT09MsiUhCLIiJbIjgBJodHRwczovL2FsZ29maS5vcmeyJzIKsikyCrIqsycQtDxn"
+    "IQUnBWU1JTUmNCVENCYhBA5EJwU0JmchBScKZTUpNSo0KUQ0KiEEDkQnCjQqZyEFJwhlNSs1LDQrRDQsIQQORCcINCxnJwsjZyEFJwxlNSc1KDQnRCcM"
+    "NChnJxEyB2coI2cpI2cnBCNnJwYjZycHI2cnEyNnJxQjZycVI2cnFiNnJxcjZycYI2cnDSNnJw4jZycPImciQguwK2RxAzUvNTA0L0QnGoAEQUxHTycb"
+    "NDBQUFA1G0L/CStkiAutQv7XKmSIC6VC/sgxACcJZBJACo8xGSMSMRAlEhBAAAEANhoAgAVkdW1teRJACnA2GgAnGRJACAY2GgAnHBJAB4o2GgAnHRJA"
+    "Bw42GgAnHhJABlc2GgAnHxJABaI2GgAnEhI2GgCAA3NlZhIRQAJuNhoAJyASQAHtNhoAgAJmbBJAAAEAIQUnBWU1JTUmNCVENCYhBA5EJwU0JmchBScK"
+    "ZTUpNSo0KUQ0KiEEDkQnCjQqZyEFJwhlNSs1LDQrRDQsIQQORCcINCxnNhoCFycKZB0jIQQfSEhMFEQiCDUWMRkjEkQxECUSRDEWIxJENhoBFypkEjYa"
+    "ARcrZBIRRDYaAhcjDUQ2GgEXKmQSQAE/NhoCFylkJwhkHSMhBB9ISEwURA5ENhoBFyISQADzMgQiCTgQIQcSRDIEIgk4ETYaARcSRDIEIgk4FDIKEkQy"
+    "BCIJOBIjDUQyBCIJOBI2GgIXNBYIEkQ2GgEXKmQSQACUK2Q2GgIXiApNNhoBFypkEkAAdykpZDQWCGc0FicFZB0jIQQfSEhMFEQ1FzYaARcqZBJAADQp"
+    "KWQ0FwlnJwcnB2Q0FwhnJw4nDmQ0FjQXCYgJzWcoZClkCiEGDEQpZChkCiEGDEQiQgm1KChkNBcJZycGJwZkNBcIZycNJw1kNBY0FwmICZlnQv/JKChk"
+    "NBYIZ0L/hipkIhJAAAwqZDYaAheICbJC/2I2GgIXiAnCQv9YMgQiCTgQIhJEMgQiCTgHMgoSRDIEIgk4CCMNRDIEIgk4CDYaAhc0FggSREL/FzYaAhco"
+    "ZCcIZB0jIQQfSEhMFEQOREL+vjEZIxJEMRAlEkQxFiIJOBkjEkQxFiIJOBAlEkQxFiIJOBgyCBJEMRYiCTkaACcSEkQxFiIJOw4jDUAABCJCCOcxFiIJ"
+    "OwhAAA4rZDEWIgk7DogJC0L/5SpkIhJAAA4qZDEWIgk7DogI9kL/0DEWIgk7DogJBEL/xDIHJxFkCTUYJxEyB2cpZCEGHSMoZB9ISEwURDUZKGQhBh0j"
+    "KWQfSEhMFEQ1GiEINBkKNBgNQALYIQg0Ggo0GA1AArwhBScFZTUlNSY0JUQ0JiEEDkQnBTQmZzEWIgk4ECISQAJrMRYiCTgRKmQSMRYiCTgRK2QSEUQx"
+    "FiIJOBAhBxJEMRYiCTgRMRYiCTgREkQxFiIJOBQyChJEMRYiCTgSIw1EMRYiCTgSNQkxFiIJOBEqZBJAAhQjNQgxGSMSRDEQJRJENhoAJxISQAHUNhoA"
+    "JxISQAELNAkhCR0jIQQfSEhMFEQiCDUDNAk0Awk1CjQKIw1ENAhAALYoZDQKHSMpZDQKCB9ISEwURDUCKChkNAIJZykpZDQJCGcqZCISQACGKmQ0AogH"
+    "vjQCNAqIB+40AiMNRDQCNhoBFw9ENAMnBWQdIyEEH0hITBRENRc0CEAANCkpZDQXCWcnBycHZDQXCGcnDicOZDQDNBcJiAdAZyhkKWQKIQYMRClkKGQK"
+    "IQYMRCJCBygoKGQ0FwlnJwYnBmQ0FwhnJw0nDWQ0AzQXCYgHDGdC/8k0AogHVEL/eSlkNAodIyhkNAoIH0hITBRENQIoKGQ0CQhnKSlkNAIJZytkNAKI"
+    "Bw80CjQCiAc/Qv9ONhoBFzULNAsjDUQ0CEAAmClkNAsdIyhkNAsJH0hITBREIgg1DDQMIw1ENAwhBB0jIQQhCQkfSEhMFEQiCDQMCTUDNAw0Awg1DTQJ"
+    "NA0PRDQIQAA1KChkNAsJZykpZDQNCGcqZCISQAAYKmQ0C4gGlTQLNAyIBsU0CTQNCTUOQv7aNAuIBplC/+coKGQ0DQhnKSlkNAsJZytkNAuIBmc0DDQL"
+    "iAaXQv/PKGQ0Cx0jKWQ0CwkfSEhMFEQiCDUMQv9lMRYiCDgZIxJEMRYiCDgQJRJEMRYiCDgYMggSRDEWIgg5GgAnIBJEQv4CIkL96SpkIhJEMRYiCTgQ"
+    "IhJEMRYiCTgHMgoSRDEWIgk4CCMNRDEWIgk4CDUJIjUIQv28JxQnFGQ0GjQYC4gFpGdC/TMnEycTZDQZNBgLiAWTZ0L9FzEWJAk4ECEHEkQxFiQJOBEn"
+    "EGQSRDEWJAk4FDIKEkQxFiQJOBIjDUQxFiIJOBkjEkQxFiIJOBAlEkQxFiIJOBgyCBJEMRYiCTkaACceEkQxGSMSRDEQJRJEMRYkCTgSJwRkEkAAPzEW"
+    "JAk4EilkHSMnBGQfSEhMFEQ1BzQHIw1ENAcpZA5EKSlkNAcJZycEJwRkMRYkCTgSCWcrZDQHiAUlIkIE6SlkNQdC/88xFiIJOBAhBxJEMRYiCTgRJxBk"
+    "EkQxFiIJOBQyChJEMRYiCTgSIw1EMRkjEkQxECUSRDEWIgg4GSMSRDEWIgg4ECUSRDEWIgg4GDIIEkQxFiIIORoAJx8SRDEWIgk4EicEZBJAAEExFiIJ"
+    "OBIoZB0jJwRkH0hITBRENQY0BiMNRDQGKGQORCgoZDQGCWcqZCISQAALKmQ0BogEfyJCBEM0BogEkEL/9ChkNQZC/80xGSMSRDEQJRJEMRYkCTgZIxJE"
+    "MRYkCTgQJRJEMRYkCTgYMggSRDEWJAk5GgAnGRJEMRYkCTsUIw1AAAQiQgP0I0AADitkMRYkCTsUiAQdQv/qKmQiEkAADipkMRYkCTsUiAQIQv/VMRYk"
+    "CTsUiAQWQv/JMRkjEkQxECUSRDEWIgk4GSMSRDEWIgk4ECUSRDEWIgk4GDIIEkQxFiIJORoAJxkSRDEWIgk7EyMNQAAEIkIDgSJAAA4rZDEWIgk7E4gD"
+    "qkL/6ipkIhJAAA4qZDEWIgk7E4gDlUL/1TEWIgk7E4gDo0L/ySpkIhJAAjMxFiQJOBAhBxJEMRYkCTgRKmQSRDEWJAk4FDIKEkQxFiQJOBIjDUQxFiQJ"
+    "OBI1BDEWIgk4ECEHEkQxFiIJOBErZBJEMRYiCTgUMgoSRDEWIgk4EiMNRDEWIgk4EjUFMRkjEkQxECUSRDEWIgg4GSMSRDEWIgg4ECUSRDEWIgg4GDII"
+    "EkQxFiIIORoAJxwSRDEWJAg4GSMSRDEWJAg4ECUSRDEWJAg4GDIIEkQxFiQIORoAJx0SRChkKWQIIxJAAWgoZCEGHSMpZB9ISEwURDUPNAQhBh0jNAUf"
+    "SEhMFEQ1EDQPIQQdIzQQH0hITBRENRU2GgEXIQkORDQVIQQ2GgEXCQ00FSEENhoBFwgMEEQ0EDQPDUAA7zQQNA8MQADENBA0DxJAAAEANAQ1ETQFNRIj"
+    "NRMjNRQoZClkCCMSQACBNBEnBGQdIyhkH0hITBRENRw0EicEZB0jKWQfSEhMFEQ1HTQcNB0NQABQNBw1ADQAIw1EKGQpZAgjEkAANSgoZDQRCGcpKWQ0"
+    "EghnJwQnBGQ0AAhnJxBkNACIAeQoZClkCiEGDEQpZChkCiEGDEQiQgGWJxEyB2dC/8M0HTUAQv+tIQg0EQo0Eg1AAAw0EZI0EpILNQBC/5Y0ETQSC5I1"
+    "AEL/izQENRE0BClkHSMoZB9ISEwURCIINRIjNRM0BTQSCTUUQv8wNAUoZB0jKWQfSEhMFEQiCDURNAU1EjQENBEJNRMjNRRC/w00BDURNAU1EkL/AjEW"
+    "JAk4ECISRDEWJAk4BzIKEkQxFiQJOAgjDUQxFiQJOAg1BEL91SJCAOkxGSEHEkAAfzYaAIADc2N1EkAAPzYaAIACcnISQAABADEAJwlkEkQqZCISQAAc"
+    "KmQnBmSIAOsrZCcHZIgA4ycGI2cnByNnIkIAnycGZIgA60L/4zEAJwlkEkQhBScMZTUnNSg0J0AAFzYaARcyBycMZAgPRCcLNhoBF2ciQgBqJww0KGdC"
+    "/+ExACcJZBJEJwtkIxNEJwtkMgcORCcLI2ciQgBGI0IAQiNCAD4jQgA6IQUnCWU1IzUkNCNEJwk0JGc2GgAXIxM2GgEXIxMQRDYaABc2GgEXDEQqNhoA"
+    "F2crNhoBF2cnDyNnIkM1HjUBNB4hCDQBCQ1AAAY0ATQeCIk0HiEINAEJCSIJiTUfsSEHshA0H7IRI7ISMgqyFCOyAbOJNSE1ILEhB7IQNCCyETQhshIx"
+    "ALIUI7IBs4k1IjIKYDQiMgEID0SxIrIQNCKyCDEAsgcjsgGziTUyNTEnFScVZDQxiP+EZycWJxZkNDKI/3lnIQg0Mgo0GQ1AABwhCDQxCjQaDUEAIicY"
+    "JxhkNDE0GguI/1VnQgARJxcnF2Q0MjQZC4j/RGdC/9OJ"
+)
 
-CLEAR_STATE_PROGRAM = [5, 129, 1, 67]
\ No newline at end of file
+MAINNET_APPROVAL_PROGRAM_25BP_CONSTANT_PRODUCT_B64 = (
+    "BSALAQACBsCEPbyg7KACBICU69wD////////////AegHxBMmIgJiMQJiMgJhMQJhMgJsYwJyZgNhMXIDYTJyBG1mbHIBYQNmbGYDY3V0A2N1ZANjZjED"
+    "Y2YyAWkBbAJsdANzZmUEY3QxMgRjdDIxA2N2MQNjdjIEY3YxMgRjdjIxAXAIQUYtUE9PTC0BLQctMjUuMEJQBXJwYTFyBXJwYTJyBGJhMW8EYmEybwNy"
+    "c3IxGCMSQAzwMRmBBRJADOQxGSISQAzZMRkkEkAMzicPZCISQAFvNhoAgAJpcBJAAAEAMRkjEkQxECUSRCcPZBREKmQiDUABRStkIg1AATYqZCISQAEN"
+    "KmRxAzUnNSgrZHEDNSk1KjQnRDQpRCcaNChQJxtQNCpQJxxQNRuxgQOyEDQbsiaAB0FGLVBPT0yyJSEIsiIlsiOAEmh0dHBzOi8vYWxnb2ZpLm9yZ7In"
+    "MgqyKTIKsiqzJxC0PGchBScFZTUfNSA0H0Q0ICEEDkQnBTQgZyEFJwplNSM1JDQjRDQkIQQORCcKNCRnIQUnCGU1JTUmNCVENCYhBA5EJwg0JmcnCyNn"
+    "IQUnDGU1ITUiNCFEJww0ImcnETIHZygjZykjZycEI2cnBiNnJwcjZycTI2cnFCNnJxUjZycWI2cnFyNnJxgjZycNI2cnDiNngAJtYSEFZ4ADc2ZwIQpn"
+    "Jw8iZyJCC+QrZHEDNSk1KjQpRCcagARBTEdPUCcbUDQqUCccUDUbQv73K2SIC95C/sIqZIgL1kL+szEAJwlkEkAKqzEZIxIxECUSEEAAAQA2GgCABWR1"
+    "bW15EkAKjDYaACcZEkAIHjYaACcdEkAHojYaACceEkAHJjYaACcfEkAGbzYaACcgEkAFujYaACcSEjYaAIADc2VmEhFAAno2GgAnIRJAAfk2GgCAAmZs"
+    "EkAAAQAhBScFZTUfNSA0H0Q0ICEEDkQnBTQgZyEFJwplNSM1JDQjRDQkIQQORCcKNCRnIQUnCGU1JTUmNCVENCYhBA5EJwg0Jmc2GgIXJwpkHSMhBB9I"
+    "SEwURCIINRYxGSMSRDEQJRJEMRYjEkQ2GgEXKmQSNhoBFytkEhFENhoCFyMNRDYaARcqZBJAAUs2GgIXKWQnCGQdIyEEH0hITBREDkQ2GgEXIhJAAP8y"
+    "BCIJOBAhBhJEMgQiCTgRNhoBFxJEMgQiCTgUMgoSRDIEIgk4EiMNRDIEIgk4EjYaAhc0FggSRDYaARcqZBJAAKArZDYaAheICn42GgEXKmQSQACDKSlk"
+    "NBYIZzQWJwVkHSMhBB9ISEwURDUXNhoBFypkEkAAQCkpZDQXCWcnBycHZDQXCGcnDicOZDQWNBcJiAn+ZyhkIQkPRClkIQkPRChkKWQKIQcMRClkKGQK"
+    "IQcMRCJCCdooKGQ0FwlnJwYnBmQ0FwhnJw0nDWQ0FjQXCYgJvmdC/70oKGQ0FghnQv96KmQiEkAADCpkNhoCF4gJ10L/VjYaAheICedC/0wyBCIJOBAi"
+    "EkQyBCIJOAcyChJEMgQiCTgIIw1EMgQiCTgINhoCFzQWCBJEQv8LNhoCFyhkJwhkHSMhBB9ISEwURA5EQv6yMRkjEkQxECUSRDEWIgk4GSMSRDEWIgk4"
+    "ECUSRDEWIgk4GDIIEkQxFiIJORoAJxISRDEWIgk7DiMNQAAEIkIJDDEWIgk7CEAADitkMRYiCTsOiAkwQv/lKmQiEkAADipkMRYiCTsOiAkbQv/QMRYi"
+    "CTsOiAkpQv/EMgcnEWQJNRgnETIHZylkIQcdIyhkH0hITBRENRkoZCEHHSMpZB9ISEwURDUaIQg0GQo0GA1AAuQhCDQaCjQYDUACyCEFJwVlNR81IDQf"
+    "RDQgIQQORCcFNCBnMRYiCTgQIhJAAncxFiIJOBEqZBIxFiIJOBErZBIRRDEWIgk4ECEGEkQxFiIJOBExFiIJOBESRDEWIgk4FDIKEkQxFiIJOBIjDUQx"
+    "FiIJOBI1CTEWIgk4ESpkEkACICM1CDEZIxJEMRAlEkQ2GgAnEhJAAeA2GgAnEhJAARc0CSEKHSMhBB9ISEwURCIINQM0CTQDCTUKNAojDUQ0CEAAwihk"
+    "NAodIylkNAoIH0hITBRENQIoKGQ0AglnKSlkNAkIZypkIhJAAJIqZDQCiAfjNAI0CogIEzQCIw1ENAI2GgEXD0Q0AycFZB0jIQQfSEhMFEQ1FzQIQABA"
+    "KSlkNBcJZycHJwdkNBcIZycOJw5kNAM0FwmIB2VnKGQhCQ9EKWQhCQ9EKGQpZAohBwxEKWQoZAohBwxEIkIHQSgoZDQXCWcnBicGZDQXCGcnDScNZDQD"
+    "NBcJiAclZ0L/vTQCiAdtQv9tKWQ0Ch0jKGQ0CggfSEhMFEQ1AigoZDQJCGcpKWQ0AglnK2Q0AogHKDQKNAKIB1hC/0I2GgEXNQs0CyMNRDQIQACYKWQ0"
+    "Cx0jKGQ0CwkfSEhMFEQiCDUMNAwjDUQ0DCEEHSMhBCEKCR9ISEwURCIINAwJNQM0DDQDCDUNNAk0DQ9ENAhAADUoKGQ0CwlnKSlkNA0IZypkIhJAABgq"
+    "ZDQLiAauNAs0DIgG3jQJNA0JNQ5C/s40C4gGskL/5ygoZDQNCGcpKWQ0CwlnK2Q0C4gGgDQMNAuIBrBC/88oZDQLHSMpZDQLCR9ISEwURCIINQxC/2Ux"
+    "FiIIOBkjEkQxFiIIOBAlEkQxFiIIOBgyCBJEMRYiCDkaACchEkRC/fYiQv3dKmQiEkQxFiIJOBAiEkQxFiIJOAcyChJEMRYiCTgIIw1EMRYiCTgINQki"
+    "NQhC/bAnFCcUZDQaNBgLiAW9Z0L9JycTJxNkNBk0GAuIBaxnQv0LMRYkCTgQIQYSRDEWJAk4EScQZBJEMRYkCTgUMgoSRDEWJAk4EiMNRDEWIgk4GSMS"
+    "RDEWIgk4ECUSRDEWIgk4GDIIEkQxFiIJORoAJx8SRDEZIxJEMRAlEkQxFiQJOBInBGQSQAA/MRYkCTgSKWQdIycEZB9ISEwURDUHNAcjDUQ0BylkDkQp"
+    "KWQ0BwlnJwQnBGQxFiQJOBIJZytkNAeIBT4iQgUCKWQ1B0L/zzEWIgk4ECEGEkQxFiIJOBEnEGQSRDEWIgk4FDIKEkQxFiIJOBIjDUQxGSMSRDEQJRJE"
+    "MRYiCDgZIxJEMRYiCDgQJRJEMRYiCDgYMggSRDEWIgg5GgAnIBJEMRYiCTgSJwRkEkAAQTEWIgk4EihkHSMnBGQfSEhMFEQ1BjQGIw1ENAYoZA5EKChk"
+    "NAYJZypkIhJAAAsqZDQGiASYIkIEXDQGiASpQv/0KGQ1BkL/zTEZIxJEMRAlEkQxFiQJOBkjEkQxFiQJOBAlEkQxFiQJOBgyCBJEMRYkCTkaACcZEkQx"
+    "FiQJOxQjDUAABCJCBA0jQAAOK2QxFiQJOxSIBDZC/+oqZCISQAAOKmQxFiQJOxSIBCFC/9UxFiQJOxSIBC9C/8kxGSMSRDEQJRJEMRYiCTgZIxJEMRYi"
+    "CTgQJRJEMRYiCTgYMggSRDEWIgk5GgAnGRJEMRYiCTsTIw1AAAQiQgOaIkAADitkMRYiCTsTiAPDQv/qKmQiEkAADipkMRYiCTsTiAOuQv/VMRYiCTsT"
+    "iAO8Qv/JKmQiEkACNzEWJAk4ECEGEkQxFiQJOBEqZBJEMRYkCTgUMgoSRDEWJAk4EiMNRDEWJAk4EjUEMRYiCTgQIQYSRDEWIgk4EStkEkQxFiIJOBQy"
+    "ChJEMRYiCTgSIw1EMRYiCTgSNQUxGSMSRDEQJRJEMRYiCDgZIxJEMRYiCDgQJRJEMRYiCDgYMggSRDEWIgg5GgAnHRJEMRYkCDgZIxJEMRYkCDgQJRJE"
+    "MRYkCDgYMggSRDEWJAg5GgAnHhJEKGQpZAgjEkABbChkIQcdIylkH0hITBRENQ80BCEHHSM0BR9ISEwURDUQNA8hBB0jNBAfSEhMFEQ1FTQVIQQ2GgEX"
+    "CQ00FSEENhoBFwgMEEQ0EDQPDUAA+zQQNA8MQADQNBA0DxJAAAEANAQ1ETQFNRIjNRMjNRQoZClkCCMSQACNNBEnBGQdIyhkH0hITBRENRw0EicEZB0j"
+    "KWQfSEhMFEQ1HTQcNB0NQABcNBw1ADQAIw1EKGQpZAgjEkAAQSgoZDQRCGcpKWQ0EghnJwQnBGQ0AAhnJxBkNACIAgUoZCEJD0QpZCEJD0QoZClkCiEH"
+    "DEQpZChkCiEHDEQiQgGrJxEyB2dC/7c0HTUAQv+hIQg0EQo0Eg1AAAw0EZI0EpILNQBC/4o0ETQSC5I1AEL/fzQENRE0BClkHSMoZB9ISEwURCIINRIj"
+    "NRM0BTQSCTUUQv8kNAUoZB0jKWQfSEhMFEQiCDURNAU1EjQENBEJNRMjNRRC/wE0BDURNAU1EkL+9jEWJAk4ECISRDEWJAk4BzIKEkQxFiQJOAgjDUQx"
+    "FiQJOAg1BEL90SJCAP4xGSEGEkAAfzYaAIADc2N1EkAAPzYaAIACcnISQAABADEAJwlkEkQqZCISQAAcKmQnBmSIAQArZCcHZIgA+CcGI2cnByNnIkIA"
+    "tCcGZIgBAEL/4zEAJwlkEkQhBScMZTUhNSI0IUAAFzYaARcyBycMZAgPRCcLNhoBF2ciQgB/Jww0ImdC/+ExACcJZBJEJwtkIxNEJwtkMgcORCcLI2ci"
+    "QgBbI0IAVyNCAFMjQgBPMTUhBg9EMTSBIA9EIQUnCWU1ATUeNAFEJwk0Hmc2GgAXIxM2GgEXIxMQRDYaABc2GgEXDEQqNhoAF2crNhoBF2eAAnZpNhoC"
+    "F2cnDyNnIkM1LDUrNCwhCDQrCQ1AAAY0KzQsCIk0LCEINCsJCSIJiTUtsSEGshA0LbIRI7ISMgqyFCOyAbOJNS81LrEhBrIQNC6yETQvshIxALIUI7IB"
+    "s4k1MDIKYDQwMgEID0SxIrIQNDCyCDEAsgcjsgGziTUyNTEnFScVZDQxiP+EZycWJxZkNDKI/3lnIQg0Mgo0GQ1AABwhCDQxCjQaDUEAIicYJxhkNDE0"
+    "GguI/1VnQgARJxcnF2Q0MjQZC4j/RGdC/9OJ"
+)
+
+MAINNET_APPROVAL_PROGRAM_75BP_CONSTANT_PRODUCT_B64 = (
+    "BSALAQACBsCEPbyg7KACBICU69wD////////////AegHzDomIgJiMQJiMgJhMQJhMgJsYwJyZgNhMXIDYTJyBG1mbHIBYQNmbGYDY3V0A2N1ZANjZjED"
+    "Y2YyAWkBbAJsdANzZmUEY3QxMgRjdDIxA2N2MQNjdjIEY3YxMgRjdjIxAXAIQUYtUE9PTC0BLQctNzUuMEJQBXJwYTFyBXJwYTJyBGJhMW8EYmEybwNy"
+    "c3IxGCMSQAzwMRmBBRJADOQxGSISQAzZMRkkEkAMzicPZCISQAFvNhoAgAJpcBJAAAEAMRkjEkQxECUSRCcPZBREKmQiDUABRStkIg1AATYqZCISQAEN"
+    "KmRxAzUnNSgrZHEDNSk1KjQnRDQpRCcaNChQJxtQNCpQJxxQNRuxgQOyEDQbsiaAB0FGLVBPT0yyJSEIsiIlsiOAEmh0dHBzOi8vYWxnb2ZpLm9yZ7In"
+    "MgqyKTIKsiqzJxC0PGchBScFZTUfNSA0H0Q0ICEEDkQnBTQgZyEFJwplNSM1JDQjRDQkIQQORCcKNCRnIQUnCGU1JTUmNCVENCYhBA5EJwg0JmcnCyNn"
+    "IQUnDGU1ITUiNCFEJww0ImcnETIHZygjZykjZycEI2cnBiNnJwcjZycTI2cnFCNnJxUjZycWI2cnFyNnJxgjZycNI2cnDiNngAJtYSEFZ4ADc2ZwIQpn"
+    "Jw8iZyJCC+QrZHEDNSk1KjQpRCcagARBTEdPUCcbUDQqUCccUDUbQv73K2SIC95C/sIqZIgL1kL+szEAJwlkEkAKqzEZIxIxECUSEEAAAQA2GgCABWR1"
+    "bW15EkAKjDYaACcZEkAIHjYaACcdEkAHojYaACceEkAHJjYaACcfEkAGbzYaACcgEkAFujYaACcSEjYaAIADc2VmEhFAAno2GgAnIRJAAfk2GgCAAmZs"
+    "EkAAAQAhBScFZTUfNSA0H0Q0ICEEDkQnBTQgZyEFJwplNSM1JDQjRDQkIQQORCcKNCRnIQUnCGU1JTUmNCVENCYhBA5EJwg0Jmc2GgIXJwpkHSMhBB9I"
+    "SEwURCIINRYxGSMSRDEQJRJEMRYjEkQ2GgEXKmQSNhoBFytkEhFENhoCFyMNRDYaARcqZBJAAUs2GgIXKWQnCGQdIyEEH0hITBREDkQ2GgEXIhJAAP8y"
+    "BCIJOBAhBhJEMgQiCTgRNhoBFxJEMgQiCTgUMgoSRDIEIgk4EiMNRDIEIgk4EjYaAhc0FggSRDYaARcqZBJAAKArZDYaAheICn42GgEXKmQSQACDKSlk"
+    "NBYIZzQWJwVkHSMhBB9ISEwURDUXNhoBFypkEkAAQCkpZDQXCWcnBycHZDQXCGcnDicOZDQWNBcJiAn+ZyhkIQkPRClkIQkPRChkKWQKIQcMRClkKGQK"
+    "IQcMRCJCCdooKGQ0FwlnJwYnBmQ0FwhnJw0nDWQ0FjQXCYgJvmdC/70oKGQ0FghnQv96KmQiEkAADCpkNhoCF4gJ10L/VjYaAheICedC/0wyBCIJOBAi"
+    "EkQyBCIJOAcyChJEMgQiCTgIIw1EMgQiCTgINhoCFzQWCBJEQv8LNhoCFyhkJwhkHSMhBB9ISEwURA5EQv6yMRkjEkQxECUSRDEWIgk4GSMSRDEWIgk4"
+    "ECUSRDEWIgk4GDIIEkQxFiIJORoAJxISRDEWIgk7DiMNQAAEIkIJDDEWIgk7CEAADitkMRYiCTsOiAkwQv/lKmQiEkAADipkMRYiCTsOiAkbQv/QMRYi"
+    "CTsOiAkpQv/EMgcnEWQJNRgnETIHZylkIQcdIyhkH0hITBRENRkoZCEHHSMpZB9ISEwURDUaIQg0GQo0GA1AAuQhCDQaCjQYDUACyCEFJwVlNR81IDQf"
+    "RDQgIQQORCcFNCBnMRYiCTgQIhJAAncxFiIJOBEqZBIxFiIJOBErZBIRRDEWIgk4ECEGEkQxFiIJOBExFiIJOBESRDEWIgk4FDIKEkQxFiIJOBIjDUQx"
+    "FiIJOBI1CTEWIgk4ESpkEkACICM1CDEZIxJEMRAlEkQ2GgAnEhJAAeA2GgAnEhJAARc0CSEKHSMhBB9ISEwURCIINQM0CTQDCTUKNAojDUQ0CEAAwihk"
+    "NAodIylkNAoIH0hITBRENQIoKGQ0AglnKSlkNAkIZypkIhJAAJIqZDQCiAfjNAI0CogIEzQCIw1ENAI2GgEXD0Q0AycFZB0jIQQfSEhMFEQ1FzQIQABA"
+    "KSlkNBcJZycHJwdkNBcIZycOJw5kNAM0FwmIB2VnKGQhCQ9EKWQhCQ9EKGQpZAohBwxEKWQoZAohBwxEIkIHQSgoZDQXCWcnBicGZDQXCGcnDScNZDQD"
+    "NBcJiAclZ0L/vTQCiAdtQv9tKWQ0Ch0jKGQ0CggfSEhMFEQ1AigoZDQJCGcpKWQ0AglnK2Q0AogHKDQKNAKIB1hC/0I2GgEXNQs0CyMNRDQIQACYKWQ0"
+    "Cx0jKGQ0CwkfSEhMFEQiCDUMNAwjDUQ0DCEEHSMhBCEKCR9ISEwURCIINAwJNQM0DDQDCDUNNAk0DQ9ENAhAADUoKGQ0CwlnKSlkNA0IZypkIhJAABgq"
+    "ZDQLiAauNAs0DIgG3jQJNA0JNQ5C/s40C4gGskL/5ygoZDQNCGcpKWQ0CwlnK2Q0C4gGgDQMNAuIBrBC/88oZDQLHSMpZDQLCR9ISEwURCIINQxC/2Ux"
+    "FiIIOBkjEkQxFiIIOBAlEkQxFiIIOBgyCBJEMRYiCDkaACchEkRC/fYiQv3dKmQiEkQxFiIJOBAiEkQxFiIJOAcyChJEMRYiCTgIIw1EMRYiCTgINQki"
+    "NQhC/bAnFCcUZDQaNBgLiAW9Z0L9JycTJxNkNBk0GAuIBaxnQv0LMRYkCTgQIQYSRDEWJAk4EScQZBJEMRYkCTgUMgoSRDEWJAk4EiMNRDEWIgk4GSMS"
+    "RDEWIgk4ECUSRDEWIgk4GDIIEkQxFiIJORoAJx8SRDEZIxJEMRAlEkQxFiQJOBInBGQSQAA/MRYkCTgSKWQdIycEZB9ISEwURDUHNAcjDUQ0BylkDkQp"
+    "KWQ0BwlnJwQnBGQxFiQJOBIJZytkNAeIBT4iQgUCKWQ1B0L/zzEWIgk4ECEGEkQxFiIJOBEnEGQSRDEWIgk4FDIKEkQxFiIJOBIjDUQxGSMSRDEQJRJE"
+    "MRYiCDgZIxJEMRYiCDgQJRJEMRYiCDgYMggSRDEWIgg5GgAnIBJEMRYiCTgSJwRkEkAAQTEWIgk4EihkHSMnBGQfSEhMFEQ1BjQGIw1ENAYoZA5EKChk"
+    "NAYJZypkIhJAAAsqZDQGiASYIkIEXDQGiASpQv/0KGQ1BkL/zTEZIxJEMRAlEkQxFiQJOBkjEkQxFiQJOBAlEkQxFiQJOBgyCBJEMRYkCTkaACcZEkQx"
+    "FiQJOxQjDUAABCJCBA0jQAAOK2QxFiQJOxSIBDZC/+oqZCISQAAOKmQxFiQJOxSIBCFC/9UxFiQJOxSIBC9C/8kxGSMSRDEQJRJEMRYiCTgZIxJEMRYi"
+    "CTgQJRJEMRYiCTgYMggSRDEWIgk5GgAnGRJEMRYiCTsTIw1AAAQiQgOaIkAADitkMRYiCTsTiAPDQv/qKmQiEkAADipkMRYiCTsTiAOuQv/VMRYiCTsT"
+    "iAO8Qv/JKmQiEkACNzEWJAk4ECEGEkQxFiQJOBEqZBJEMRYkCTgUMgoSRDEWJAk4EiMNRDEWJAk4EjUEMRYiCTgQIQYSRDEWIgk4EStkEkQxFiIJOBQy"
+    "ChJEMRYiCTgSIw1EMRYiCTgSNQUxGSMSRDEQJRJEMRYiCDgZIxJEMRYiCDgQJRJEMRYiCDgYMggSRDEWIgg5GgAnHRJEMRYkCDgZIxJEMRYkCDgQJRJE"
+    "MRYkCDgYMggSRDEWJAg5GgAnHhJEKGQpZAgjEkABbChkIQcdIylkH0hITBRENQ80BCEHHSM0BR9ISEwURDUQNA8hBB0jNBAfSEhMFEQ1FTQVIQQ2GgEX"
+    "CQ00FSEENhoBFwgMEEQ0EDQPDUAA+zQQNA8MQADQNBA0DxJAAAEANAQ1ETQFNRIjNRMjNRQoZClkCCMSQACNNBEnBGQdIyhkH0hITBRENRw0EicEZB0j"
+    "KWQfSEhMFEQ1HTQcNB0NQABcNBw1ADQAIw1EKGQpZAgjEkAAQSgoZDQRCGcpKWQ0EghnJwQnBGQ0AAhnJxBkNACIAgUoZCEJD0QpZCEJD0QoZClkCiEH"
+    "DEQpZChkCiEHDEQiQgGrJxEyB2dC/7c0HTUAQv+hIQg0EQo0Eg1AAAw0EZI0EpILNQBC/4o0ETQSC5I1AEL/fzQENRE0BClkHSMoZB9ISEwURCIINRIj"
+    "NRM0BTQSCTUUQv8kNAUoZB0jKWQfSEhMFEQiCDURNAU1EjQENBEJNRMjNRRC/wE0BDURNAU1EkL+9jEWJAk4ECISRDEWJAk4BzIKEkQxFiQJOAgjDUQx"
+    "FiQJOAg1BEL90SJCAP4xGSEGEkAAfzYaAIADc2N1EkAAPzYaAIACcnISQAABADEAJwlkEkQqZCISQAAcKmQnBmSIAQArZCcHZIgA+CcGI2cnByNnIkIA"
+    "tCcGZIgBAEL/4zEAJwlkEkQhBScMZTUhNSI0IUAAFzYaARcyBycMZAgPRCcLNhoBF2ciQgB/Jww0ImdC/+ExACcJZBJEJwtkIxNEJwtkMgcORCcLI2ci"
+    "QgBbI0IAVyNCAFMjQgBPMTUhBg9EMTSBIA9EIQUnCWU1ATUeNAFEJwk0Hmc2GgAXIxM2GgEXIxMQRDYaABc2GgEXDEQqNhoAF2crNhoBF2eAAnZpNhoC"
+    "F2cnDyNnIkM1LDUrNCwhCDQrCQ1AAAY0KzQsCIk0LCEINCsJCSIJiTUtsSEGshA0LbIRI7ISMgqyFCOyAbOJNS81LrEhBrIQNC6yETQvshIxALIUI7IB"
+    "s4k1MDIKYDQwMgEID0SxIrIQNDCyCDEAsgcjsgGziTUyNTEnFScVZDQxiP+EZycWJxZkNDKI/3lnIQg0Mgo0GQ1AABwhCDQxCjQaDUEAIicYJxhkNDE0"
+    "GguI/1VnQgARJxcnF2Q0MjQZC4j/RGdC/9OJ"
+)
+
+CLEAR_STATE_PROGRAM_B64 = "BYEBQw=="
+
+PROGRAM_NAMES = [
+    "TESTNET_APPROVAL_PROGRAM_30BP_CONSTANT_PRODUCT",
+    "TESTNET_APPROVAL_PROGRAM_100BP_CONSTANT_PRODUCT",
+    "MAINNET_APPROVAL_PROGRAM_25BP_CONSTANT_PRODUCT",
+    "MAINNET_APPROVAL_PROGRAM_75BP_CONSTANT_PRODUCT",
+    "CLEAR_STATE_PROGRAM",
+]
+
+# decoded programs by name
+_programs = {}
+
+
+def __getattr__(name):
+    """Decodes and caches the program with given name on first access
+
+    :param name: name of the module attribute
+    :type name: str
+    :return: program bytecode
+    :rtype: bytes
+    """
+
+    if name in PROGRAM_NAMES:
+        program = _programs.get(name, None)
+        if program is None:
+            program = b64decode(globals()[name + "_B64"])
+            _programs[name] = program
+        return program
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + PROGRAM_NAMES)
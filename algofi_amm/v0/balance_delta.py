@@ -1,4 +1,7 @@
 
+from .fee_model import get_extra_compute_fee
+
+
 class BalanceDelta():
 
     def __init__(self, pool, asset1_delta, asset2_delta, lp_delta, num_iter=0):
@@ -18,7 +21,8 @@ class BalanceDelta():
         self.asset1_delta = asset1_delta
         self.asset2_delta = asset2_delta
         self.lp_delta = lp_delta
-        self.extra_compute_fee = int(num_iter / (700 / 400)) * 1000
+        self.num_iter = num_iter
+        self.extra_compute_fee = get_extra_compute_fee(num_iter)
 
         if (lp_delta != 0):
             self.price_delta = 0
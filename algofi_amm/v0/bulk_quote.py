@@ -0,0 +1,407 @@
+
+import io
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import multiprocessing
+from collections import deque
+from .quote_server import QuoteState, _parse_pool
+from .routing import DEFAULT_MAX_HOPS, get_best_route_quote
+from .snapshot import PoolSnapshot
+
+# quote methods of trade intents, named as the methods of :class:`QuoteServer`
+BULK_QUOTE_METHODS = frozenset(["swap_exact_for", "swap_for_exact", "burn", "route"])
+
+# method of intents without a method field
+DEFAULT_METHOD = "swap_exact_for"
+
+# intent fields parsed as integers
+INTEGER_FIELDS = frozenset(["app_id", "asset_id", "amount", "swap_in_asset_id", "swap_out_asset_id", "max_hops"])
+
+# intent fields, in csv column order
+INTENT_FIELDS = ["method", "app_id", "asset_id", "amount", "swap_in_asset_id", "swap_out_asset_id", "max_hops"]
+
+# result fields appended to each intent, in csv column order
+RESULT_FIELDS = ["swap_in_amount", "swap_out_amount", "asset1_amount", "asset2_amount", "route", "error"]
+
+# default number of intents quoted per task
+DEFAULT_CHUNK_SIZE = 10000
+
+# default seconds between throughput reports
+DEFAULT_REPORT_INTERVAL = 5.0
+
+# number of tasks in flight per worker process, bounding the memory used by unwritten results
+TASKS_PER_PROCESS = 2
+
+
+def save_snapshot(snapshot, path):
+    """Writes a snapshot to a JSON file which :func:`load_snapshot` reads
+
+    :param snapshot: pool snapshot
+    :type snapshot: :class:`PoolSnapshot`
+    :param path: path of the file
+    :type path: str
+    """
+
+    with open(path, "w") as f:
+        json.dump(snapshot.to_dict(), f)
+
+
+def load_snapshot(path):
+    """Reads a snapshot written by :func:`save_snapshot`
+
+    :param path: path of the file
+    :type path: str
+    :return: pool snapshot
+    :rtype: :class:`PoolSnapshot`
+    """
+
+    with open(path, "r") as f:
+        return PoolSnapshot.from_dict(json.load(f))
+
+
+def parse_intents(lines, input_format, fieldnames=None):
+    """Parses trade intents, one per line. Each intent has a method (defaults to swap_exact_for) and the fields of
+    the corresponding :class:`QuoteServer` query:
+
+    * swap_exact_for and swap_for_exact: app_id, asset_id, amount
+    * burn: app_id, amount
+    * route: swap_in_asset_id, swap_out_asset_id, amount and optionally max_hops
+
+    :param lines: lines of the input, without the csv header
+    :type lines: list
+    :param input_format: "csv" or "jsonl"
+    :type input_format: str
+    :param fieldnames: csv column names
+    :type fieldnames: list, optional
+    :return: list of intent dicts, a dict with an "error" key for each line which cannot be parsed
+    :rtype: list
+    """
+
+    if input_format == "jsonl":
+        intents = []
+        for line in lines:
+            try:
+                intents.append(json.loads(line))
+            except ValueError as e:
+                intents.append({"error": "Invalid JSON: %s" % e})
+        return intents
+
+    intents = []
+    for row in csv.DictReader(lines, fieldnames=fieldnames):
+        intent = {}
+        try:
+            for name, value in row.items():
+                if value is None or value == "":
+                    continue
+                intent[name] = int(value) if name in INTEGER_FIELDS else value
+        except ValueError as e:
+            intent = dict(row, error="Invalid field: %s" % e)
+        intents.append(intent)
+    return intents
+
+
+def _quote_batch(results, indices, quote, args, format_amounts):
+    """Quotes the intents at indices with one vectorized call, or one by one to isolate errors if it raises"""
+
+    if not indices:
+        return
+    try:
+        amounts = quote(*args)
+    except Exception:
+        for j, i in enumerate(indices):
+            try:
+                results[i] = format_amounts(quote(*[[arg[j]] for arg in args]), 0)
+            except Exception as e:
+                results[i] = {"error": str(e)}
+        return
+    for j, i in enumerate(indices):
+        results[i] = format_amounts(amounts, j)
+
+
+def quote_intents(state, intents):
+    """Quotes trade intents against a pool state. Swap and burn intents are grouped by method and quoted with the
+    vectorized :class:`PoolTable` methods, routes are quoted with :func:`get_best_route_quote`.
+
+    :param state: pool state to quote against
+    :type state: :class:`QuoteState`
+    :param intents: intents as returned by :func:`parse_intents`
+    :type intents: list
+    :return: one result dict per intent, with the keys of :data:`RESULT_FIELDS` that apply to its method
+    :rtype: list
+    """
+
+    table = state.table
+    views = state.views
+    results = [None for _ in intents]
+    # method -> (indices, app ids, asset ids, amounts) of the intents quoted together
+    batches = {method: ([], [], [], []) for method in ("swap_exact_for", "swap_for_exact", "burn")}
+    for i, intent in enumerate(intents):
+        if "error" in intent:
+            results[i] = {"error": intent["error"]}
+            continue
+        method = intent.get("method", DEFAULT_METHOD)
+        try:
+            if method not in BULK_QUOTE_METHODS:
+                results[i] = {"error": "Unknown method %s" % method}
+            elif method == "route":
+                swap_in_asset_id, swap_out_asset_id = intent["swap_in_asset_id"], intent["swap_out_asset_id"]
+                routes = state.get_routes(swap_in_asset_id, swap_out_asset_id, intent.get("max_hops", DEFAULT_MAX_HOPS))
+                quote = get_best_route_quote(None, swap_in_asset_id, swap_out_asset_id, intent["amount"], routes=routes)
+                if quote is None:
+                    results[i] = {"error": "No route from %d to %d" % (swap_in_asset_id, swap_out_asset_id)}
+                else:
+                    results[i] = {"swap_out_amount": quote.swap_out_amount,
+                                  "route": [[pool.application_id, asset_id] for pool, asset_id in quote.route]}
+            else:
+                app_id, amount = intent["app_id"], intent["amount"]
+                view = views.get(app_id, None)
+                if view is None:
+                    results[i] = {"error": "Unknown pool %d" % app_id}
+                    continue
+                asset_id = 0
+                if method != "burn":
+                    asset_id = intent["asset_id"]
+                    if asset_id != view.asset1_id and asset_id != view.asset2_id:
+                        results[i] = {"error": "Asset %d is not in pool %d" % (asset_id, app_id)}
+                        continue
+                indices, app_ids, asset_ids, amounts = batches[method]
+                indices.append(i)
+                app_ids.append(app_id)
+                asset_ids.append(asset_id)
+                amounts.append(amount)
+        except KeyError as e:
+            results[i] = {"error": "Missing field %s" % e}
+        except Exception as e:
+            results[i] = {"error": str(e)}
+
+    indices, app_ids, asset_ids, amounts = batches["swap_exact_for"]
+    _quote_batch(results, indices, table.get_swap_exact_for_amounts, [app_ids, asset_ids, amounts],
+                 lambda out, j: {"swap_out_amount": out[j]})
+    indices, app_ids, asset_ids, amounts = batches["swap_for_exact"]
+    _quote_batch(results, indices, table.get_swap_for_exact_amounts, [app_ids, asset_ids, amounts],
+                 lambda out, j: {"swap_in_amount": out[j]})
+    indices, app_ids, _, amounts = batches["burn"]
+    _quote_batch(results, indices, table.get_burn_amounts, [app_ids, amounts],
+                 lambda out, j: {"asset1_amount": out[0][j], "asset2_amount": out[1][j]})
+    return results
+
+
+def format_results(intents, results, output_format, fieldnames=None):
+    """Returns quoted intents as text
+
+    :param intents: intents as returned by :func:`parse_intents`
+    :type intents: list
+    :param results: results as returned by :func:`quote_intents`
+    :type results: list
+    :param output_format: "csv" or "jsonl"
+    :type output_format: str
+    :param fieldnames: csv column names, the intent fields followed by :data:`RESULT_FIELDS`
+    :type fieldnames: list, optional
+    :return: one line per intent
+    :rtype: str
+    """
+
+    if output_format == "jsonl":
+        return "".join(json.dumps(dict(intent, **result)) + "\n" for intent, result in zip(intents, results))
+
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore", lineterminator="\n")
+    for intent, result in zip(intents, results):
+        row = dict(intent, **result)
+        if "route" in result:
+            row["route"] = "|".join("%d:%d" % (app_id, asset_id) for app_id, asset_id in result["route"])
+        writer.writerow(row)
+    return output.getvalue()
+
+
+# (state, input format, output format, input fieldnames, output fieldnames) of a worker process
+_worker_config = None
+
+
+def _init_worker(table, round_num, t, input_format, output_format, input_fieldnames, output_fieldnames):
+    global _worker_config
+    _worker_config = (QuoteState(table, round_num, t), input_format, output_format, input_fieldnames, output_fieldnames)
+
+
+def _quote_lines(lines):
+    """Quotes a chunk of input lines in a worker process, returns (output text, number of intents, number of errors)"""
+
+    state, input_format, output_format, input_fieldnames, output_fieldnames = _worker_config
+    intents = parse_intents(lines, input_format, input_fieldnames)
+    results = quote_intents(state, intents)
+    errors = sum(1 for result in results if "error" in result)
+    return format_results(intents, results, output_format, output_fieldnames), len(intents), errors
+
+
+class BulkQuoter():
+
+    def __init__(self, snapshot, processes=None, chunk_size=DEFAULT_CHUNK_SIZE, report_interval=DEFAULT_REPORT_INTERVAL):
+        """Constructor method for :class:`BulkQuoter`, which streams trade intents through the vectorized quote
+        methods of a pool snapshot. Input lines are read in chunks which worker processes parse and quote, and results
+        are written in input order as chunks complete. At most TASKS_PER_PROCESS chunks per process are in flight,
+        so memory use does not grow with the size of the input.
+
+        :param snapshot: pool state to quote against
+        :type snapshot: :class:`PoolSnapshot`
+        :param processes: number of worker processes, defaults to the number of cpus, 1 quotes in this process
+        :type processes: int, optional
+        :param chunk_size: number of intents per task
+        :type chunk_size: int, optional
+        :param report_interval: seconds between throughput reports, None to disable them
+        :type report_interval: float, optional
+        """
+
+        self.snapshot = snapshot
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.report_interval = report_interval
+        self.intents = 0
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def _read_chunks(self, input_file):
+        chunk = []
+        for line in input_file:
+            if not line.strip():
+                continue
+            chunk.append(line)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run(self, input_file, output_file, input_format="csv", output_format="csv", report_file=sys.stderr):
+        """Quotes every intent of input_file and writes the results to output_file
+
+        :param input_file: text file of intents, with a header line for csv
+        :type input_file: file
+        :param output_file: text file the results are written to
+        :type output_file: file
+        :param input_format: "csv" or "jsonl"
+        :type input_format: str, optional
+        :param output_format: "csv" or "jsonl"
+        :type output_format: str, optional
+        :param report_file: file throughput reports are written to, None to disable them
+        :type report_file: file, optional
+        :return: dict of intents, errors, seconds and intents_per_second
+        :rtype: dict
+        """
+
+        input_fieldnames = None
+        output_fieldnames = None
+        if input_format == "csv":
+            header = input_file.readline()
+            if not header:
+                raise Exception("Input has no csv header")
+            input_fieldnames = next(csv.reader([header]))
+        if output_format == "csv":
+            output_fieldnames = [name for name in (input_fieldnames or INTENT_FIELDS) if name not in RESULT_FIELDS]
+            output_fieldnames += RESULT_FIELDS
+            output_file.write(",".join(output_fieldnames) + "\n")
+
+        table = self.snapshot.get_table()
+        initargs = (table, self.snapshot.round, self.snapshot.t, input_format, output_format, input_fieldnames, output_fieldnames)
+        self.intents = 0
+        self.errors = 0
+        start = time.perf_counter()
+        last_report = start
+
+        def write(output):
+            nonlocal last_report
+            text, intents, errors = output
+            output_file.write(text)
+            self.intents += intents
+            self.errors += errors
+            now = time.perf_counter()
+            if report_file is not None and self.report_interval is not None and now - last_report >= self.report_interval:
+                last_report = now
+                self._report(report_file, now - start)
+
+        if self.processes == 1:
+            _init_worker(*initargs)
+            for chunk in self._read_chunks(input_file):
+                write(_quote_lines(chunk))
+        else:
+            with multiprocessing.Pool(self.processes, initializer=_init_worker, initargs=initargs) as pool:
+                pending = deque()
+                for chunk in self._read_chunks(input_file):
+                    pending.append(pool.apply_async(_quote_lines, (chunk,)))
+                    if len(pending) >= self.processes * TASKS_PER_PROCESS:
+                        write(pending.popleft().get())
+                while pending:
+                    write(pending.popleft().get())
+
+        output_file.flush()
+        self.elapsed = time.perf_counter() - start
+        if report_file is not None:
+            self._report(report_file, self.elapsed)
+        return {
+            "intents": self.intents,
+            "errors": self.errors,
+            "seconds": self.elapsed,
+            "intents_per_second": self.intents / self.elapsed if self.elapsed else 0.0,
+        }
+
+    def _report(self, report_file, elapsed):
+        report_file.write("quoted %d intents (%d errors) in %.1fs, %.0f intents/s\n" % (
+            self.intents, self.errors, elapsed, self.intents / elapsed if elapsed else 0.0))
+        report_file.flush()
+
+
+def _get_format(path):
+    return "jsonl" if path.endswith(".jsonl") or path.endswith(".json") else "csv"
+
+
+def main(argv=None):
+    """Entry point of the bulk quote tool, e.g.
+    ``python -m algofi_amm.v0.bulk_quote --snapshot state.json --input intents.csv --output quotes.csv``
+    """
+
+    from .client import AlgofiAMMMainnetClient, AlgofiAMMTestnetClient
+
+    parser = argparse.ArgumentParser(description="Quotes a stream of trade intents against Algofi AMM pool state")
+    parser.add_argument("--snapshot", default=None, help="pool state file written by --save-snapshot to quote against")
+    parser.add_argument("--network", choices=["mainnet", "testnet"], default="mainnet")
+    parser.add_argument("--pool", action="append", type=_parse_pool, default=[],
+                        help="pool to read live as pool_type:asset1_id:asset2_id, e.g. constant_product_30bp_fee:1:31566704")
+    parser.add_argument("--save-snapshot", default=None, help="file to write the live pool state to")
+    parser.add_argument("--input", default="-", help="csv or jsonl file of trade intents, - for stdin")
+    parser.add_argument("--output", default="-", help="file to write the results to, - for stdout")
+    parser.add_argument("--input-format", choices=["csv", "jsonl"], default=None, help="defaults to the input extension")
+    parser.add_argument("--output-format", choices=["csv", "jsonl"], default=None, help="defaults to the output extension")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, defaults to the number of cpus")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--report-interval", type=float, default=DEFAULT_REPORT_INTERVAL)
+    args = parser.parse_args(argv)
+
+    if args.snapshot is not None:
+        snapshot = load_snapshot(args.snapshot)
+    elif args.pool:
+        client = AlgofiAMMMainnetClient() if args.network == "mainnet" else AlgofiAMMTestnetClient()
+        snapshot = client.snapshot([client.get_pool(pool_type, asset1_id, asset2_id) for pool_type, asset1_id, asset2_id in args.pool])
+    else:
+        parser.error("either --snapshot or at least one --pool is required")
+    if args.save_snapshot is not None:
+        save_snapshot(snapshot, args.save_snapshot)
+
+    input_format = args.input_format or _get_format(args.input)
+    output_format = args.output_format or (_get_format(args.output) if args.output != "-" else input_format)
+    input_file = sys.stdin if args.input == "-" else open(args.input, "r", newline="")
+    output_file = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        quoter = BulkQuoter(snapshot, processes=args.processes, chunk_size=args.chunk_size, report_interval=args.report_interval)
+        quoter.run(input_file, output_file, input_format, output_format)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+if __name__ == "__main__":
+    main()
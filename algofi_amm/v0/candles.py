@@ -0,0 +1,303 @@
+
+import os
+import struct
+from .trade_store import OP_SWAP_EXACT_FOR, OP_SWAP_FOR_EXACT
+
+# default candle resolutions in seconds
+DEFAULT_RESOLUTIONS = (60, 300, 900, 3600, 14400, 86400)
+
+# persisted candle record: start time, open, high, low, close, asset 1 volume, asset 2 volume, number of updates
+CANDLE_RECORD = struct.Struct("<QddddqqI")
+
+# open state of a pool, rewritten on flush: whether cumulative volumes are known, cumulative volume asset 1,
+# cumulative volume asset 2, number of open candles, followed by a resolution and a candle record per open candle
+OPEN_STATE_HEADER = struct.Struct("<BQQI")
+OPEN_CANDLE_RESOLUTION = struct.Struct("<Q")
+
+# name of the open state file in the directory of a pool
+OPEN_STATE_FILE = "open.state"
+
+# trade ops which move the price
+SWAP_OPS = frozenset([OP_SWAP_EXACT_FOR, OP_SWAP_FOR_EXACT])
+
+
+class Candle():
+
+    __slots__ = ("start", "open", "high", "low", "close", "volume1", "volume2", "count")
+
+    def __init__(self, start, open, high, low, close, volume1=0, volume2=0, count=1):
+        """Constructor method for :class:`Candle`, the OHLCV of one period. Prices are in units of asset 1 per
+        asset 2, as :meth:`Pool.get_pool_price` of asset 1.
+
+        :param start: start time of the period
+        :type start: int
+        :param open: first price of the period
+        :type open: float
+        :param high: highest price of the period
+        :type high: float
+        :param low: lowest price of the period
+        :type low: float
+        :param close: last price of the period
+        :type close: float
+        :param volume1: asset 1 volume of the period
+        :type volume1: int, optional
+        :param volume2: asset 2 volume of the period
+        :type volume2: int, optional
+        :param count: number of updates in the period
+        :type count: int, optional
+        """
+
+        self.start = start
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume1 = volume1
+        self.volume2 = volume2
+        self.count = count
+
+    def __repr__(self):
+        return "Candle(start={}, open={}, high={}, low={}, close={}, volume1={}, volume2={}, count={})".format(
+            self.start, self.open, self.high, self.low, self.close, self.volume1, self.volume2, self.count)
+
+    def update(self, price, volume1, volume2):
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.close = price
+        self.volume1 += volume1
+        self.volume2 += volume2
+        self.count += 1
+
+    def pack(self):
+        return CANDLE_RECORD.pack(self.start, self.open, self.high, self.low, self.close, self.volume1, self.volume2, self.count)
+
+
+class CandleBuilder():
+
+    def __init__(self, resolutions=DEFAULT_RESOLUTIONS, root=None):
+        """Constructor method for :class:`CandleBuilder`, which maintains OHLCV candles of many pools at several
+        resolutions. Each price update touches only the open candles of its pool, so a round costs
+        O(pools touched x resolutions). Periods without updates produce no candle.
+
+        :param resolutions: candle lengths in seconds
+        :type resolutions: tuple, optional
+        :param root: candle directory to resume the open candles and volume baselines of a previous run from
+        :type root: str, optional
+        """
+
+        self.resolutions = tuple(sorted(resolutions))
+        # (app_id, resolution) -> closed candles not yet flushed, open candle
+        self.closed = {}
+        self.open = {}
+        # app_id -> (cumsum volume asset 1, cumsum volume asset 2) of the last snapshot
+        self.cumsum_volumes = {}
+        # app_ids whose open state changed since the last flush
+        self.dirty = set()
+        if root is not None:
+            self.load(root)
+
+    def load(self, root):
+        """Loads the open candles and cumulative volumes persisted by :meth:`flush`, so that the current periods
+        and the volume of the next snapshot continue from where the previous run stopped. Resolutions which are
+        not built by this builder are ignored.
+
+        :param root: candle directory
+        :type root: str
+        :return: number of pools loaded
+        :rtype: int
+        """
+
+        if not os.path.isdir(root):
+            return 0
+        loaded = 0
+        for name in os.listdir(root):
+            path = os.path.join(root, name, OPEN_STATE_FILE)
+            if not name.isdigit() or not os.path.exists(path):
+                continue
+            app_id = int(name)
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < OPEN_STATE_HEADER.size:
+                continue
+            has_cumsum_volumes, cumsum_volume1, cumsum_volume2, num_candles = OPEN_STATE_HEADER.unpack_from(data, 0)
+            if has_cumsum_volumes:
+                self.cumsum_volumes[app_id] = (cumsum_volume1, cumsum_volume2)
+            offset = OPEN_STATE_HEADER.size
+            for _ in range(num_candles):
+                resolution = OPEN_CANDLE_RESOLUTION.unpack_from(data, offset)[0]
+                candle = Candle(*CANDLE_RECORD.unpack_from(data, offset + OPEN_CANDLE_RESOLUTION.size))
+                offset += OPEN_CANDLE_RESOLUTION.size + CANDLE_RECORD.size
+                if resolution in self.resolutions:
+                    self.open[(app_id, resolution)] = candle
+            loaded += 1
+        return loaded
+
+    def add_price(self, app_id, t, price, volume1=0, volume2=0):
+        """Adds a price observation of a pool
+
+        :param app_id: pool application id
+        :type app_id: int
+        :param t: timestamp of the observation, non-decreasing per pool
+        :type t: int
+        :param price: price in units of asset 1 per asset 2
+        :type price: float
+        :param volume1: asset 1 volume since the previous observation
+        :type volume1: int, optional
+        :param volume2: asset 2 volume since the previous observation
+        :type volume2: int, optional
+        """
+
+        # the finest open candle starts latest, so checking it rejects out of order observations before any update
+        finest_candle = self.open.get((app_id, self.resolutions[0]), None)
+        if finest_candle is not None and t < finest_candle.start:
+            raise Exception("Price observation at %d is before the open candle at %d" % (t, finest_candle.start))
+
+        self.dirty.add(app_id)
+        for resolution in self.resolutions:
+            key = (app_id, resolution)
+            start = t - t % resolution
+            candle = self.open.get(key, None)
+            if candle is not None and candle.start == start:
+                candle.update(price, volume1, volume2)
+                continue
+            if candle is not None:
+                self.closed.setdefault(key, []).append(candle)
+            self.open[key] = Candle(start, price, price, price, price, volume1, volume2)
+
+    def add_snapshot(self, pool, t):
+        """Adds the state of a pool as a price observation. Volume is taken from the change of the cumulative
+        volumes of the pool state since its previous snapshot.
+
+        :param pool: pool with refreshed state
+        :type pool: :class:`Pool`
+        :param t: timestamp of the state, e.g. the block timestamp
+        :type t: int
+        """
+
+        if not pool.asset1_balance or not pool.asset2_balance:
+            return
+        cumsum_volumes = (pool.cumsum_volume_asset1, pool.cumsum_volume_asset2)
+        last_cumsum_volumes = self.cumsum_volumes.get(pool.application_id, cumsum_volumes)
+        self.cumsum_volumes[pool.application_id] = cumsum_volumes
+        self.dirty.add(pool.application_id)
+        self.add_price(pool.application_id, t, pool.get_pool_price(pool.asset1.asset_id),
+                       max(0, cumsum_volumes[0] - last_cumsum_volumes[0]), max(0, cumsum_volumes[1] - last_cumsum_volumes[1]))
+
+    def add_trade(self, app_id, trade):
+        """Adds a decoded trade row of :mod:`trade_store` as a price observation at its execution price. Trades
+        which are not swaps are ignored.
+
+        :param app_id: pool application id
+        :type app_id: int
+        :param trade: (round, time, op, asset 1 change, asset 2 change, lp change) of the pool
+        :type trade: tuple
+        """
+
+        t, op, asset1_change, asset2_change = trade[1], trade[2], trade[3], trade[4]
+        if op not in SWAP_OPS or not asset1_change or not asset2_change:
+            return
+        self.add_price(app_id, t, abs(asset1_change) / abs(asset2_change), abs(asset1_change), abs(asset2_change))
+
+    def add_state_diffs(self, diffs, t):
+        """Adds the pools changed in one round of a :class:`PoolStateStream`
+
+        :param diffs: state diffs of one round
+        :type diffs: list
+        :param t: block timestamp of the round
+        :type t: int
+        """
+
+        for diff in diffs:
+            self.add_snapshot(diff.pool, t)
+
+    def get_candles(self, app_id, resolution, include_open=True):
+        """Returns the unflushed candles of a pool
+
+        :param app_id: pool application id
+        :type app_id: int
+        :param resolution: candle length in seconds
+        :type resolution: int
+        :param include_open: whether to include the open candle
+        :type include_open: bool, optional
+        :return: list of :class:`Candle` in time order
+        :rtype: list
+        """
+
+        candles = list(self.closed.get((app_id, resolution), []))
+        candle = self.open.get((app_id, resolution), None)
+        if include_open and candle is not None:
+            candles.append(candle)
+        return candles
+
+    def flush(self, root):
+        """Appends the closed candles to fixed size binary records at root/<app_id>/<resolution>.candles and drops
+        them from memory. The open candles and cumulative volumes of the pools updated since the last flush are
+        rewritten to root/<app_id>/open.state, from which :meth:`load` resumes after a restart.
+
+        :param root: candle directory
+        :type root: str
+        :return: number of flushed candles
+        :rtype: int
+        """
+
+        flushed = 0
+        for (app_id, resolution), candles in self.closed.items():
+            if not candles:
+                continue
+            path = os.path.join(root, str(app_id))
+            os.makedirs(path, exist_ok=True)
+            with open(os.path.join(path, "%d.candles" % resolution), "ab") as f:
+                # drop a partial record left by a crash during a previous flush
+                f.truncate(f.tell() // CANDLE_RECORD.size * CANDLE_RECORD.size)
+                f.write(b"".join(candle.pack() for candle in candles))
+            flushed += len(candles)
+        self.closed = {}
+
+        for app_id in self.dirty:
+            path = os.path.join(root, str(app_id))
+            os.makedirs(path, exist_ok=True)
+            cumsum_volumes = self.cumsum_volumes.get(app_id, None)
+            open_candles = [(resolution, self.open[(app_id, resolution)]) for resolution in self.resolutions
+                            if (app_id, resolution) in self.open]
+            data = OPEN_STATE_HEADER.pack(cumsum_volumes is not None, *(cumsum_volumes or (0, 0)), len(open_candles))
+            data += b"".join(OPEN_CANDLE_RESOLUTION.pack(resolution) + candle.pack() for resolution, candle in open_candles)
+            # replaced atomically, a crash leaves either the previous or the new state
+            temp_path = os.path.join(path, OPEN_STATE_FILE + ".tmp")
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, os.path.join(path, OPEN_STATE_FILE))
+        self.dirty = set()
+        return flushed
+
+
+def load_candles(root, app_id, resolution, start_time=None, end_time=None):
+    """Reads flushed candles of a pool
+
+    :param root: candle directory
+    :type root: str
+    :param app_id: pool application id
+    :type app_id: int
+    :param resolution: candle length in seconds
+    :type resolution: int
+    :param start_time: first candle start time to include
+    :type start_time: int, optional
+    :param end_time: last candle start time to include
+    :type end_time: int, optional
+    :return: list of :class:`Candle` in time order
+    :rtype: list
+    """
+
+    path = os.path.join(root, str(app_id), "%d.candles" % resolution)
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        data = f.read()
+    # a partially written record at the end is ignored
+    data = data[:len(data) - len(data) % CANDLE_RECORD.size]
+    candles = []
+    for record in CANDLE_RECORD.iter_unpack(data):
+        if (start_time is None or record[0] >= start_time) and (end_time is None or record[0] <= end_time):
+            candles.append(Candle(*record))
+    return candles
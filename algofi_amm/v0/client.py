@@ -5,17 +5,51 @@ from .config import Network, get_manager_application_id, b64_to_utf_keys, utf_to
 from .logic_sig_generator import generate_logic_sig
 from .pool import Pool
 from .asset import Asset
+from .accounts import AccountCache, AccountSummary, get_account_infos, DEFAULT_MAX_WORKERS, DEFAULT_ACCOUNT_CACHE_MAX_AGE
+from .snapshot import get_pool_snapshot, DEFAULT_MAX_RETRIES as DEFAULT_SNAPSHOT_MAX_RETRIES
 from ..contract_strings import algofi_pool_strings as pool_strings
 from ..contract_strings import algofi_manager_strings as manager_strings
+from ..telemetry import instrument, InstrumentedClient
+from ..scheduler import schedule, ScheduledClient
+from ..transport import PooledAlgodClient, PooledIndexerClient
+from ..failover import failover, FailoverClient
+
+def remove_proxy(client, proxy_class):
+    """Returns client with the outermost proxy of proxy_class in its chain of wrapped clients removed. The proxies
+    wrapped around the removed one are copied around its wrapped client, so clients already holding them are
+    unaffected.
+
+    :param client: client, possibly wrapped in telemetry and scheduling proxies
+    :type client: :class:`AlgodClient` or :class:`IndexerClient`
+    :param proxy_class: class of the proxy to remove (e.g. :class:`InstrumentedClient`)
+    :type proxy_class: type
+    :return: client without the proxy, or client unchanged if there is no such proxy
+    :rtype: :class:`AlgodClient` or :class:`IndexerClient`
+    """
+
+    if isinstance(client, proxy_class):
+        return client.wrapped_client
+    if isinstance(client, FailoverClient) or not hasattr(client, "wrapped_client"):
+        return client
+    wrapped_client = remove_proxy(client.wrapped_client, proxy_class)
+    if wrapped_client is client.wrapped_client:
+        return client
+    # the proxies forward attribute assignment to the wrapped client, so copy through __dict__
+    proxy = type(client).__new__(type(client))
+    proxy.__dict__.update(client.__dict__)
+    proxy.__dict__["_client"] = wrapped_client
+    return proxy
+
 
 class AlgofiAMMClient():
 
     def __init__(self, algod_client: AlgodClient, indexer_client: IndexerClient, historical_indexer_client: IndexerClient, user_address, network):
         """Constructor method for :class:`Client`
 
-        :param algod_client: a :class:`AlgodClient` object for interacting with the network
+        :param algod_client: a :class:`AlgodClient` object for interacting with the network, or a list of them for
+            several endpoints which are hedged and failed over by a :class:`FailoverClient`
         :type algod_client: :class:`AlgodClient`
-        :param indexer_client: a :class:`IndexerClient` object for interacting with the network
+        :param indexer_client: a :class:`IndexerClient` object for interacting with the network, or a list of them
         :type indexer_client: :class:`IndexerClient`
         :param historical_indexer_client: a :class:`IndexerClient` object for interacting with the network (historical state)
         :type historical_indexer_client: :class:`IndexerClient`
@@ -28,12 +62,94 @@ class AlgofiAMMClient():
         """
 
         # clients info
-        self.algod = algod_client
-        self.indexer = indexer_client
-        self.historical_indexer = historical_indexer_client
+        self.algod = failover(algod_client)
+        self.indexer = failover(indexer_client)
+        self.historical_indexer = failover(historical_indexer_client)
         self.network = network
         self.user_address = user_address
         self.manager_application_id = get_manager_application_id(network, False)
+        self.telemetry = None
+        self.request_scheduler = None
+        self.account_cache = None
+        # pool application id -> creator address, whose account holds the pool state read by snapshot
+        self.pool_creators = {}
+
+    def enable_telemetry(self, telemetry):
+        """Wraps the algod and indexer clients so that every call is recorded to the given telemetry collector.
+        Only :class:`Pool` and :class:`Asset` objects created after this call are instrumented.
+
+        :param telemetry: telemetry collector
+        :type telemetry: :class:`Telemetry`
+        """
+
+        self.telemetry = telemetry
+        self.algod = instrument(self.algod, telemetry, "algod")
+        self.indexer = instrument(self.indexer, telemetry, "indexer")
+        self.historical_indexer = instrument(self.historical_indexer, telemetry, "historical_indexer")
+
+    def disable_telemetry(self):
+        """Restores the uninstrumented algod and indexer clients, also when they were scheduled after instrumenting
+        """
+
+        self.algod = remove_proxy(self.algod, InstrumentedClient)
+        self.indexer = remove_proxy(self.indexer, InstrumentedClient)
+        self.historical_indexer = remove_proxy(self.historical_indexer, InstrumentedClient)
+        self.telemetry = None
+
+    def get_endpoint_stats(self):
+        """Returns the hedging and failover counters and endpoint health of the clients with several endpoints
+
+        :return: dict of client name -> stats as returned by :meth:`EndpointPool.get_stats`
+        :rtype: dict
+        """
+
+        stats = {}
+        for name in ["algod", "indexer", "historical_indexer"]:
+            client = getattr(self, name)
+            # unwrap telemetry and scheduling proxies
+            while not isinstance(client, FailoverClient) and hasattr(client, "wrapped_client"):
+                client = client.wrapped_client
+            if isinstance(client, FailoverClient):
+                stats[name] = client.endpoint_pool.get_stats()
+        return stats
+
+    def enable_request_scheduler(self, request_scheduler):
+        """Routes algod and indexer calls through a :class:`RequestScheduler` which rate limits, coalesces and
+        retries them. Only :class:`Pool` and :class:`Asset` objects created after this call are scheduled.
+
+        :param request_scheduler: request scheduler
+        :type request_scheduler: :class:`RequestScheduler`
+        """
+
+        self.request_scheduler = request_scheduler
+        self.algod = schedule(self.algod, request_scheduler, "algod")
+        self.indexer = schedule(self.indexer, request_scheduler, "indexer")
+        self.historical_indexer = schedule(self.historical_indexer, request_scheduler, "historical_indexer")
+
+    def disable_request_scheduler(self):
+        """Restores the unscheduled algod and indexer clients, also when they were instrumented after scheduling
+        """
+
+        self.algod = remove_proxy(self.algod, ScheduledClient)
+        self.indexer = remove_proxy(self.indexer, ScheduledClient)
+        self.historical_indexer = remove_proxy(self.historical_indexer, ScheduledClient)
+        self.request_scheduler = None
+
+    def enable_account_cache(self, max_age=DEFAULT_ACCOUNT_CACHE_MAX_AGE):
+        """Caches account_info responses per round, so that repeated balance and opt in checks of the same address
+        within a round do not refetch the account
+
+        :param max_age: maximum age in seconds of a cached account
+        :type max_age: float, optional
+        """
+
+        self.account_cache = AccountCache(max_age)
+
+    def disable_account_cache(self):
+        """Disables the account cache
+        """
+
+        self.account_cache = None
 
     def get_pool(self, pool_type, asset1_id, asset2_id):
         """Returns a :class:`Pool` object for given assets and pool_type
@@ -85,10 +201,50 @@ class AlgofiAMMClient():
         if not address:
             address = self.user_address
         if address:
-            return self.algod.account_info(address)
+            if self.account_cache is None:
+                return self.algod.account_info(address)
+            user_info = self.account_cache.get(address)
+            if user_info is None:
+                user_info = self.algod.account_info(address)
+                self.account_cache.put(address, user_info)
+            return user_info
         else:
             raise Exception("user_address has not been specified")
 
+    def get_accounts(self, addresses, pools=None, max_workers=DEFAULT_MAX_WORKERS):
+        """Fetches many accounts concurrently and returns their balances, opt ins and lp positions in one pass.
+        Lp positions are valued against the current state of the given pools, which is not refreshed.
+
+        :param addresses: account addresses
+        :type addresses: list
+        :param pools: pools whose lp tokens are valued
+        :type pools: list, optional
+        :param max_workers: maximum number of concurrent requests
+        :type max_workers: int, optional
+        :return: dict of address -> :class:`AccountSummary`
+        :rtype: dict
+        """
+
+        account_infos = get_account_infos(self.algod, addresses, max_workers=max_workers, account_cache=self.account_cache)
+        return {address: AccountSummary(account_info, pools) for address, account_info in account_infos.items()}
+
+    def snapshot(self, pools, max_workers=DEFAULT_MAX_WORKERS, max_retries=DEFAULT_SNAPSHOT_MAX_RETRIES):
+        """Reads the state of many pools concurrently at a single round, so that quotes, routes and prices across
+        the pools do not mix rounds. Pools read at an older round than the others are refetched. The given pools
+        are not modified.
+
+        :param pools: pools to read
+        :type pools: list
+        :param max_workers: maximum number of concurrent requests
+        :type max_workers: int, optional
+        :param max_retries: maximum number of refetches before giving up
+        :type max_retries: int, optional
+        :return: immutable snapshot of the pools
+        :rtype: :class:`PoolSnapshot`
+        """
+
+        return get_pool_snapshot(self.algod, pools, self.pool_creators, max_workers=max_workers, max_retries=max_retries)
+
     def is_opted_into_app(self, app_id, address=None):
         """Returns a boolean if the user address is opted into an application with id app_id
 
@@ -204,8 +360,21 @@ class AlgofiAMMClient():
         return pool_app_ids
 
 
+def _get_algod_client(algod_address, connection_pool=None):
+    if connection_pool is not None:
+        return PooledAlgodClient("", algod_address, headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+    return AlgodClient("", algod_address, headers={"User-Agent": "algosdk"})
+
+
+def _get_indexer_client(indexer_address, connection_pool=None):
+    if connection_pool is not None:
+        return PooledIndexerClient("", indexer_address, headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+    return IndexerClient("", indexer_address, headers={"User-Agent": "algosdk"})
+
+
 class AlgofiAMMTestnetClient(AlgofiAMMClient):
-    def __init__(self, algod_client=None, indexer_client=None, user_address=None):
+    def __init__(self, algod_client=None, indexer_client=None, user_address=None, connection_pool=None,
+                 algod_addresses=None, indexer_addresses=None):
         """Constructor method for the testnet generic client.
 
         :param algod_client: a :class:`AlgodClient` for interacting with the network
@@ -214,17 +383,35 @@ class AlgofiAMMTestnetClient(AlgofiAMMClient):
         :type indexer_client: :class:`IndexerClient`
         :param user_address: address of the user
         :type user_address: string
+        :param connection_pool: a :class:`ConnectionPool` of keep-alive connections used by the default clients
+        :type connection_pool: :class:`ConnectionPool`, optional
+        :param algod_addresses: algod addresses to use instead of the default one, hedged and failed over if several
+        :type algod_addresses: list, optional
+        :param indexer_addresses: indexer addresses to use instead of the default one, hedged and failed over if several
+        :type indexer_addresses: list, optional
         """
-        historical_indexer_client = IndexerClient("", "https://indexer.testnet.algoexplorerapi.io/", headers={"User-Agent": "algosdk"})
-        if algod_client is None:
-            algod_client = AlgodClient("", "https://api.testnet.algoexplorer.io", headers={"User-Agent": "algosdk"})
-        if indexer_client is None:
-            indexer_client = IndexerClient("", "https://algoindexer.testnet.algoexplorerapi.io", headers={"User-Agent": "algosdk"})
+        if algod_client is None and algod_addresses:
+            algod_client = [_get_algod_client(address, connection_pool) for address in algod_addresses]
+        if indexer_client is None and indexer_addresses:
+            indexer_client = [_get_indexer_client(address, connection_pool) for address in indexer_addresses]
+        if connection_pool is not None:
+            historical_indexer_client = PooledIndexerClient("", "https://indexer.testnet.algoexplorerapi.io", headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+            if algod_client is None:
+                algod_client = PooledAlgodClient("", "https://api.testnet.algoexplorer.io", headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+            if indexer_client is None:
+                indexer_client = PooledIndexerClient("", "https://algoindexer.testnet.algoexplorerapi.io", headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+        else:
+            historical_indexer_client = IndexerClient("", "https://indexer.testnet.algoexplorerapi.io/", headers={"User-Agent": "algosdk"})
+            if algod_client is None:
+                algod_client = AlgodClient("", "https://api.testnet.algoexplorer.io", headers={"User-Agent": "algosdk"})
+            if indexer_client is None:
+                indexer_client = IndexerClient("", "https://algoindexer.testnet.algoexplorerapi.io", headers={"User-Agent": "algosdk"})
         super().__init__(algod_client, indexer_client=indexer_client, historical_indexer_client=historical_indexer_client, user_address=user_address, network=Network.TESTNET)
 
 
 class AlgofiAMMMainnetClient(AlgofiAMMClient):
-    def __init__(self, algod_client=None, indexer_client=None, user_address=None):
+    def __init__(self, algod_client=None, indexer_client=None, user_address=None, connection_pool=None,
+                 algod_addresses=None, indexer_addresses=None):
         """Constructor method for the mainnet generic client.
         
         :param algod_client: a :class:`AlgodClient` for interacting with the network
@@ -233,10 +420,27 @@ class AlgofiAMMMainnetClient(AlgofiAMMClient):
         :type indexer_client: :class:`IndexerClient`
         :param user_address: address of the user
         :type user_address: string
+        :param connection_pool: a :class:`ConnectionPool` of keep-alive connections used by the default clients
+        :type connection_pool: :class:`ConnectionPool`, optional
+        :param algod_addresses: algod addresses to use instead of the default one, hedged and failed over if several
+        :type algod_addresses: list, optional
+        :param indexer_addresses: indexer addresses to use instead of the default one, hedged and failed over if several
+        :type indexer_addresses: list, optional
         """
-        historical_indexer_client = IndexerClient("", "https://indexer.algoexplorerapi.io/", headers={"User-Agent": "algosdk"})
-        if algod_client is None:
-            algod_client = AlgodClient("", "https://algoexplorerapi.io", headers={"User-Agent": "algosdk"})
-        if indexer_client is None:
-            indexer_client = IndexerClient("", "https://algoindexer.algoexplorerapi.io", headers={"User-Agent": "algosdk"})
+        if algod_client is None and algod_addresses:
+            algod_client = [_get_algod_client(address, connection_pool) for address in algod_addresses]
+        if indexer_client is None and indexer_addresses:
+            indexer_client = [_get_indexer_client(address, connection_pool) for address in indexer_addresses]
+        if connection_pool is not None:
+            historical_indexer_client = PooledIndexerClient("", "https://indexer.algoexplorerapi.io", headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+            if algod_client is None:
+                algod_client = PooledAlgodClient("", "https://algoexplorerapi.io", headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+            if indexer_client is None:
+                indexer_client = PooledIndexerClient("", "https://algoindexer.algoexplorerapi.io", headers={"User-Agent": "algosdk"}, connection_pool=connection_pool)
+        else:
+            historical_indexer_client = IndexerClient("", "https://indexer.algoexplorerapi.io/", headers={"User-Agent": "algosdk"})
+            if algod_client is None:
+                algod_client = AlgodClient("", "https://algoexplorerapi.io", headers={"User-Agent": "algosdk"})
+            if indexer_client is None:
+                indexer_client = IndexerClient("", "https://algoindexer.algoexplorerapi.io", headers={"User-Agent": "algosdk"})
         super().__init__(algod_client, indexer_client=indexer_client, historical_indexer_client=historical_indexer_client, user_address=user_address, network=Network.MAINNET)
\ No newline at end of file
@@ -1,8 +1,6 @@
 
 from enum import Enum
 from base64 import b64encode
-from .approval_programs import MAINNET_APPROVAL_PROGRAM_25BP_CONSTANT_PRODUCT, MAINNET_APPROVAL_PROGRAM_75BP_CONSTANT_PRODUCT, \
-    TESTNET_APPROVAL_PROGRAM_30BP_CONSTANT_PRODUCT, TESTNET_APPROVAL_PROGRAM_100BP_CONSTANT_PRODUCT, CLEAR_STATE_PROGRAM
 from ..contract_strings import algofi_pool_strings as pool_strings
 from ..contract_strings import algofi_manager_strings as manager_strings
 
@@ -87,30 +85,35 @@ def get_approval_program_by_pool_type(pool_type, network):
     :type pool_type: :class:`PoolType`
     :param pool_type: a :class:`PoolType` object for the type of pool (e.g. 30bp, 100bp fee)
     :type pool_type: :class:`PoolType`
-    :return: approval program bytecode for given pool type as list of ints
-    :rtype: list
+    :return: approval program bytecode for given pool type
+    :rtype: bytes
     """
 
+    # approval programs are only needed to create pools, import them on first use
+    from . import approval_programs
+
     if network == Network.MAINNET:
         if (pool_type == PoolType.CONSTANT_PRODUCT_25BP_FEE):
-            return bytes(MAINNET_APPROVAL_PROGRAM_25BP_CONSTANT_PRODUCT)
+            return approval_programs.MAINNET_APPROVAL_PROGRAM_25BP_CONSTANT_PRODUCT
         elif (pool_type == PoolType.CONSTANT_PRODUCT_75BP_FEE):
-            return bytes(MAINNET_APPROVAL_PROGRAM_75BP_CONSTANT_PRODUCT)
+            return approval_programs.MAINNET_APPROVAL_PROGRAM_75BP_CONSTANT_PRODUCT
     elif network == Network.TESTNET:
         if (pool_type == PoolType.CONSTANT_PRODUCT_30BP_FEE):
-            return bytes(TESTNET_APPROVAL_PROGRAM_30BP_CONSTANT_PRODUCT)
+            return approval_programs.TESTNET_APPROVAL_PROGRAM_30BP_CONSTANT_PRODUCT
         elif (pool_type == PoolType.CONSTANT_PRODUCT_100BP_FEE):
-            return bytes(TESTNET_APPROVAL_PROGRAM_100BP_CONSTANT_PRODUCT)
+            return approval_programs.TESTNET_APPROVAL_PROGRAM_100BP_CONSTANT_PRODUCT
 
 
 def get_clear_state_program():
     """Gets the clear state program
 
-    :return: clear state program bytecode as list of ints
-    :rtype: list
+    :return: clear state program bytecode
+    :rtype: bytes
     """
 
-    return bytes(CLEAR_STATE_PROGRAM)
+    from . import approval_programs
+
+    return approval_programs.CLEAR_STATE_PROGRAM
 
 
 def get_manager_application_id(network, is_nanoswap):
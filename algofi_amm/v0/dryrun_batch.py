@@ -0,0 +1,254 @@
+
+from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
+from algosdk import encoding
+from algosdk.future.transaction import SignedTransaction
+from algosdk.v2client.models import DryrunRequest
+from .config import ALGO_ASSET_ID
+from .balance_delta import BalanceDelta
+from ..contract_strings import algofi_pool_strings as pool_strings
+from .transaction_batch import pack_sizes
+from ..utils import MAX_GROUP_SIZE, TransactionGroup
+
+# default number of concurrent dryrun requests
+DEFAULT_MAX_WORKERS = 8
+
+# first app args of the pool calls which only address other transactions of their group relative to their own
+# position. Groups with other app calls, e.g. a flash loan which must be at group index 0 and is repaid at
+# GroupSize - 1, are dryrun in a request of their own.
+PACKABLE_APP_CALLS = frozenset(bytes(name, "utf-8") for name in [
+    pool_strings.pool,
+    pool_strings.redeem_pool_asset1_residual,
+    pool_strings.redeem_pool_asset2_residual,
+    pool_strings.burn_asset1_out,
+    pool_strings.burn_asset2_out,
+    pool_strings.swap_exact_for,
+    pool_strings.swap_for_exact,
+    pool_strings.redeem_swap_residual,
+])
+
+# app call messages which do not describe an error
+DRYRUN_STATUS_MESSAGES = frozenset(["ApprovalProgram", "ClearStateProgram", "PASS", "REJECT"])
+
+
+def _get_signed_transactions(transaction_group):
+    if not isinstance(transaction_group, TransactionGroup):
+        transaction_group = TransactionGroup(list(transaction_group))
+    # dryrun does not check signatures, unsigned transactions are sent with an empty signature
+    return [stxn if stxn is not None else SignedTransaction(txn, None)
+            for txn, stxn in zip(transaction_group.transactions, transaction_group.signed_transactions)]
+
+
+def _decode_address(value):
+    # addresses are raw bytes in dictified transactions and base32 or base64 strings in dryrun responses
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return encoding.encode_address(value)
+    if len(value) == 58:
+        return value
+    return encoding.encode_address(b64decode(value))
+
+
+def _add_transfer(changes, txn, address):
+    """Adds the balance changes of address by a transfer in the json form of a dryrun response"""
+
+    if txn.get("type", None) == "pay":
+        asset_id, amount, receiver = ALGO_ASSET_ID, txn.get("amt", 0), txn.get("rcv", None)
+    elif txn.get("type", None) == "axfer":
+        asset_id, amount, receiver = txn.get("xaid", 0), txn.get("aamt", 0), txn.get("arcv", None)
+    else:
+        return
+    sender = _decode_address(txn.get("snd", None))
+    receiver = _decode_address(receiver)
+    if sender == address:
+        changes[asset_id] = changes.get(asset_id, 0) - amount
+    if receiver == address:
+        changes[asset_id] = changes.get(asset_id, 0) + amount
+
+
+def _add_inner_transfers(changes, inner_txns, address):
+    for inner_txn in inner_txns or []:
+        _add_transfer(changes, inner_txn.get("txn", {}).get("txn", {}), address)
+        _add_inner_transfers(changes, inner_txn.get("inner-txns", None), address)
+
+
+class DryrunResult():
+
+    def __init__(self, transactions, txn_results, error=None, pool=None, sender=None):
+        """Constructor method for :class:`DryrunResult`, the decoded dryrun of one candidate group
+
+        :param transactions: signed transactions of the group
+        :type transactions: list
+        :param txn_results: entries of the "txns" field of the dryrun response for the transactions of the group
+        :type txn_results: list
+        :param error: error of the whole dryrun request
+        :type error: str, optional
+        :param pool: pool whose assets the balance delta is expressed in
+        :type pool: :class:`Pool`, optional
+        :param sender: address whose balance delta is computed, defaults to the sender of the first transaction
+        :type sender: str, optional
+        """
+
+        self.transactions = transactions
+        self.txn_results = txn_results
+        self.pool = pool
+        self.sender = sender if sender is not None else transactions[0].transaction.sender
+        self.costs = []
+        self.messages = []
+        self.passed = not error and len(txn_results) == len(transactions)
+        self.error = error or None
+        for txn_result in txn_results:
+            messages = list(txn_result.get("app-call-messages", None) or []) + list(txn_result.get("logic-sig-messages", None) or [])
+            self.messages.append(messages)
+            if messages and (messages[-1] != "PASS" or "REJECT" in messages):
+                self.passed = False
+                if self.error is None:
+                    self.error = "; ".join(message for message in messages if message not in DRYRUN_STATUS_MESSAGES) or "REJECT"
+            cost = txn_result.get("budget-consumed", txn_result.get("cost", None))
+            self.costs.append(cost)
+        self.cost = sum(cost for cost in self.costs if cost)
+
+    def __str__(self):
+        """Returns a string representation of the :class:`DryrunResult` object
+        """
+
+        if self.passed:
+            return "DryrunResult(passed, cost={})".format(self.cost)
+        return "DryrunResult(failed: {})".format(self.error)
+
+    def get_balance_changes(self, address=None):
+        """Returns the changes of the balances of an address from the transfers of the group, including inner
+        transfers and excluding fees. A failed group changes no balances.
+
+        :param address: account address, defaults to the sender of the group
+        :type address: str, optional
+        :return: dict of asset id -> change
+        :rtype: dict
+        """
+
+        if not self.passed:
+            return {}
+        address = address if address is not None else self.sender
+        changes = {}
+        for stxn, txn_result in zip(self.transactions, self.txn_results):
+            _add_transfer(changes, stxn.transaction.dictify(), address)
+            _add_inner_transfers(changes, txn_result.get("inner-txns", None), address)
+        return {asset_id: change for asset_id, change in changes.items() if change}
+
+    def get_balance_delta(self, pool=None, address=None):
+        """Returns the change of the balances of an address in the assets and lp token of a pool, in the form of
+        the quotes of :class:`Pool`
+
+        :param pool: pool, defaults to the pool given for the group
+        :type pool: :class:`Pool`, optional
+        :param address: account address, defaults to the sender of the group
+        :type address: str, optional
+        :return: balance delta of the address
+        :rtype: :class:`BalanceDelta`
+        """
+
+        pool = pool if pool is not None else self.pool
+        if pool is None:
+            raise Exception("No pool given for the balance delta")
+        changes = self.get_balance_changes(address)
+        return BalanceDelta(pool, changes.get(pool.asset1.asset_id, 0), changes.get(pool.asset2.asset_id, 0),
+                            changes.get(pool.lp_asset_id, 0))
+
+
+def is_packable(transaction_group):
+    """Returns whether a group can share a dryrun request with other groups. Packing shifts the txn GroupIndex
+    and global GroupSize seen by every group after the first, so only groups whose app calls are in
+    PACKABLE_APP_CALLS, i.e. swap, pool and burn groups, are packed.
+
+    :param transaction_group: candidate group, signed or unsigned
+    :type transaction_group: :class:`TransactionGroup` or list
+    :return: whether the group can be packed
+    :rtype: bool
+    """
+
+    if isinstance(transaction_group, TransactionGroup):
+        transaction_group = transaction_group.transactions
+    for txn in transaction_group:
+        txn = getattr(txn, "transaction", txn)
+        if getattr(txn, "type", None) != "appl":
+            continue
+        app_args = getattr(txn, "app_args", None) or []
+        if not app_args or app_args[0] not in PACKABLE_APP_CALLS:
+            return False
+    return True
+
+
+def get_dryrun_packing(transaction_groups, max_request_size=MAX_GROUP_SIZE):
+    """Returns the packing of candidate groups into dryrun requests as lists of group indices. Groups which are not
+    :func:`is_packable`, e.g. flash loan groups, get a request of their own.
+
+    :param transaction_groups: candidate groups
+    :type transaction_groups: list
+    :param max_request_size: maximum number of transactions per dryrun request
+    :type max_request_size: int, optional
+    :return: list of requests, each a list of group indices
+    :rtype: list
+    """
+
+    packable = [i for i, transaction_group in enumerate(transaction_groups) if is_packable(transaction_group)]
+    sizes = [len(transaction_groups[i].transactions if isinstance(transaction_groups[i], TransactionGroup) else transaction_groups[i])
+             for i in packable]
+    packing = [[packable[j] for j in request] for request in pack_sizes(sizes, max_size=max(max_request_size, max(sizes or [0])))]
+    packed = set(packable)
+    return packing + [[i] for i in range(len(transaction_groups)) if i not in packed]
+
+
+def dryrun_groups(algod_client, transaction_groups, pools=None, senders=None, max_request_size=MAX_GROUP_SIZE,
+                  max_workers=DEFAULT_MAX_WORKERS):
+    """Dryruns many candidate groups, e.g. from :meth:`Pool.get_swap_exact_for_txns`,
+    :meth:`Pool.get_swap_for_exact_txns` or :meth:`Pool.get_flash_loan_txns`, packing them into as few dryrun
+    requests of at most max_request_size transactions as possible and sending the requests concurrently.
+
+    The node evaluates the transactions of a request as one group against the current ledger, without applying the
+    transfers of earlier transactions, so packed groups are each evaluated against the same state. Packing shifts
+    the txn GroupIndex and global GroupSize seen by every group after the first, so only swap, pool and burn groups
+    are packed and groups with other app calls, e.g. flash loans, are dryrun on their own. The fee credit
+    of a request is pooled across its groups, so pass max_request_size=1 to check the fees of each group on its own.
+    Groups are never split across requests.
+
+    :param algod_client: a :class:`AlgodClient` object, or any object with a dryrun method, to send the requests to
+    :type algod_client: :class:`AlgodClient`
+    :param transaction_groups: candidate groups, signed or unsigned
+    :type transaction_groups: list
+    :param pools: pool of each group, used for its balance delta
+    :type pools: list, optional
+    :param senders: address of each group whose balance delta is computed, defaults to the sender of each group
+    :type senders: list, optional
+    :param max_request_size: maximum number of transactions per dryrun request
+    :type max_request_size: int, optional
+    :param max_workers: maximum number of concurrent dryrun requests
+    :type max_workers: int, optional
+    :return: :class:`DryrunResult` of each group, in the order of transaction_groups
+    :rtype: list
+    """
+
+    signed_groups = [_get_signed_transactions(transaction_group) for transaction_group in transaction_groups]
+    packing = get_dryrun_packing(signed_groups, max_request_size)
+
+    def dryrun(request):
+        txns = [stxn for i in request for stxn in signed_groups[i]]
+        return algod_client.dryrun(DryrunRequest(txns=txns))
+
+    if len(packing) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(packing))) as executor:
+            responses = list(executor.map(dryrun, packing))
+    else:
+        responses = [dryrun(request) for request in packing]
+
+    results = [None] * len(signed_groups)
+    for request, response in zip(packing, responses):
+        txn_results = response.get("txns", None) or []
+        error = response.get("error", None)
+        offset = 0
+        for i in request:
+            size = len(signed_groups[i])
+            results[i] = DryrunResult(signed_groups[i], txn_results[offset:offset + size], error=error,
+                                      pool=pools[i] if pools else None, sender=senders[i] if senders else None)
+            offset += size
+    return results
@@ -0,0 +1,81 @@
+
+from ..contract_strings import algofi_pool_strings as pool_strings
+
+# minimum fee of a transaction (and of each inner transaction) in microalgos
+MIN_TXN_FEE = 1000
+
+# opcode budget of a single application call, pooled across the group
+APP_CALL_OPCODE_BUDGET = 700
+
+# opcodes of one newton iteration of the stableswap get_D / get_y loops of the nanoswap approval program
+NANOSWAP_OPCODES_PER_ITERATION = 400
+
+# largest iteration count of a single operation (get_D and get_y both stop after 255 iterations)
+MAX_NUM_ITER = 2 * 255
+
+# fee of each pool application call: the call itself plus the inner transactions it issues
+OPERATION_FEES = {
+    pool_strings.pool: 3000,
+    pool_strings.redeem_pool_asset1_residual: 1000,
+    pool_strings.redeem_pool_asset2_residual: 1000,
+    pool_strings.burn_asset1_out: 2000,
+    pool_strings.burn_asset2_out: 2000,
+    pool_strings.swap_exact_for: 2000,
+    pool_strings.swap_for_exact: 2000,
+    pool_strings.redeem_swap_residual: 2000,
+    pool_strings.flash_loan: 2000,
+    pool_strings.initialize_pool: 4000,
+}
+
+# operations which run the stableswap loops on nanoswap pools
+COMPUTE_OPERATIONS = frozenset([pool_strings.pool, pool_strings.swap_exact_for, pool_strings.swap_for_exact])
+
+
+def get_extra_compute_budget_calls(num_iter):
+    """Returns the number of extra opcode budget increments (each paid with one minimum fee) needed by num_iter
+    stableswap iterations
+
+    :param num_iter: number of stableswap loop iterations
+    :type num_iter: int
+    :return: number of extra opcode budget increments
+    :rtype: int
+    """
+
+    opcodes = num_iter * NANOSWAP_OPCODES_PER_ITERATION
+    return -(-opcodes // APP_CALL_OPCODE_BUDGET)
+
+
+# extra compute fee by iteration count, computed once
+EXTRA_COMPUTE_FEES = [get_extra_compute_budget_calls(num_iter) * MIN_TXN_FEE for num_iter in range(MAX_NUM_ITER + 1)]
+
+
+def get_extra_compute_fee(num_iter):
+    """Returns the fee in microalgos needed to cover the opcode budget of num_iter stableswap iterations
+
+    :param num_iter: number of stableswap loop iterations
+    :type num_iter: int
+    :return: extra compute fee
+    :rtype: int
+    """
+
+    if num_iter <= MAX_NUM_ITER:
+        return EXTRA_COMPUTE_FEES[num_iter]
+    return get_extra_compute_budget_calls(num_iter) * MIN_TXN_FEE
+
+
+def get_operation_fee(operation, num_iter=0):
+    """Returns the fee in microalgos of a pool application call, including the extra compute fee of its
+    stableswap iterations on nanoswap pools
+
+    :param operation: pool operation (e.g. algofi_pool_strings.swap_exact_for)
+    :type operation: str
+    :param num_iter: number of stableswap loop iterations of the operation
+    :type num_iter: int, optional
+    :return: fee of the application call
+    :rtype: int
+    """
+
+    fee = OPERATION_FEES[operation]
+    if num_iter and operation in COMPUTE_OPERATIONS:
+        fee += get_extra_compute_fee(num_iter)
+    return fee
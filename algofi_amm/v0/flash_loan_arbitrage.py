@@ -0,0 +1,352 @@
+
+import math
+from .config import PoolType, ALGO_ASSET_ID
+from .pool import Pool
+from .fee_model import MIN_TXN_FEE, get_operation_fee
+from ..contract_strings import algofi_pool_strings as pool_strings
+from ..profiling import profile_build
+from ..utils import PARAMETER_SCALE_FACTOR, MAX_GROUP_SIZE, get_params
+
+# fees of the transactions built by :meth:`Pool.get_flash_loan_txns` and :meth:`Pool.get_swap_exact_for_txns`
+FLASH_LOAN_TXN_FEE = get_operation_fee(pool_strings.flash_loan)
+REPAYMENT_TXN_FEE = MIN_TXN_FEE
+SWAP_TXN_FEES = MIN_TXN_FEE + get_operation_fee(pool_strings.swap_exact_for)
+
+# maximum number of golden section steps used to size cycles through nanoswap pools
+GOLDEN_SECTION_STEPS = 128
+
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+# the memoized quote methods are bypassed so that sizing does not evict the pools' cached quotes
+get_swap_exact_for_quote = getattr(Pool.get_swap_exact_for_quote, "__wrapped__", Pool.get_swap_exact_for_quote)
+
+
+def get_flash_loan_fee(pool, amount):
+    """Returns the fee charged by a pool for a flash loan of amount, as repaid by :meth:`Pool.get_flash_loan_txns`
+
+    :param pool: pool lending the asset
+    :type pool: :class:`Pool`
+    :param amount: flash loan amount
+    :type amount: int
+    :return: flash loan fee
+    :rtype: int
+    """
+
+    return (amount * pool.flash_loan_fee) // PARAMETER_SCALE_FACTOR + 1
+
+
+def get_max_flash_loan_amount(pool, asset_id):
+    """Returns the maximum flash loan amount of an asset allowed by the pool's max_flash_loan_ratio
+
+    :param pool: pool lending the asset
+    :type pool: :class:`Pool`
+    :param asset_id: asset id of the asset to borrow
+    :type asset_id: int
+    :return: maximum flash loan amount
+    :rtype: int
+    """
+
+    balance = pool.asset1_balance if asset_id == pool.asset1.asset_id else pool.asset2_balance
+    return balance * pool.max_flash_loan_ratio // PARAMETER_SCALE_FACTOR
+
+
+def get_other_asset(pool, asset_id):
+    """Returns the :class:`Asset` of the pool which is not asset_id
+
+    :param pool: pool
+    :type pool: :class:`Pool`
+    :param asset_id: asset id of one of the pool assets
+    :type asset_id: int
+    :return: the other asset of the pool
+    :rtype: :class:`Asset`
+    """
+
+    return pool.asset2 if asset_id == pool.asset1.asset_id else pool.asset1
+
+
+class ArbitragePlan():
+
+    def __init__(self, flash_loan_pool, asset, amount, route, swap_quotes, txn_fee, profit):
+        """Constructor method for :class:`ArbitragePlan`, a sized flash loan funded swap cycle
+
+        :param flash_loan_pool: pool lending the asset
+        :type flash_loan_pool: :class:`Pool`
+        :param asset: borrowed asset, which is also the asset the cycle returns to
+        :type asset: :class:`Asset`
+        :param amount: flash loan amount
+        :type amount: int
+        :param route: list of (pool, swap in asset) hops
+        :type route: list
+        :param swap_quotes: swap exact for quote of each hop
+        :type swap_quotes: list
+        :param txn_fee: total transaction fee of the group in microalgos
+        :type txn_fee: int
+        :param profit: expected profit in the borrowed asset, net of the flash loan fee and (converted) transaction fee
+        :type profit: int
+        """
+
+        self.flash_loan_pool = flash_loan_pool
+        self.asset = asset
+        self.amount = amount
+        self.route = route
+        self.swap_quotes = swap_quotes
+        self.txn_fee = txn_fee
+        self.profit = profit
+        self.flash_loan_fee = get_flash_loan_fee(flash_loan_pool, amount)
+
+    def get_swap_amounts(self):
+        """Returns the (swap in amount, swap out amount) of each hop
+
+        :return: list of (swap in amount, swap out amount)
+        :rtype: list
+        """
+
+        amounts = []
+        for (pool, swap_in_asset), quote in zip(self.route, self.swap_quotes):
+            if swap_in_asset.asset_id == pool.asset1.asset_id:
+                amounts.append((-1 * quote.asset1_delta, quote.asset2_delta))
+            else:
+                amounts.append((-1 * quote.asset2_delta, quote.asset1_delta))
+        return amounts
+
+    @profile_build
+    def get_txns(self, sender, maximum_slippage=0, params=None):
+        """Get the group transaction of the plan: a flash loan from the lending pool wrapping one swap exact for
+        per hop and the repayment. Each swap must return at least its quoted output less maximum_slippage.
+
+        :param sender: sender
+        :type sender: str
+        :param maximum_slippage: maximum slippage percent (scaled by 1000000) allowed on each swap output
+        :type maximum_slippage: int, optional
+        :return: unsigned group transaction for the plan
+        :rtype: :class:`TransactionGroup`
+        """
+
+        if params is None:
+            params = get_params(self.flash_loan_pool.algod)
+        base_fee = params.fee
+
+        swap_txns = None
+        swap_in_amount = self.amount
+        for ((pool, swap_in_asset), quote), (_, swap_out_amount) in zip(zip(self.route, self.swap_quotes), self.get_swap_amounts()):
+            min_amount_to_receive = swap_out_amount * (PARAMETER_SCALE_FACTOR - maximum_slippage) // PARAMETER_SCALE_FACTOR
+            params.fee = base_fee
+            hop_txns = pool.get_swap_exact_for_txns(sender, swap_in_asset, swap_in_amount, min_amount_to_receive, params=params,
+                                                    fee=get_operation_fee(pool_strings.swap_exact_for, quote.num_iter))
+            swap_txns = hop_txns if swap_txns is None else swap_txns + hop_txns
+            swap_in_amount = min_amount_to_receive
+
+        params.fee = base_fee
+        return self.flash_loan_pool.get_flash_loan_txns(sender, self.asset, self.amount, swap_txns, params=params)
+
+
+class FlashLoanArbitragePlanner():
+
+    def __init__(self, pools, max_hops=3):
+        """Constructor method for :class:`FlashLoanArbitragePlanner`, which searches the cached states of a set of
+        pools for swap cycles that are profitable when funded by a flash loan from another pool of the set
+
+        :param pools: list of :class:`Pool` objects with loaded state
+        :type pools: list
+        :param max_hops: maximum number of swaps per cycle, at most 7 to fit an atomic group
+        :type max_hops: int, optional
+        """
+
+        if (2 * max_hops + 2 > MAX_GROUP_SIZE):
+            raise Exception("max_hops too large, group would exceed %d transactions" % MAX_GROUP_SIZE)
+        self.pools = list(pools)
+        self.max_hops = max_hops
+        self.refresh_cycles()
+
+    def refresh_cycles(self):
+        """Recomputes the swap cycles of the pool set. Call after changing the pool set.
+        """
+
+        # asset id -> list of (pool, other asset id)
+        edges = {}
+        for pool in self.pools:
+            edges.setdefault(pool.asset1.asset_id, []).append((pool, pool.asset2.asset_id))
+            edges.setdefault(pool.asset2.asset_id, []).append((pool, pool.asset1.asset_id))
+
+        # asset id -> list of routes, each a list of (pool, swap in asset id)
+        self.cycles = {}
+        for start_asset_id in edges:
+            cycles = []
+            stack = [(start_asset_id, [])]
+            while stack:
+                asset_id, route = stack.pop()
+                for pool, next_asset_id in edges[asset_id]:
+                    if any(pool is hop_pool for hop_pool, _ in route):
+                        continue
+                    hop_route = route + [(pool, asset_id)]
+                    if next_asset_id == start_asset_id:
+                        if len(hop_route) >= 2:
+                            cycles.append(hop_route)
+                    elif len(hop_route) < self.max_hops and not any(next_asset_id == hop_asset_id for _, hop_asset_id in route):
+                        stack.append((next_asset_id, hop_route))
+            self.cycles[start_asset_id] = cycles
+
+        self.lenders = {}
+        for pool in self.pools:
+            self.lenders.setdefault(pool.asset1.asset_id, []).append(pool)
+            self.lenders.setdefault(pool.asset2.asset_id, []).append(pool)
+
+    def get_algo_price(self, asset_id):
+        """Returns the price of one microalgo in units of asset_id from a pool of the set, or None if there is no
+        pool pairing the asset with ALGO
+
+        :param asset_id: asset id
+        :type asset_id: int
+        :return: price of a microalgo in the asset
+        :rtype: float
+        """
+
+        if asset_id == ALGO_ASSET_ID:
+            return 1.0
+        for pool, other_asset_id in ((pool, get_other_asset(pool, asset_id).asset_id) for pool in self.lenders.get(asset_id, [])):
+            if other_asset_id == ALGO_ASSET_ID and pool.lp_circulation > 0:
+                return pool.get_pool_price(asset_id)
+        return None
+
+    def _get_cycle_output(self, route, amount):
+        quotes = []
+        for pool, swap_in_asset_id in route:
+            quote = get_swap_exact_for_quote(pool, swap_in_asset_id, amount)
+            quotes.append(quote)
+            amount = quote.asset2_delta if swap_in_asset_id == pool.asset1.asset_id else quote.asset1_delta
+            if amount <= 0:
+                return 0, quotes
+        return amount, quotes
+
+    def _get_constant_product_optimum(self, route, flash_loan_pool):
+        # each constant product hop is the mobius map x -> P x / (Q + R x), and so is their composition
+        P, Q, R = 1.0, 1.0, 0.0
+        for pool, swap_in_asset_id in route:
+            if swap_in_asset_id == pool.asset1.asset_id:
+                balance_in, balance_out = pool.asset1_balance, pool.asset2_balance
+            else:
+                balance_in, balance_out = pool.asset2_balance, pool.asset1_balance
+            fee_factor = 1 - pool.swap_fee
+            P, Q, R = P * balance_out * fee_factor, Q * balance_in, R * balance_in + P * fee_factor
+        # maximize P x / (Q + R x) - (1 + flash loan fee rate) x
+        cost_rate = 1 + flash_loan_pool.flash_loan_fee / PARAMETER_SCALE_FACTOR
+        if P <= Q * cost_rate or R <= 0:
+            return 0
+        return int((math.sqrt(P * Q / cost_rate) - Q) / R)
+
+    def _get_profit(self, route, flash_loan_pool, amount, fee_in_asset):
+        output, quotes = self._get_cycle_output(route, amount)
+        return output - amount - get_flash_loan_fee(flash_loan_pool, amount) - fee_in_asset, quotes
+
+    def _size_cycle(self, route, flash_loan_pool, max_amount, fee_in_asset):
+        if all(pool.pool_type != PoolType.NANOSWAP for pool, _ in route):
+            optimum = min(self._get_constant_product_optimum(route, flash_loan_pool), max_amount)
+            if optimum <= 0:
+                return 0, None, None
+            # integer rounding of the quotes may move the optimum by a few units
+            best = None
+            for amount in (optimum - 1, optimum, optimum + 1):
+                if 0 < amount <= max_amount:
+                    profit, quotes = self._get_profit(route, flash_loan_pool, amount, fee_in_asset)
+                    if best is None or profit > best[1]:
+                        best = (amount, profit, quotes)
+            return best
+
+        # profit is concave in the amount, golden section search over [1, max_amount]
+        low, high = 1, max_amount
+        for _ in range(GOLDEN_SECTION_STEPS):
+            if high - low <= 2:
+                break
+            left = high - int((high - low) * GOLDEN_RATIO)
+            right = low + int((high - low) * GOLDEN_RATIO)
+            if left >= right:
+                break
+            if self._get_profit(route, flash_loan_pool, left, fee_in_asset)[0] < self._get_profit(route, flash_loan_pool, right, fee_in_asset)[0]:
+                low = left
+            else:
+                high = right
+        best = None
+        for amount in range(low, high + 1):
+            profit, quotes = self._get_profit(route, flash_loan_pool, amount, fee_in_asset)
+            if best is None or profit > best[1]:
+                best = (amount, profit, quotes)
+        return best
+
+    def _is_candidate(self, route, flash_loan_pool):
+        # product of the marginal rates of the hops must beat the flash loan fee
+        rate = 1.0
+        for pool, swap_in_asset_id in route:
+            if swap_in_asset_id == pool.asset1.asset_id:
+                balance_in, balance_out = pool.asset1_balance, pool.asset2_balance
+            else:
+                balance_in, balance_out = pool.asset2_balance, pool.asset1_balance
+            if balance_in == 0 or balance_out == 0 or pool.lp_circulation == 0:
+                return False
+            if pool.pool_type == PoolType.NANOSWAP:
+                probe = max(balance_in // 1000000, 1)
+                quote = get_swap_exact_for_quote(pool, swap_in_asset_id, probe)
+                probe_out = quote.asset2_delta if swap_in_asset_id == pool.asset1.asset_id else quote.asset1_delta
+                rate *= probe_out / probe
+            else:
+                rate *= (balance_out / balance_in) * (1 - pool.swap_fee)
+        return rate > 1 + flash_loan_pool.flash_loan_fee / PARAMETER_SCALE_FACTOR
+
+    def find_opportunities(self, min_profit=1):
+        """Returns the profitable flash loan funded cycles of the current cached pool states, best first.
+        Each cycle is sized to maximize profit net of the flash loan fee and the transaction fees, which are
+        converted into the borrowed asset through a pool pairing it with ALGO (and ignored if there is none).
+        Cycles never swap through the pool lending the asset.
+
+        :param min_profit: minimum profit in the borrowed asset
+        :type min_profit: int, optional
+        :return: list of :class:`ArbitragePlan`
+        :rtype: list
+        """
+
+        plans = []
+        for asset_id, cycles in self.cycles.items():
+            if not cycles:
+                continue
+            algo_price = self.get_algo_price(asset_id)
+            for flash_loan_pool in self.lenders[asset_id]:
+                if flash_loan_pool.lp_circulation == 0:
+                    continue
+                max_amount = get_max_flash_loan_amount(flash_loan_pool, asset_id)
+                if max_amount <= 0:
+                    continue
+                asset = flash_loan_pool.asset1 if asset_id == flash_loan_pool.asset1.asset_id else flash_loan_pool.asset2
+                for route in cycles:
+                    if any(pool is flash_loan_pool for pool, _ in route):
+                        continue
+                    if not self._is_candidate(route, flash_loan_pool):
+                        continue
+                    txn_fee = FLASH_LOAN_TXN_FEE + REPAYMENT_TXN_FEE + SWAP_TXN_FEES * len(route)
+                    fee_in_asset = int(math.ceil(txn_fee * algo_price)) if algo_price is not None else 0
+                    sized = self._size_cycle(route, flash_loan_pool, max_amount, fee_in_asset)
+                    if sized is None or sized[2] is None:
+                        continue
+                    amount, profit, quotes = sized
+                    # stableswap iterations are paid for with extra compute fee
+                    extra_compute_fee = sum(quote.extra_compute_fee for quote in quotes)
+                    if extra_compute_fee:
+                        txn_fee += extra_compute_fee
+                        profit -= int(math.ceil(extra_compute_fee * algo_price)) if algo_price is not None else 0
+                    if profit < min_profit:
+                        continue
+                    hops = [(pool, pool.asset1 if swap_in_asset_id == pool.asset1.asset_id else pool.asset2) for pool, swap_in_asset_id in route]
+                    plans.append(ArbitragePlan(flash_loan_pool, asset, amount, hops, quotes, txn_fee, profit))
+
+        plans.sort(key=lambda plan: plan.profit, reverse=True)
+        return plans
+
+    def get_best_plan(self, min_profit=1):
+        """Returns the most profitable flash loan funded cycle, or None if there is no profitable cycle
+
+        :param min_profit: minimum profit in the borrowed asset
+        :type min_profit: int, optional
+        :return: most profitable plan
+        :rtype: :class:`ArbitragePlan`
+        """
+
+        plans = self.find_opportunities(min_profit)
+        return plans[0] if plans else None
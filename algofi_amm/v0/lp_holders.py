@@ -0,0 +1,176 @@
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+# default number of holders fetched per indexer page
+DEFAULT_PAGE_SIZE = 1000
+
+# default number of concurrent indexer account requests of an incremental update
+DEFAULT_MAX_WORKERS = 8
+
+
+def get_burn_amounts(lp_amounts, asset1_balance, asset2_balance, lp_circulation):
+    """Returns the asset amounts claimed by many lp amounts of one pool, computed as in :meth:`Pool.get_burn_quote`
+
+    :param lp_amounts: lp amounts
+    :type lp_amounts: list
+    :param asset1_balance: asset 1 balance of the pool
+    :type asset1_balance: int
+    :param asset2_balance: asset 2 balance of the pool
+    :type asset2_balance: int
+    :param lp_circulation: lp circulation of the pool
+    :type lp_circulation: int
+    :return: tuple of (asset 1 amounts, asset 2 amounts, shares of lp_circulation)
+    :rtype: tuple
+    """
+
+    if (lp_circulation == 0):
+        return array("q", bytes(8 * len(lp_amounts))), array("q", bytes(8 * len(lp_amounts))), array("d", bytes(8 * len(lp_amounts)))
+
+    # same float expression as get_burn_quote, so that amounts match the quotes exactly
+    asset1_amounts = array("q", [int(lp_amount * asset1_balance / lp_circulation) for lp_amount in lp_amounts])
+    asset2_amounts = array("q", [int(lp_amount * asset2_balance / lp_circulation) for lp_amount in lp_amounts])
+    shares = array("d", [lp_amount / lp_circulation for lp_amount in lp_amounts])
+    return asset1_amounts, asset2_amounts, shares
+
+
+class LPHolderPage():
+
+    def __init__(self, pool, round_num, addresses, lp_amounts):
+        """Constructor method for :class:`LPHolderPage`, the lp balances of a page of holders of a pool with their
+        claims on the pool balances
+
+        :param pool: pool whose lp token is held
+        :type pool: :class:`Pool`
+        :param round_num: round of the lp balances
+        :type round_num: int
+        :param addresses: holder addresses
+        :type addresses: list
+        :param lp_amounts: lp balances of the holders
+        :type lp_amounts: list
+        """
+
+        self.pool = pool
+        self.round = round_num
+        self.addresses = addresses
+        self.lp_amounts = array("Q", lp_amounts)
+        self.asset1_amounts, self.asset2_amounts, self.shares = get_burn_amounts(self.lp_amounts, pool.asset1_balance,
+                                                                                 pool.asset2_balance, pool.lp_circulation)
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def __iter__(self):
+        """Yields (address, lp amount, asset 1 amount, asset 2 amount, share) tuples
+        """
+
+        return zip(self.addresses, self.lp_amounts, self.asset1_amounts, self.asset2_amounts, self.shares)
+
+
+def iter_lp_holder_pages(indexer_client, pool, page_size=DEFAULT_PAGE_SIZE, round_num=None):
+    """Pages through the indexer for the holders of the lp token of a pool. Pages are yielded as they are fetched,
+    so only one page is held in memory. Holders with a zero balance and the pool account, which holds the lp tokens
+    not in circulation, are skipped.
+
+    :param indexer_client: a :class:`IndexerClient` object for interacting with the network
+    :type indexer_client: :class:`IndexerClient`
+    :param pool: pool whose lp holders are listed
+    :type pool: :class:`Pool`
+    :param page_size: number of holders per indexer page
+    :type page_size: int, optional
+    :param round_num: round at which to list the holders, defaults to the latest round
+    :type round_num: int, optional
+    :return: generator of :class:`LPHolderPage`
+    :rtype: generator
+    """
+
+    next_page = ""
+    while next_page is not None:
+        response = indexer_client.asset_balances(pool.lp_asset_id, limit=page_size, next_page=next_page, min_balance=0, round_num=round_num)
+        addresses = []
+        lp_amounts = []
+        for balance in response.get("balances", []):
+            if balance["amount"] > 0 and balance["address"] != pool.address:
+                addresses.append(balance["address"])
+                lp_amounts.append(balance["amount"])
+        if addresses:
+            yield LPHolderPage(pool, response.get("current-round", round_num), addresses, lp_amounts)
+        next_page = response.get("next-token", None) if response.get("balances", None) else None
+
+
+def iter_lp_holders(indexer_client, pool, page_size=DEFAULT_PAGE_SIZE, round_num=None):
+    """Yields the holders of the lp token of a pool one by one, see :func:`iter_lp_holder_pages`
+
+    :param indexer_client: a :class:`IndexerClient` object for interacting with the network
+    :type indexer_client: :class:`IndexerClient`
+    :param pool: pool whose lp holders are listed
+    :type pool: :class:`Pool`
+    :param page_size: number of holders per indexer page
+    :type page_size: int, optional
+    :param round_num: round at which to list the holders, defaults to the latest round
+    :type round_num: int, optional
+    :return: generator of (address, lp amount, asset 1 amount, asset 2 amount, share) tuples
+    :rtype: generator
+    """
+
+    for page in iter_lp_holder_pages(indexer_client, pool, page_size=page_size, round_num=round_num):
+        for holder in page:
+            yield holder
+
+
+def _add_transfer_addresses(txn, asset_id, addresses):
+    transfer = txn.get("asset-transfer-transaction", None)
+    if transfer is not None and transfer.get("asset-id", None) == asset_id:
+        for address in (txn.get("sender", None), transfer.get("receiver", None), transfer.get("close-to", None),
+                        transfer.get("sender", None)):
+            if address:
+                addresses.add(address)
+    for inner_txn in txn.get("inner-txns", []):
+        _add_transfer_addresses(inner_txn, asset_id, addresses)
+
+
+def get_lp_holder_changes(indexer_client, pool, checkpoint_round, page_size=DEFAULT_PAGE_SIZE, max_workers=DEFAULT_MAX_WORKERS):
+    """Returns the current lp balances of the holders whose lp balance may have changed after checkpoint_round,
+    found from the lp token transfers since the checkpoint. Holders with a zero balance have exited the pool.
+
+    :param indexer_client: a :class:`IndexerClient` object for interacting with the network
+    :type indexer_client: :class:`IndexerClient`
+    :param pool: pool whose lp holders are updated
+    :type pool: :class:`Pool`
+    :param checkpoint_round: last round already accounted for
+    :type checkpoint_round: int
+    :param page_size: number of transactions per indexer page
+    :type page_size: int, optional
+    :param max_workers: maximum number of concurrent account requests
+    :type max_workers: int, optional
+    :return: :class:`LPHolderPage` of the changed holders, whose round is the next checkpoint round
+    :rtype: :class:`LPHolderPage`
+    """
+
+    addresses = set()
+    next_page = ""
+    current_round = checkpoint_round
+    while next_page is not None:
+        response = indexer_client.search_asset_transactions(pool.lp_asset_id, limit=page_size, next_page=next_page,
+                                                            min_round=checkpoint_round + 1)
+        current_round = max(current_round, response.get("current-round", checkpoint_round))
+        for txn in response.get("transactions", []):
+            _add_transfer_addresses(txn, pool.lp_asset_id, addresses)
+        next_page = response.get("next-token", None) if response.get("transactions", None) else None
+    addresses.discard(pool.address)
+    addresses = sorted(addresses)
+
+    def get_lp_amount(address):
+        account = indexer_client.account_info(address).get("account", {})
+        for asset in account.get("assets", []):
+            if asset["asset-id"] == pool.lp_asset_id:
+                return asset["amount"]
+        return 0
+
+    if len(addresses) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(addresses))) as executor:
+            lp_amounts = list(executor.map(get_lp_amount, addresses))
+    else:
+        lp_amounts = [get_lp_amount(address) for address in addresses]
+
+    return LPHolderPage(pool, current_round, addresses, lp_amounts)
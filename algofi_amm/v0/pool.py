@@ -1,6 +1,8 @@
 
+import copy
 import time
 import math
+from fractions import Fraction
 from algosdk.logic import get_application_address
 from algosdk.future.transaction import LogicSigAccount, LogicSigTransaction, OnComplete, StateSchema, ApplicationCreateTxn, \
     ApplicationOptInTxn, ApplicationNoOpTxn, OnComplete
@@ -8,14 +10,17 @@ from .config import PoolStatus, Network, get_validator_index, get_approval_progr
     get_clear_state_program, get_swap_fee, get_manager_application_id, PoolType
 from .balance_delta import BalanceDelta
 from .logic_sig_generator import generate_logic_sig
-from .stable_swap_math import get_D, get_y
+from .stable_swap_math import A_PRECISION, get_D, get_y, get_y_for_ratio, isqrt
+from .fee_model import get_operation_fee
+from .quote_cache import QuoteCache, cached_quote, DEFAULT_QUOTE_CACHE_SIZE
 from ..contract_strings import algofi_manager_strings as manager_strings
 from ..contract_strings import algofi_pool_strings as pool_strings
+from ..profiling import profile_build
 from ..utils import PARAMETER_SCALE_FACTOR, TransactionGroup, get_application_local_state, get_application_global_state, get_params, int_to_bytes, get_payment_txn
 
 
 class Pool:
-    def __init__(self, algod_client, indexer_client, historical_indexer_client, network, pool_type, asset1, asset2):
+    def __init__(self, algod_client, indexer_client, historical_indexer_client, network, pool_type, asset1, asset2, quote_cache_size=DEFAULT_QUOTE_CACHE_SIZE):
         """Constructor method for :class:`Pool`
 
         :param algod_client: a :class:`AlgodClient` object for interacting with the network
@@ -32,6 +37,8 @@ class Pool:
         :type asset1: :class:`Asset`
         :param asset2: a :class:`Asset` representing the second asset of the pool
         :type asset2: :class:`Asset`
+        :param quote_cache_size: maximum number of memoized quotes, 0 disables memoization
+        :type quote_cache_size: int, optional
         """
 
         if (asset1.asset_id >= asset2.asset_id):
@@ -52,6 +59,9 @@ class Pool:
         self.manager_address = get_application_address(self.manager_application_id)
         self.validator_index = get_validator_index(network, pool_type)
         self.swap_fee = get_swap_fee(pool_type)
+        # quotes are memoized per state version, which advances on every refresh_state
+        self.state_version = 0
+        self.quote_cache = QuoteCache(quote_cache_size) if quote_cache_size else None
 
         if pool_type == PoolType.NANOSWAP:
             if self.network == Network.TESTNET:
@@ -131,6 +141,17 @@ class Pool:
 
         # load pool state
         pool_state = get_application_global_state(self.algod, self.application_id)
+        self.set_global_state(pool_state)
+
+    def set_global_state(self, pool_state, t=None):
+        """Sets the state of the pool from an already fetched global state and invalidates memoized quotes
+
+        :param pool_state: global state of the pool application, keyed by :class:`algofi_pool_strings`
+        :type pool_state: dict
+        :param t: latest block timestamp used for the amplification factor of nanoswap pools, fetched if not specified
+        :type t: int, optional
+        """
+
         self.asset1_balance = pool_state[pool_strings.balance_1]
         self.asset2_balance = pool_state[pool_strings.balance_2]
         self.lp_circulation = pool_state[pool_strings.lp_circulation]
@@ -151,11 +172,34 @@ class Pool:
             self.future_amplification_factor = pool_state[pool_strings.future_amplification_factor]
             self.initial_amplification_factor_time = pool_state.get(pool_strings.initial_amplification_factor_time, 0)
             self.future_amplification_factor_time = pool_state.get(pool_strings.future_amplification_factor_time, 0)
-            status = self.algod.status()
-            last_round = status["last-round"]
-            block = self.algod.block_info(last_round)
-            timestamp = block["block"]["ts"]
-            self.t = timestamp
+            if t is None:
+                status = self.algod.status()
+                last_round = status["last-round"]
+                block = self.algod.block_info(last_round)
+                t = block["block"]["ts"]
+            self.t = t
+
+        self.invalidate_quote_cache()
+
+    def invalidate_quote_cache(self):
+        """Advances the state version of the pool, invalidating memoized quotes. Called by :meth:`refresh_state`,
+        call it after modifying the pool state by hand.
+        """
+
+        self.state_version += 1
+        if self.quote_cache is not None:
+            self.quote_cache.clear()
+
+    def get_quote_cache_stats(self):
+        """Returns the hit / miss counters and size of the quote cache
+
+        :return: dict with keys hits, misses, size and max_size, or None if memoization is disabled
+        :rtype: dict
+        """
+
+        if self.quote_cache is None:
+            return None
+        return self.quote_cache.get_stats()
 
     def get_pool_price(self, asset_id):
         """Gets the price of the pool in terms of the asset with given asset_id
@@ -184,6 +228,7 @@ class Pool:
         assert self.pool_type != PoolType.NANOSWAP, 'Nanoswap pools are not compatible with manager logic sigs'
         return LogicSigTransaction(transaction, self.logic_sig)
 
+    @profile_build
     def get_create_pool_txn(self, sender, params=None):
         """Returns unsigned CreatePool transaction with given sender
 
@@ -223,6 +268,7 @@ class Pool:
 
         return TransactionGroup([txn0])
 
+    @profile_build
     def get_initialize_pool_txns(self, sender, pool_app_id, params=None):
         """Get group transaction for initializing the pool. First, the manager is 
         funded (which funds the pool contract (for opting into assets, creating LP token)
@@ -269,7 +315,7 @@ class Pool:
         )
 
         # call pool initialize fcn
-        params.fee = 4000
+        params.fee = get_operation_fee(pool_strings.initialize_pool)
         foreign_assets = [self.asset2.asset_id] if self.asset1.asset_id == 1 else [self.asset1.asset_id, self.asset2.asset_id]
         txn3 = ApplicationNoOpTxn(
             sender=sender,
@@ -295,7 +341,8 @@ class Pool:
             params = get_params(self.algod)
         return get_payment_txn(params, sender, sender, amount=int(0), asset_id=self.lp_asset_id)
 
-    def get_pool_txns(self, sender, asset1_amount, asset2_amount, maximum_slippage, params=None, fee=3000):
+    @profile_build
+    def get_pool_txns(self, sender, asset1_amount, asset2_amount, maximum_slippage, params=None, fee=None):
         """Get group transaction for pooling with given asset amounts and maximum slippage.
         The two assets are sent via two :class:`PaymentTxn` / :class:`AssetTransferTxn`. Then, a pool call
         is made from which the LP tokens are issued via inner asset transfer txn. Lastly,
@@ -312,12 +359,23 @@ class Pool:
         :type asset2_amount: int
         :param maximum_slippage: maximum slippage percent (scaled by 1000000) allowed
         :type maximum_slippage: int
+        :param fee: fee of the pool call, predicted by the fee model if not specified
+        :type fee: int, optional
         :return: group transaction for pooling with given asset amounts and maximum slippage
         :rtype: :class:`TransactionGroup`
         """
         if params is None:
             params = get_params(self.algod)
 
+        if fee is None:
+            if self.pool_type != PoolType.NANOSWAP:
+                num_iter = 0
+            elif self.lp_circulation == 0:
+                num_iter = self.get_empty_pool_quote(asset1_amount, asset2_amount).num_iter
+            else:
+                num_iter = self.get_pool_quote(self.asset1.asset_id, asset1_amount).num_iter
+            fee = get_operation_fee(pool_strings.pool, num_iter)
+
         # send asset 1
         txn0 = get_payment_txn(params, sender, self.address, asset1_amount, self.asset1.asset_id)
 
@@ -337,7 +395,7 @@ class Pool:
         )
 
         # redeem asset 1 residual
-        params.fee = 1000
+        params.fee = get_operation_fee(pool_strings.redeem_pool_asset1_residual)
         txn3 = ApplicationNoOpTxn(
             sender=sender,
             sp=params,
@@ -348,6 +406,7 @@ class Pool:
         )
 
         # redeem asset 2 residual
+        params.fee = get_operation_fee(pool_strings.redeem_pool_asset2_residual)
         txn4 = ApplicationNoOpTxn(
             sender=sender,
             sp=params,
@@ -359,6 +418,7 @@ class Pool:
 
         return TransactionGroup([txn0, txn1, txn2, txn3, txn4])
 
+    @profile_build
     def get_burn_txns(self, sender, burn_amount,params = None):
         """Get group transaction for burn with given burn amount. The LP token
         is transferred via :class:`AssetTransferTxn`. Then, two burn calls are made,
@@ -379,7 +439,7 @@ class Pool:
         txn0 = get_payment_txn(params, sender, self.address, burn_amount, self.lp_asset_id)
 
         # burn asset 1 out
-        params.fee = 2000
+        params.fee = get_operation_fee(pool_strings.burn_asset1_out)
         txn1 = ApplicationNoOpTxn(
             sender=sender,
             sp=params,
@@ -390,6 +450,7 @@ class Pool:
         )
 
         # burn asset 2 out
+        params.fee = get_operation_fee(pool_strings.burn_asset2_out)
         txn2 = ApplicationNoOpTxn(
             sender=sender,
             sp=params,
@@ -401,7 +462,8 @@ class Pool:
 
         return TransactionGroup([txn0, txn1, txn2])
 
-    def get_swap_exact_for_txns(self, sender, swap_in_asset, swap_in_amount, min_amount_to_receive, params=None, fee=2000):
+    @profile_build
+    def get_swap_exact_for_txns(self, sender, swap_in_asset, swap_in_amount, min_amount_to_receive, params=None, fee=None):
         """Get group transaction for swap exact for transaction. An exact amount of the asset
         to be swapped is sent via a :class:`PaymentTxn` or :class:`AssetTransferTxn`. 
         Then, a swap exact for call is made from which the output asset is sent via inner transaction.
@@ -415,12 +477,17 @@ class Pool:
         :type swap_in_amount: int
         :param min_amount_to_receive: minimum amount of outgoing asset to receive, assert failure if not
         :type min_amount_to_receive: int
+        :param fee: fee of the swap call, predicted by the fee model if not specified
+        :type fee: int, optional
         :return: group transaction for swap exact for transaction
         :rtype: :class:`TransactionGroup`
         """
         if params is None:
             params = get_params(self.algod)
 
+        if fee is None:
+            num_iter = self.get_swap_exact_for_quote(swap_in_asset.asset_id, swap_in_amount).num_iter if self.pool_type == PoolType.NANOSWAP else 0
+            fee = get_operation_fee(pool_strings.swap_exact_for, num_iter)
 
         # send swap in asset
         txn0 = get_payment_txn(params, sender, self.address, swap_in_amount, swap_in_asset.asset_id)
@@ -440,7 +507,8 @@ class Pool:
 
         return TransactionGroup([txn0, txn1])
 
-    def get_swap_for_exact_txns(self, sender, swap_in_asset, swap_in_amount, amount_to_receive, params=None, fee=2000):
+    @profile_build
+    def get_swap_for_exact_txns(self, sender, swap_in_asset, swap_in_amount, amount_to_receive, params=None, fee=None):
         """Get group transaction for swap for exact transaction. An amount of the asset to be
         swapped is sent via a :class:`PaymentTxn` or :class:`AssetTransferTxn`. Then, swap for exact
         call is made to swap for an exact amount of the output asset. If a sufficient amount
@@ -455,12 +523,22 @@ class Pool:
         :type swap_in_amount: int
         :param amount_to_receive: exact amount to receive of outgoing asset, assert fail if not possible
         :type amount_to_receive: int
+        :param fee: fee of the swap call, predicted by the fee model if not specified
+        :type fee: int, optional
         :return: group transaction for swap for exact transaction
         :rtype: :class:`TransactionGroup`
         """
         if params is None:
             params = get_params(self.algod)
 
+        if fee is None:
+            if self.pool_type == PoolType.NANOSWAP:
+                swap_out_asset_id = self.asset2.asset_id if swap_in_asset.asset_id == self.asset1.asset_id else self.asset1.asset_id
+                num_iter = self.get_swap_for_exact_quote(swap_out_asset_id, amount_to_receive).num_iter
+            else:
+                num_iter = 0
+            fee = get_operation_fee(pool_strings.swap_for_exact, num_iter)
+
         # send swap in asset
         txn0 = get_payment_txn(params, sender, self.address, swap_in_amount, swap_in_asset.asset_id)
 
@@ -478,7 +556,7 @@ class Pool:
         )
 
         # redeem unused swap in asset
-        params.fee = 2000
+        params.fee = get_operation_fee(pool_strings.redeem_swap_residual)
         txn2 = ApplicationNoOpTxn(
             sender=sender,
             sp=params,
@@ -491,6 +569,7 @@ class Pool:
 
         return TransactionGroup([txn0, txn1, txn2])
 
+    @profile_build
     def get_flash_loan_txns(self, sender, flash_loan_asset, flash_loan_amount, group_transaction,params=None):
         """Get group transaction for swap exact for transaction
 
@@ -509,7 +588,7 @@ class Pool:
             params = get_params(self.algod)
 
         # flash loan txn
-        params.fee = 2000
+        params.fee = get_operation_fee(pool_strings.flash_loan)
         foreign_assets = [self.asset2.asset_id] if flash_loan_asset.asset_id == self.asset2.asset_id else ([self.asset1.asset_id] if self.asset1.asset_id != 1 else [])
         txn0 = ApplicationNoOpTxn(
             sender=sender,
@@ -547,6 +626,7 @@ class Pool:
 
         return self.future_amplification_factor
 
+    @cached_quote
     def get_empty_pool_quote(self, asset1_pooled_amount, asset2_pooled_amount):
         """Get pool quote for an empty pool
 
@@ -569,6 +649,7 @@ class Pool:
 
         return BalanceDelta(self, -1 * asset1_pooled_amount, -1 * asset2_pooled_amount, lps_issued, num_iter)
 
+    @cached_quote
     def get_pool_quote(self, asset_id, asset_amount):
         """Get full pool quote for a given asset id and amount
 
@@ -601,6 +682,7 @@ class Pool:
 
         return BalanceDelta(self, -1 * asset1_pooled_amount, -1 * asset2_pooled_amount, lps_issued, num_iter)
 
+    @cached_quote
     def get_burn_quote(self, lp_amount):
         """Get burn quote for a given amount of lps to burn
 
@@ -621,6 +703,7 @@ class Pool:
 
         return BalanceDelta(self, asset1_amount, asset2_amount, -1 * lp_amount)
 
+    @cached_quote
     def get_swap_exact_for_quote(self, swap_in_asset_id, swap_in_amount):
         """Get swap exact for quote for a given asset id and swap amount
 
@@ -659,6 +742,7 @@ class Pool:
                 num_iter = 0
             return BalanceDelta(self, swap_out_amount, -1 * swap_in_amount, 0, num_iter)
 
+    @cached_quote
     def get_swap_for_exact_quote(self, swap_out_asset_id, swap_out_amount):
         """Get swap for exact quote for a given asset id and swap amount
 
@@ -697,4 +781,239 @@ class Pool:
         if (swap_out_asset_id == self.asset1.asset_id):
             return BalanceDelta(self, swap_out_amount, -1 * swap_in_amount, 0, num_iter)
         else:
-            return BalanceDelta(self, -1 * swap_in_amount, swap_out_amount, 0, num_iter)
\ No newline at end of file
+            return BalanceDelta(self, -1 * swap_in_amount, swap_out_amount, 0, num_iter)
+
+    def get_swap_to_price_quote(self, asset_id, target_price):
+        """Get the swap exact for quote which moves the pool price of the asset with given asset_id
+        (as returned by :meth:`get_pool_price`) to target_price. The swap size is solved in closed form for
+        constant product pools and with an integer newton method on the stableswap invariant for nanoswap pools,
+        with the share of the swap fee not sent to the reserve staying in the pool balance.
+
+        :param asset_id: asset id of the asset to price
+        :type asset_id: int
+        :param target_price: target pool price in terms of the asset with given asset_id
+        :type target_price: float or :class:`Fraction`
+        :return: tuple of (id of incoming asset, amount of incoming asset, swap exact for quote)
+        :rtype: tuple
+        """
+
+        if (self.lp_circulation == 0):
+            raise Exception("Error: pool is empty")
+
+        if (asset_id == self.asset1.asset_id):
+            balance, other_balance, other_asset_id = self.asset1_balance, self.asset2_balance, self.asset2.asset_id
+        elif (asset_id == self.asset2.asset_id):
+            balance, other_balance, other_asset_id = self.asset2_balance, self.asset1_balance, self.asset1.asset_id
+        else:
+            raise Exception("Invalid asset id")
+
+        target_price = Fraction(target_price)
+        if (target_price <= 0):
+            raise Exception("Invalid target price")
+
+        current_price = Fraction(balance, other_balance)
+        if (target_price == current_price):
+            return asset_id, 0, BalanceDelta(self, 0, 0, 0)
+
+        # the price of the incoming asset rises, so swap in asset_id to raise its price and the other asset to lower it
+        if (target_price > current_price):
+            swap_in_asset_id, in_balance, out_balance, target_ratio = asset_id, balance, other_balance, target_price
+        else:
+            swap_in_asset_id, in_balance, out_balance, target_ratio = other_asset_id, other_balance, balance, 1 / target_price
+
+        # the reserve share of the swap fee leaves the pool, the rest stays in the balance of the incoming asset:
+        # in_balance_after = in_balance + swap_in_amount * (1 - fee * reserve_factor) = in_balance + c * x with
+        # x = swap_in_amount * (1 - fee) the amount less fees the output is computed from
+        fee = Fraction(self.swap_fee)
+        c = (1 - fee * Fraction(self.reserve_factor, PARAMETER_SCALE_FACTOR)) / (1 - fee)
+        if self.pool_type == PoolType.NANOSWAP:
+            in_index = 0 if swap_in_asset_id == self.asset1.asset_id else 1
+            swap_in_amount_less_fees = self._get_nanoswap_swap_to_price_amount(in_index, target_ratio, c)
+        else:
+            # (in_balance + c * x) * (in_balance + x) = target_ratio * in_balance * out_balance, as the output leaves
+            # out_balance * in_balance / (in_balance + x), solved for x
+            discriminant = in_balance * in_balance * (1 + c) ** 2 - 4 * c * in_balance * (in_balance - target_ratio * out_balance)
+            root = Fraction(isqrt(discriminant.numerator * discriminant.denominator), discriminant.denominator)
+            swap_in_amount_less_fees = max(int((root - in_balance * (1 + c)) / (2 * c)), 0)
+
+        # smallest swap amount whose amount less fees reaches swap_in_amount_less_fees
+        swap_in_amount = int(math.ceil(swap_in_amount_less_fees / (1 - self.swap_fee)))
+        while swap_in_amount - int(math.ceil(swap_in_amount * self.swap_fee)) < swap_in_amount_less_fees:
+            swap_in_amount += 1
+        while swap_in_amount > 0 and (swap_in_amount - 1) - int(math.ceil((swap_in_amount - 1) * self.swap_fee)) >= swap_in_amount_less_fees:
+            swap_in_amount -= 1
+
+        return swap_in_asset_id, swap_in_amount, self.get_swap_exact_for_quote(swap_in_asset_id, swap_in_amount)
+
+    def _get_nanoswap_swap_to_price_amount(self, in_index, target_ratio, c):
+        """Returns the smallest swap amount less fees x of the asset at in_index into a nanoswap pool with
+        (in_balance + c * x) / y(in_balance + x) >= target_ratio, where y is the other balance on the invariant,
+        found with an integer newton method on x. The mismatch is concave in x, so the iterates increase
+        monotonically onto the root from x = 0. Falls back to bisection below the solution without retained fees
+        if newton does not converge.
+        """
+
+        balances = [self.asset1_balance, self.asset2_balance]
+        in_balance = balances[in_index]
+        amplification_factor = self.amplification_factor
+        Ann = amplification_factor * 4
+        D, _ = get_D(balances, amplification_factor)
+        p, q = target_ratio.numerator, target_ratio.denominator
+        c_numerator, c_denominator = c.numerator, c.denominator
+
+        def ratio_mismatch(x):
+            y, _ = get_y(in_index, 1 - in_index, in_balance + x, balances, D, amplification_factor)
+            return q * (c_denominator * in_balance + c_numerator * x) - p * c_denominator * y, y
+
+        x = 0
+        for _i in range(255):
+            mismatch, y = ratio_mismatch(x)
+            if mismatch >= 0:
+                # the integer output of get_y may round the mismatch across the root
+                while x > 0 and ratio_mismatch(x - 1)[0] >= 0:
+                    x -= 1
+                return x
+            # dy/du = -y (4 Ann u^2 y + A D^3) / (u (4 Ann u y^2 + A D^3)) on the invariant, u = in_balance + x
+            u = in_balance + x
+            dy_numerator = y * (4 * Ann * u * u * y + A_PRECISION * D ** 3)
+            dy_denominator = u * (4 * Ann * u * y * y + A_PRECISION * D ** 3)
+            step = -mismatch * dy_denominator // (q * c_numerator * dy_denominator + p * c_denominator * dy_numerator)
+            x += max(step, 1)
+
+        # bisection below the solution without retained fees, where the balance ratio already reaches the target
+        out_balance_after, _ = get_y_for_ratio(D, amplification_factor, p, q)
+        in_balance_after = -(-p * out_balance_after // q)
+        low, high = 0, max(in_balance_after - in_balance, 0)
+        while low < high:
+            x = (low + high) // 2
+            if ratio_mismatch(x)[0] >= 0:
+                high = x
+            else:
+                low = x + 1
+        return low
+
+    def get_zap_in_quote(self, asset_id, asset_amount):
+        """Get quote for adding liquidity from a single asset. Part of the asset is swapped for the other asset
+        such that the remainder and the swap output match the pool ratio after the swap. The swap amount is solved
+        in closed form for constant product pools and numerically on the stableswap invariant for nanoswap pools,
+        with swap fees included and fees assumed to stay in the pool balance.
+
+        :param asset_id: asset id of the asset to add
+        :type asset_id: int
+        :param asset_amount: amount of the asset to add
+        :type asset_amount: int
+        :return: tuple of (amount to swap, swap exact for quote, pool quote for the post swap pool state)
+        :rtype: tuple
+        """
+
+        if (self.lp_circulation == 0):
+            raise Exception("Error: pool is empty")
+
+        if (asset_id == self.asset1.asset_id):
+            in_index, balance, other_balance = 0, self.asset1_balance, self.asset2_balance
+        elif (asset_id == self.asset2.asset_id):
+            in_index, balance, other_balance = 1, self.asset2_balance, self.asset1_balance
+        else:
+            raise Exception("Invalid asset id")
+
+        if self.pool_type == PoolType.NANOSWAP:
+            swap_in_amount = self._get_nanoswap_zap_in_swap_amount(in_index, asset_amount)
+        else:
+            # solve (asset_amount - s) / out(s) = (balance + s) / (other_balance - out(s)) with fee = n / d
+            fee = Fraction(self.swap_fee)
+            n, d = fee.numerator, fee.denominator
+            discriminant = balance * balance * (2 * d - n) ** 2 + 4 * (d - n) * d * balance * asset_amount
+            swap_in_amount = (isqrt(discriminant) - balance * (2 * d - n)) // (2 * (d - n))
+        swap_in_amount = min(max(swap_in_amount, 0), asset_amount)
+
+        swap_quote = self.get_swap_exact_for_quote(asset_id, swap_in_amount)
+        swap_out_amount = swap_quote.asset2_delta if in_index == 0 else swap_quote.asset1_delta
+
+        # quote pooling against the pool state after the swap
+        post_swap_pool = copy.copy(self)
+        post_swap_pool.quote_cache = None
+        if in_index == 0:
+            post_swap_pool.asset1_balance = balance + swap_in_amount
+            post_swap_pool.asset2_balance = other_balance - swap_out_amount
+            pool_quote = post_swap_pool.get_pool_quote(self.asset1.asset_id, asset_amount - swap_in_amount)
+            if (-1 * pool_quote.asset2_delta > swap_out_amount):
+                pool_quote = post_swap_pool.get_pool_quote(self.asset2.asset_id, swap_out_amount)
+        else:
+            post_swap_pool.asset2_balance = balance + swap_in_amount
+            post_swap_pool.asset1_balance = other_balance - swap_out_amount
+            pool_quote = post_swap_pool.get_pool_quote(self.asset2.asset_id, asset_amount - swap_in_amount)
+            if (-1 * pool_quote.asset1_delta > swap_out_amount):
+                pool_quote = post_swap_pool.get_pool_quote(self.asset1.asset_id, swap_out_amount)
+
+        return swap_in_amount, swap_quote, pool_quote
+
+    def _get_nanoswap_zap_in_swap_amount(self, in_index, asset_amount):
+        """Returns the amount to swap for a single sided add of asset_amount of the asset at in_index to a
+        nanoswap pool, found with the illinois method on the pool ratio mismatch after the swap
+        """
+
+        balances = [self.asset1_balance, self.asset2_balance]
+        out_index = 1 - in_index
+        amplification_factor = self.amplification_factor
+        D, _ = get_D(balances, amplification_factor)
+
+        def ratio_mismatch(swap_in_amount):
+            swap_in_amount_less_fees = swap_in_amount - int(math.ceil(swap_in_amount * self.swap_fee))
+            y, _ = get_y(in_index, out_index, balances[in_index] + swap_in_amount_less_fees, balances, D, amplification_factor)
+            swap_out_amount = balances[out_index] - y
+            return (asset_amount - swap_in_amount) * (balances[out_index] - swap_out_amount) - swap_out_amount * (balances[in_index] + swap_in_amount)
+
+        low, high = 0, asset_amount
+        low_value, high_value = ratio_mismatch(low), ratio_mismatch(high)
+        side = 0
+        while high - low > 1:
+            guess = low + int((high - low) * low_value / (low_value - high_value))
+            guess = min(max(guess, low + 1), high - 1)
+            guess_value = ratio_mismatch(guess)
+            if guess_value > 0:
+                low, low_value = guess, guess_value
+                if side == 1:
+                    high_value //= 2
+                side = 1
+            else:
+                high, high_value = guess, guess_value
+                if side == -1:
+                    low_value //= 2
+                side = -1
+        return low
+
+    @profile_build
+    def get_zap_in_txns(self, sender, asset, asset_amount, maximum_slippage, params=None):
+        """Get a single group transaction adding liquidity from a single asset: a swap exact for of part of the
+        asset (see :meth:`get_zap_in_quote`) followed by a pool of the remainder and the swap output.
+        The swap must return at least the quoted amount less half of maximum_slippage, which is the amount
+        of the other asset pooled. Unused amounts are returned by the residual redemption calls of the pool.
+
+        :param sender: sender
+        :type sender: str
+        :param asset: asset to add
+        :type asset: :class:`Asset`
+        :param asset_amount: amount of the asset to add
+        :type asset_amount: int
+        :param maximum_slippage: maximum slippage percent (scaled by 1000000) allowed
+        :type maximum_slippage: int
+        :return: group transaction for adding liquidity from a single asset
+        :rtype: :class:`TransactionGroup`
+        """
+
+        if params is None:
+            params = get_params(self.algod)
+        base_fee = params.fee
+
+        swap_in_amount, swap_quote, _ = self.get_zap_in_quote(asset.asset_id, asset_amount)
+        swap_out_amount = swap_quote.asset2_delta if asset.asset_id == self.asset1.asset_id else swap_quote.asset1_delta
+        min_amount_to_receive = swap_out_amount * (PARAMETER_SCALE_FACTOR - maximum_slippage // 2) // PARAMETER_SCALE_FACTOR
+
+        swap_txns = self.get_swap_exact_for_txns(sender, asset, swap_in_amount, min_amount_to_receive, params=params)
+        params.fee = base_fee
+        if asset.asset_id == self.asset1.asset_id:
+            pool_txns = self.get_pool_txns(sender, asset_amount - swap_in_amount, min_amount_to_receive, maximum_slippage, params=params)
+        else:
+            pool_txns = self.get_pool_txns(sender, min_amount_to_receive, asset_amount - swap_in_amount, maximum_slippage, params=params)
+
+        return swap_txns + pool_txns
@@ -0,0 +1,252 @@
+
+from base64 import b64encode
+import msgpack
+from .config import PoolType
+from ..utils import get_application_global_state
+
+# global state delta actions of the block apply data
+SET_BYTES_ACTION = 1
+SET_UINT_ACTION = 2
+DELETE_ACTION = 3
+
+
+def decode_map_keys(value):
+    """Decodes the bytes keys of a map unpacked from msgpack with raw=True, leaving the values as raw bytes
+    """
+
+    return {key.decode("utf-8") if isinstance(key, bytes) else key: item for key, item in value.items()}
+
+
+def get_block(algod_client, round_num):
+    """Returns the block of a round fetched as msgpack, so that bytes values (e.g. "bs" of global state deltas) are raw
+    bytes, which the json encoding of algod does not preserve
+
+    :param algod_client: a :class:`AlgodClient` object for interacting with the network
+    :type algod_client: :class:`AlgodClient`
+    :param round_num: round of the block
+    :type round_num: int
+    :return: block with decoded keys and raw bytes values
+    :rtype: dict
+    """
+
+    return msgpack.unpackb(algod_client.block_info(round_num, response_format="msgpack"), raw=True, object_hook=decode_map_keys)
+
+
+def iter_block_transactions(block):
+    """Yields every transaction of a block with its apply data, including inner transactions
+
+    :param block: block returned by :func:`get_block`
+    :type block: dict
+    :return: generator of signed transactions with apply data
+    :rtype: generator
+    """
+
+    stack = list(reversed(block.get("block", block).get("txns", None) or []))
+    while stack:
+        stxn = stack.pop()
+        yield stxn
+        inner_txns = stxn.get("dt", {}).get("itx", None)
+        if inner_txns:
+            stack.extend(reversed(inner_txns))
+
+
+def get_block_application_ids(block):
+    """Returns the ids of the applications called in a block, including calls by inner transactions
+
+    :param block: block returned by :func:`get_block`
+    :type block: dict
+    :return: set of called application ids
+    :rtype: set
+    """
+
+    app_ids = set()
+    for stxn in iter_block_transactions(block):
+        app_id = stxn.get("txn", {}).get("apid", 0)
+        if app_id:
+            app_ids.add(app_id)
+    return app_ids
+
+
+def apply_global_state_delta(state, global_delta):
+    """Applies the global state delta of one application call to a global state dict in place
+
+    :param state: global state keyed by decoded key, with base64 encoded bytes values
+    :type state: dict
+    :param global_delta: "gd" field of the apply data of an application call
+    :type global_delta: dict
+    """
+
+    for key, value_delta in global_delta.items():
+        if isinstance(key, bytes):
+            key = key.decode("utf-8")
+        action = value_delta.get("at", 0)
+        if action == SET_UINT_ACTION:
+            state[key] = value_delta.get("ui", 0)
+        elif action == SET_BYTES_ACTION:
+            # base64 encoded as in the states read by :func:`get_application_global_state`
+            state[key] = b64encode(value_delta.get("bs", b"")).decode("utf-8")
+        elif action == DELETE_ACTION:
+            state.pop(key, None)
+
+
+def get_state_changes(old_state, new_state):
+    """Returns the field level changes between two global states
+
+    :param old_state: previous global state
+    :type old_state: dict
+    :param new_state: current global state
+    :type new_state: dict
+    :return: dict of key -> (old value, new value), deleted and new keys have a None value on the missing side
+    :rtype: dict
+    """
+
+    changes = {}
+    for key, value in new_state.items():
+        old_value = old_state.get(key, None)
+        if old_value != value:
+            changes[key] = (old_value, value)
+    for key, old_value in old_state.items():
+        if key not in new_state:
+            changes[key] = (old_value, None)
+    return changes
+
+
+class PoolStateDiff():
+
+    def __init__(self, pool, round_num, changes):
+        """Constructor method for :class:`PoolStateDiff`, the changes to the global state of one pool in one round
+
+        :param pool: pool whose state changed, already updated to the new state
+        :type pool: :class:`Pool`
+        :param round_num: round in which the state changed
+        :type round_num: int
+        :param changes: dict of key -> (old value, new value), keyed by :class:`algofi_pool_strings`
+        :type changes: dict
+        """
+
+        self.pool = pool
+        self.application_id = pool.application_id
+        self.round = round_num
+        self.changes = changes
+
+    def __str__(self):
+        """Returns a string representation of the :class:`PoolStateDiff` object
+        """
+
+        fields = ", ".join("{}: {} -> {}".format(key, old, new) for key, (old, new) in sorted(self.changes.items()))
+        return "PoolStateDiff(app_id={}, round={}, {})".format(self.application_id, self.round, fields)
+
+
+class PoolStateStream():
+
+    def __init__(self, algod_client, pools, use_block_deltas=True):
+        """Constructor method for :class:`PoolStateStream`, which follows new rounds and updates only the pools
+        called in each block. Changed pools are found by scanning the block's transactions for pool application
+        ids, so upstream load is one block fetch per round plus, if block deltas are not used, one global state
+        fetch per changed pool.
+
+        :param algod_client: a :class:`AlgodClient` object for interacting with the network
+        :type algod_client: :class:`AlgodClient`
+        :param pools: pools to follow
+        :type pools: list
+        :param use_block_deltas: whether to apply the global state deltas of the block apply data instead of
+            fetching the state of called pools
+        :type use_block_deltas: bool, optional
+        """
+
+        self.algod = algod_client
+        self.use_block_deltas = use_block_deltas
+        self.pools = {pool.application_id: pool for pool in pools}
+        self.states = {}
+        for app_id in self.pools:
+            self.states[app_id] = get_application_global_state(self.algod, app_id)
+        self.last_round = None
+        self.blocks_processed = 0
+        self.state_fetches = 0
+
+    def process_block(self, round_num, block=None):
+        """Updates the pools called in a block and returns their state changes
+
+        :param round_num: round of the block
+        :type round_num: int
+        :param block: block returned by :func:`get_block`, fetched if not specified
+        :type block: dict, optional
+        :return: list of :class:`PoolStateDiff` for the pools whose global state changed
+        :rtype: list
+        """
+
+        if block is None:
+            block = get_block(self.algod, round_num)
+        header = block.get("block", block)
+        timestamp = header.get("ts", None)
+        self.blocks_processed += 1
+        self.last_round = round_num
+
+        if self.use_block_deltas:
+            new_states = {}
+            for stxn in iter_block_transactions(block):
+                app_id = stxn.get("txn", {}).get("apid", 0)
+                global_delta = stxn.get("dt", {}).get("gd", None)
+                if app_id in self.pools and global_delta:
+                    if app_id not in new_states:
+                        new_states[app_id] = dict(self.states[app_id])
+                    apply_global_state_delta(new_states[app_id], global_delta)
+        else:
+            new_states = {}
+            for app_id in get_block_application_ids(block):
+                if app_id in self.pools:
+                    new_states[app_id] = get_application_global_state(self.algod, app_id)
+                    self.state_fetches += 1
+
+        diffs = []
+        changed_app_ids = set()
+        for app_id, new_state in new_states.items():
+            changes = get_state_changes(self.states[app_id], new_state)
+            if not changes:
+                continue
+            self.states[app_id] = new_state
+            pool = self.pools[app_id]
+            pool.set_global_state(new_state, t=timestamp)
+            changed_app_ids.add(app_id)
+            diffs.append(PoolStateDiff(pool, round_num, changes))
+
+        # amplification factors of ramping nanoswap pools change with the block timestamp
+        if timestamp is not None:
+            for app_id, pool in self.pools.items():
+                if app_id not in changed_app_ids and pool.pool_type == PoolType.NANOSWAP and pool.t < pool.future_amplification_factor_time:
+                    pool.t = timestamp
+                    pool.invalidate_quote_cache()
+
+        return diffs
+
+    def follow(self, start_round=None, max_rounds=None):
+        """Follows new rounds, blocking until each is available, and yields the state changes of the pools
+
+        :param start_round: first round to process, defaults to the round after the last processed round or the next
+            round of the network
+        :type start_round: int, optional
+        :param max_rounds: number of rounds after which to stop, follows indefinitely if not specified
+        :type max_rounds: int, optional
+        :return: generator of :class:`PoolStateDiff`
+        :rtype: generator
+        """
+
+        if start_round is None:
+            if self.last_round is not None:
+                start_round = self.last_round + 1
+            else:
+                start_round = self.algod.status()["last-round"] + 1
+
+        round_num = start_round
+        rounds = 0
+        while max_rounds is None or rounds < max_rounds:
+            status = self.algod.status_after_block(round_num - 1)
+            while status["last-round"] < round_num:
+                status = self.algod.status_after_block(status["last-round"])
+            for diff in self.process_block(round_num):
+                yield diff
+            round_num += 1
+            rounds += 1
+
+    def __iter__(self):
+        return self.follow()
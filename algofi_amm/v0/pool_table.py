@@ -0,0 +1,445 @@
+
+import math
+from array import array
+from .config import PoolType, get_swap_fee
+from .pool import Pool
+from .stable_swap_math import get_D, get_y
+from ..contract_strings import algofi_pool_strings as pool_strings
+from ..utils import get_application_global_state
+
+# uint64 state columns of the table, named as the corresponding :class:`Pool` attributes
+UINT_COLUMNS = [
+    "asset1_id",
+    "asset2_id",
+    "lp_asset_id",
+    "asset1_balance",
+    "asset2_balance",
+    "lp_circulation",
+    "asset1_reserve",
+    "asset2_reserve",
+    "latest_time",
+    "cumsum_time_weighted_asset1_to_asset2_price",
+    "cumsum_time_weighted_asset2_to_asset1_price",
+    "cumsum_volume_asset1",
+    "cumsum_volume_asset2",
+    "cumsum_volume_weighted_asset1_to_asset2_price",
+    "cumsum_volume_weighted_asset2_to_asset1_price",
+    "cumsum_fees_asset1",
+    "cumsum_fees_asset2",
+    "reserve_factor",
+    "flash_loan_fee",
+    "max_flash_loan_ratio",
+    "initial_amplification_factor",
+    "future_amplification_factor",
+    "initial_amplification_factor_time",
+    "future_amplification_factor_time",
+    "t",
+]
+
+# global state keys of the columns refreshed by :meth:`Pool.refresh_state`
+STATE_KEYS = {
+    "asset1_balance": pool_strings.balance_1,
+    "asset2_balance": pool_strings.balance_2,
+    "lp_circulation": pool_strings.lp_circulation,
+    "asset1_reserve": pool_strings.asset1_reserve,
+    "asset2_reserve": pool_strings.asset2_reserve,
+    "latest_time": pool_strings.latest_time,
+    "cumsum_time_weighted_asset1_to_asset2_price": pool_strings.cumsum_time_weighted_asset1_to_asset2_price,
+    "cumsum_time_weighted_asset2_to_asset1_price": pool_strings.cumsum_time_weighted_asset2_to_asset1_price,
+    "cumsum_volume_asset1": pool_strings.cumsum_volume_asset1,
+    "cumsum_volume_asset2": pool_strings.cumsum_volume_asset2,
+    "cumsum_volume_weighted_asset1_to_asset2_price": pool_strings.cumsum_volume_weighted_asset1_to_asset2_price,
+    "cumsum_volume_weighted_asset2_to_asset1_price": pool_strings.cumsum_volume_weighted_asset2_to_asset1_price,
+    "cumsum_fees_asset1": pool_strings.cumsum_fees_asset1,
+    "cumsum_fees_asset2": pool_strings.cumsum_fees_asset2,
+    "reserve_factor": pool_strings.reserve_factor,
+    "flash_loan_fee": pool_strings.flash_loan_fee,
+    "max_flash_loan_ratio": pool_strings.max_flash_loan_ratio,
+    "initial_amplification_factor": pool_strings.initial_amplification_factor,
+    "future_amplification_factor": pool_strings.future_amplification_factor,
+    "initial_amplification_factor_time": pool_strings.initial_amplification_factor_time,
+    "future_amplification_factor_time": pool_strings.future_amplification_factor_time,
+}
+
+
+class AssetRef():
+    __slots__ = ["asset_id"]
+
+    def __init__(self, asset_id):
+        """Constructor method for :class:`AssetRef`, a minimal stand in for :class:`Asset` used by pool views
+
+        :param asset_id: asset id
+        :type asset_id: int
+        """
+
+        self.asset_id = asset_id
+
+
+class PoolView():
+    __slots__ = ["table", "row"]
+
+    def __init__(self, table, row):
+        """Constructor method for :class:`PoolView`, a read only view of one row of a :class:`PoolTable`
+        supporting the quote and pricing methods of :class:`Pool`
+
+        :param table: pool table
+        :type table: :class:`PoolTable`
+        :param row: row index of the pool
+        :type row: int
+        """
+
+        self.table = table
+        self.row = row
+
+    def __getattr__(self, attr):
+        column = self.table.columns.get(attr, None)
+        if column is None:
+            raise AttributeError(attr)
+        return column[self.row]
+
+    @property
+    def application_id(self):
+        return self.table.app_ids[self.row]
+
+    @property
+    def pool_type(self):
+        return PoolType(self.table.pool_types[self.row])
+
+    @property
+    def swap_fee(self):
+        return self.table.swap_fees[self.row]
+
+    @property
+    def asset1(self):
+        return AssetRef(self.table.columns["asset1_id"][self.row])
+
+    @property
+    def asset2(self):
+        return AssetRef(self.table.columns["asset2_id"][self.row])
+
+    amplification_factor = Pool.amplification_factor
+    get_pool_price = Pool.get_pool_price
+    get_pool_quote = Pool.get_pool_quote
+    get_burn_quote = Pool.get_burn_quote
+    get_swap_exact_for_quote = Pool.get_swap_exact_for_quote
+    get_swap_for_exact_quote = Pool.get_swap_for_exact_quote
+
+
+class PoolTable():
+
+    def __init__(self):
+        """Constructor method for :class:`PoolTable`, a struct of arrays holding the state of many pools in
+        contiguous typed columns indexed by application id
+        """
+
+        self.app_ids = array("Q")
+        self.pool_types = array("B")
+        self.swap_fees = array("d")
+        self.columns = {name: array("Q") for name in UINT_COLUMNS}
+        self.rows = {}
+
+    def __len__(self):
+        return len(self.app_ids)
+
+    def __contains__(self, app_id):
+        return app_id in self.rows
+
+    @classmethod
+    def from_pools(cls, pools):
+        """Returns a :class:`PoolTable` holding the state of the given pools
+
+        :param pools: list of :class:`Pool` objects with loaded state
+        :type pools: list
+        :return: pool table
+        :rtype: :class:`PoolTable`
+        """
+
+        table = cls()
+        for pool in pools:
+            table.set_pool(pool)
+        return table
+
+    @classmethod
+    def from_dict(cls, data):
+        """Returns a :class:`PoolTable` from its dict representation, see :meth:`to_dict`
+
+        :param data: dict representation of a pool table
+        :type data: dict
+        :return: pool table
+        :rtype: :class:`PoolTable`
+        """
+
+        table = cls()
+        table.app_ids = array("Q", data["app_ids"])
+        table.pool_types = array("B", data["pool_types"])
+        table.swap_fees = array("d", data["swap_fees"])
+        for name in UINT_COLUMNS:
+            table.columns[name] = array("Q", data["columns"][name])
+        table.rows = {app_id: row for row, app_id in enumerate(table.app_ids)}
+        return table
+
+    def to_dict(self):
+        """Returns a JSON serializable dict representation of the table
+
+        :return: dict of app_ids, pool_types, swap_fees and columns
+        :rtype: dict
+        """
+
+        return {
+            "app_ids": self.app_ids.tolist(),
+            "pool_types": self.pool_types.tolist(),
+            "swap_fees": self.swap_fees.tolist(),
+            "columns": {name: column.tolist() for name, column in self.columns.items()},
+        }
+
+    def _get_or_add_row(self, app_id, pool_type):
+        row = self.rows.get(app_id, None)
+        if row is None:
+            row = len(self.app_ids)
+            self.rows[app_id] = row
+            self.app_ids.append(app_id)
+            self.pool_types.append(pool_type.value)
+            self.swap_fees.append(get_swap_fee(pool_type))
+            for column in self.columns.values():
+                column.append(0)
+        return row
+
+    def set_pool(self, pool):
+        """Copies the state of a :class:`Pool` into the table, adding a row if needed
+
+        :param pool: pool with loaded state
+        :type pool: :class:`Pool`
+        :return: row index of the pool
+        :rtype: int
+        """
+
+        row = self._get_or_add_row(pool.application_id, pool.pool_type)
+        columns = self.columns
+        columns["asset1_id"][row] = pool.asset1.asset_id
+        columns["asset2_id"][row] = pool.asset2.asset_id
+        for name in UINT_COLUMNS[2:]:
+            columns[name][row] = getattr(pool, name, 0)
+        return row
+
+    def set_global_state(self, app_id, pool_type, asset1_id, asset2_id, global_state, t=0):
+        """Writes the formatted global state of a pool application into the table, adding a row if needed
+
+        :param app_id: application id of the pool
+        :type app_id: int
+        :param pool_type: a :class:`PoolType` object for the type of pool
+        :type pool_type: :class:`PoolType`
+        :param asset1_id: asset 1 id
+        :type asset1_id: int
+        :param asset2_id: asset 2 id
+        :type asset2_id: int
+        :param global_state: formatted global state as returned by :func:`get_application_global_state`
+        :type global_state: dict
+        :param t: latest block timestamp, used for the amplification factor of nanoswap pools
+        :type t: int, optional
+        :return: row index of the pool
+        :rtype: int
+        """
+
+        row = self._get_or_add_row(app_id, pool_type)
+        columns = self.columns
+        columns["asset1_id"][row] = asset1_id
+        columns["asset2_id"][row] = asset2_id
+        columns["lp_asset_id"][row] = global_state.get(pool_strings.lp_id, 0)
+        for name, key in STATE_KEYS.items():
+            columns[name][row] = global_state.get(key, 0)
+        columns["t"][row] = t
+        return row
+
+    def refresh(self, algod_client, app_ids=None, t=None):
+        """Reloads the global state of pools in the table
+
+        :param algod_client: :class:`AlgodClient` object for interacting with network
+        :type algod_client: :class:`AlgodClient`
+        :param app_ids: application ids to refresh, defaults to all pools in the table
+        :type app_ids: list, optional
+        :param t: latest block timestamp, defaults to the current timestamp of each row
+        :type t: int, optional
+        """
+
+        if app_ids is None:
+            app_ids = list(self.app_ids)
+        columns = self.columns
+        for app_id in app_ids:
+            row = self.rows[app_id]
+            global_state = get_application_global_state(algod_client, app_id)
+            self.set_global_state(app_id, PoolType(self.pool_types[row]), columns["asset1_id"][row], columns["asset2_id"][row],
+                                  global_state, columns["t"][row] if t is None else t)
+
+    def get_view(self, app_id):
+        """Returns a read only view of the pool with given application id
+
+        :param app_id: application id of the pool
+        :type app_id: int
+        :return: view of the pool
+        :rtype: :class:`PoolView`
+        """
+
+        return PoolView(self, self.rows[app_id])
+
+    def get_column(self, name):
+        """Returns the typed array holding the given column
+
+        :param name: name of the column (e.g. "asset1_balance")
+        :type name: str
+        :return: column
+        :rtype: :class:`array`
+        """
+
+        return self.columns[name]
+
+    def get_pool_prices(self, app_ids=None):
+        """Returns the price of asset 1 in terms of asset 2 for each pool, as in :meth:`Pool.get_pool_price`
+        called with asset 1
+
+        :param app_ids: application ids, defaults to all pools in the table
+        :type app_ids: list, optional
+        :return: prices in row order of app_ids
+        :rtype: :class:`array`
+        """
+
+        rows = range(len(self.app_ids)) if app_ids is None else [self.rows[app_id] for app_id in app_ids]
+        balances1 = self.columns["asset1_balance"]
+        balances2 = self.columns["asset2_balance"]
+        return array("d", [balances1[row] / balances2[row] for row in rows])
+
+    def _get_amplification_factor(self, row):
+        return PoolView(self, row).amplification_factor
+
+    def get_swap_exact_for_amounts(self, app_ids, swap_in_asset_ids, swap_in_amounts):
+        """Returns the output amounts of swap exact for quotes for many (pool, asset, amount) triples,
+        computed as in :meth:`Pool.get_swap_exact_for_quote` without allocating :class:`BalanceDelta` objects
+
+        :param app_ids: application ids of the pools
+        :type app_ids: list
+        :param swap_in_asset_ids: ids of incoming assets
+        :type swap_in_asset_ids: list
+        :param swap_in_amounts: amounts of incoming assets
+        :type swap_in_amounts: list
+        :return: amounts of outgoing assets
+        :rtype: :class:`array`
+        """
+
+        rows = self.rows
+        columns = self.columns
+        asset1_ids = columns["asset1_id"]
+        balances1 = columns["asset1_balance"]
+        balances2 = columns["asset2_balance"]
+        lp_circulations = columns["lp_circulation"]
+        pool_types = self.pool_types
+        swap_fees = self.swap_fees
+        nanoswap = PoolType.NANOSWAP.value
+
+        out = array("q", bytes(8 * len(app_ids)))
+        for i, (app_id, swap_in_asset_id, swap_in_amount) in enumerate(zip(app_ids, swap_in_asset_ids, swap_in_amounts)):
+            row = rows[app_id]
+            if lp_circulations[row] == 0:
+                raise Exception("Error: pool is empty")
+            balance1, balance2 = balances1[row], balances2[row]
+            swap_in_amount_less_fees = swap_in_amount - int(math.ceil(swap_in_amount * swap_fees[row]))
+            is_asset1_in = swap_in_asset_id == asset1_ids[row]
+            if pool_types[row] == nanoswap:
+                amplification_factor = self._get_amplification_factor(row)
+                D, _ = get_D([balance1, balance2], amplification_factor)
+                if is_asset1_in:
+                    y, _ = get_y(0, 1, balance1 + swap_in_amount_less_fees, [balance1, balance2], D, amplification_factor)
+                    out[i] = balance2 - y
+                else:
+                    y, _ = get_y(1, 0, balance2 + swap_in_amount_less_fees, [balance1, balance2], D, amplification_factor)
+                    out[i] = balance1 - y
+            elif is_asset1_in:
+                out[i] = int((balance2 * swap_in_amount_less_fees) / (balance1 + swap_in_amount_less_fees))
+            else:
+                out[i] = int((balance1 * swap_in_amount_less_fees) / (balance2 + swap_in_amount_less_fees))
+        return out
+
+    def get_swap_for_exact_amounts(self, app_ids, swap_out_asset_ids, swap_out_amounts):
+        """Returns the input amounts of swap for exact quotes for many (pool, asset, amount) triples,
+        computed as in :meth:`Pool.get_swap_for_exact_quote` without allocating :class:`BalanceDelta` objects
+
+        :param app_ids: application ids of the pools
+        :type app_ids: list
+        :param swap_out_asset_ids: ids of outgoing assets
+        :type swap_out_asset_ids: list
+        :param swap_out_amounts: amounts of outgoing assets
+        :type swap_out_amounts: list
+        :return: amounts of incoming assets
+        :rtype: :class:`array`
+        """
+
+        rows = self.rows
+        columns = self.columns
+        asset1_ids = columns["asset1_id"]
+        balances1 = columns["asset1_balance"]
+        balances2 = columns["asset2_balance"]
+        lp_circulations = columns["lp_circulation"]
+        pool_types = self.pool_types
+        swap_fees = self.swap_fees
+        nanoswap = PoolType.NANOSWAP.value
+
+        out = array("q", bytes(8 * len(app_ids)))
+        for i, (app_id, swap_out_asset_id, swap_out_amount) in enumerate(zip(app_ids, swap_out_asset_ids, swap_out_amounts)):
+            row = rows[app_id]
+            if lp_circulations[row] == 0:
+                raise Exception("Error: pool is empty")
+            balance1, balance2 = balances1[row], balances2[row]
+            is_asset1_out = swap_out_asset_id == asset1_ids[row]
+            if pool_types[row] == nanoswap:
+                amplification_factor = self._get_amplification_factor(row)
+                D, _ = get_D([balance1, balance2], amplification_factor)
+                if is_asset1_out:
+                    y, _ = get_y(1, 0, balance1 - swap_out_amount, [balance1, balance2], D, amplification_factor)
+                    swap_in_amount_less_fees = y - balance2
+                else:
+                    y, _ = get_y(0, 1, balance2 - swap_out_amount, [balance1, balance2], D, amplification_factor)
+                    swap_in_amount_less_fees = y - balance1
+            elif is_asset1_out:
+                swap_in_amount_less_fees = int((balance2 * swap_out_amount) / (balance1 - swap_out_amount)) - 1
+            else:
+                swap_in_amount_less_fees = int((balance1 * swap_out_amount) / (balance2 - swap_out_amount)) - 1
+            out[i] = math.ceil(swap_in_amount_less_fees / (1 - swap_fees[row]))
+        return out
+
+    def get_burn_amounts(self, app_ids, lp_amounts):
+        """Returns the asset amounts received for burning lp tokens of many pools, computed as in
+        :meth:`Pool.get_burn_quote`
+
+        :param app_ids: application ids of the pools
+        :type app_ids: list
+        :param lp_amounts: lp amounts to burn
+        :type lp_amounts: list
+        :return: tuple of (asset 1 amounts, asset 2 amounts)
+        :rtype: tuple
+        """
+
+        rows = self.rows
+        balances1 = self.columns["asset1_balance"]
+        balances2 = self.columns["asset2_balance"]
+        lp_circulations = self.columns["lp_circulation"]
+
+        asset1_amounts = array("q", bytes(8 * len(app_ids)))
+        asset2_amounts = array("q", bytes(8 * len(app_ids)))
+        for i, (app_id, lp_amount) in enumerate(zip(app_ids, lp_amounts)):
+            row = rows[app_id]
+            lp_circulation = lp_circulations[row]
+            if (lp_circulation == 0):
+                raise Exception("Error: pool is empty")
+            if (lp_circulation < lp_amount):
+                raise Exception("Error: cannot burn more lp tokens than are in circulation")
+            asset1_amounts[i] = int(lp_amount * balances1[row] / lp_circulation)
+            asset2_amounts[i] = int(lp_amount * balances2[row] / lp_circulation)
+        return asset1_amounts, asset2_amounts
+
+    def get_memory_usage(self):
+        """Returns the number of bytes used by the column buffers of the table
+
+        :return: bytes used by the columns
+        :rtype: int
+        """
+
+        arrays = [self.app_ids, self.pool_types, self.swap_fees] + list(self.columns.values())
+        return sum(column.buffer_info()[1] * column.itemsize for column in arrays)
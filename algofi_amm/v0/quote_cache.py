@@ -0,0 +1,105 @@
+
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+# default maximum number of quotes cached per pool
+DEFAULT_QUOTE_CACHE_SIZE = 256
+
+
+class QuoteCache():
+
+    def __init__(self, max_size=DEFAULT_QUOTE_CACHE_SIZE):
+        """Constructor method for :class:`QuoteCache`, a bounded LRU cache of pool quotes keyed by
+        (state version, method, arguments)
+
+        :param max_size: maximum number of cached quotes
+        :type max_size: int, optional
+        """
+
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Returns the cached quote for key, or None if not cached
+
+        :param key: cache key
+        :type key: tuple
+        :return: cached quote
+        :rtype: :class:`BalanceDelta`
+        """
+
+        with self.lock:
+            value = self.entries.get(key, None)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Caches a quote, evicting the least recently used quote if full
+
+        :param key: cache key
+        :type key: tuple
+        :param value: quote
+        :type value: :class:`BalanceDelta`
+        """
+
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached quotes. Hit and miss counters are kept.
+        """
+
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self):
+        """Returns the hit / miss counters and size of the cache
+
+        :return: dict with keys hits, misses, size and max_size
+        :rtype: dict
+        """
+
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "max_size": self.max_size}
+
+
+def cached_quote(method):
+    """Decorator memoizing a quote method of :class:`Pool` in the pool's quote_cache, keyed by the pool's
+    state_version, the method name and its arguments. Objects without a quote cache are not memoized.
+    Cached :class:`BalanceDelta` objects are shared between callers and must not be mutated.
+
+    :param method: quote method
+    :type method: function
+    :return: memoized quote method
+    :rtype: function
+    """
+
+    name = method.__name__
+
+    @wraps(method)
+    def memoized(self, *args, **kwargs):
+        try:
+            cache = self.quote_cache
+        except AttributeError:
+            cache = None
+        if cache is None:
+            return method(self, *args, **kwargs)
+        key = (self.state_version, name, args, tuple(sorted(kwargs.items())) if kwargs else ())
+        quote = cache.get(key)
+        if quote is None:
+            quote = method(self, *args, **kwargs)
+            cache.put(key, quote)
+        return quote
+
+    return memoized
@@ -0,0 +1,378 @@
+
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .config import PoolType
+from .pool_table import PoolTable
+from .routing import DEFAULT_MAX_HOPS, get_routes, get_best_route_quote
+from ..utils import get_application_global_state
+
+# default seconds between background refreshes of the pool state, about one round
+DEFAULT_REFRESH_INTERVAL = 4.0
+
+# default number of concurrent global state requests of a refresh
+DEFAULT_MAX_WORKERS = 8
+
+# maximum size in bytes of a request body
+MAX_REQUEST_SIZE = 16 * 1024 * 1024
+
+# quote methods served, named as the quote methods of :class:`Pool` without the get_ prefix and _quote suffix
+QUOTE_METHODS = frozenset(["swap_exact_for", "swap_for_exact", "pool", "burn", "route"])
+
+
+def _format_balance_delta(app_id, quote):
+    return {
+        "app_id": app_id,
+        "asset1_delta": quote.asset1_delta,
+        "asset2_delta": quote.asset2_delta,
+        "lp_delta": quote.lp_delta,
+        "price_delta": quote.price_delta,
+        "extra_compute_fee": quote.extra_compute_fee,
+    }
+
+
+def _format_route_quote(quote):
+    return {
+        "route": [[pool.application_id, asset_id] for pool, asset_id in quote.route],
+        "swap_in_amount": quote.swap_in_amount,
+        "swap_amounts": quote.swap_amounts,
+        "swap_out_amount": quote.swap_out_amount,
+        "extra_compute_fee": quote.extra_compute_fee,
+    }
+
+
+class QuoteState():
+
+    def __init__(self, table, round_num, t):
+        """Constructor method for :class:`QuoteState`, the pool state one refresh of a :class:`QuoteServer` serves
+        quotes from. It is never modified after construction, a refresh swaps in a new state.
+
+        :param table: pool table
+        :type table: :class:`PoolTable`
+        :param round_num: round the state was read at
+        :type round_num: int
+        :param t: block timestamp of the round
+        :type t: int
+        """
+
+        self.table = table
+        self.round = round_num
+        self.t = t
+        self.views = {app_id: table.get_view(app_id) for app_id in table.app_ids}
+        # (swap in asset id, swap out asset id, max hops) -> routes through the views of this state
+        self.routes = {}
+
+    def get_routes(self, swap_in_asset_id, swap_out_asset_id, max_hops):
+        key = (swap_in_asset_id, swap_out_asset_id, max_hops)
+        routes = self.routes.get(key, None)
+        if routes is None:
+            routes = get_routes(list(self.views.values()), swap_in_asset_id, swap_out_asset_id, max_hops)
+            self.routes[key] = routes
+        return routes
+
+
+class QuoteServer():
+
+    def __init__(self, client, pools, refresh_interval=DEFAULT_REFRESH_INTERVAL, max_workers=DEFAULT_MAX_WORKERS):
+        """Constructor method for :class:`QuoteServer`, which keeps the state of a set of pools warm and serves
+        quotes from it without network calls. The state is refreshed by a background thread and replaced as a
+        whole, so each request is quoted against the state of a single refresh.
+
+        Requests are JSON objects posted to /quote, or JSON arrays of them to quote a batch in one request. Each
+        object has a "method" of swap_exact_for, swap_for_exact, pool, burn or route and the arguments of the
+        corresponding quote method of :class:`Pool`:
+
+        * swap_exact_for, swap_for_exact and pool: app_id, asset_id, amount
+        * burn: app_id, amount
+        * route: swap_in_asset_id, swap_out_asset_id, amount and optionally max_hops
+
+        :param client: client whose algod client is used for refreshes
+        :type client: :class:`AlgofiAMMClient`
+        :param pools: pools to serve, with loaded state
+        :type pools: list
+        :param refresh_interval: seconds between refreshes
+        :type refresh_interval: float, optional
+        :param max_workers: maximum number of concurrent global state requests of a refresh
+        :type max_workers: int, optional
+        """
+
+        self.client = client
+        self.pools = {pool.application_id: pool for pool in pools}
+        self.refresh_interval = refresh_interval
+        self.max_workers = max_workers
+        self.state = QuoteState(PoolTable.from_pools(pools), 0, 0)
+        self.quotes_served = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.last_refresh_error = None
+        self.last_refresh_time = time.time()
+        self.stop_event = threading.Event()
+        self.refresh_thread = None
+        self.server = None
+
+    def refresh(self):
+        """Fetches the global states of all pools and swaps in the new state
+
+        :return: the new state
+        :rtype: :class:`QuoteState`
+        """
+
+        algod = self.client.algod
+        round_num = algod.status()["last-round"]
+        t = algod.block_info(round_num)["block"]["ts"]
+        app_ids = list(self.pools)
+
+        def get_global_state(app_id):
+            return get_application_global_state(algod, app_id)
+
+        if len(app_ids) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(app_ids))) as executor:
+                global_states = list(executor.map(get_global_state, app_ids))
+        else:
+            global_states = [get_global_state(app_id) for app_id in app_ids]
+
+        table = PoolTable()
+        for app_id, global_state in zip(app_ids, global_states):
+            pool = self.pools[app_id]
+            table.set_global_state(app_id, pool.pool_type, pool.asset1.asset_id, pool.asset2.asset_id, global_state, t)
+        self.state = QuoteState(table, round_num, t)
+        self.refreshes += 1
+        self.last_refresh_time = time.time()
+        return self.state
+
+    def _run_refresher(self):
+        while not self.stop_event.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # keep serving the previous state
+                self.refresh_errors += 1
+                self.last_refresh_error = str(e)
+
+    def start_refresher(self):
+        """Starts the background refresh thread
+        """
+
+        if self.refresh_thread is None:
+            self.stop_event.clear()
+            self.refresh_thread = threading.Thread(target=self._run_refresher, daemon=True)
+            self.refresh_thread.start()
+
+    def quote(self, query, state=None):
+        """Returns the quote of one query
+
+        :param query: query object, see :class:`QuoteServer`
+        :type query: dict
+        :param state: state to quote against, defaults to the current state
+        :type state: :class:`QuoteState`, optional
+        :return: quote as a dict, or a dict with an "error" key if the query is invalid
+        :rtype: dict
+        """
+
+        state = state if state is not None else self.state
+        try:
+            method = query["method"]
+            if method not in QUOTE_METHODS:
+                return {"error": "Unknown method %s" % method}
+            if method == "route":
+                swap_in_asset_id, swap_out_asset_id = query["swap_in_asset_id"], query["swap_out_asset_id"]
+                max_hops = query.get("max_hops", DEFAULT_MAX_HOPS)
+                routes = state.get_routes(swap_in_asset_id, swap_out_asset_id, max_hops)
+                quote = get_best_route_quote(None, swap_in_asset_id, swap_out_asset_id, query["amount"], routes=routes)
+                if quote is None:
+                    return {"error": "No route from %d to %d" % (swap_in_asset_id, swap_out_asset_id)}
+                return _format_route_quote(quote)
+            app_id = query["app_id"]
+            view = state.views.get(app_id, None)
+            if view is None:
+                return {"error": "Unknown pool %d" % app_id}
+            if method != "burn":
+                asset_id = query["asset_id"]
+                if asset_id != view.asset1_id and asset_id != view.asset2_id:
+                    return {"error": "Asset %d is not in pool %d" % (asset_id, app_id)}
+            if method == "swap_exact_for":
+                quote = view.get_swap_exact_for_quote(asset_id, query["amount"])
+            elif method == "swap_for_exact":
+                quote = view.get_swap_for_exact_quote(asset_id, query["amount"])
+            elif method == "pool":
+                quote = view.get_pool_quote(asset_id, query["amount"])
+            else:
+                quote = view.get_burn_quote(query["amount"])
+            return _format_balance_delta(app_id, quote)
+        except KeyError as e:
+            return {"error": "Missing field %s" % e}
+        except Exception as e:
+            return {"error": str(e)}
+
+    def handle_request(self, request):
+        """Quotes a decoded request, all queries of a batch against the same state
+
+        :param request: query object or list of query objects
+        :type request: dict or list
+        :return: response object, a list for batches
+        :rtype: dict or list
+        """
+
+        state = self.state
+        if isinstance(request, list):
+            self.quotes_served += len(request)
+            return [self.quote(query, state) for query in request]
+        self.quotes_served += 1
+        return self.quote(request, state)
+
+    def get_status(self):
+        """Returns the status of the server
+
+        :return: dict of round, t, pools, quotes_served, refreshes, refresh_errors, last_refresh_error and
+            seconds_since_refresh
+        :rtype: dict
+        """
+
+        state = self.state
+        return {
+            "round": state.round,
+            "t": state.t,
+            "pools": len(state.table),
+            "quotes_served": self.quotes_served,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "last_refresh_error": self.last_refresh_error,
+            "seconds_since_refresh": time.time() - self.last_refresh_time,
+        }
+
+    def serve(self, host="127.0.0.1", port=8080, unix_socket=None):
+        """Starts the background refresher and serves HTTP requests on a TCP port or a Unix socket until
+        :meth:`shutdown` is called
+
+        :param host: host to bind
+        :type host: str, optional
+        :param port: port to bind
+        :type port: int, optional
+        :param unix_socket: path of a Unix socket to bind instead of a TCP port
+        :type unix_socket: str, optional
+        """
+
+        self.server = self.get_http_server(host, port, unix_socket)
+        self.start_refresher()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+
+    def get_http_server(self, host="127.0.0.1", port=8080, unix_socket=None):
+        """Returns an HTTP server bound to a TCP port or a Unix socket which serves this quote server, without
+        starting it
+
+        :param host: host to bind
+        :type host: str, optional
+        :param port: port to bind, 0 for any free port
+        :type port: int, optional
+        :param unix_socket: path of a Unix socket to bind instead of a TCP port
+        :type unix_socket: str, optional
+        :return: HTTP server
+        :rtype: :class:`ThreadingHTTPServer`
+        """
+
+        # TCP_NODELAY only applies to TCP sockets
+        handler = type("BoundQuoteRequestHandler", (QuoteRequestHandler,),
+                       {"quote_server": self, "disable_nagle_algorithm": unix_socket is None})
+        if unix_socket is not None:
+            # not available on windows
+            from socketserver import ThreadingUnixStreamServer
+            return ThreadingUnixStreamServer(unix_socket, handler)
+        return ThreadingHTTPServer((host, port), handler)
+
+    def shutdown(self):
+        """Stops serving and refreshing
+        """
+
+        self.stop_event.set()
+        if self.server is not None:
+            self.server.shutdown()
+        if self.refresh_thread is not None:
+            self.refresh_thread.join()
+            self.refresh_thread = None
+
+
+class QuoteRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that connections are kept alive
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    quote_server = None
+
+    def send_json(self, code, response):
+        body = json.dumps(response, separators=(",", ":")).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/status":
+            self.send_json(200, self.quote_server.get_status())
+        else:
+            self.send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length > MAX_REQUEST_SIZE:
+            self.close_connection = True
+            self.send_json(413, {"error": "Request too large"})
+            return
+        body = self.rfile.read(length)
+        if self.path != "/quote":
+            self.send_json(404, {"error": "Not found"})
+            return
+        try:
+            request = json.loads(body)
+        except ValueError:
+            self.send_json(400, {"error": "Invalid JSON"})
+            return
+        self.send_json(200, self.quote_server.handle_request(request))
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _parse_pool(value):
+    pool_type, asset1_id, asset2_id = value.split(":")
+    return PoolType[pool_type.upper()], int(asset1_id), int(asset2_id)
+
+
+def main(argv=None):
+    """Entry point of the quote server, e.g.
+    ``python -m algofi_amm.v0.quote_server --network mainnet --pool constant_product_30bp_fee:1:31566704 --port 8080``
+    """
+
+    from .client import AlgofiAMMMainnetClient, AlgofiAMMTestnetClient
+
+    parser = argparse.ArgumentParser(description="Serves Algofi AMM quotes from warm pool state")
+    parser.add_argument("--network", choices=["mainnet", "testnet"], default="mainnet")
+    parser.add_argument("--pool", action="append", type=_parse_pool, required=True,
+                        help="pool to serve as pool_type:asset1_id:asset2_id, e.g. constant_product_30bp_fee:1:31566704")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix-socket", default=None, help="path of a Unix socket to serve on instead of a TCP port")
+    parser.add_argument("--refresh-interval", type=float, default=DEFAULT_REFRESH_INTERVAL)
+    args = parser.parse_args(argv)
+
+    client = AlgofiAMMMainnetClient() if args.network == "mainnet" else AlgofiAMMTestnetClient()
+    pools = [client.get_pool(pool_type, asset1_id, asset2_id) for pool_type, asset1_id, asset2_id in args.pool]
+    quote_server = QuoteServer(client, pools, refresh_interval=args.refresh_interval)
+    quote_server.refresh()
+    try:
+        quote_server.serve(args.host, args.port, args.unix_socket)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
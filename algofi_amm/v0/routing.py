@@ -0,0 +1,122 @@
+
+from .fee_model import get_extra_compute_fee
+
+# default maximum number of pools in a route
+DEFAULT_MAX_HOPS = 3
+
+
+def get_routes(pools, swap_in_asset_id, swap_out_asset_id, max_hops=DEFAULT_MAX_HOPS):
+    """Returns every route from one asset to another through the given pools which uses each pool at most once
+    and does not revisit an asset
+
+    :param pools: :class:`Pool` or :class:`PoolView` objects to route through
+    :type pools: list
+    :param swap_in_asset_id: id of the asset to swap in
+    :type swap_in_asset_id: int
+    :param swap_out_asset_id: id of the asset to swap out
+    :type swap_out_asset_id: int
+    :param max_hops: maximum number of pools in a route
+    :type max_hops: int, optional
+    :return: list of routes, each a list of (pool, swap in asset id)
+    :rtype: list
+    """
+
+    # asset id -> list of (pool, other asset id)
+    edges = {}
+    for pool in pools:
+        edges.setdefault(pool.asset1.asset_id, []).append((pool, pool.asset2.asset_id))
+        edges.setdefault(pool.asset2.asset_id, []).append((pool, pool.asset1.asset_id))
+
+    routes = []
+    stack = [(swap_in_asset_id, [], {swap_in_asset_id})]
+    while stack:
+        asset_id, route, visited = stack.pop()
+        for pool, next_asset_id in edges.get(asset_id, []):
+            if next_asset_id in visited:
+                continue
+            hop_route = route + [(pool, asset_id)]
+            if next_asset_id == swap_out_asset_id:
+                routes.append(hop_route)
+            elif len(hop_route) < max_hops:
+                stack.append((next_asset_id, hop_route, visited | {next_asset_id}))
+    return routes
+
+
+class RouteQuote():
+
+    def __init__(self, route, swap_in_amount, swap_quotes):
+        """Constructor method for :class:`RouteQuote`, the chained swap exact for quotes of a route
+
+        :param route: list of (pool, swap in asset id) hops
+        :type route: list
+        :param swap_in_amount: amount swapped into the first pool
+        :type swap_in_amount: int
+        :param swap_quotes: :class:`BalanceDelta` of each hop
+        :type swap_quotes: list
+        """
+
+        self.route = route
+        self.swap_in_amount = swap_in_amount
+        self.swap_quotes = swap_quotes
+        self.swap_amounts = [max(quote.asset1_delta, quote.asset2_delta) for quote in swap_quotes]
+        self.swap_out_amount = self.swap_amounts[-1]
+        self.extra_compute_fee = get_extra_compute_fee(sum(quote.num_iter for quote in swap_quotes))
+
+    def __str__(self):
+        """Returns a string representation of the :class:`RouteQuote` object
+        """
+
+        hops = " -> ".join("{}({})".format(pool.application_id, asset_id) for pool, asset_id in self.route)
+        return "RouteQuote({}, in={}, out={})".format(hops, self.swap_in_amount, self.swap_out_amount)
+
+
+def get_route_quote(route, swap_in_amount):
+    """Returns the quote of swapping an amount through a route, each hop swapping the output of the previous one
+
+    :param route: list of (pool, swap in asset id) hops
+    :type route: list
+    :param swap_in_amount: amount swapped into the first pool
+    :type swap_in_amount: int
+    :return: quote of the route
+    :rtype: :class:`RouteQuote`
+    """
+
+    swap_quotes = []
+    amount = swap_in_amount
+    for pool, asset_id in route:
+        quote = pool.get_swap_exact_for_quote(asset_id, amount)
+        swap_quotes.append(quote)
+        amount = max(quote.asset1_delta, quote.asset2_delta)
+    return RouteQuote(route, swap_in_amount, swap_quotes)
+
+
+def get_best_route_quote(pools, swap_in_asset_id, swap_out_asset_id, swap_in_amount, max_hops=DEFAULT_MAX_HOPS, routes=None):
+    """Returns the route quote with the largest output amount between two assets. Routes through empty pools are
+    skipped.
+
+    :param pools: :class:`Pool` or :class:`PoolView` objects to route through
+    :type pools: list
+    :param swap_in_asset_id: id of the asset to swap in
+    :type swap_in_asset_id: int
+    :param swap_out_asset_id: id of the asset to swap out
+    :type swap_out_asset_id: int
+    :param swap_in_amount: amount to swap in
+    :type swap_in_amount: int
+    :param max_hops: maximum number of pools in a route
+    :type max_hops: int, optional
+    :param routes: routes to compare as returned by :func:`get_routes`, computed from pools if not specified
+    :type routes: list, optional
+    :return: best route quote, or None if no route exists
+    :rtype: :class:`RouteQuote`
+    """
+
+    if routes is None:
+        routes = get_routes(pools, swap_in_asset_id, swap_out_asset_id, max_hops)
+    best_quote = None
+    for route in routes:
+        if any(pool.lp_circulation == 0 for pool, _ in route):
+            continue
+        quote = get_route_quote(route, swap_in_amount)
+        if best_quote is None or quote.swap_out_amount > best_quote.swap_out_amount:
+            best_quote = quote
+    return best_quote
@@ -0,0 +1,222 @@
+
+import time
+import struct
+from array import array
+from multiprocessing import shared_memory
+from .pool_table import PoolTable, UINT_COLUMNS
+
+# first header field of a shared pool table segment
+SHARED_TABLE_MAGIC = int.from_bytes(b"AFPOOLS1", "little")
+
+# header: magic, sequence number, capacity, number of rows
+HEADER = struct.Struct("<QQQQ")
+SEQUENCE_OFFSET = 8
+NUM_ROWS_OFFSET = 24
+HEADER_FIELD = struct.Struct("<Q")
+
+# default seconds between refreshes of the refresher loop, about one round
+DEFAULT_REFRESH_INTERVAL = 4.0
+
+
+def _get_layout(capacity):
+    """Returns the offsets of the columns of a segment with given capacity as a list of (name, typecode, offset)"""
+
+    layout = []
+    offset = HEADER.size
+    for name, typecode in [("app_ids", "Q"), ("swap_fees", "d")] + [(name, "Q") for name in UINT_COLUMNS] + [("pool_types", "B")]:
+        layout.append((name, typecode, offset))
+        offset += capacity * array(typecode).itemsize
+    return layout, offset
+
+
+def _get_table_arrays(table):
+    arrays = {"app_ids": table.app_ids, "swap_fees": table.swap_fees, "pool_types": table.pool_types}
+    arrays.update(table.columns)
+    return arrays
+
+
+class SharedPoolTable():
+
+    def __init__(self, segment, capacity, owner):
+        """Constructor method for :class:`SharedPoolTable`, a :class:`PoolTable` published in a shared memory
+        segment. One refresher process creates the segment and publishes its table, worker processes attach to it
+        and copy consistent snapshots into a local table, from which they quote without network calls. Publishes
+        and snapshots are guarded by a seqlock: the writer makes the sequence number odd while copying, readers retry
+        while it is odd or changes during their copy. Use :meth:`create` and :meth:`attach` instead of this
+        constructor.
+
+        :param segment: shared memory segment
+        :type segment: :class:`SharedMemory`
+        :param capacity: maximum number of pools
+        :type capacity: int
+        :param owner: whether this process created the segment and publishes to it
+        :type owner: bool
+        """
+
+        self.segment = segment
+        self.name = segment.name
+        self.capacity = capacity
+        self.owner = owner
+        self.layout, self.size = _get_layout(capacity)
+        self.table = PoolTable()
+        self.sequence = 0
+        self.snapshots = 0
+        self.retries = 0
+
+    @classmethod
+    def create(cls, pools, name=None, capacity=None):
+        """Creates a segment holding the state of the given pools and publishes it
+
+        :param pools: list of :class:`Pool` objects with loaded state
+        :type pools: list
+        :param name: name of the segment, generated if not specified
+        :type name: str, optional
+        :param capacity: maximum number of pools, defaults to the number of pools
+        :type capacity: int, optional
+        :return: writable shared pool table
+        :rtype: :class:`SharedPoolTable`
+        """
+
+        capacity = capacity or len(pools)
+        _, size = _get_layout(capacity)
+        segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        HEADER.pack_into(segment.buf, 0, SHARED_TABLE_MAGIC, 0, capacity, 0)
+        shared_table = cls(segment, capacity, True)
+        shared_table.table = PoolTable.from_pools(pools)
+        shared_table.publish()
+        return shared_table
+
+    @classmethod
+    def attach(cls, name):
+        """Attaches to a segment created by :meth:`create` and takes a first snapshot
+
+        :param name: name of the segment
+        :type name: str
+        :return: read only shared pool table
+        :rtype: :class:`SharedPoolTable`
+        """
+
+        # readers must not unlink the segment of the refresher when they exit
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            from multiprocessing import resource_tracker
+            # a resource tracker inherited from the refresher's process tree must keep its registration, a tracker
+            # started by attaching, e.g. in a worker forked by a server, would unlink the segment on exit
+            inherited_tracker = getattr(resource_tracker._resource_tracker, "_fd", None) is not None
+            segment = shared_memory.SharedMemory(name=name)
+            if not inherited_tracker:
+                resource_tracker.unregister(segment._name, "shared_memory")
+        magic, _, capacity, _ = HEADER.unpack_from(segment.buf, 0)
+        if magic != SHARED_TABLE_MAGIC:
+            segment.close()
+            raise Exception("Shared memory segment %s is not a shared pool table" % name)
+        shared_table = cls(segment, capacity, False)
+        shared_table.refresh()
+        return shared_table
+
+    def publish(self):
+        """Copies the local table into the segment
+        """
+
+        if not self.owner:
+            raise Exception("Only the process which created the shared pool table can publish to it")
+        table = self.table
+        if len(table) > self.capacity:
+            raise Exception("Shared pool table capacity of %d pools exceeded" % self.capacity)
+        buf = self.segment.buf
+        arrays = _get_table_arrays(table)
+        # header fields are written by slice assignment, struct.pack_into zeroes its target before packing so
+        # readers could see an even sequence number of 0 in between
+        self.sequence += 1
+        buf[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 8] = HEADER_FIELD.pack(self.sequence)
+        for name, typecode, offset in self.layout:
+            data = arrays[name].tobytes()
+            buf[offset:offset + len(data)] = data
+        buf[NUM_ROWS_OFFSET:NUM_ROWS_OFFSET + 8] = HEADER_FIELD.pack(len(table))
+        self.sequence += 1
+        buf[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 8] = HEADER_FIELD.pack(self.sequence)
+
+    def refresh(self):
+        """Copies a consistent snapshot of the segment into the local table if it changed since the last snapshot.
+        For readers only, the owner's local table is the source of the segment.
+
+        :return: whether the local table changed
+        :rtype: bool
+        """
+
+        if self.owner:
+            return False
+        buf = self.segment.buf
+        while True:
+            sequence = HEADER_FIELD.unpack_from(buf, SEQUENCE_OFFSET)[0]
+            if sequence == self.sequence:
+                return False
+            if sequence & 1:
+                self.retries += 1
+                time.sleep(0)
+                continue
+            num_rows = HEADER_FIELD.unpack_from(buf, NUM_ROWS_OFFSET)[0]
+            data = bytes(buf[:self.size])
+            if HEADER_FIELD.unpack_from(buf, SEQUENCE_OFFSET)[0] == sequence:
+                break
+            self.retries += 1
+
+        table = PoolTable()
+        for name, typecode, offset in self.layout:
+            column = array(typecode)
+            column.frombytes(data[offset:offset + num_rows * column.itemsize])
+            if name in table.columns:
+                table.columns[name] = column
+            else:
+                setattr(table, name, column)
+        table.rows = {app_id: row for row, app_id in enumerate(table.app_ids)}
+        self.table = table
+        self.sequence = sequence
+        self.snapshots += 1
+        return True
+
+    def get_view(self, app_id):
+        """Returns a read only view of a pool in the current local table, see :meth:`PoolTable.get_view`. Views
+        taken before a :meth:`refresh` keep quoting against the earlier snapshot.
+
+        :param app_id: application id of the pool
+        :type app_id: int
+        :return: view of the pool
+        :rtype: :class:`PoolView`
+        """
+
+        return self.table.get_view(app_id)
+
+    def run_refresher(self, algod_client, interval=DEFAULT_REFRESH_INTERVAL, stop_event=None):
+        """Refreshes the local table from the network and publishes it every interval seconds until stop_event is
+        set. The network calls happen outside of the seqlock, readers only wait for the copy.
+
+        :param algod_client: :class:`AlgodClient` object for interacting with network
+        :type algod_client: :class:`AlgodClient`
+        :param interval: seconds between refreshes
+        :type interval: float, optional
+        :param stop_event: event which stops the loop when set
+        :type stop_event: :class:`Event`, optional
+        """
+
+        while stop_event is None or not stop_event.is_set():
+            last_round = algod_client.status()["last-round"]
+            t = algod_client.block_info(last_round)["block"]["ts"]
+            self.table.refresh(algod_client, t=t)
+            self.publish()
+            if stop_event is not None:
+                stop_event.wait(interval)
+            else:
+                time.sleep(interval)
+
+    def close(self, unlink=None):
+        """Detaches from the segment
+
+        :param unlink: whether to destroy the segment, defaults to True for the owner
+        :type unlink: bool, optional
+        """
+
+        self.segment.close()
+        if unlink if unlink is not None else self.owner:
+            self.segment.unlink()
@@ -0,0 +1,216 @@
+
+from concurrent.futures import ThreadPoolExecutor
+from .config import PoolType
+from .accounts import get_account_infos
+from .pool_table import PoolTable
+from .routing import DEFAULT_MAX_HOPS, get_routes, get_best_route_quote
+from ..utils import format_global_state
+
+# default number of concurrent requests of a snapshot
+DEFAULT_MAX_WORKERS = 16
+
+# default number of times pools read at an older round than the others are refetched
+DEFAULT_MAX_RETRIES = 5
+
+
+class PoolSnapshot():
+
+    def __init__(self, table, round_num, t):
+        """Constructor method for :class:`PoolSnapshot`, the state of many pools read at one round. The snapshot
+        is immutable, its pools are read only :class:`PoolView` objects supporting the quote and pricing methods of
+        :class:`Pool`. Use :meth:`AlgofiAMMClient.snapshot` instead of this constructor.
+
+        :param table: pool table holding the state of the pools
+        :type table: :class:`PoolTable`
+        :param round_num: round the state of every pool was read at
+        :type round_num: int
+        :param t: block timestamp of the round, used for the amplification factor of nanoswap pools
+        :type t: int
+        """
+
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "round", round_num)
+        object.__setattr__(self, "t", t)
+        object.__setattr__(self, "_views", {app_id: table.get_view(app_id) for app_id in table.app_ids})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PoolSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("PoolSnapshot is immutable")
+
+    def __len__(self):
+        return len(self._views)
+
+    def __contains__(self, app_id):
+        return app_id in self._views
+
+    def __str__(self):
+        """Returns a string representation of the :class:`PoolSnapshot` object
+        """
+
+        return "PoolSnapshot(round={}, pools={})".format(self.round, len(self._views))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Returns a :class:`PoolSnapshot` from its dict representation, see :meth:`to_dict`
+
+        :param data: dict representation of a snapshot
+        :type data: dict
+        :return: snapshot
+        :rtype: :class:`PoolSnapshot`
+        """
+
+        return cls(PoolTable.from_dict(data["table"]), data["round"], data["t"])
+
+    def to_dict(self):
+        """Returns a JSON serializable dict representation of the snapshot, e.g. to save it for offline analysis
+
+        :return: dict of round, t and table
+        :rtype: dict
+        """
+
+        return {"round": self.round, "t": self.t, "table": self._table.to_dict()}
+
+    def get_table(self):
+        """Returns the pool table of the snapshot, which must not be modified
+
+        :return: pool table
+        :rtype: :class:`PoolTable`
+        """
+
+        return self._table
+
+    def get_pool(self, app_id):
+        """Returns the pool with given application id
+
+        :param app_id: application id of the pool
+        :type app_id: int
+        :return: read only view of the pool
+        :rtype: :class:`PoolView`
+        """
+
+        return self._views[app_id]
+
+    def get_pools(self):
+        """Returns all pools of the snapshot, e.g. to pass to :func:`get_routes`
+
+        :return: list of read only views of the pools
+        :rtype: list
+        """
+
+        return list(self._views.values())
+
+    def get_pool_price(self, app_id, asset_id):
+        """Returns the price of a pool in terms of an asset, see :meth:`Pool.get_pool_price`
+
+        :param app_id: application id of the pool
+        :type app_id: int
+        :param asset_id: asset id of the asset to price
+        :type asset_id: int
+        :return: price of pool in terms of asset with given asset_id
+        :rtype: float
+        """
+
+        return self._views[app_id].get_pool_price(asset_id)
+
+    def get_pool_prices(self, app_ids=None):
+        """Returns the price of asset 1 in terms of asset 2 for each pool, see :meth:`PoolTable.get_pool_prices`
+
+        :param app_ids: application ids, defaults to all pools
+        :type app_ids: list, optional
+        :return: prices in order of app_ids
+        :rtype: :class:`array`
+        """
+
+        return self._table.get_pool_prices(app_ids)
+
+    def get_swap_exact_for_amounts(self, app_ids, swap_in_asset_ids, swap_in_amounts):
+        """Returns the output amounts of many swap exact for quotes, see :meth:`PoolTable.get_swap_exact_for_amounts`
+        """
+
+        return self._table.get_swap_exact_for_amounts(app_ids, swap_in_asset_ids, swap_in_amounts)
+
+    def get_swap_for_exact_amounts(self, app_ids, swap_out_asset_ids, swap_out_amounts):
+        """Returns the input amounts of many swap for exact quotes, see :meth:`PoolTable.get_swap_for_exact_amounts`
+        """
+
+        return self._table.get_swap_for_exact_amounts(app_ids, swap_out_asset_ids, swap_out_amounts)
+
+    def get_best_route_quote(self, swap_in_asset_id, swap_out_asset_id, swap_in_amount, max_hops=DEFAULT_MAX_HOPS):
+        """Returns the route quote through the pools of the snapshot with the largest output amount, see
+        :func:`get_best_route_quote`
+
+        :param swap_in_asset_id: id of the asset to swap in
+        :type swap_in_asset_id: int
+        :param swap_out_asset_id: id of the asset to swap out
+        :type swap_out_asset_id: int
+        :param swap_in_amount: amount to swap in
+        :type swap_in_amount: int
+        :param max_hops: maximum number of pools in a route
+        :type max_hops: int, optional
+        :return: best route quote, or None if no route exists
+        :rtype: :class:`RouteQuote`
+        """
+
+        routes = get_routes(self.get_pools(), swap_in_asset_id, swap_out_asset_id, max_hops)
+        return get_best_route_quote(None, swap_in_asset_id, swap_out_asset_id, swap_in_amount, routes=routes)
+
+
+def get_pool_snapshot(algod_client, pools, creators, max_workers=DEFAULT_MAX_WORKERS, max_retries=DEFAULT_MAX_RETRIES):
+    """Reads the state of many pools at a single round. Global states are read from the created apps of the
+    accounts which created the pools, because account_info responses carry the round they were read at while
+    application_info responses do not. Accounts are fetched concurrently, pools sharing a creator are read
+    together, and only the accounts read at an older round than the latest one are refetched.
+
+    :param algod_client: a :class:`AlgodClient` object for interacting with the network
+    :type algod_client: :class:`AlgodClient`
+    :param pools: pools to read
+    :type pools: list
+    :param creators: dict of application id -> creator address, filled in place for pools not in it
+    :type creators: dict
+    :param max_workers: maximum number of concurrent requests
+    :type max_workers: int, optional
+    :param max_retries: maximum number of refetches before giving up
+    :type max_retries: int, optional
+    :return: snapshot of the pools
+    :rtype: :class:`PoolSnapshot`
+    """
+
+    missing = [pool.application_id for pool in pools if pool.application_id not in creators]
+    if len(missing) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+            application_infos = list(executor.map(algod_client.application_info, missing))
+    else:
+        application_infos = [algod_client.application_info(app_id) for app_id in missing]
+    for app_id, application_info in zip(missing, application_infos):
+        creators[app_id] = application_info["params"]["creator"]
+
+    addresses = list(set(creators[pool.application_id] for pool in pools))
+    account_infos = get_account_infos(algod_client, addresses, max_workers=max_workers)
+    for retry in range(max_retries + 1):
+        target_round = max([account_info.get("round", 0) for account_info in account_infos.values()], default=0)
+        stale = [address for address, account_info in account_infos.items() if account_info.get("round", 0) != target_round]
+        if not stale:
+            break
+        if retry == max_retries:
+            raise Exception("Could not read all pools at one round in %d retries" % max_retries)
+        account_infos.update(get_account_infos(algod_client, stale, max_workers=max_workers))
+
+    # application id -> encoded global state
+    global_states = {}
+    for account_info in account_infos.values():
+        for app in account_info.get("created-apps", None) or []:
+            global_states[app["id"]] = app["params"].get("global-state", None) or []
+
+    t = 0
+    if any(pool.pool_type == PoolType.NANOSWAP for pool in pools):
+        t = algod_client.block_info(target_round)["block"]["ts"]
+
+    table = PoolTable()
+    for pool in pools:
+        if pool.application_id not in global_states:
+            raise Exception("Pool application %d not found in the account of its creator" % pool.application_id)
+        table.set_global_state(pool.application_id, pool.pool_type, pool.asset1.asset_id, pool.asset2.asset_id,
+                               format_global_state(global_states[pool.application_id]), t)
+    return PoolSnapshot(table, target_round, t)
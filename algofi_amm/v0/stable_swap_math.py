@@ -3,6 +3,22 @@ from typing import List, Tuple
 A_PRECISION = 1000000
 
 
+def isqrt(n: int) -> int:
+    """Returns the integer square root of n (math.isqrt is not available on python 3.7)
+    """
+
+    if n < 0:
+        raise ValueError("isqrt of negative number")
+    if n == 0:
+        return 0
+    x = 1 << ((n.bit_length() + 1) // 2)
+    while True:
+        y = (x + n // x) // 2
+        if y >= x:
+            return x
+        x = y
+
+
 def get_D(token_amounts: List[int], amplification_factor: int) -> Tuple[int, int]:
     N_COINS = len(token_amounts)
     S = 0
@@ -74,4 +90,32 @@ def get_y(
         else:
             if y_prev - y <= 1:
                 return int(y), _i
-    raise
\ No newline at end of file
+    raise
+
+def get_y_for_ratio(D: int, amplification_factor: int, ratio_numerator: int, ratio_denominator: int) -> Tuple[int, int]:
+    """Returns the balance y of a two coin stableswap pool with invariant D at which the balance ratio x / y equals
+    ratio_numerator / ratio_denominator, found with an integer newton method on the invariant. Starts from the
+    constant product solution, which is an upper bound, so the iterates decrease monotonically onto the root.
+    """
+
+    p = ratio_numerator
+    q = ratio_denominator
+    assert p > 0 and q > 0
+    Ann = amplification_factor * 4
+
+    def invariant(y):
+        return 4 * p * y * y * (Ann * ((p + q) * y - q * D) + q * A_PRECISION * D) - q * q * A_PRECISION * D * D * D
+
+    def invariant_derivative(y):
+        return 8 * p * y * (Ann * ((p + q) * y - q * D) + q * A_PRECISION * D) + 4 * p * y * y * Ann * (p + q)
+
+    # constant product solution, x * y = D^2 / 4
+    y = isqrt(D * D * q // (4 * p)) + 1
+    for _i in range(255):
+        step = invariant(y) // invariant_derivative(y)
+        if step <= 0:
+            while y > 1 and invariant(y - 1) >= 0:
+                y -= 1
+            return int(y), _i
+        y -= step
+    raise
@@ -0,0 +1,1355 @@
+
+import copy
+from base64 import b64decode
+from functools import lru_cache
+from algosdk import encoding
+from algosdk.logic import get_application_address
+from .config import ALGO_ASSET_ID, PoolType, get_approval_program_by_pool_type
+from .balance_delta import BalanceDelta
+from .fee_model import MIN_TXN_FEE, APP_CALL_OPCODE_BUDGET
+from .stable_swap_math import isqrt
+from ..utils import TransactionGroup
+
+# largest uint64
+MAX_UINT64 = 2**64 - 1
+
+# protocol limits enforced by the evaluator
+MIN_BALANCE = 100000
+MAX_INNER_TRANSACTIONS = 16
+MAX_BYTES_LENGTH = 4096
+MAX_KEY_LENGTH = 64
+MAX_CALLSUB_DEPTH = 1024
+MAX_STACK_DEPTH = 1000
+
+# asset ids given to assets created by inner transactions
+FIRST_CREATED_ASSET_ID = 2**62
+
+ZERO_ADDRESS = bytes(32)
+
+# transaction type enums
+TYPE_ENUMS = {"pay": 1, "keyreg": 2, "acfg": 3, "axfer": 4, "afrz": 5, "appl": 6}
+TYPE_NAMES = {type_enum: type_name for type_name, type_enum in TYPE_ENUMS.items()}
+
+# transaction fields (txn, gtxn, gtxns, itxn_field)
+SENDER = 0
+FEE = 1
+RECEIVER = 7
+AMOUNT = 8
+CLOSE_REMAINDER_TO = 9
+TYPE = 15
+TYPE_ENUM = 16
+XFER_ASSET = 17
+ASSET_AMOUNT = 18
+ASSET_SENDER = 19
+ASSET_RECEIVER = 20
+ASSET_CLOSE_TO = 21
+GROUP_INDEX = 22
+APPLICATION_ID = 24
+ON_COMPLETION = 25
+APPLICATION_ARGS = 26
+NUM_APP_ARGS = 27
+ACCOUNTS = 28
+NUM_ACCOUNTS = 29
+CONFIG_ASSET = 33
+CONFIG_ASSET_TOTAL = 34
+CONFIG_ASSET_DECIMALS = 35
+CONFIG_ASSET_DEFAULT_FROZEN = 36
+CONFIG_ASSET_UNIT_NAME = 37
+CONFIG_ASSET_NAME = 38
+CONFIG_ASSET_URL = 39
+CONFIG_ASSET_METADATA_HASH = 40
+CONFIG_ASSET_MANAGER = 41
+CONFIG_ASSET_RESERVE = 42
+CONFIG_ASSET_FREEZE = 43
+CONFIG_ASSET_CLAWBACK = 44
+ASSETS = 48
+NUM_ASSETS = 49
+APPLICATIONS = 50
+NUM_APPLICATIONS = 51
+GLOBAL_NUM_UINT = 52
+GLOBAL_NUM_BYTE_SLICE = 53
+LOCAL_NUM_UINT = 54
+LOCAL_NUM_BYTE_SLICE = 55
+CREATED_ASSET_ID = 60
+
+# asset config fields of inner transactions mapped to asset params fields
+ASSET_CONFIG_PARAMS = {CONFIG_ASSET_TOTAL: 0, CONFIG_ASSET_DECIMALS: 1, CONFIG_ASSET_DEFAULT_FROZEN: 2, CONFIG_ASSET_UNIT_NAME: 3,
+                       CONFIG_ASSET_NAME: 4, CONFIG_ASSET_URL: 5, CONFIG_ASSET_METADATA_HASH: 6, CONFIG_ASSET_MANAGER: 7,
+                       CONFIG_ASSET_RESERVE: 8, CONFIG_ASSET_FREEZE: 9, CONFIG_ASSET_CLAWBACK: 10}
+
+# asset params fields (asset_params_get)
+ASSET_CREATOR = 11
+
+# global fields
+GLOBAL_MIN_TXN_FEE = 0
+GLOBAL_MIN_BALANCE = 1
+GLOBAL_ZERO_ADDRESS = 3
+GLOBAL_GROUP_SIZE = 4
+GLOBAL_LOGIC_SIG_VERSION = 5
+GLOBAL_ROUND = 6
+GLOBAL_LATEST_TIMESTAMP = 7
+GLOBAL_CURRENT_APPLICATION_ID = 8
+GLOBAL_CREATOR_ADDRESS = 9
+GLOBAL_CURRENT_APPLICATION_ADDRESS = 10
+GLOBAL_GROUP_ID = 11
+
+# number of immediate bytes of opcodes with fixed size immediates
+IMMEDIATE_SIZES = {0x05: 1, 0x06: 1, 0x07: 1, 0x21: 1, 0x27: 1, 0x2c: 1, 0x31: 1, 0x32: 1, 0x33: 2, 0x34: 1, 0x35: 1, 0x36: 2,
+                   0x37: 3, 0x38: 1, 0x39: 2, 0x3a: 2, 0x3b: 1, 0x3c: 1, 0x40: 2, 0x41: 2, 0x42: 2, 0x4b: 1, 0x4e: 1,
+                   0x4f: 1, 0x51: 2, 0x57: 2, 0x70: 1, 0x71: 1, 0x72: 1, 0x88: 2, 0xb2: 1, 0xb4: 1, 0xb5: 2, 0xc0: 1,
+                   0xc1: 2, 0xc2: 1}
+
+# opcodes whose immediate is a signed 16 bit branch offset
+BRANCH_OPCODES = frozenset([0x40, 0x41, 0x42, 0x88])
+
+# opcode costs which differ from 1
+OPCODE_COSTS = {0x1f: 20, 0x92: 4}
+
+
+class EvaluationError(Exception):
+    pass
+
+
+def _read_uvarint(program, i):
+    value = 0
+    shift = 0
+    while True:
+        if i >= len(program):
+            raise EvaluationError("truncated varuint")
+        byte = program[i]
+        i += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, i
+
+
+class DecodedProgram():
+
+    def __init__(self, program):
+        """Constructor method for :class:`DecodedProgram`, a TEAL program decoded into instructions with branch
+        targets resolved to instruction indices
+
+        :param program: program bytecode
+        :type program: bytes
+        """
+
+        if not program:
+            raise EvaluationError("empty program")
+        self.version = program[0]
+        self.opcodes = []
+        self.immediates = []
+        self.pcs = []
+        branches = []
+        i = 1
+        while i < len(program):
+            pc = i
+            opcode = program[i]
+            i += 1
+            if opcode == 0x20:
+                count, i = _read_uvarint(program, i)
+                immediate = []
+                for _ in range(count):
+                    value, i = _read_uvarint(program, i)
+                    immediate.append(value)
+            elif opcode == 0x26:
+                count, i = _read_uvarint(program, i)
+                immediate = []
+                for _ in range(count):
+                    length, i = _read_uvarint(program, i)
+                    immediate.append(bytes(program[i:i + length]))
+                    i += length
+            elif opcode == 0x80:
+                length, i = _read_uvarint(program, i)
+                immediate = bytes(program[i:i + length])
+                i += length
+            elif opcode == 0x81:
+                immediate, i = _read_uvarint(program, i)
+            elif opcode in BRANCH_OPCODES:
+                offset = int.from_bytes(program[i:i + 2], "big", signed=True)
+                i += 2
+                immediate = i + offset
+                branches.append(len(self.opcodes))
+            else:
+                size = IMMEDIATE_SIZES.get(opcode, 0)
+                immediate = program[i] if size == 1 else tuple(program[i:i + size])
+                i += size
+            self.opcodes.append(opcode)
+            self.immediates.append(immediate)
+            self.pcs.append(pc)
+
+        # resolve branch targets to instruction indices, the end of the program is a valid target
+        indices = {pc: index for index, pc in enumerate(self.pcs)}
+        indices[len(program)] = len(self.opcodes)
+        for index in branches:
+            target = indices.get(self.immediates[index], None)
+            if target is None:
+                raise EvaluationError("branch at pc %d to invalid target %d" % (self.pcs[index], self.immediates[index]))
+            self.immediates[index] = target
+
+        # handlers and costs are looked up once per program instead of once per executed instruction
+        self.handlers = [OPCODE_HANDLERS.get(opcode, _op_unsupported) for opcode in self.opcodes]
+        self.costs = [OPCODE_COSTS.get(opcode, 1) for opcode in self.opcodes]
+
+
+# decoded programs keyed by bytecode
+_decoded_programs = {}
+
+
+def decode_program(program):
+    """Returns the decoded program, decoding each distinct program once
+
+    :param program: program bytecode
+    :type program: bytes
+    :return: decoded program
+    :rtype: :class:`DecodedProgram`
+    """
+
+    decoded = _decoded_programs.get(program, None)
+    if decoded is None:
+        decoded = DecodedProgram(program)
+        _decoded_programs[program] = decoded
+    return decoded
+
+
+def _decode_global_state(global_state):
+    state = {}
+    for keyvalue in global_state:
+        value = keyvalue["value"]
+        state[b64decode(keyvalue["key"])] = value.get("uint", 0) if value["type"] == 2 else b64decode(value.get("bytes", ""))
+    return state
+
+
+# addresses are converted many times per group, base32 and checksums are cached
+@lru_cache(maxsize=4096)
+def _encode_address(address_bytes):
+    return encoding.encode_address(address_bytes)
+
+
+@lru_cache(maxsize=4096)
+def _decode_address(address):
+    return encoding.decode_address(address)
+
+
+@lru_cache(maxsize=4096)
+def _get_application_address(app_id):
+    return get_application_address(app_id)
+
+
+def _get_address_bytes(address):
+    if address is None:
+        return ZERO_ADDRESS
+    if isinstance(address, bytes):
+        return address
+    return _decode_address(address)
+
+
+class LedgerState():
+
+    def __init__(self, latest_timestamp=0, round_num=0):
+        """Constructor method for :class:`LedgerState`, the in-memory model of applications, balances and assets
+        that groups are evaluated against
+
+        :param latest_timestamp: timestamp of the latest block
+        :type latest_timestamp: int, optional
+        :param round_num: latest round
+        :type round_num: int, optional
+        """
+
+        self.latest_timestamp = latest_timestamp
+        self.round = round_num
+        # (address, asset id) -> amount, microalgos are held as ALGO_ASSET_ID
+        self.balances = {}
+        # app id -> approval program bytecode
+        self.programs = {}
+        # app id -> global state keyed by bytes
+        self.global_states = {}
+        # asset id -> asset params keyed by asset params field
+        self.asset_params = {}
+        self.next_asset_id = FIRST_CREATED_ASSET_ID
+
+    def copy(self):
+        """Returns a copy of the ledger, programs are shared
+
+        :return: copied ledger
+        :rtype: :class:`LedgerState`
+        """
+
+        ledger = copy.copy(self)
+        ledger.balances = dict(self.balances)
+        ledger.programs = dict(self.programs)
+        ledger.global_states = {app_id: dict(state) for app_id, state in self.global_states.items()}
+        ledger.asset_params = {asset_id: dict(params) for asset_id, params in self.asset_params.items()}
+        return ledger
+
+    def get_balance(self, address, asset_id=ALGO_ASSET_ID):
+        """Returns the balance of an address, None if it is not opted into the asset
+
+        :param address: account address
+        :type address: str
+        :param asset_id: asset id, ALGO_ASSET_ID for microalgos
+        :type asset_id: int, optional
+        :return: balance
+        :rtype: int
+        """
+
+        balance = self.balances.get((address, asset_id), None)
+        if balance is None and asset_id == ALGO_ASSET_ID:
+            return 0
+        return balance
+
+    def set_balance(self, address, asset_id, amount):
+        """Sets the balance of an address, which opts it into the asset
+
+        :param address: account address
+        :type address: str
+        :param asset_id: asset id, ALGO_ASSET_ID for microalgos
+        :type asset_id: int
+        :param amount: balance
+        :type amount: int
+        """
+
+        self.balances[(address, asset_id)] = amount
+
+    def set_application(self, app_id, program, global_state):
+        """Sets the approval program and global state of an application
+
+        :param app_id: application id
+        :type app_id: int
+        :param program: approval program bytecode, None for applications which are only read
+        :type program: bytes
+        :param global_state: global state keyed by bytes or str
+        :type global_state: dict
+        """
+
+        if program is not None:
+            self.programs[app_id] = program
+        self.global_states[app_id] = {(key.encode("utf-8") if isinstance(key, str) else key): value for key, value in global_state.items()}
+
+    def set_asset_params(self, asset_id, total=0, decimals=0, unit_name=b"", name=b"", url=b"", creator=None):
+        """Sets the params of an asset
+
+        :param asset_id: asset id
+        :type asset_id: int
+        :param total: total supply
+        :type total: int, optional
+        :param decimals: decimals
+        :type decimals: int, optional
+        :param unit_name: unit name
+        :type unit_name: bytes, optional
+        :param name: name
+        :type name: bytes, optional
+        :param url: url
+        :type url: bytes, optional
+        :param creator: creator address
+        :type creator: str, optional
+        """
+
+        self.asset_params[asset_id] = {0: total, 1: decimals, 2: 0, 3: unit_name, 4: name, 5: url, 6: b"", 7: ZERO_ADDRESS,
+                                       8: ZERO_ADDRESS, 9: ZERO_ADDRESS, 10: ZERO_ADDRESS, ASSET_CREATOR: _get_address_bytes(creator)}
+
+    def load_application(self, algod_client, app_id, program=None):
+        """Loads the global state, and unless given the approval program, of an application from algod
+
+        :param algod_client: a :class:`AlgodClient` object for interacting with the network
+        :type algod_client: :class:`AlgodClient`
+        :param app_id: application id
+        :type app_id: int
+        :param program: approval program bytecode, fetched if not specified
+        :type program: bytes, optional
+        """
+
+        params = algod_client.application_info(app_id)["params"]
+        if program is None and params.get("approval-program", None):
+            program = b64decode(params["approval-program"])
+        self.set_application(app_id, program, _decode_global_state(params.get("global-state", [])))
+
+    def load_account(self, algod_client, address):
+        """Loads the algo and asset balances of an account from algod
+
+        :param algod_client: a :class:`AlgodClient` object for interacting with the network
+        :type algod_client: :class:`AlgodClient`
+        :param address: account address
+        :type address: str
+        """
+
+        account_info = algod_client.account_info(address)
+        self.set_balance(address, ALGO_ASSET_ID, account_info["amount"])
+        for asset in account_info.get("assets", []):
+            self.set_balance(address, asset["asset-id"], asset["amount"])
+
+    def load_asset(self, algod_client, asset_id):
+        """Loads the params of an asset from algod
+
+        :param algod_client: a :class:`AlgodClient` object for interacting with the network
+        :type algod_client: :class:`AlgodClient`
+        :param asset_id: asset id
+        :type asset_id: int
+        """
+
+        params = algod_client.asset_info(asset_id)["params"]
+        self.set_asset_params(asset_id, total=params.get("total", 0), decimals=params.get("decimals", 0),
+                              unit_name=params.get("unit-name", "").encode("utf-8"), name=params.get("name", "").encode("utf-8"),
+                              url=params.get("url", "").encode("utf-8"), creator=params.get("creator", None))
+
+    @classmethod
+    def from_pool(cls, pool, accounts=None):
+        """Loads the ledger needed to evaluate groups against a pool: the pool and manager applications, the pool
+        account, the pool assets and the given accounts. The bundled approval program is used for the pool.
+
+        :param pool: pool to load
+        :type pool: :class:`Pool`
+        :param accounts: addresses of the senders of the evaluated groups
+        :type accounts: list, optional
+        :return: ledger
+        :rtype: :class:`LedgerState`
+        """
+
+        algod = pool.algod
+        program = None
+        if pool.pool_type != PoolType.NANOSWAP:
+            program = get_approval_program_by_pool_type(pool.pool_type, pool.network)
+        status = algod.status()
+        ledger = cls(algod.block_info(status["last-round"])["block"]["ts"], status["last-round"])
+        ledger.load_application(algod, pool.application_id, program)
+        ledger.load_application(algod, pool.manager_application_id)
+        for address in [pool.address] + list(accounts or []):
+            ledger.load_account(algod, address)
+        for asset_id in (pool.asset1.asset_id, pool.asset2.asset_id, pool.lp_asset_id):
+            if asset_id != ALGO_ASSET_ID:
+                ledger.load_asset(algod, asset_id)
+        return ledger
+
+
+def get_transaction_fields(txn, group_index):
+    """Returns the fields of an algosdk transaction keyed by TEAL transaction field
+
+    :param txn: unsigned or signed transaction
+    :type txn: :class:`Transaction`
+    :param group_index: index of the transaction in its group
+    :type group_index: int
+    :return: dict of field -> value
+    :rtype: dict
+    """
+
+    txn = getattr(txn, "transaction", txn)
+    type_name = txn.type
+    fields = {SENDER: _get_address_bytes(txn.sender), FEE: txn.fee, TYPE: type_name.encode("utf-8"),
+              TYPE_ENUM: TYPE_ENUMS.get(type_name, 0), GROUP_INDEX: group_index}
+    if type_name == "pay":
+        fields[RECEIVER] = _get_address_bytes(txn.receiver)
+        fields[AMOUNT] = txn.amt
+        fields[CLOSE_REMAINDER_TO] = _get_address_bytes(txn.close_remainder_to)
+    elif type_name == "axfer":
+        fields[XFER_ASSET] = txn.index
+        fields[ASSET_AMOUNT] = txn.amount
+        fields[ASSET_SENDER] = _get_address_bytes(txn.revocation_target)
+        fields[ASSET_RECEIVER] = _get_address_bytes(txn.receiver)
+        fields[ASSET_CLOSE_TO] = _get_address_bytes(txn.close_assets_to)
+    elif type_name == "appl":
+        app_args = [arg.encode("utf-8") if isinstance(arg, str) else bytes(arg) for arg in (txn.app_args or [])]
+        accounts = [_get_address_bytes(account) for account in (txn.accounts or [])]
+        fields[APPLICATION_ID] = txn.index or 0
+        fields[ON_COMPLETION] = int(txn.on_complete)
+        fields[APPLICATION_ARGS] = app_args
+        fields[NUM_APP_ARGS] = len(app_args)
+        fields[ACCOUNTS] = accounts
+        fields[NUM_ACCOUNTS] = len(accounts)
+        fields[ASSETS] = list(txn.foreign_assets or [])
+        fields[NUM_ASSETS] = len(fields[ASSETS])
+        fields[APPLICATIONS] = list(txn.foreign_apps or [])
+        fields[NUM_APPLICATIONS] = len(fields[APPLICATIONS])
+        global_schema = txn.global_schema
+        local_schema = txn.local_schema
+        fields[GLOBAL_NUM_UINT] = global_schema.num_uints or 0 if global_schema else 0
+        fields[GLOBAL_NUM_BYTE_SLICE] = global_schema.num_byte_slices or 0 if global_schema else 0
+        fields[LOCAL_NUM_UINT] = local_schema.num_uints or 0 if local_schema else 0
+        fields[LOCAL_NUM_BYTE_SLICE] = local_schema.num_byte_slices or 0 if local_schema else 0
+    return fields
+
+
+# default values of fields which are not set on a transaction
+def _get_field(fields, field):
+    value = fields.get(field, None)
+    if value is None:
+        if field in (RECEIVER, CLOSE_REMAINDER_TO, ASSET_SENDER, ASSET_RECEIVER, ASSET_CLOSE_TO, CONFIG_ASSET_MANAGER,
+                     CONFIG_ASSET_RESERVE, CONFIG_ASSET_FREEZE, CONFIG_ASSET_CLAWBACK):
+            return ZERO_ADDRESS
+        if field in (TYPE, CONFIG_ASSET_UNIT_NAME, CONFIG_ASSET_NAME, CONFIG_ASSET_URL, CONFIG_ASSET_METADATA_HASH):
+            return b""
+        if field in (APPLICATION_ARGS, ACCOUNTS, ASSETS, APPLICATIONS):
+            raise EvaluationError("txn field %d is not an array of this transaction" % field)
+        return 0
+    return value
+
+
+class EvaluationResult():
+
+    def __init__(self, ledger_before, ledger, transactions, passed, error=None, failed_index=None, pc=None, costs=None,
+                 inner_transactions=None):
+        """Constructor method for :class:`EvaluationResult`
+
+        :param ledger_before: ledger the group was evaluated against
+        :type ledger_before: :class:`LedgerState`
+        :param ledger: ledger after the group, equal to ledger_before if the group failed
+        :type ledger: :class:`LedgerState`
+        :param transactions: fields of the transactions of the group
+        :type transactions: list
+        :param passed: whether the group would be approved
+        :type passed: bool
+        :param error: reason the group failed
+        :type error: str, optional
+        :param failed_index: index of the failed transaction
+        :type failed_index: int, optional
+        :param pc: program counter of the failed instruction
+        :type pc: int, optional
+        :param costs: opcode cost of each transaction, None for transactions which are not application calls
+        :type costs: list, optional
+        :param inner_transactions: fields of the inner transactions submitted by each transaction
+        :type inner_transactions: list, optional
+        """
+
+        self.ledger_before = ledger_before
+        self.ledger = ledger
+        self.transactions = transactions
+        self.passed = passed
+        self.error = error
+        self.failed_index = failed_index
+        self.pc = pc
+        self.costs = costs or []
+        self.cost = sum(cost for cost in self.costs if cost)
+        self.inner_transactions = inner_transactions or []
+
+    def __str__(self):
+        """Returns a string representation of the :class:`EvaluationResult` object
+        """
+
+        if self.passed:
+            return "EvaluationResult(passed, cost={})".format(self.cost)
+        return "EvaluationResult(failed at txn {} pc {}: {})".format(self.failed_index, self.pc, self.error)
+
+    def get_fees_paid(self, address):
+        """Returns the fees paid by an address for the outer transactions of the group
+
+        :param address: account address
+        :type address: str
+        :return: fees in microalgos
+        :rtype: int
+        """
+
+        address = _get_address_bytes(address)
+        return sum(fields[FEE] for fields in self.transactions if fields[SENDER] == address)
+
+    def get_balance_changes(self, address):
+        """Returns the changes of the balances of an address, fees included
+
+        :param address: account address
+        :type address: str
+        :return: dict of asset id -> change
+        :rtype: dict
+        """
+
+        changes = {}
+        for (balance_address, asset_id) in set(self.ledger_before.balances) | set(self.ledger.balances):
+            if balance_address != address:
+                continue
+            change = (self.ledger.balances.get((address, asset_id), 0) or 0) - (self.ledger_before.balances.get((address, asset_id), 0) or 0)
+            if change:
+                changes[asset_id] = change
+        return changes
+
+    def get_balance_delta(self, pool, address):
+        """Returns the change of the balances of an address in the assets and lp token of a pool, excluding fees,
+        in the form of the quotes of :class:`Pool`
+
+        :param pool: pool
+        :type pool: :class:`Pool`
+        :param address: account address
+        :type address: str
+        :return: balance delta of the address
+        :rtype: :class:`BalanceDelta`
+        """
+
+        changes = self.get_balance_changes(address)
+        changes[ALGO_ASSET_ID] = changes.get(ALGO_ASSET_ID, 0) + self.get_fees_paid(address)
+        return BalanceDelta(pool, changes.get(pool.asset1.asset_id, 0), changes.get(pool.asset2.asset_id, 0),
+                            changes.get(pool.lp_asset_id, 0))
+
+    def get_global_state_changes(self, app_id):
+        """Returns the changes of the global state of an application
+
+        :param app_id: application id
+        :type app_id: int
+        :return: dict of key -> (old value, new value)
+        :rtype: dict
+        """
+
+        before = self.ledger_before.global_states.get(app_id, {})
+        after = self.ledger.global_states.get(app_id, {})
+        changes = {}
+        for key in set(before) | set(after):
+            if before.get(key, None) != after.get(key, None):
+                changes[key.decode("utf-8", "replace")] = (before.get(key, None), after.get(key, None))
+        return changes
+
+
+class _GroupEvaluation():
+
+    def __init__(self, ledger, transactions):
+        self.ledger = ledger
+        self.transactions = transactions
+        self.scratch_spaces = [None] * len(transactions)
+        self.inner_transactions = [[] for _ in transactions]
+        self.fee_credit = sum(fields[FEE] for fields in transactions) - MIN_TXN_FEE * len(transactions)
+        self.budget = APP_CALL_OPCODE_BUDGET * sum(1 for fields in transactions if fields[TYPE_ENUM] == 6)
+        self.cost = 0
+
+    def move(self, sender, receiver, asset_id, amount):
+        ledger = self.ledger
+        sender_balance = ledger.get_balance(sender, asset_id)
+        if sender_balance is None:
+            raise EvaluationError("sender %s is not opted into asset %d" % (sender, asset_id))
+        if sender_balance < amount:
+            raise EvaluationError("overspend of asset %d by %s (balance %d, amount %d)" % (asset_id, sender, sender_balance, amount))
+        receiver_balance = ledger.get_balance(receiver, asset_id)
+        if receiver_balance is None:
+            raise EvaluationError("receiver %s is not opted into asset %d" % (receiver, asset_id))
+        ledger.balances[(sender, asset_id)] = sender_balance - amount
+        ledger.balances[(receiver, asset_id)] = ledger.balances.get((receiver, asset_id), 0) + amount
+
+    def close(self, sender, close_to, asset_id):
+        remaining = self.ledger.get_balance(sender, asset_id) or 0
+        self.move(sender, close_to, asset_id, remaining)
+        if asset_id == ALGO_ASSET_ID:
+            self.ledger.balances[(sender, asset_id)] = 0
+        else:
+            del self.ledger.balances[(sender, asset_id)]
+
+    def pay_fee(self, sender, fee):
+        balance = self.ledger.get_balance(sender)
+        if balance < fee:
+            raise EvaluationError("overspend of fee by %s" % sender)
+        self.ledger.balances[(sender, ALGO_ASSET_ID)] = balance - fee
+
+    def apply_transfer(self, fields, app_address=None):
+        """Applies a payment, asset transfer or asset creation, returns the created asset id"""
+
+        type_enum = fields.get(TYPE_ENUM, 0)
+        sender = _encode_address(fields.get(SENDER, ZERO_ADDRESS))
+        self.pay_fee(sender, fields.get(FEE, 0))
+
+        if type_enum == 1:
+            self.move(sender, _encode_address(_get_field(fields, RECEIVER)), ALGO_ASSET_ID, fields.get(AMOUNT, 0))
+            close_to = _get_field(fields, CLOSE_REMAINDER_TO)
+            if close_to != ZERO_ADDRESS:
+                self.close(sender, _encode_address(close_to), ALGO_ASSET_ID)
+        elif type_enum == 4:
+            if _get_field(fields, ASSET_SENDER) != ZERO_ADDRESS:
+                raise EvaluationError("clawback transfers are not supported")
+            asset_id = fields.get(XFER_ASSET, 0)
+            receiver = _encode_address(_get_field(fields, ASSET_RECEIVER))
+            amount = fields.get(ASSET_AMOUNT, 0)
+            if receiver == sender and amount == 0:
+                if self.ledger.get_balance(sender, asset_id) is None:
+                    self.ledger.set_balance(sender, asset_id, 0)
+            else:
+                self.move(sender, receiver, asset_id, amount)
+            close_to = _get_field(fields, ASSET_CLOSE_TO)
+            if close_to != ZERO_ADDRESS:
+                self.close(sender, _encode_address(close_to), asset_id)
+        elif type_enum == 3 and app_address is not None and not fields.get(CONFIG_ASSET, 0):
+            asset_id = self.ledger.next_asset_id
+            self.ledger.next_asset_id += 1
+            params = {ASSET_CONFIG_PARAMS[field]: _get_field(fields, field) for field in ASSET_CONFIG_PARAMS}
+            params[ASSET_CREATOR] = fields[SENDER]
+            self.ledger.asset_params[asset_id] = params
+            self.ledger.set_balance(sender, asset_id, params[0])
+            return asset_id
+        else:
+            raise EvaluationError("unsupported transaction type %s" % TYPE_NAMES.get(type_enum, type_enum))
+        return None
+
+    def run(self):
+        costs = []
+        for index, fields in enumerate(self.transactions):
+            try:
+                if fields[TYPE_ENUM] == 6:
+                    self.pay_fee(_encode_address(fields[SENDER]), fields[FEE])
+                    call = _ApplicationCall(self, index, fields)
+                    call.run()
+                    self.scratch_spaces[index] = call.scratch
+                    costs.append(call.cost)
+                else:
+                    self.apply_transfer(fields)
+                    costs.append(None)
+            except _ProgramError as e:
+                return index, e.pc, str(e.error), costs
+            except EvaluationError as e:
+                return index, None, str(e), costs
+        return None, None, None, costs
+
+
+class _ProgramError(Exception):
+
+    def __init__(self, error, pc):
+        super().__init__(str(error))
+        self.error = error
+        self.pc = pc
+
+
+def _check_uint(value):
+    if type(value) is not int:
+        raise EvaluationError("expected uint64, got bytes")
+    return value
+
+
+def _check_bytes(value):
+    if type(value) is int:
+        raise EvaluationError("expected bytes, got uint64")
+    return value
+
+
+class _ApplicationCall():
+
+    def __init__(self, group, index, fields):
+        self.group = group
+        self.index = index
+        self.fields = fields
+        self.app_id = fields[APPLICATION_ID]
+        if not self.app_id:
+            raise EvaluationError("application creation is not supported")
+        program = group.ledger.programs.get(self.app_id, None)
+        if program is None:
+            raise EvaluationError("application %d is not loaded" % self.app_id)
+        self.program = decode_program(program)
+        self.app_address = _get_application_address(self.app_id)
+        self.app_address_bytes = _decode_address(self.app_address)
+        self.global_state = group.ledger.global_states.setdefault(self.app_id, {})
+        self.stack = []
+        self.scratch = [0] * 256
+        self.intc = []
+        self.bytec = []
+        self.callstack = []
+        self.inner_fields = None
+        self.last_inner_fields = None
+        self.num_inner_transactions = 0
+        self.cost = 0
+
+    def run(self):
+        program = self.program
+        handlers = program.handlers
+        costs = program.costs
+        immediates = program.immediates
+        num_instructions = len(handlers)
+        stack = self.stack
+        group = self.group
+        remaining_budget = group.budget - group.cost
+        cost = 0
+        index = 0
+        try:
+            while index < num_instructions:
+                cost += costs[index]
+                if cost > remaining_budget:
+                    raise EvaluationError("dynamic cost budget exceeded (budget %d)" % group.budget)
+                next_index = handlers[index](self, immediates[index], index)
+                if next_index is None:
+                    index += 1
+                elif next_index < 0:
+                    return
+                else:
+                    index = next_index
+                if len(stack) > MAX_STACK_DEPTH:
+                    raise EvaluationError("stack overflow")
+            if len(stack) != 1:
+                raise EvaluationError("stack must contain exactly one value at the end of the program")
+            if not _check_uint(stack[0]):
+                raise EvaluationError("rejected")
+        except IndexError:
+            raise _ProgramError(EvaluationError("stack underflow"), program.pcs[min(index, num_instructions - 1)])
+        except EvaluationError as e:
+            raise _ProgramError(e, program.pcs[min(index, num_instructions - 1)] if num_instructions else 0)
+        finally:
+            self.cost = cost
+            group.cost += cost
+
+    # helpers
+
+    def pop_uint(self):
+        return _check_uint(self.stack.pop())
+
+    def pop_bytes(self):
+        return _check_bytes(self.stack.pop())
+
+    def get_txn_fields(self, group_index):
+        transactions = self.group.transactions
+        if not 0 <= group_index < len(transactions):
+            raise EvaluationError("group index %d out of range" % group_index)
+        return transactions[group_index]
+
+    def resolve_app(self, value):
+        apps = self.fields[APPLICATIONS]
+        if value == 0:
+            return self.app_id
+        if value <= len(apps):
+            return apps[value - 1]
+        return value
+
+    def resolve_asset(self, value):
+        assets = self.fields[ASSETS]
+        if value < len(assets):
+            return assets[value]
+        return value
+
+    def resolve_account(self, value):
+        if type(value) is int:
+            if value == 0:
+                return _encode_address(self.fields[SENDER])
+            accounts = self.fields[ACCOUNTS]
+            if value > len(accounts):
+                raise EvaluationError("invalid account index %d" % value)
+            return _encode_address(accounts[value - 1])
+        if len(value) != 32:
+            raise EvaluationError("invalid address")
+        return _encode_address(value)
+
+    def get_global(self, field):
+        group = self.group
+        if field == GLOBAL_MIN_TXN_FEE:
+            return MIN_TXN_FEE
+        if field == GLOBAL_MIN_BALANCE:
+            return MIN_BALANCE
+        if field == GLOBAL_ZERO_ADDRESS:
+            return ZERO_ADDRESS
+        if field == GLOBAL_GROUP_SIZE:
+            return len(group.transactions)
+        if field == GLOBAL_LOGIC_SIG_VERSION:
+            return self.program.version
+        if field == GLOBAL_ROUND:
+            return group.ledger.round
+        if field == GLOBAL_LATEST_TIMESTAMP:
+            return group.ledger.latest_timestamp
+        if field == GLOBAL_CURRENT_APPLICATION_ID:
+            return self.app_id
+        if field == GLOBAL_CREATOR_ADDRESS:
+            return ZERO_ADDRESS
+        if field == GLOBAL_CURRENT_APPLICATION_ADDRESS:
+            return self.app_address_bytes
+        if field == GLOBAL_GROUP_ID:
+            return bytes(32)
+        raise EvaluationError("unsupported global field %d" % field)
+
+
+def _binary_uint(operation):
+    def handler(call, immediate, index):
+        stack = call.stack
+        b = _check_uint(stack.pop())
+        a = _check_uint(stack.pop())
+        stack.append(operation(a, b))
+    return handler
+
+
+def _add(a, b):
+    result = a + b
+    if result > MAX_UINT64:
+        raise EvaluationError("+ overflowed")
+    return result
+
+
+def _sub(a, b):
+    if b > a:
+        raise EvaluationError("- would result negative")
+    return a - b
+
+
+def _mul(a, b):
+    result = a * b
+    if result > MAX_UINT64:
+        raise EvaluationError("* overflowed")
+    return result
+
+
+def _div(a, b):
+    if b == 0:
+        raise EvaluationError("/ by zero")
+    return a // b
+
+
+def _mod(a, b):
+    if b == 0:
+        raise EvaluationError("% by zero")
+    return a % b
+
+
+def _op_unsupported(call, immediate, index):
+    raise EvaluationError("unsupported opcode 0x%02x" % call.program.opcodes[index])
+
+
+def _op_err(call, immediate, index):
+    raise EvaluationError("err opcode executed")
+
+
+def _op_equal(call, immediate, index):
+    stack = call.stack
+    b = stack.pop()
+    a = stack.pop()
+    if type(a) is not type(b):
+        raise EvaluationError("cannot compare uint64 to bytes")
+    stack.append(1 if a == b else 0)
+
+
+def _op_not_equal(call, immediate, index):
+    stack = call.stack
+    b = stack.pop()
+    a = stack.pop()
+    if type(a) is not type(b):
+        raise EvaluationError("cannot compare uint64 to bytes")
+    stack.append(1 if a != b else 0)
+
+
+def _op_not(call, immediate, index):
+    call.stack.append(1 if call.pop_uint() == 0 else 0)
+
+
+def _op_len(call, immediate, index):
+    call.stack.append(len(call.pop_bytes()))
+
+
+def _op_itob(call, immediate, index):
+    call.stack.append(call.pop_uint().to_bytes(8, "big"))
+
+
+def _op_btoi(call, immediate, index):
+    value = call.pop_bytes()
+    if len(value) > 8:
+        raise EvaluationError("btoi arg too long")
+    call.stack.append(int.from_bytes(value, "big"))
+
+
+def _op_mulw(call, immediate, index):
+    stack = call.stack
+    b = _check_uint(stack.pop())
+    a = _check_uint(stack.pop())
+    product = a * b
+    stack.append(product >> 64)
+    stack.append(product & MAX_UINT64)
+
+
+def _op_addw(call, immediate, index):
+    stack = call.stack
+    b = _check_uint(stack.pop())
+    a = _check_uint(stack.pop())
+    total = a + b
+    stack.append(total >> 64)
+    stack.append(total & MAX_UINT64)
+
+
+def _op_divmodw(call, immediate, index):
+    stack = call.stack
+    divisor_low = _check_uint(stack.pop())
+    divisor_high = _check_uint(stack.pop())
+    dividend_low = _check_uint(stack.pop())
+    dividend_high = _check_uint(stack.pop())
+    divisor = (divisor_high << 64) | divisor_low
+    if divisor == 0:
+        raise EvaluationError("divmodw by zero")
+    quotient, remainder = divmod((dividend_high << 64) | dividend_low, divisor)
+    stack.append(quotient >> 64)
+    stack.append(quotient & MAX_UINT64)
+    stack.append(remainder >> 64)
+    stack.append(remainder & MAX_UINT64)
+
+
+def _op_intcblock(call, immediate, index):
+    call.intc = immediate
+
+
+def _op_intc(call, immediate, index):
+    call.stack.append(call.intc[immediate])
+
+
+def _intc(i):
+    def handler(call, immediate, index):
+        call.stack.append(call.intc[i])
+    return handler
+
+
+def _op_bytecblock(call, immediate, index):
+    call.bytec = immediate
+
+
+def _op_bytec(call, immediate, index):
+    call.stack.append(call.bytec[immediate])
+
+
+def _bytec(i):
+    def handler(call, immediate, index):
+        call.stack.append(call.bytec[i])
+    return handler
+
+
+def _op_txn(call, immediate, index):
+    call.stack.append(_get_field(call.fields, immediate))
+
+
+def _op_global(call, immediate, index):
+    call.stack.append(call.get_global(immediate))
+
+
+def _op_gtxn(call, immediate, index):
+    call.stack.append(_get_field(call.get_txn_fields(immediate[0]), immediate[1]))
+
+
+def _op_load(call, immediate, index):
+    call.stack.append(call.scratch[immediate])
+
+
+def _op_store(call, immediate, index):
+    call.scratch[immediate] = call.stack.pop()
+
+
+def _get_array_field(fields, field, i):
+    values = _get_field(fields, field)
+    if i >= len(values):
+        raise EvaluationError("array index %d out of range" % i)
+    return values[i]
+
+
+def _op_txna(call, immediate, index):
+    call.stack.append(_get_array_field(call.fields, immediate[0], immediate[1]))
+
+
+def _op_gtxna(call, immediate, index):
+    call.stack.append(_get_array_field(call.get_txn_fields(immediate[0]), immediate[1], immediate[2]))
+
+
+def _op_gtxns(call, immediate, index):
+    call.stack.append(_get_field(call.get_txn_fields(call.pop_uint()), immediate))
+
+
+def _op_gtxnsa(call, immediate, index):
+    call.stack.append(_get_array_field(call.get_txn_fields(call.pop_uint()), immediate[0], immediate[1]))
+
+
+def _load_scratch(call, group_index, slot):
+    if group_index >= call.index:
+        raise EvaluationError("can only load scratch space of earlier transactions")
+    scratch = call.group.scratch_spaces[group_index]
+    if scratch is None:
+        raise EvaluationError("transaction %d is not an application call" % group_index)
+    return scratch[slot]
+
+
+def _op_gload(call, immediate, index):
+    call.stack.append(_load_scratch(call, immediate[0], immediate[1]))
+
+
+def _op_gloads(call, immediate, index):
+    call.stack.append(_load_scratch(call, call.pop_uint(), immediate))
+
+
+def _op_bnz(call, immediate, index):
+    if call.pop_uint() != 0:
+        return immediate
+
+
+def _op_bz(call, immediate, index):
+    if call.pop_uint() == 0:
+        return immediate
+
+
+def _op_b(call, immediate, index):
+    return immediate
+
+
+def _op_return(call, immediate, index):
+    if call.pop_uint() == 0:
+        raise EvaluationError("rejected")
+    return -1
+
+
+def _op_assert(call, immediate, index):
+    if call.pop_uint() == 0:
+        raise EvaluationError("assert failed")
+
+
+def _op_pop(call, immediate, index):
+    call.stack.pop()
+
+
+def _op_dup(call, immediate, index):
+    call.stack.append(call.stack[-1])
+
+
+def _op_dig(call, immediate, index):
+    call.stack.append(call.stack[-1 - immediate])
+
+
+def _op_swap(call, immediate, index):
+    stack = call.stack
+    stack[-1], stack[-2] = stack[-2], stack[-1]
+
+
+def _op_select(call, immediate, index):
+    stack = call.stack
+    c = _check_uint(stack.pop())
+    b = stack.pop()
+    a = stack.pop()
+    stack.append(b if c else a)
+
+
+def _op_concat(call, immediate, index):
+    b = call.pop_bytes()
+    a = call.pop_bytes()
+    if len(a) + len(b) > MAX_BYTES_LENGTH:
+        raise EvaluationError("concat produced a too big byte array")
+    call.stack.append(a + b)
+
+
+def _op_balance(call, immediate, index):
+    address = call.resolve_account(call.stack.pop())
+    call.stack.append(call.group.ledger.get_balance(address))
+
+
+def _op_app_global_get(call, immediate, index):
+    key = call.pop_bytes()
+    call.stack.append(call.global_state.get(key, 0))
+
+
+def _op_app_global_get_ex(call, immediate, index):
+    key = call.pop_bytes()
+    app_id = call.resolve_app(call.pop_uint())
+    state = call.group.ledger.global_states.get(app_id, None)
+    if state is None:
+        raise EvaluationError("application %d is not loaded" % app_id)
+    if key in state:
+        call.stack.append(state[key])
+        call.stack.append(1)
+    else:
+        call.stack.append(0)
+        call.stack.append(0)
+
+
+def _op_app_global_put(call, immediate, index):
+    value = call.stack.pop()
+    key = call.pop_bytes()
+    if len(key) > MAX_KEY_LENGTH:
+        raise EvaluationError("key too long")
+    call.global_state[key] = value
+
+
+def _op_app_global_del(call, immediate, index):
+    call.global_state.pop(call.pop_bytes(), None)
+
+
+def _op_asset_params_get(call, immediate, index):
+    asset_id = call.resolve_asset(call.pop_uint())
+    params = call.group.ledger.asset_params.get(asset_id, None)
+    if params is None:
+        call.stack.append(0)
+        call.stack.append(0)
+    else:
+        if immediate not in params:
+            raise EvaluationError("unsupported asset params field %d" % immediate)
+        call.stack.append(params[immediate])
+        call.stack.append(1)
+
+
+def _op_asset_holding_get(call, immediate, index):
+    asset_id = call.resolve_asset(call.pop_uint())
+    address = call.resolve_account(call.stack.pop())
+    balance = call.group.ledger.get_balance(address, asset_id)
+    if immediate != 0:
+        raise EvaluationError("unsupported asset holding field %d" % immediate)
+    if balance is None:
+        call.stack.append(0)
+        call.stack.append(0)
+    else:
+        call.stack.append(balance)
+        call.stack.append(1)
+
+
+def _op_pushbytes(call, immediate, index):
+    call.stack.append(immediate)
+
+
+def _op_pushint(call, immediate, index):
+    call.stack.append(immediate)
+
+
+def _op_callsub(call, immediate, index):
+    if len(call.callstack) >= MAX_CALLSUB_DEPTH:
+        raise EvaluationError("callsub depth exceeded")
+    call.callstack.append(index + 1)
+    return immediate
+
+
+def _op_retsub(call, immediate, index):
+    if not call.callstack:
+        raise EvaluationError("retsub with empty callstack")
+    return call.callstack.pop()
+
+
+def _op_sqrt(call, immediate, index):
+    call.stack.append(isqrt(call.pop_uint()))
+
+
+def _op_itxn_begin(call, immediate, index):
+    if call.inner_fields is not None:
+        raise EvaluationError("itxn_begin without itxn_submit")
+    if call.num_inner_transactions >= MAX_INNER_TRANSACTIONS:
+        raise EvaluationError("too many inner transactions")
+    credit = max(0, min(call.group.fee_credit, MIN_TXN_FEE))
+    call.inner_fields = {SENDER: call.app_address_bytes, FEE: MIN_TXN_FEE - credit}
+
+
+def _op_itxn_field(call, immediate, index):
+    if call.inner_fields is None:
+        raise EvaluationError("itxn_field without itxn_begin")
+    value = call.stack.pop()
+    if immediate == TYPE:
+        type_enum = TYPE_ENUMS.get(_check_bytes(value).decode("utf-8", "replace"), None)
+        if type_enum is None:
+            raise EvaluationError("unknown inner transaction type")
+        call.inner_fields[TYPE_ENUM] = type_enum
+        value = _check_bytes(value)
+    elif immediate == SENDER and value != call.app_address_bytes:
+        raise EvaluationError("inner transaction sender must be the application account")
+    call.inner_fields[immediate] = value
+
+
+def _op_itxn_submit(call, immediate, index):
+    fields = call.inner_fields
+    if fields is None:
+        raise EvaluationError("itxn_submit without itxn_begin")
+    group = call.group
+    fee = fields.get(FEE, 0)
+    group.fee_credit += fee - MIN_TXN_FEE
+    if group.fee_credit < 0:
+        raise EvaluationError("fee too small to cover inner transactions")
+    created_asset_id = group.apply_transfer(fields, call.app_address)
+    if created_asset_id is not None:
+        fields[CREATED_ASSET_ID] = created_asset_id
+    group.inner_transactions[call.index].append(fields)
+    call.num_inner_transactions += 1
+    call.last_inner_fields = fields
+    call.inner_fields = None
+
+
+def _op_itxn(call, immediate, index):
+    if call.last_inner_fields is None:
+        raise EvaluationError("no inner transaction submitted")
+    call.stack.append(_get_field(call.last_inner_fields, immediate))
+
+
+def _comparison(operation):
+    def handler(call, immediate, index):
+        stack = call.stack
+        b = _check_uint(stack.pop())
+        a = _check_uint(stack.pop())
+        stack.append(1 if operation(a, b) else 0)
+    return handler
+
+
+# opcode -> handler(call, immediate, instruction index) returning the next instruction index, None to continue
+OPCODE_HANDLERS = {
+    0x00: _op_err,
+    0x08: _binary_uint(_add),
+    0x09: _binary_uint(_sub),
+    0x0a: _binary_uint(_div),
+    0x0b: _binary_uint(_mul),
+    0x0c: _comparison(lambda a, b: a < b),
+    0x0d: _comparison(lambda a, b: a > b),
+    0x0e: _comparison(lambda a, b: a <= b),
+    0x0f: _comparison(lambda a, b: a >= b),
+    0x10: _comparison(lambda a, b: a and b),
+    0x11: _comparison(lambda a, b: a or b),
+    0x12: _op_equal,
+    0x13: _op_not_equal,
+    0x14: _op_not,
+    0x15: _op_len,
+    0x16: _op_itob,
+    0x17: _op_btoi,
+    0x18: _binary_uint(_mod),
+    0x19: _binary_uint(lambda a, b: a | b),
+    0x1a: _binary_uint(lambda a, b: a & b),
+    0x1b: _binary_uint(lambda a, b: a ^ b),
+    0x1d: _op_mulw,
+    0x1e: _op_addw,
+    0x1f: _op_divmodw,
+    0x20: _op_intcblock,
+    0x21: _op_intc,
+    0x22: _intc(0),
+    0x23: _intc(1),
+    0x24: _intc(2),
+    0x25: _intc(3),
+    0x26: _op_bytecblock,
+    0x27: _op_bytec,
+    0x28: _bytec(0),
+    0x29: _bytec(1),
+    0x2a: _bytec(2),
+    0x2b: _bytec(3),
+    0x31: _op_txn,
+    0x32: _op_global,
+    0x33: _op_gtxn,
+    0x34: _op_load,
+    0x35: _op_store,
+    0x36: _op_txna,
+    0x37: _op_gtxna,
+    0x38: _op_gtxns,
+    0x39: _op_gtxnsa,
+    0x3a: _op_gload,
+    0x3b: _op_gloads,
+    0x40: _op_bnz,
+    0x41: _op_bz,
+    0x42: _op_b,
+    0x43: _op_return,
+    0x44: _op_assert,
+    0x48: _op_pop,
+    0x49: _op_dup,
+    0x4b: _op_dig,
+    0x4c: _op_swap,
+    0x4d: _op_select,
+    0x50: _op_concat,
+    0x60: _op_balance,
+    0x64: _op_app_global_get,
+    0x65: _op_app_global_get_ex,
+    0x67: _op_app_global_put,
+    0x69: _op_app_global_del,
+    0x70: _op_asset_holding_get,
+    0x71: _op_asset_params_get,
+    0x80: _op_pushbytes,
+    0x81: _op_pushint,
+    0x88: _op_callsub,
+    0x89: _op_retsub,
+    0x92: _op_sqrt,
+    0xb1: _op_itxn_begin,
+    0xb2: _op_itxn_field,
+    0xb3: _op_itxn_submit,
+    0xb4: _op_itxn,
+}
+
+
+def evaluate_group(ledger, transactions):
+    """Evaluates a group against an in-memory ledger, running the approval programs of its application calls with
+    the opcode subset used by the bundled pool programs. Signatures and minimum balances of user accounts are not
+    checked. The given ledger is not modified.
+
+    :param ledger: ledger to evaluate against
+    :type ledger: :class:`LedgerState`
+    :param transactions: group to evaluate
+    :type transactions: :class:`TransactionGroup` or list
+    :return: evaluation result, with the resulting ledger if the group passed
+    :rtype: :class:`EvaluationResult`
+    """
+
+    if isinstance(transactions, TransactionGroup):
+        transactions = transactions.transactions
+    fields = [get_transaction_fields(txn, i) for i, txn in enumerate(transactions)]
+    group = _GroupEvaluation(ledger.copy(), fields)
+    if group.fee_credit < 0:
+        return EvaluationResult(ledger, ledger, fields, False, error="fee too small", costs=[])
+    failed_index, pc, error, costs = group.run()
+    if failed_index is not None:
+        return EvaluationResult(ledger, ledger, fields, False, error=error, failed_index=failed_index, pc=pc, costs=costs,
+                                inner_transactions=group.inner_transactions)
+    return EvaluationResult(ledger, group.ledger, fields, True, costs=costs, inner_transactions=group.inner_transactions)
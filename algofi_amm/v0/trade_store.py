@@ -0,0 +1,413 @@
+
+import os
+import mmap
+import time
+from array import array
+from base64 import b64decode
+from bisect import bisect_left, bisect_right
+from ..contract_strings import algofi_pool_strings as pool_strings
+from .config import ALGO_ASSET_ID
+
+# trade op codes stored in the op column
+OP_SWAP_EXACT_FOR = 1
+OP_SWAP_FOR_EXACT = 2
+OP_POOL = 3
+OP_BURN = 4
+OP_FLASH_LOAN = 5
+
+# pool app call op names -> trade op code, redeem residual calls belong to the trade of their group
+TRADE_OPS = {
+    pool_strings.swap_exact_for: OP_SWAP_EXACT_FOR,
+    pool_strings.swap_for_exact: OP_SWAP_FOR_EXACT,
+    pool_strings.pool: OP_POOL,
+    pool_strings.burn_asset1_out: OP_BURN,
+    pool_strings.burn_asset2_out: OP_BURN,
+    pool_strings.flash_loan: OP_FLASH_LOAN,
+}
+
+# column name -> array typecode, files are in native byte order
+TRADE_COLUMNS = (("round", "Q"), ("time", "Q"), ("op", "B"), ("asset1", "q"), ("asset2", "q"), ("lp", "q"))
+
+# default number of transactions per indexer page
+DEFAULT_PAGE_SIZE = 1000
+
+CHECKPOINT_FILE = "checkpoint"
+
+
+def get_day(timestamp):
+    """Returns the UTC day partition key of a timestamp
+
+    :param timestamp: unix timestamp
+    :type timestamp: int
+    :return: day as YYYYMMDD
+    :rtype: str
+    """
+
+    return time.strftime("%Y%m%d", time.gmtime(timestamp))
+
+
+def _add_pool_flows(flows, txn, pool_address):
+    payment = txn.get("payment-transaction", None)
+    transfer = txn.get("asset-transfer-transaction", None)
+    if payment is not None:
+        asset_id, amount, receiver = ALGO_ASSET_ID, payment.get("amount", 0), payment.get("receiver", None)
+    elif transfer is not None:
+        asset_id, amount, receiver = transfer.get("asset-id", 0), transfer.get("amount", 0), transfer.get("receiver", None)
+    else:
+        asset_id = None
+    if asset_id is not None:
+        if receiver == pool_address:
+            flows[asset_id] = flows.get(asset_id, 0) + amount
+        if txn.get("sender", None) == pool_address:
+            flows[asset_id] = flows.get(asset_id, 0) - amount
+    for inner_txn in txn.get("inner-txns", []):
+        _add_pool_flows(flows, inner_txn, pool_address)
+
+
+def decode_group_trade(pool, txns):
+    """Decodes the indexer transactions of one group into a trade row. Amounts are the net changes of the pool
+    balances, so residuals redeemed in the same group are already netted out.
+
+    :param pool: pool the group trades with
+    :type pool: :class:`Pool`
+    :param txns: indexer transactions of the group which involve the pool
+    :type txns: list
+    :return: (round, time, op, asset 1 change, asset 2 change, lp change), None if the group calls no trade op
+    :rtype: tuple
+    """
+
+    op = None
+    flows = {}
+    for txn in txns:
+        app_call = txn.get("application-transaction", None)
+        if op is None and app_call is not None and app_call.get("application-id", None) == pool.application_id:
+            app_args = app_call.get("application-args", [])
+            if app_args:
+                op = TRADE_OPS.get(b64decode(app_args[0]).decode("utf-8", "replace"), None)
+        _add_pool_flows(flows, txn, pool.address)
+    if op is None:
+        return None
+    return (txns[0]["confirmed-round"], txns[0]["round-time"], op, flows.get(pool.asset1.asset_id, 0),
+            flows.get(pool.asset2.asset_id, 0), flows.get(pool.lp_asset_id, 0))
+
+
+def iter_pool_trades(indexer_client, pool, min_round=None, max_round=None, page_size=DEFAULT_PAGE_SIZE):
+    """Pages through the indexer for the transactions involving the pool account and yields their trade rows
+    in round order
+
+    :param indexer_client: a :class:`IndexerClient` object for interacting with the network (historical state)
+    :type indexer_client: :class:`IndexerClient`
+    :param pool: pool whose trades are listed
+    :type pool: :class:`Pool`
+    :param min_round: first round to include
+    :type min_round: int, optional
+    :param max_round: last round to include
+    :type max_round: int, optional
+    :param page_size: number of transactions per indexer page
+    :type page_size: int, optional
+    :return: generator of (round, time, op, asset 1 change, asset 2 change, lp change) tuples
+    :rtype: generator
+    """
+
+    group_key = None
+    group_txns = []
+    next_page = ""
+    while next_page is not None:
+        response = indexer_client.search_transactions(limit=page_size, next_page=next_page, min_round=min_round,
+                                                      max_round=max_round, address=pool.address)
+        for txn in response.get("transactions", []):
+            # transactions of a group are consecutive and may span pages
+            key = txn.get("group", None) or txn["id"]
+            if key != group_key and group_txns:
+                trade = decode_group_trade(pool, group_txns)
+                if trade is not None:
+                    yield trade
+                group_txns = []
+            group_key = key
+            group_txns.append(txn)
+        next_page = response.get("next-token", None) if response.get("transactions", None) else None
+    if group_txns:
+        trade = decode_group_trade(pool, group_txns)
+        if trade is not None:
+            yield trade
+
+
+class TradeColumns():
+
+    def __init__(self, app_id, day, columns):
+        """Constructor method for :class:`TradeColumns`, the trades of one pool in one day partition as
+        memoryviews onto the memory mapped column files. Slicing does not copy.
+
+        :param app_id: pool application id
+        :type app_id: int
+        :param day: day partition key
+        :type day: str
+        :param columns: dict of column name -> memoryview
+        :type columns: dict
+        """
+
+        self.application_id = app_id
+        self.day = day
+        self.columns = columns
+        self.round = columns["round"]
+        self.time = columns["time"]
+        self.op = columns["op"]
+        self.asset1 = columns["asset1"]
+        self.asset2 = columns["asset2"]
+        self.lp = columns["lp"]
+
+    def __len__(self):
+        return len(self.round)
+
+    def __iter__(self):
+        """Yields (round, time, op, asset 1 change, asset 2 change, lp change) tuples
+        """
+
+        return zip(self.round, self.time, self.op, self.asset1, self.asset2, self.lp)
+
+    def slice(self, start, stop):
+        """Returns the rows in [start, stop) without copying
+
+        :param start: first row
+        :type start: int
+        :param stop: row after the last row
+        :type stop: int
+        :return: sliced columns
+        :rtype: :class:`TradeColumns`
+        """
+
+        return TradeColumns(self.application_id, self.day, {name: view[start:stop] for name, view in self.columns.items()})
+
+
+class TradeStore():
+
+    def __init__(self, root):
+        """Constructor method for :class:`TradeStore`, a local store of decoded pool trades in columnar files
+        partitioned by pool and UTC day, at root/<app_id>/<YYYYMMDD>/<column>. Rows are appended in round order
+        and read through memory maps.
+
+        :param root: store directory, created if missing
+        :type root: str
+        """
+
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        # (app_id, day) -> (mmaps, TradeColumns) of the partitions read so far
+        self.partitions = {}
+
+    def _get_pool_path(self, app_id):
+        return os.path.join(self.root, str(app_id))
+
+    def get_checkpoint(self, app_id):
+        """Returns the last round synced for a pool
+
+        :param app_id: pool application id
+        :type app_id: int
+        :return: last synced round, 0 if never synced
+        :rtype: int
+        """
+
+        try:
+            with open(os.path.join(self._get_pool_path(app_id), CHECKPOINT_FILE)) as f:
+                return int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _set_checkpoint(self, app_id, round_num):
+        path = os.path.join(self._get_pool_path(app_id), CHECKPOINT_FILE)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            f.write(str(round_num))
+        os.replace(path + ".tmp", path)
+
+    def get_days(self, app_id):
+        """Returns the day partitions of a pool
+
+        :param app_id: pool application id
+        :type app_id: int
+        :return: sorted day partition keys
+        :rtype: list
+        """
+
+        path = self._get_pool_path(app_id)
+        if not os.path.isdir(path):
+            return []
+        return sorted(day for day in os.listdir(path) if os.path.isdir(os.path.join(path, day)))
+
+    def _get_num_rows(self, path):
+        # rows of a partially written append are ignored
+        num_rows = None
+        for name, typecode in TRADE_COLUMNS:
+            column_path = os.path.join(path, name)
+            size = os.path.getsize(column_path) if os.path.exists(column_path) else 0
+            rows = size // array(typecode).itemsize
+            num_rows = rows if num_rows is None else min(num_rows, rows)
+        return num_rows
+
+    def _append_partition(self, app_id, day, rows):
+        path = os.path.join(self._get_pool_path(app_id), day)
+        os.makedirs(path, exist_ok=True)
+        num_rows = self._get_num_rows(path)
+        self.partitions.pop((app_id, day), None)
+        for i, (name, typecode) in enumerate(TRADE_COLUMNS):
+            column = array(typecode, [row[i] for row in rows])
+            with open(os.path.join(path, name), "ab") as f:
+                f.truncate(num_rows * column.itemsize)
+                f.write(column.tobytes())
+
+    def _truncate_after(self, app_id, checkpoint):
+        # rows after the checkpoint were written by an append which crashed before moving the checkpoint
+        for day in reversed(self.get_days(app_id)):
+            path = os.path.join(self._get_pool_path(app_id), day)
+            num_rows = self._get_num_rows(path)
+            if num_rows == 0:
+                continue
+            rounds = array("Q")
+            with open(os.path.join(path, "round"), "rb") as f:
+                f.seek((num_rows - 1) * rounds.itemsize)
+                if array("Q", f.read(rounds.itemsize))[0] <= checkpoint:
+                    return
+                f.seek(0)
+                rounds.frombytes(f.read(num_rows * rounds.itemsize))
+            num_rows = bisect_right(rounds, checkpoint)
+            self.partitions.pop((app_id, day), None)
+            for name, typecode in TRADE_COLUMNS:
+                with open(os.path.join(path, name), "ab") as f:
+                    f.truncate(num_rows * array(typecode).itemsize)
+            if num_rows > 0:
+                return
+
+    def append(self, app_id, trades, checkpoint_round=None):
+        """Appends trade rows of a pool. Rows at or before the checkpoint are skipped, and stored rows after the
+        checkpoint, left by an append interrupted before it moved the checkpoint, are dropped first, so appends are
+        idempotent.
+
+        :param app_id: pool application id
+        :type app_id: int
+        :param trades: (round, time, op, asset 1 change, asset 2 change, lp change) tuples in round order
+        :type trades: iterable
+        :param checkpoint_round: round up to which the pool is synced after the append, defaults to the last
+            appended round
+        :type checkpoint_round: int, optional
+        :return: number of appended rows
+        :rtype: int
+        """
+
+        checkpoint = self.get_checkpoint(app_id)
+        self._truncate_after(app_id, checkpoint)
+        appended = 0
+        day, rows = None, []
+        last_round = checkpoint
+        for trade in trades:
+            if trade[0] <= checkpoint:
+                continue
+            trade_day = get_day(trade[1])
+            if trade_day != day and rows:
+                self._append_partition(app_id, day, rows)
+                appended += len(rows)
+                rows = []
+            day = trade_day
+            rows.append(trade)
+            last_round = max(last_round, trade[0])
+        if rows:
+            self._append_partition(app_id, day, rows)
+            appended += len(rows)
+        checkpoint_round = max(last_round, checkpoint_round or 0)
+        if checkpoint_round > checkpoint:
+            self._set_checkpoint(app_id, checkpoint_round)
+        return appended
+
+    def sync(self, indexer_client, pool, max_round=None, page_size=DEFAULT_PAGE_SIZE):
+        """Fetches and appends the trades of a pool after its checkpoint
+
+        :param indexer_client: a :class:`IndexerClient` object for interacting with the network (historical state)
+        :type indexer_client: :class:`IndexerClient`
+        :param pool: pool to sync
+        :type pool: :class:`Pool`
+        :param max_round: last round to sync, defaults to the latest round of the indexer
+        :type max_round: int, optional
+        :param page_size: number of transactions per indexer page
+        :type page_size: int, optional
+        :return: number of appended rows
+        :rtype: int
+        """
+
+        if max_round is None:
+            max_round = indexer_client.health()["round"]
+        checkpoint = self.get_checkpoint(pool.application_id)
+        trades = iter_pool_trades(indexer_client, pool, min_round=checkpoint + 1, max_round=max_round, page_size=page_size)
+        return self.append(pool.application_id, trades, checkpoint_round=max_round)
+
+    def get_partition(self, app_id, day):
+        """Returns the trades of one day partition of a pool, mapped on first access
+
+        :param app_id: pool application id
+        :type app_id: int
+        :param day: day partition key
+        :type day: str
+        :return: trade columns, None if the partition is empty
+        :rtype: :class:`TradeColumns`
+        """
+
+        partition = self.partitions.get((app_id, day), None)
+        if partition is not None:
+            return partition[1]
+        path = os.path.join(self._get_pool_path(app_id), day)
+        num_rows = self._get_num_rows(path) if os.path.isdir(path) else 0
+        if not num_rows:
+            return None
+        mmaps = []
+        columns = {}
+        for name, typecode in TRADE_COLUMNS:
+            with open(os.path.join(path, name), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            mmaps.append(mapped)
+            columns[name] = memoryview(mapped).cast(typecode)[:num_rows]
+        trade_columns = TradeColumns(app_id, day, columns)
+        self.partitions[(app_id, day)] = (mmaps, trade_columns)
+        return trade_columns
+
+    def query(self, app_id, start_time=None, end_time=None, min_round=None, max_round=None):
+        """Yields the trades of a pool within a time and round range, one day partition at a time, without copying
+
+        :param app_id: pool application id
+        :type app_id: int
+        :param start_time: first timestamp to include
+        :type start_time: int, optional
+        :param end_time: last timestamp to include
+        :type end_time: int, optional
+        :param min_round: first round to include
+        :type min_round: int, optional
+        :param max_round: last round to include
+        :type max_round: int, optional
+        :return: generator of :class:`TradeColumns`
+        :rtype: generator
+        """
+
+        start_day = get_day(start_time) if start_time is not None else None
+        end_day = get_day(end_time) if end_time is not None else None
+        for day in self.get_days(app_id):
+            if (start_day is not None and day < start_day) or (end_day is not None and day > end_day):
+                continue
+            columns = self.get_partition(app_id, day)
+            if columns is None:
+                continue
+            # rows are in round order, so time and round are both sorted
+            start, stop = 0, len(columns)
+            if start_time is not None:
+                start = max(start, bisect_left(columns.time, start_time))
+            if end_time is not None:
+                stop = min(stop, bisect_right(columns.time, end_time))
+            if min_round is not None:
+                start = max(start, bisect_left(columns.round, min_round))
+            if max_round is not None:
+                stop = min(stop, bisect_right(columns.round, max_round))
+            if start < stop:
+                yield columns.slice(start, stop)
+
+    def close(self):
+        """Drops the memory maps of the partitions read so far, each mapping is released once no view returned
+        by earlier queries references it
+        """
+
+        self.partitions = {}
@@ -0,0 +1,231 @@
+
+from ..utils import MAX_GROUP_SIZE, TransactionGroup, get_params
+
+
+def pack_sizes(sizes, max_size=MAX_GROUP_SIZE, preserve_order=False):
+    """Packs items of given sizes into as few bins of at most max_size as possible
+
+    :param sizes: size of each item
+    :type sizes: list
+    :param max_size: maximum total size of a bin
+    :type max_size: int, optional
+    :param preserve_order: whether items must be packed in order, otherwise items are packed first fit decreasing
+    :type preserve_order: bool, optional
+    :return: list of bins, each a sorted list of item indices
+    :rtype: list
+    """
+
+    if preserve_order:
+        bins = []
+        current_bin, bin_size = [], 0
+        for i, size in enumerate(sizes):
+            if bin_size + size > max_size and current_bin:
+                bins.append(current_bin)
+                current_bin, bin_size = [], 0
+            current_bin.append(i)
+            bin_size += size
+        if current_bin:
+            bins.append(current_bin)
+        return bins
+
+    # first fit decreasing, stable for items of equal size
+    bins = []
+    bin_sizes = []
+    for i in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        for j, bin_size in enumerate(bin_sizes):
+            if bin_size + sizes[i] <= max_size:
+                bins[j].append(i)
+                bin_sizes[j] += sizes[i]
+                break
+        else:
+            bins.append([i])
+            bin_sizes.append(sizes[i])
+    return sorted(sorted(current_bin) for current_bin in bins)
+
+
+class TransactionBatchBuilder():
+
+    def __init__(self, algod_client, params=None, preserve_order=False):
+        """Constructor method for :class:`TransactionBatchBuilder`, which collects swap, pool and burn operations
+        and packs them into as few atomic groups of at most 16 transactions as possible. The transactions of one
+        operation always stay together and in order, and group ids are assigned once per final group.
+
+        :param algod_client: a :class:`AlgodClient` object for interacting with the network
+        :type algod_client: :class:`AlgodClient`
+        :param params: suggested params shared by all operations, fetched on first use if not specified
+        :type params: :class:`SuggestedParams`, optional
+        :param preserve_order: whether operations must be packed in the order they were added, e.g. when one
+            operation spends the output of a previous one. Otherwise operations are packed first fit decreasing.
+        :type preserve_order: bool, optional
+        """
+
+        self.algod = algod_client
+        self.params = params
+        self.preserve_order = preserve_order
+        self.operations = []
+        # operation index -> transaction group of operations which cannot share a group with other operations
+        self.standalone = {}
+
+    def __len__(self):
+        return len(self.operations)
+
+    def _get_params(self):
+        if self.params is None:
+            self.params = get_params(self.algod)
+        return self.params
+
+    def add_transactions(self, transactions):
+        """Adds an operation made of already built transactions, which are kept together in one group. Operations
+        which rely on absolute group positions, e.g. a flash loan which must be at group index 0 and is repaid at
+        GroupSize - 1, are not packed with other operations and are returned by :meth:`build` as their own group,
+        unmodified.
+
+        :param transactions: transactions of the operation
+        :type transactions: :class:`TransactionGroup` or list
+        """
+
+        # imported here as dryrun_batch imports pack_sizes from this module
+        from .dryrun_batch import is_packable
+
+        transaction_group = transactions if isinstance(transactions, TransactionGroup) else None
+        if transaction_group is not None:
+            transactions = transaction_group.transactions
+        transactions = list(transactions)
+        if len(transactions) > MAX_GROUP_SIZE:
+            raise Exception("Operation of %d transactions exceeds the group size limit of %d" % (len(transactions), MAX_GROUP_SIZE))
+        if not transactions:
+            return
+        if not is_packable(transactions):
+            if transaction_group is None:
+                for txn in transactions:
+                    txn.group = None
+                transaction_group = TransactionGroup(transactions)
+            self.standalone[len(self.operations)] = transaction_group
+        self.operations.append(transactions)
+
+    def _add_built(self, build, *args, **kwargs):
+        params = self._get_params()
+        base_fee = params.fee
+        try:
+            transaction_group = build(*args, params=params, **kwargs)
+        finally:
+            params.fee = base_fee
+        self.add_transactions(transaction_group)
+
+    def add_swap_exact_for(self, pool, sender, swap_in_asset, swap_in_amount, min_amount_to_receive, fee=None):
+        """Adds a swap exact for, see :meth:`Pool.get_swap_exact_for_txns`
+
+        :param pool: pool to swap in
+        :type pool: :class:`Pool`
+        :param sender: sender
+        :type sender: str
+        :param swap_in_asset: asset to swap in
+        :type swap_in_asset: :class:`Asset`
+        :param swap_in_amount: amount of asset to swap in
+        :type swap_in_amount: int
+        :param min_amount_to_receive: minimum amount of outgoing asset to receive
+        :type min_amount_to_receive: int
+        :param fee: fee of the swap call, predicted by the fee model if not specified
+        :type fee: int, optional
+        """
+
+        self._add_built(pool.get_swap_exact_for_txns, sender, swap_in_asset, swap_in_amount, min_amount_to_receive, fee=fee)
+
+    def add_swap_for_exact(self, pool, sender, swap_in_asset, swap_in_amount, amount_to_receive, fee=None):
+        """Adds a swap for exact, see :meth:`Pool.get_swap_for_exact_txns`
+
+        :param pool: pool to swap in
+        :type pool: :class:`Pool`
+        :param sender: sender
+        :type sender: str
+        :param swap_in_asset: asset to swap in
+        :type swap_in_asset: :class:`Asset`
+        :param swap_in_amount: maximum amount of asset to swap in
+        :type swap_in_amount: int
+        :param amount_to_receive: exact amount of outgoing asset to receive
+        :type amount_to_receive: int
+        :param fee: fee of the swap call, predicted by the fee model if not specified
+        :type fee: int, optional
+        """
+
+        self._add_built(pool.get_swap_for_exact_txns, sender, swap_in_asset, swap_in_amount, amount_to_receive, fee=fee)
+
+    def add_pool(self, pool, sender, asset1_amount, asset2_amount, maximum_slippage, fee=None):
+        """Adds a pool operation, see :meth:`Pool.get_pool_txns`
+
+        :param pool: pool to add liquidity to
+        :type pool: :class:`Pool`
+        :param sender: sender
+        :type sender: str
+        :param asset1_amount: amount of asset 1 to pool
+        :type asset1_amount: int
+        :param asset2_amount: amount of asset 2 to pool
+        :type asset2_amount: int
+        :param maximum_slippage: maximum slippage percent (scaled by 1000000) allowed
+        :type maximum_slippage: int
+        :param fee: fee of the pool call, predicted by the fee model if not specified
+        :type fee: int, optional
+        """
+
+        self._add_built(pool.get_pool_txns, sender, asset1_amount, asset2_amount, maximum_slippage, fee=fee)
+
+    def add_burn(self, pool, sender, burn_amount):
+        """Adds a burn, see :meth:`Pool.get_burn_txns`
+
+        :param pool: pool to burn lp tokens of
+        :type pool: :class:`Pool`
+        :param sender: sender
+        :type sender: str
+        :param burn_amount: amount of lp tokens to burn
+        :type burn_amount: int
+        """
+
+        self._add_built(pool.get_burn_txns, sender, burn_amount)
+
+    def get_packing(self):
+        """Returns the packing of the operations into groups as lists of operation indices
+
+        :return: list of groups, each a list of operation indices
+        :rtype: list
+        """
+
+        # operations which cannot be packed get a group of their own, after the others unless preserve_order is set,
+        # in which case they split the other operations into runs which are packed separately
+        packing = []
+        run = []
+        standalone = []
+
+        def pack_run():
+            bins = pack_sizes([len(self.operations[i]) for i in run], preserve_order=self.preserve_order)
+            packing.extend([run[j] for j in current_bin] for current_bin in bins)
+
+        for i in range(len(self.operations)):
+            if i not in self.standalone:
+                run.append(i)
+            elif self.preserve_order:
+                pack_run()
+                run = []
+                packing.append([i])
+            else:
+                standalone.append([i])
+        pack_run()
+        return packing + standalone
+
+    def build(self):
+        """Packs the operations into atomic groups and assigns each final group its group id
+
+        :return: list of unsigned group transactions
+        :rtype: list
+        """
+
+        transaction_groups = []
+        for group in self.get_packing():
+            if group[0] in self.standalone:
+                transaction_groups.append(self.standalone[group[0]])
+                continue
+            transactions = [txn for i in group for txn in self.operations[i]]
+            # clear the group ids assigned by the per operation builders
+            for txn in transactions:
+                txn.group = None
+            transaction_groups.append(TransactionGroup(transactions))
+        return transaction_groups
@@ -0,0 +1,66 @@
+import json
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from algofi_amm.failover import EndpointPool, FailoverClient
+from algofi_amm.transport import ConnectionPool, PooledAlgodClient
+
+# number of calls made with each client
+NUM_CALLS = 1000
+
+# latency of a fake endpoint: usually FAST_LATENCY, with probability SLOW_PROBABILITY SLOW_LATENCY
+FAST_LATENCY = 0.002
+SLOW_LATENCY = 0.1
+SLOW_PROBABILITY = 0.05
+
+# seconds to wait for the first endpoint before hedging to the second
+HEDGE_DELAY = 0.01
+
+STATUS_RESPONSE = json.dumps({"last-round": 1, "time-since-last-round": 0}).encode("utf-8")
+
+
+class SlowTailHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that connections are kept alive
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(SLOW_LATENCY if random.random() < SLOW_PROBABILITY else FAST_LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STATUS_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(STATUS_RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def time_calls(algod_client):
+    latencies = []
+    for _ in range(NUM_CALLS):
+        start = time.perf_counter()
+        algod_client.status()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+servers = [ThreadingHTTPServer(("127.0.0.1", 0), SlowTailHandler) for _ in range(2)]
+for server in servers:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+addresses = ["http://127.0.0.1:%d" % server.server_address[1] for server in servers]
+
+connection_pool = ConnectionPool()
+clients = [PooledAlgodClient("", address, connection_pool=connection_pool) for address in addresses]
+single_p50, single_p99 = time_calls(clients[0])
+endpoint_pool = EndpointPool(clients, hedge_delay=HEDGE_DELAY)
+hedged_p50, hedged_p99 = time_calls(FailoverClient(endpoint_pool))
+for server in servers:
+    server.shutdown()
+
+stats = endpoint_pool.get_stats()
+print("single endpoint: p50 %.1f ms, p99 %.1f ms" % (single_p50 * 1e3, single_p99 * 1e3))
+print("hedged:          p50 %.1f ms, p99 %.1f ms (%d hedges, %d won by the hedge)" % (
+    hedged_p50 * 1e3, hedged_p99 * 1e3, stats["hedges"], stats["hedge_wins"]))
@@ -0,0 +1,31 @@
+import sys
+import json
+import statistics
+import subprocess
+
+# number of fresh interpreters per measurement
+NUM_RUNS = 10
+
+MEASURE_SCRIPT = """
+import json, time, tracemalloc
+tracemalloc.start()
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "peak_bytes": tracemalloc.get_traced_memory()[1]}}))
+"""
+
+MODULES = ["algofi_amm", "algofi_amm.v0.config", "algofi_amm.v0.pool", "algofi_amm.v0.approval_programs"]
+
+
+def measure(module):
+    results = []
+    for _ in range(NUM_RUNS):
+        output = subprocess.check_output([sys.executable, "-c", MEASURE_SCRIPT.format(module=module)])
+        results.append(json.loads(output))
+    return statistics.median(r["seconds"] for r in results), statistics.median(r["peak_bytes"] for r in results)
+
+
+for module in MODULES:
+    seconds, peak_bytes = measure(module)
+    print("%-36s %8.2f ms %8.1f KiB" % (module, seconds * 1000, peak_bytes / 1024))
@@ -0,0 +1,49 @@
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from algosdk.v2client.algod import AlgodClient
+from algofi_amm.transport import ConnectionPool, PooledAlgodClient
+
+# number of calls made with each client
+NUM_CALLS = 2000
+
+STATUS_RESPONSE = json.dumps({"last-round": 1, "time-since-last-round": 0}).encode("utf-8")
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that connections are kept alive
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STATUS_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(STATUS_RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def time_calls(algod_client):
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        algod_client.status()
+    return (time.perf_counter() - start) / NUM_CALLS
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+address = "http://127.0.0.1:%d" % server.server_address[1]
+
+connection_pool = ConnectionPool(max_connections_per_host=1)
+default_latency = time_calls(AlgodClient("", address))
+pooled_latency = time_calls(PooledAlgodClient("", address, connection_pool=connection_pool))
+server.shutdown()
+
+print("default client: %.1f us / call" % (default_latency * 1e6))
+print("pooled client:  %.1f us / call" % (pooled_latency * 1e6))
+print("saved:          %.1f us / call (%d connections opened, %d reused)" % (
+    (default_latency - pooled_latency) * 1e6, connection_pool.connections_opened, connection_pool.connections_reused))
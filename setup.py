@@ -19,5 +19,11 @@ setuptools.setup(
     install_requires=["py-algorand-sdk >= 1.6.0"],
     packages=setuptools.find_packages(),
     python_requires=">=3.7",
+    entry_points={
+        "console_scripts": [
+            "algofi-amm-quote-server=algofi_amm.v0.quote_server:main",
+            "algofi-amm-bulk-quote=algofi_amm.v0.bulk_quote:main",
+        ],
+    },
     include_package_data=True
 )
\ No newline at end of file